@@ -0,0 +1,29 @@
+"""add projects.version for ETag support
+
+Revision ID: 002
+Revises: 001
+Create Date: 2026-10-19 00:00:00.000000
+"""
+
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "002"
+down_revision = "001"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "projects",
+        sa.Column("version", sa.BigInteger(), server_default="1", nullable=False),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("projects", "version")
@@ -0,0 +1,63 @@
+"""add deadline_warnings and job_watermarks for the deadline scanner
+
+Revision ID: 004
+Revises: 003
+Create Date: 2026-10-19 00:00:00.000000
+"""
+
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = "004"
+down_revision = "003"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "job_watermarks",
+        sa.Column("name", sa.String(64), nullable=False),
+        sa.Column("value", sa.DateTime(timezone=True), nullable=False),
+        sa.PrimaryKeyConstraint("name"),
+    )
+
+    op.create_table(
+        "deadline_warnings",
+        sa.Column("task_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("deadline", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("warn_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("sent_at", sa.DateTime(timezone=True), nullable=True),
+        sa.PrimaryKeyConstraint("task_id", "deadline"),
+    )
+    op.create_foreign_key(
+        "fk_deadline_warnings_task_id_tasks",
+        "deadline_warnings",
+        "tasks",
+        ["task_id"],
+        ["id"],
+        ondelete="CASCADE",
+    )
+    op.create_index(
+        "ix_deadline_warnings_due",
+        "deadline_warnings",
+        ["warn_at"],
+        postgresql_where=sa.text("sent_at IS NULL"),
+    )
+    op.create_index("ix_deadline_warnings_deadline", "deadline_warnings", ["deadline"])
+
+    # Lets the scanner pick up tasks edited behind its deadline watermark.
+    op.create_index("ix_tasks_updated_at", "tasks", ["updated_at"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_tasks_updated_at", table_name="tasks")
+    op.drop_index("ix_deadline_warnings_deadline", table_name="deadline_warnings")
+    op.drop_index("ix_deadline_warnings_due", table_name="deadline_warnings")
+    op.drop_table("deadline_warnings")
+    op.drop_table("job_watermarks")
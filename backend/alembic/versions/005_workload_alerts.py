@@ -0,0 +1,45 @@
+"""add workload_alerts for event-driven workload alerts
+
+Revision ID: 005
+Revises: 004
+Create Date: 2026-10-19 00:00:00.000000
+"""
+
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = "005"
+down_revision = "004"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "workload_alerts",
+        sa.Column("member_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column(
+            "raised_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.PrimaryKeyConstraint("member_id"),
+    )
+    op.create_foreign_key(
+        "fk_workload_alerts_member_id_project_members",
+        "workload_alerts",
+        "project_members",
+        ["member_id"],
+        ["id"],
+        ondelete="CASCADE",
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("workload_alerts")
@@ -0,0 +1,57 @@
+"""add task_progress_estimates for incremental progress estimation
+
+Revision ID: 006
+Revises: 005
+Create Date: 2026-10-19 00:00:00.000000
+"""
+
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = "006"
+down_revision = "005"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "task_progress_estimates",
+        sa.Column("task_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("percentage", sa.Integer(), nullable=False),
+        sa.Column("confidence", sa.Float(), nullable=False),
+        sa.Column("reasoning", sa.Text(), server_default="", nullable=False),
+        sa.Column("summary", sa.Text(), server_default="", nullable=False),
+        sa.Column("last_report_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("last_report_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.PrimaryKeyConstraint("task_id"),
+    )
+    op.create_foreign_key(
+        "fk_task_progress_estimates_task_id_tasks",
+        "task_progress_estimates",
+        "tasks",
+        ["task_id"],
+        ["id"],
+        ondelete="CASCADE",
+    )
+    op.create_index(
+        "ix_task_logs_task_id_created_at",
+        "task_logs",
+        ["task_id", "created_at", "id"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_task_logs_task_id_created_at", table_name="task_logs")
+    op.drop_table("task_progress_estimates")
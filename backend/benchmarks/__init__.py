@@ -0,0 +1 @@
+"""Micro-benchmarks for hot request paths (not collected by pytest)."""
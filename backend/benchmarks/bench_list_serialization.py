@@ -0,0 +1,189 @@
+"""Benchmark list endpoint serialization: validated pydantic vs constructed + orjson.
+
+Run from the repository root:
+
+    python -m backend.benchmarks.bench_list_serialization [--items 200] [--repeat 200]
+
+Each case serializes one page the way the endpoint used to (validated
+response models, re-validated against response_model, stdlib JSON) and the
+way it does now (plain rows + ORJSONResponse). FastAPI's own Rust
+dump_json path is shown for reference.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import timeit
+from collections.abc import Callable
+from datetime import datetime, timedelta, timezone
+from uuid import uuid4
+
+from fastapi.encoders import jsonable_encoder
+from pydantic import BaseModel, TypeAdapter
+
+from backend.src.adapters.api.responses import ORJSONResponse, paginated
+from backend.src.adapters.api.routers.members import (
+    MemberResponse,
+    PaginatedMembersResponse,
+)
+from backend.src.adapters.api.routers.projects import (
+    PaginatedProjectsResponse,
+    ProjectResponse,
+)
+from backend.src.adapters.api.routers.tasks import (
+    PaginatedTaskLogsResponse,
+    PaginatedTasksResponse,
+    TaskLogResponse,
+    TaskResponse,
+)
+from backend.src.application.use_cases.project_management import EnrichedMember
+from backend.src.domain.entities import Project, Task, TaskLog
+
+
+def _tasks(n: int) -> list[Task]:
+    project_id = uuid4()
+    start = datetime(2026, 1, 5, 9, tzinfo=timezone.utc)
+    return [
+        Task(
+            project_id=project_id,
+            title=f"Task {i}",
+            description="Implement the thing " * 5,
+            difficulty_points=i % 13 + 1,
+            assignee_id=uuid4() if i % 2 else None,
+            expected_start_date=start + timedelta(days=i),
+            expected_end_date=start + timedelta(days=i + 3),
+        )
+        for i in range(n)
+    ]
+
+
+def _logs(n: int) -> list[TaskLog]:
+    task_id, author_id = uuid4(), uuid4()
+    return [
+        TaskLog.create_report_log(task_id=task_id, author_id=author_id, report_text=f"r{i}")
+        for i in range(n)
+    ]
+
+
+def _projects(n: int) -> list[Project]:
+    manager_id = uuid4()
+    return [Project(name=f"Project {i}", manager_id=manager_id) for i in range(n)]
+
+
+def _members(n: int) -> list[EnrichedMember]:
+    project_id, role_id = uuid4(), uuid4()
+    return [
+        EnrichedMember(
+            id=uuid4(),
+            project_id=project_id,
+            user_id=uuid4(),
+            role_id=role_id,
+            seniority_level="Mid",
+            joined_at=datetime.now(timezone.utc).isoformat(),
+            user_name=f"User {i}",
+            user_email=f"user{i}@example.com",
+            role_name="Developer",
+        )
+        for i in range(n)
+    ]
+
+
+def _validated(model: type[BaseModel], item_model: type[BaseModel]):
+    """Old path: validated items, response_model re-validation, stdlib JSON."""
+    adapter = TypeAdapter(model)
+
+    def run(items: list) -> bytes:
+        page = model(
+            items=[item_model.model_validate(i, from_attributes=True) for i in items],
+            total=len(items),
+            limit=len(items),
+            offset=0,
+        )
+        validated = adapter.validate_python(page.model_dump())
+        return json.dumps(jsonable_encoder(validated)).encode()
+
+    return run
+
+
+def _fastapi_dump_json(model: type[BaseModel], item_model: type[BaseModel]):
+    """FastAPI's default path for response_model endpoints (Rust dump_json)."""
+    adapter = TypeAdapter(model)
+
+    def run(items: list) -> bytes:
+        page = model(
+            items=[item_model.model_validate(i, from_attributes=True) for i in items],
+            total=len(items),
+            limit=len(items),
+            offset=0,
+        )
+        return adapter.dump_json(adapter.validate_python(page.model_dump()))
+
+    return run
+
+
+def _fast(build_row: Callable):
+    """New path: plain rows from validated entities rendered by ORJSONResponse."""
+
+    def run(items: list) -> bytes:
+        return ORJSONResponse(
+            paginated(
+                [build_row(i) for i in items],
+                total=len(items),
+                limit=len(items),
+                offset=0,
+            )
+        ).body
+
+    return run
+
+
+CASES = {
+    "tasks": (_tasks, PaginatedTasksResponse, TaskResponse, TaskResponse.row),
+    "task logs": (
+        _logs,
+        PaginatedTaskLogsResponse,
+        TaskLogResponse,
+        TaskLogResponse.row,
+    ),
+    "projects": (
+        _projects,
+        PaginatedProjectsResponse,
+        ProjectResponse,
+        ProjectResponse.row,
+    ),
+    "members": (
+        _members,
+        PaginatedMembersResponse,
+        MemberResponse,
+        MemberResponse.row,
+    ),
+}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--items", type=int, default=200, help="items per page")
+    parser.add_argument("--repeat", type=int, default=200, help="pages per timing")
+    args = parser.parse_args()
+
+    print(f"{args.items} items/page, best of 5 x {args.repeat} pages (ms per page)")
+    print(f"{'endpoint':<10} {'validated':>10} {'dump_json':>10} {'orjson':>10} {'speedup':>8}")
+    for name, (make, page_model, item_model, build_row) in CASES.items():
+        items = make(args.items)
+        timings = []
+        for run in (
+            _validated(page_model, item_model),
+            _fastapi_dump_json(page_model, item_model),
+            _fast(build_row),
+        ):
+            best = min(timeit.repeat(lambda: run(items), number=args.repeat, repeat=5))
+            timings.append(best / args.repeat * 1000)
+        print(
+            f"{name:<10} {timings[0]:>10.3f} {timings[1]:>10.3f} {timings[2]:>10.3f}"
+            f" {timings[0] / timings[2]:>7.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
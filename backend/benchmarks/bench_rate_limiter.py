@@ -0,0 +1,108 @@
+"""Benchmark Redis rate limiting: INCR/EXPIRE/TTL round-trips vs one Lua script.
+
+Needs a running Redis. Run from the repository root:
+
+    python -m backend.benchmarks.bench_rate_limiter --redis-url redis://localhost:6379/15 \
+        [--hits 20000] [--concurrency 50] [--keys 100]
+
+Each case issues ``--hits`` checks from ``--concurrency`` tasks spread over
+``--keys`` keys and reports hits per second and per-hit latency. The
+legacy case is the fixed-window limiter this replaced, kept here verbatim
+for comparison. Keys are written under a ``bench`` prefix and flushed
+afterwards.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import statistics
+import time
+from collections.abc import Awaitable, Callable
+
+from redis.asyncio import Redis
+
+from backend.src.domain.ports.services import RateLimitAlgorithm
+from backend.src.infrastructure.cache import RedisRateLimiter, create_redis_client
+
+PREFIX = "bench:ratelimit"
+
+
+async def legacy_hit(redis: Redis, key: str, limit: int, window_seconds: int) -> bool:
+    """The previous implementation: three sequential round-trips."""
+    redis_key = f"{PREFIX}:legacy:{key}"
+    current = await redis.incr(redis_key)
+    if current == 1:
+        await redis.expire(redis_key, window_seconds)
+    await redis.ttl(redis_key)
+    return current <= limit
+
+
+async def run_case(
+    name: str,
+    hit: Callable[[str], Awaitable[object]],
+    hits: int,
+    concurrency: int,
+    keys: int,
+) -> None:
+    latencies: list[float] = []
+    per_task = hits // concurrency
+
+    async def worker(worker_id: int) -> None:
+        for i in range(per_task):
+            key = f"k{(worker_id * per_task + i) % keys}"
+            started = time.perf_counter()
+            await hit(key)
+            latencies.append(time.perf_counter() - started)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker(w) for w in range(concurrency)))
+    elapsed = time.perf_counter() - started
+
+    latencies.sort()
+    p99 = latencies[int(len(latencies) * 0.99) - 1]
+    print(
+        f"{name:<16} {len(latencies) / elapsed:>10.0f} hits/s   "
+        f"p50 {statistics.median(latencies) * 1000:6.2f} ms   p99 {p99 * 1000:6.2f} ms"
+    )
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--redis-url", required=True)
+    parser.add_argument("--hits", type=int, default=20_000)
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--keys", type=int, default=100)
+    args = parser.parse_args()
+
+    redis = create_redis_client(args.redis_url)
+    limiter = RedisRateLimiter(redis, prefix=PREFIX)
+    limit, window = 1_000_000, 60
+
+    print(f"{args.hits} hits, {args.concurrency} concurrent, {args.keys} keys")
+    try:
+        await run_case(
+            "legacy",
+            lambda key: legacy_hit(redis, key, limit, window),
+            args.hits,
+            args.concurrency,
+            args.keys,
+        )
+        for algorithm in RateLimitAlgorithm:
+            await run_case(
+                algorithm.value,
+                lambda key, algorithm=algorithm: limiter.hit(
+                    key, limit, window, algorithm=algorithm
+                ),
+                args.hits,
+                args.concurrency,
+                args.keys,
+            )
+    finally:
+        async for key in redis.scan_iter(match=f"{PREFIX}:*"):
+            await redis.delete(key)
+        await redis.aclose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,161 @@
+"""Benchmark SMTP delivery: one session per email vs pooled connections.
+
+Needs aiosmtpd. Run from the repository root:
+
+    python -m backend.benchmarks.bench_smtp_pool \
+        [--messages 500] [--concurrency 8] [--pool-size 4] [--latency-ms 2]
+
+Starts a local aiosmtpd server that accepts any login and discards mail,
+then delivers ``--messages`` emails. The legacy case is the previous
+``aiosmtplib.send`` call per email, which connects, greets and
+authenticates every time; it runs with ``--concurrency`` tasks, as the
+outbox dispatcher would. The pooled case sends the same emails through
+``SMTPEmailService.send_many``. ``--latency-ms`` delays every server reply
+to approximate a round-trip to a remote relay; TLS is not used, so real
+savings against a TLS relay are larger.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import socket
+import logging
+import time
+from collections.abc import Awaitable, Callable
+
+import aiosmtplib
+from aiosmtpd.controller import Controller
+from aiosmtpd.smtp import SMTP as SMTPServer, AuthResult
+
+from backend.src.adapters.services import SMTPEmailService
+from backend.src.config.settings import AppSettings
+from backend.src.domain.ports.services import EmailMessage
+
+
+class SlowSMTPServer(SMTPServer):
+    """aiosmtpd server that waits before every reply."""
+
+    latency = 0.0
+
+    async def push(self, status: str) -> None:
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        await super().push(status)
+
+
+class SlowController(Controller):
+    def factory(self):
+        return SlowSMTPServer(self.handler, **self.SMTP_kwargs)
+
+
+class CountingHandler:
+    def __init__(self) -> None:
+        self.received = 0
+
+    async def handle_DATA(self, server, session, envelope) -> str:
+        self.received += 1
+        return "250 OK"
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+async def run_case(
+    name: str,
+    send: Callable[[list[EmailMessage]], Awaitable[None]],
+    messages: list[EmailMessage],
+    handler: CountingHandler,
+) -> None:
+    handler.received = 0
+    started = time.perf_counter()
+    await send(messages)
+    elapsed = time.perf_counter() - started
+    assert handler.received == len(messages), handler.received
+    print(
+        f"{name:<8} {len(messages) / elapsed:>8.0f} emails/s   "
+        f"{elapsed / len(messages) * 1000:6.2f} ms/email"
+    )
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--messages", type=int, default=500)
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--pool-size", type=int, default=4)
+    parser.add_argument("--latency-ms", type=float, default=2.0)
+    args = parser.parse_args()
+
+    # aiosmtpd logs a deprecation warning of its own on every AUTH.
+    logging.getLogger("mail.log").setLevel(logging.ERROR)
+    SlowSMTPServer.latency = args.latency_ms / 1000
+    handler = CountingHandler()
+    port = free_port()
+    controller = SlowController(
+        handler,
+        hostname="127.0.0.1",
+        port=port,
+        authenticator=lambda *_: AuthResult(success=True),
+        auth_require_tls=False,
+    )
+    controller.start()
+
+    settings = AppSettings(
+        smtp_host="127.0.0.1",
+        smtp_port=port,
+        smtp_user="bench",
+        smtp_password="bench",
+        smtp_from_email="bench@example.com",
+        smtp_use_tls=False,
+        smtp_pool_size=args.pool_size,
+    )
+    service = SMTPEmailService(settings)
+    messages = [
+        EmailMessage(
+            recipients=[f"user{n}@example.com"],
+            subject="Daily report",
+            body_text="Project summary " * 20,
+        )
+        for n in range(args.messages)
+    ]
+
+    async def legacy(batch: list[EmailMessage]) -> None:
+        semaphore = asyncio.Semaphore(args.concurrency)
+
+        async def send_one(message: EmailMessage) -> None:
+            async with semaphore:
+                await aiosmtplib.send(
+                    service._to_mime(message),
+                    hostname=settings.smtp_host,
+                    port=settings.smtp_port,
+                    username=settings.smtp_user,
+                    password=settings.smtp_password,
+                    use_tls=settings.smtp_use_tls,
+                    recipients=message.recipients,
+                )
+
+        await asyncio.gather(*(send_one(message) for message in batch))
+
+    async def pooled(batch: list[EmailMessage]) -> None:
+        results = await service.send_many(batch)
+        failures = [error for error in results if error is not None]
+        if failures:
+            raise failures[0]
+
+    print(
+        f"{args.messages} emails, legacy concurrency {args.concurrency}, "
+        f"pool size {args.pool_size}, server latency {args.latency_ms:g} ms"
+    )
+    try:
+        await run_case("legacy", legacy, messages, handler)
+        await run_case("pooled", pooled, messages, handler)
+    finally:
+        await service.aclose()
+        controller.stop()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
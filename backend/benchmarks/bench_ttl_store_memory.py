@@ -0,0 +1,139 @@
+"""Benchmark memory retained by the in-memory stores under key churn.
+
+Run from the repository root:
+
+    python -m backend.benchmarks.bench_ttl_store_memory \
+        [--keys 2000000] [--rate 2000] [--ttl 60]
+
+Simulates a long-running single node where every key (client IP, user,
+token id) is seen once: ``--keys`` distinct keys arrive at ``--rate`` keys
+per simulated second, with a ``--ttl`` second rate-limit window and
+revocation lifetime. Each case reports the memory still allocated at the
+end (tracemalloc) and, from a separate untraced run, the time per
+operation. The legacy cases are the plain-dict implementations these
+stores replaced, which only dropped an expired entry when the same key
+was looked up again.
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import time
+import tracemalloc
+from collections.abc import Callable
+
+from backend.src.adapters.services import InMemoryRateLimiter, InMemoryRevokedTokenStore
+
+
+class Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def legacy_rate_limiter(clock: Clock, ttl: float) -> Callable[[str], None]:
+    entries: dict[str, tuple[int, float]] = {}
+
+    def hit(key: str) -> None:
+        now = clock()
+        current, expires_at = entries.get(key, (0, now + ttl))
+        if now >= expires_at:
+            current, expires_at = 0, now + ttl
+        entries[key] = (current + 1, expires_at)
+
+    return hit
+
+
+def bounded_rate_limiter(clock: Clock, ttl: float) -> Callable[[str], None]:
+    limiter = InMemoryRateLimiter(clock=clock)
+
+    def hit(key: str) -> None:
+        # hit() never awaits, so driving the coroutine by hand is enough.
+        coro = limiter.hit(key, limit=100, window_seconds=int(ttl))
+        try:
+            coro.send(None)
+        except StopIteration:
+            pass
+
+    return hit
+
+
+def legacy_revoked_store(clock: Clock, ttl: float) -> Callable[[str], None]:
+    entries: dict[str, float] = {}
+
+    def revoke(jti: str) -> None:
+        entries[jti] = clock() + ttl
+
+    return revoke
+
+
+def bounded_revoked_store(clock: Clock, ttl: float) -> Callable[[str], None]:
+    store = InMemoryRevokedTokenStore(clock=clock)
+
+    def revoke(jti: str) -> None:
+        coro = store.revoke(jti, int(ttl))
+        try:
+            coro.send(None)
+        except StopIteration:
+            pass
+
+    return revoke
+
+
+Factory = Callable[[Clock, float], Callable[[str], None]]
+
+
+def drive(factory: Factory, keys: int, rate: int, ttl: float) -> tuple[float, object]:
+    clock = Clock()
+    op = factory(clock, ttl)
+    started = time.perf_counter()
+    for i in range(keys):
+        clock.now = i / rate
+        op(f"key-{i}")
+    return time.perf_counter() - started, op
+
+
+def run_case(name: str, factory: Factory, keys: int, rate: int, ttl: float) -> None:
+    gc.collect()
+    elapsed, op = drive(factory, keys, rate, ttl)
+    del op
+    gc.collect()
+
+    tracemalloc.start()
+    _, op = drive(factory, keys, rate, ttl)
+    gc.collect()
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del op
+
+    print(
+        f"{name:<24} retained {current / 2**20:8.1f} MiB   "
+        f"peak {peak / 2**20:8.1f} MiB   {elapsed / keys * 1e6:6.2f} us/op"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--keys", type=int, default=2_000_000)
+    parser.add_argument("--rate", type=int, default=2_000)
+    parser.add_argument("--ttl", type=float, default=60)
+    args = parser.parse_args()
+
+    print(
+        f"{args.keys} distinct keys at {args.rate} keys/s simulated, ttl {args.ttl:g}s"
+    )
+    cases: list[tuple[str, Factory]] = [
+        ("rate limiter (legacy)", legacy_rate_limiter),
+        ("rate limiter (bounded)", bounded_rate_limiter),
+        ("revoked store (legacy)", legacy_revoked_store),
+        ("revoked store (bounded)", bounded_revoked_store),
+    ]
+    for name, factory in cases:
+        run_case(name, factory, args.keys, args.rate, args.ttl)
+
+
+if __name__ == "__main__":
+    main()
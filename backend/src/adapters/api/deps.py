@@ -7,8 +7,14 @@ from uuid import UUID
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 
+from backend.src.adapters.services import (
+    CircuitBreakerRegistry,
+    InMemoryToastHub,
+    LLMCacheStats,
+)
 from backend.src.domain.ports.services import RateLimiter, TokenService
 from backend.src.infrastructure.di import ContainerFactory
+from backend.src.infrastructure.outbox import EmailOutboxDispatcher
 
 security = HTTPBearer()
 
@@ -48,6 +54,10 @@ class JWTUserIdProvider(CurrentUserIdProvider):
 _container_factory: ContainerFactory | None = None
 _current_user_id_provider: CurrentUserIdProvider | None = None
 _rate_limiter: RateLimiter | None = None
+_email_outbox_dispatcher: EmailOutboxDispatcher | None = None
+_toast_hub: InMemoryToastHub | None = None
+_llm_circuit_breakers: CircuitBreakerRegistry | None = None
+_llm_cache_stats: LLMCacheStats | None = None
 
 
 def get_container_factory() -> ContainerFactory:
@@ -77,3 +87,41 @@ def get_rate_limiter() -> RateLimiter | None:
 def set_rate_limiter(rate_limiter: RateLimiter | None) -> None:
     global _rate_limiter
     _rate_limiter = rate_limiter
+
+
+def get_email_outbox_dispatcher() -> EmailOutboxDispatcher | None:
+    return _email_outbox_dispatcher
+
+
+def set_email_outbox_dispatcher(dispatcher: EmailOutboxDispatcher | None) -> None:
+    global _email_outbox_dispatcher
+    _email_outbox_dispatcher = dispatcher
+
+
+def get_toast_hub() -> InMemoryToastHub:
+    if _toast_hub is None:
+        raise RuntimeError("Toast hub not initialized")
+    return _toast_hub
+
+
+def set_toast_hub(hub: InMemoryToastHub | None) -> None:
+    global _toast_hub
+    _toast_hub = hub
+
+
+def get_llm_circuit_breakers() -> CircuitBreakerRegistry | None:
+    return _llm_circuit_breakers
+
+
+def set_llm_circuit_breakers(breakers: CircuitBreakerRegistry | None) -> None:
+    global _llm_circuit_breakers
+    _llm_circuit_breakers = breakers
+
+
+def get_llm_cache_stats() -> LLMCacheStats | None:
+    return _llm_cache_stats
+
+
+def set_llm_cache_stats(stats: LLMCacheStats | None) -> None:
+    global _llm_cache_stats
+    _llm_cache_stats = stats
@@ -0,0 +1,41 @@
+"""Mapping of domain errors to HTTP status codes."""
+
+from fastapi import status
+
+from backend.src.application.use_cases.task_management import BatchCommandError
+from backend.src.domain.errors import (
+    DomainError,
+    ManagerRequiredError,
+    ProjectAccessDeniedError,
+    ProjectNotFoundError,
+    TaskNotAssignedError,
+    TaskNotFoundError,
+    TaskNotOwnedError,
+    TaskNotSelectableError,
+    WorkloadExceededError,
+)
+
+_STATUS_OVERRIDES: dict[type[DomainError], int] = {
+    TaskNotFoundError: status.HTTP_404_NOT_FOUND,
+    ProjectNotFoundError: status.HTTP_404_NOT_FOUND,
+    ManagerRequiredError: status.HTTP_403_FORBIDDEN,
+    ProjectAccessDeniedError: status.HTTP_403_FORBIDDEN,
+    TaskNotOwnedError: status.HTTP_403_FORBIDDEN,
+    TaskNotSelectableError: status.HTTP_422_UNPROCESSABLE_ENTITY,
+    WorkloadExceededError: status.HTTP_422_UNPROCESSABLE_ENTITY,
+    TaskNotAssignedError: status.HTTP_422_UNPROCESSABLE_ENTITY,
+}
+
+
+def http_status_for(exc: DomainError | ValueError) -> int:
+    """Return the HTTP status code used to report an error."""
+    if isinstance(exc, BatchCommandError):
+        exc = exc.cause
+    if isinstance(exc, DomainError):
+        return _STATUS_OVERRIDES.get(type(exc), exc.status)
+    return status.HTTP_400_BAD_REQUEST
+
+
+def error_detail(exc: DomainError | ValueError) -> str:
+    """Return the client-facing message of an error."""
+    return exc.message if isinstance(exc, DomainError) else str(exc)
@@ -4,24 +4,39 @@ from __future__ import annotations
 
 from uuid import uuid4
 
-from fastapi import Request
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.responses import Response
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 from backend.src.observability.logging_context import reset_request_id, set_request_id
 
 
-class RequestIdMiddleware(BaseHTTPMiddleware):
-    """Ensure every request has a correlation ID."""
+class RequestIdMiddleware:
+    """
+    Ensure every request has a correlation ID.
+
+    Implemented as plain ASGI so responses, including streaming ones, are
+    passed through untouched apart from the added header.
+    """
 
     header_name = "X-Request-Id"
 
-    async def dispatch(self, request: Request, call_next) -> Response:
-        request_id = request.headers.get(self.header_name) or str(uuid4())
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        request_id = Headers(scope=scope).get(self.header_name) or str(uuid4())
+
+        async def send_with_request_id(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                MutableHeaders(scope=message)[self.header_name] = request_id
+            await send(message)
+
         token = set_request_id(request_id)
         try:
-            response = await call_next(request)
+            await self.app(scope, receive, send_with_request_id)
         finally:
             reset_request_id(token)
-        response.headers[self.header_name] = request_id
-        return response
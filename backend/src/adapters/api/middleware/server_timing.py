@@ -0,0 +1,89 @@
+"""Server-Timing instrumentation for API requests."""
+
+from __future__ import annotations
+
+import functools
+import inspect
+from collections.abc import Callable
+from typing import Any
+
+from fastapi.routing import APIRoute
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from backend.src.observability.server_timing import (
+    measure_endpoint,
+    reset_request_timing,
+    start_request_timing,
+)
+
+
+class ServerTimingMiddleware:
+    """
+    Add a Server-Timing header breaking request latency down by phase.
+
+    Phases are auth, db (with query count), domain and serialize, plus the
+    total time until the response started. Streaming bodies are not held
+    back: the header reflects the work done before the first byte.
+    """
+
+    header_name = "Server-Timing"
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        timing, token = start_request_timing()
+
+        async def send_with_timing(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                MutableHeaders(scope=message).append(
+                    self.header_name, timing.header_value()
+                )
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            reset_request_timing(token)
+
+
+def _timed_endpoint(endpoint: Callable[..., Any]) -> Callable[..., Any]:
+    """Wrap an endpoint so its body is reported as domain time."""
+    if getattr(endpoint, "__server_timing__", False):
+        return endpoint
+
+    # FastAPI inspects the unwrapped signature, and runs sync endpoints in a
+    # threadpool, so the wrapper must keep the endpoint's calling convention.
+    if inspect.iscoroutinefunction(endpoint):
+
+        @functools.wraps(endpoint)
+        async def wrapper(*args: Any, **kwargs: Any) -> Any:
+            with measure_endpoint():
+                return await endpoint(*args, **kwargs)
+
+    elif inspect.isfunction(endpoint) and not (
+        inspect.isgeneratorfunction(endpoint) or inspect.isasyncgenfunction(endpoint)
+    ):
+
+        @functools.wraps(endpoint)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            with measure_endpoint():
+                return endpoint(*args, **kwargs)
+
+    else:
+        return endpoint
+
+    wrapper.__server_timing__ = True  # type: ignore[attr-defined]
+    return wrapper
+
+
+class TimedRoute(APIRoute):
+    """APIRoute that separates endpoint time from response serialization."""
+
+    def __init__(self, path: str, endpoint: Callable[..., Any], **kwargs: Any) -> None:
+        super().__init__(path, _timed_endpoint(endpoint), **kwargs)
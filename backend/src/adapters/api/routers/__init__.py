@@ -1,17 +1,27 @@
 """API routers."""
 
 from backend.src.adapters.api.routers.auth import router as auth_router
+from backend.src.adapters.api.routers.batch import router as batch_router
+from backend.src.adapters.api.routers.exports import router as exports_router
 from backend.src.adapters.api.routers.invites import router as invites_router
 from backend.src.adapters.api.routers.members import router as members_router
+from backend.src.adapters.api.routers.notifications import (
+    router as notifications_router,
+)
 from backend.src.adapters.api.routers.projects import router as projects_router
 from backend.src.adapters.api.routers.roles import router as roles_router
+from backend.src.adapters.api.routers.snapshot import router as snapshot_router
 from backend.src.adapters.api.routers.tasks import router as tasks_router
 
 __all__ = [
     "auth_router",
+    "batch_router",
+    "exports_router",
     "invites_router",
     "members_router",
+    "notifications_router",
     "projects_router",
     "roles_router",
+    "snapshot_router",
     "tasks_router",
 ]
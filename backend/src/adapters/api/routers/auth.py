@@ -6,14 +6,15 @@ from uuid import UUID
 from fastapi import APIRouter, Depends, HTTPException, Request, status
 from pydantic import BaseModel, EmailStr, Field
 
-from backend.src.adapters.api.routers.common import get_container
+from backend.src.adapters.api.middleware.server_timing import TimedRoute
+from backend.src.adapters.api.routers.common import enforce_rate_limit, get_container
 from backend.src.adapters.api import deps
 from backend.src.application.use_cases.auth.request_magic_link import RequestMagicLinkInput
 from backend.src.config.settings import get_settings
 from backend.src.infrastructure.di import Container
 from backend.src.adapters.services import MockEmailService
 
-router = APIRouter(prefix="/auth", tags=["auth"])
+router = APIRouter(prefix="/auth", tags=["auth"], route_class=TimedRoute)
 
 
 class MagicLinkRequest(BaseModel):
@@ -54,22 +55,12 @@ async def _apply_rate_limit(
     limit: int,
     window_seconds: int,
 ) -> None:
-    limiter = deps.get_rate_limiter()
-    if limiter is None:
-        return
     client_ip = request.client.host if request.client else "unknown"
-    result = await limiter.hit(
+    await enforce_rate_limit(
         key=f"{bucket}:{client_ip}",
         limit=limit,
         window_seconds=window_seconds,
     )
-    if not result.allowed:
-        retry_after = result.retry_after_seconds or window_seconds
-        raise HTTPException(
-            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
-            detail="Rate limit exceeded",
-            headers={"Retry-After": str(retry_after)},
-        )
 
 
 @router.post("/magic-link", status_code=status.HTTP_204_NO_CONTENT)
@@ -166,8 +157,13 @@ async def get_last_magic_link() -> DebugMagicLinkResponse:
             detail="EMAIL_PROVIDER must be set to mock",
         )
 
-    factory = deps.get_container_factory()
-    email_service = factory.get_email_service()
+    dispatcher = deps.get_email_outbox_dispatcher()
+    if dispatcher is not None:
+        # Deliver anything still queued so the latest link is visible.
+        await dispatcher.drain()
+        email_service = dispatcher.transport
+    else:
+        email_service = deps.get_container_factory().get_email_service()
     if not isinstance(email_service, MockEmailService):
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
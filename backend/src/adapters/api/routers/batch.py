@@ -0,0 +1,113 @@
+"""Batched task command API endpoints."""
+
+from typing import Annotated
+from uuid import UUID
+
+from fastapi import APIRouter, Depends
+from pydantic import BaseModel, Field
+
+from backend.src.adapters.api.errors import error_detail, http_status_for
+from backend.src.adapters.api.middleware.server_timing import TimedRoute
+from backend.src.adapters.api.routers.common import get_container, get_current_user_id
+from backend.src.adapters.api.routers.tasks import ErrorResponse, TaskResponse
+from backend.src.application.use_cases.task_management import (
+    BatchCommand,
+    BatchMode,
+    BatchOperation,
+    RunTaskBatchInput,
+)
+from backend.src.infrastructure.di import Container
+
+router = APIRouter(
+    prefix="/projects/{project_id}/batch",
+    tags=["tasks"],
+    route_class=TimedRoute,
+)
+
+MAX_BATCH_COMMANDS = 200
+
+
+class BatchCommandRequest(BaseModel):
+    """A single task command. For dependency commands task_id is the blocked task."""
+
+    op: BatchOperation
+    task_id: UUID
+    blocking_task_id: UUID | None = None
+    reason: str = Field(default="", max_length=1000)
+
+
+class BatchRequest(BaseModel):
+    """Request body for running task commands in order."""
+
+    mode: BatchMode = BatchMode.ATOMIC
+    commands: list[BatchCommandRequest] = Field(
+        ..., min_length=1, max_length=MAX_BATCH_COMMANDS
+    )
+
+
+class BatchCommandResponse(BaseModel):
+    index: int
+    op: BatchOperation
+    ok: bool
+    task: TaskResponse | None = None
+    error: str | None = None
+    status_code: int | None = None
+
+
+class BatchResponse(BaseModel):
+    results: list[BatchCommandResponse]
+
+
+@router.post(
+    "",
+    response_model=BatchResponse,
+    responses={
+        400: {"model": ErrorResponse, "description": "A command failed (atomic mode)"},
+        403: {"model": ErrorResponse, "description": "Not a project member"},
+        404: {"model": ErrorResponse, "description": "Project not found"},
+    },
+)
+async def run_batch(
+    project_id: UUID,
+    request: BatchRequest,
+    container: Annotated[Container, Depends(get_container)],
+    user_id: Annotated[UUID, Depends(get_current_user_id)],
+) -> BatchResponse:
+    """
+    Run select, complete, abandon, cancel, delete and dependency commands in order.
+
+    All commands share one transaction and one authorization pass, and the
+    schedule is recalculated at most once. In `atomic` mode the first failing
+    command aborts the batch with that command's error; in `partial` mode
+    failures are reported per command and the successful ones are committed.
+    """
+    use_case = container.run_task_batch_use_case()
+    output = await use_case.execute(
+        RunTaskBatchInput(
+            project_id=project_id,
+            user_id=user_id,
+            mode=request.mode,
+            commands=[
+                BatchCommand(
+                    operation=command.op,
+                    task_id=command.task_id,
+                    blocking_task_id=command.blocking_task_id,
+                    reason=command.reason,
+                )
+                for command in request.commands
+            ],
+        )
+    )
+    return BatchResponse(
+        results=[
+            BatchCommandResponse(
+                index=result.index,
+                op=result.operation,
+                ok=result.ok,
+                task=TaskResponse.from_entity(result.task) if result.task else None,
+                error=error_detail(result.error) if result.error else None,
+                status_code=http_status_for(result.error) if result.error else None,
+            )
+            for result in output.results
+        ]
+    )
@@ -2,16 +2,22 @@
 
 from __future__ import annotations
 
+from collections.abc import Awaitable, Callable
+from enum import Enum
 from typing import Annotated
 from uuid import UUID
 
-from fastapi import Depends, HTTPException, status
+from fastapi import Depends, HTTPException, Request, Response, status
 from fastapi.security import HTTPAuthorizationCredentials
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from backend.src.adapters.api import deps
+from backend.src.application.use_cases.project_management import GetProjectVersionInput
+from backend.src.config.settings import get_settings
+from backend.src.domain.ports.services import RateLimitAlgorithm
 from backend.src.infrastructure.db.session import get_db
 from backend.src.infrastructure.di import Container, ContainerFactory
+from backend.src.observability.server_timing import measure
 
 
 async def get_container(
@@ -32,4 +38,123 @@ async def get_current_user_id(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Authentication not configured",
         )
-    return await provider.get_user_id(auth)
+    with measure("auth"):
+        return await provider.get_user_id(auth)
+
+
+def _etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """Weak comparison of an If-None-Match header against an entity tag."""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    opaque = etag.removeprefix("W/")
+    return any(
+        candidate.strip().removeprefix("W/") == opaque
+        for candidate in if_none_match.split(",")
+    )
+
+
+async def get_project_cache_headers(
+    project_id: UUID,
+    request: Request,
+    response: Response,
+    container: Annotated[Container, Depends(get_container)],
+    user_id: Annotated[UUID, Depends(get_current_user_id)],
+) -> dict[str, str]:
+    """
+    Conditional-GET support for project-scoped reads.
+
+    Looks up the project version with a single indexed query and answers a
+    matching If-None-Match with 304 before the endpoint loads anything else.
+    Otherwise the ETag is set on the response and the headers are returned
+    for endpoints that build their own Response. If the project is missing
+    or not accessible, nothing is set and the endpoint reports the error.
+    """
+    use_case = container.get_project_version_use_case()
+    version = await use_case.execute(
+        GetProjectVersionInput(project_id=project_id, requester_id=user_id)
+    )
+    if version is None:
+        return {}
+
+    headers = {"ETag": f'W/"{version}"', "Cache-Control": "private, no-cache"}
+    if _etag_matches(request.headers.get("if-none-match"), headers["ETag"]):
+        raise HTTPException(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    response.headers.update(headers)
+    return headers
+
+
+async def enforce_rate_limit(
+    key: str,
+    limit: int,
+    window_seconds: int,
+    algorithm: RateLimitAlgorithm = RateLimitAlgorithm.SLIDING_WINDOW,
+) -> None:
+    """Count a hit against `key` and answer 429 once the limit is reached."""
+    limiter = deps.get_rate_limiter()
+    if limiter is None or limit <= 0:
+        return
+    result = await limiter.hit(
+        key=key,
+        limit=limit,
+        window_seconds=window_seconds,
+        algorithm=algorithm,
+    )
+    if not result.allowed:
+        retry_after = result.retry_after_seconds or window_seconds
+        raise HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail="Rate limit exceeded",
+            headers={"Retry-After": str(retry_after)},
+        )
+
+
+class RateLimitScope(str, Enum):
+    """What a rate-limit bucket is keyed by."""
+
+    USER = "user"
+    PROJECT = "project"
+
+
+def rate_limit(
+    bucket: str,
+    *,
+    per: RateLimitScope,
+    limit: int | None = None,
+    window_seconds: int | None = None,
+    algorithm: RateLimitAlgorithm = RateLimitAlgorithm.SLIDING_WINDOW,
+) -> Callable[..., Awaitable[None]]:
+    """
+    Build a dependency that rate-limits authenticated requests.
+
+    Usable on a route, a router or `include_router`. Buckets are keyed by
+    the current user or by the `project_id` path parameter (routes without
+    one are not limited per project). Limit and window default to the
+    API-wide settings for the scope; a limit of 0 disables the check.
+    """
+
+    async def dependency(
+        request: Request,
+        user_id: Annotated[UUID, Depends(get_current_user_id)],
+    ) -> None:
+        settings = get_settings()
+        if per == RateLimitScope.USER:
+            subject: object = user_id
+            default_limit = settings.api_user_rate_limit
+            default_window = settings.api_user_rate_window_seconds
+        else:
+            subject = request.path_params.get("project_id")
+            if subject is None:
+                return
+            default_limit = settings.api_project_rate_limit
+            default_window = settings.api_project_rate_window_seconds
+
+        await enforce_rate_limit(
+            key=f"{bucket}:{per.value}:{subject}",
+            limit=default_limit if limit is None else limit,
+            window_seconds=default_window if window_seconds is None else window_seconds,
+            algorithm=algorithm,
+        )
+
+    return dependency
@@ -0,0 +1,222 @@
+"""Streaming project export API endpoints."""
+
+import csv
+import io
+import json
+import zlib
+from collections.abc import AsyncIterator, Callable
+from datetime import datetime
+from enum import Enum
+from typing import Annotated, Any
+from uuid import UUID
+
+from fastapi import APIRouter, Depends, Query
+from fastapi.responses import StreamingResponse
+
+from backend.src.adapters.api.middleware.server_timing import TimedRoute
+from backend.src.adapters.api.routers.common import (
+    get_container,
+    get_current_user_id,
+    get_project_cache_headers,
+)
+from backend.src.application.use_cases.project_management import (
+    ExportProjectDataInput,
+    ExportResource,
+)
+from backend.src.domain.entities import Task, TaskDependency, TaskLog
+from backend.src.infrastructure.di import Container
+
+router = APIRouter(
+    prefix="/projects/{project_id}/export",
+    tags=["exports"],
+    route_class=TimedRoute,
+)
+
+# Encoded rows are coalesced into chunks of roughly this size before being
+# written to the socket (or the gzip stream).
+CHUNK_SIZE = 64 * 1024
+
+
+class ExportFormat(str, Enum):
+    NDJSON = "ndjson"
+    CSV = "csv"
+
+
+_MEDIA_TYPES = {
+    ExportFormat.NDJSON: "application/x-ndjson",
+    ExportFormat.CSV: "text/csv; charset=utf-8",
+}
+
+
+def _task_row(task: Task) -> dict[str, Any]:
+    return {
+        "id": task.id,
+        "project_id": task.project_id,
+        "title": task.title,
+        "description": task.description,
+        "difficulty_points": task.difficulty_points,
+        "status": task.status.value,
+        "assignee_id": task.assignee_id,
+        "required_role_id": task.required_role_id,
+        "progress_percent": task.progress_percent,
+        "expected_start_date": task.expected_start_date,
+        "expected_end_date": task.expected_end_date,
+        "actual_end_date": task.actual_end_date,
+        "created_at": task.created_at,
+        "updated_at": task.updated_at,
+    }
+
+
+def _dependency_row(dependency: TaskDependency) -> dict[str, Any]:
+    return {
+        "blocking_task_id": dependency.blocking_task_id,
+        "blocked_task_id": dependency.blocked_task_id,
+        "created_at": dependency.created_at,
+    }
+
+
+def _log_row(log: TaskLog) -> dict[str, Any]:
+    return {
+        "id": log.id,
+        "task_id": log.task_id,
+        "author_id": log.author_id,
+        "log_type": log.log_type.value,
+        "content": log.content,
+        "created_at": log.created_at,
+    }
+
+
+_ROW_BUILDERS: dict[ExportResource, Callable[[Any], dict[str, Any]]] = {
+    ExportResource.TASKS: _task_row,
+    ExportResource.DEPENDENCIES: _dependency_row,
+    ExportResource.LOGS: _log_row,
+}
+
+
+def _to_text(value: Any) -> Any:
+    if value is None:
+        return ""
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, UUID):
+        return str(value)
+    return value
+
+
+def _json_default(value: Any) -> str:
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, UUID):
+        return str(value)
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+async def encode_ndjson(rows: AsyncIterator[dict[str, Any]]) -> AsyncIterator[str]:
+    """Encode rows as newline-delimited JSON."""
+    async for row in rows:
+        yield json.dumps(row, default=_json_default, ensure_ascii=False) + "\n"
+
+
+async def encode_csv(rows: AsyncIterator[dict[str, Any]]) -> AsyncIterator[str]:
+    """Encode rows as CSV, using the first row's keys as the header."""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    header_written = False
+    async for row in rows:
+        if not header_written:
+            writer.writerow(row.keys())
+            header_written = True
+        writer.writerow(_to_text(value) for value in row.values())
+        yield buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate()
+
+
+async def coalesce(
+    pieces: AsyncIterator[str], chunk_size: int = CHUNK_SIZE
+) -> AsyncIterator[bytes]:
+    """Join small encoded rows into larger byte chunks."""
+    parts: list[bytes] = []
+    size = 0
+    async for piece in pieces:
+        data = piece.encode("utf-8")
+        parts.append(data)
+        size += len(data)
+        if size >= chunk_size:
+            yield b"".join(parts)
+            parts.clear()
+            size = 0
+    if parts:
+        yield b"".join(parts)
+
+
+async def gzip_stream(chunks: AsyncIterator[bytes]) -> AsyncIterator[bytes]:
+    """Compress a byte stream on the fly into a single gzip member."""
+    compressor = zlib.compressobj(6, zlib.DEFLATED, zlib.MAX_WBITS | 16)
+    async for chunk in chunks:
+        compressed = compressor.compress(chunk)
+        if compressed:
+            yield compressed
+    yield compressor.flush()
+
+
+@router.get(
+    "/{resource}",
+    response_class=StreamingResponse,
+    responses={
+        200: {
+            "content": {media_type: {} for media_type in _MEDIA_TYPES.values()},
+            "description": "Streamed export of the requested records",
+        },
+        304: {"description": "Project unchanged since the If-None-Match ETag"},
+        403: {"description": "Not a project member"},
+        404: {"description": "Project not found"},
+    },
+)
+async def export_project_data(
+    project_id: UUID,
+    resource: ExportResource,
+    container: Annotated[Container, Depends(get_container)],
+    user_id: Annotated[UUID, Depends(get_current_user_id)],
+    cache_headers: Annotated[dict[str, str], Depends(get_project_cache_headers)],
+    format: ExportFormat = Query(ExportFormat.NDJSON),
+    gzip: bool = Query(False, description="Compress the stream with gzip"),
+) -> StreamingResponse:
+    """
+    Stream every task, dependency or log entry of a project as NDJSON or CSV.
+
+    Records are read through a server-side cursor, so memory use does not
+    depend on the size of the project.
+    """
+    use_case = container.export_project_data_use_case()
+    records = use_case.execute(
+        ExportProjectDataInput(
+            project_id=project_id,
+            requester_id=user_id,
+            resource=resource,
+        )
+    )
+    # Pull the first record now so authorization errors become regular error
+    # responses instead of a truncated stream.
+    first = await anext(records, None)
+    build_row = _ROW_BUILDERS[resource]
+
+    async def rows() -> AsyncIterator[dict[str, Any]]:
+        if first is None:
+            return
+        yield build_row(first)
+        async for record in records:
+            yield build_row(record)
+
+    encode = encode_csv if format is ExportFormat.CSV else encode_ndjson
+    body = coalesce(encode(rows()))
+    filename = f"{project_id}-{resource.value}.{format.value}"
+    headers = {
+        **cache_headers,
+        "Content-Disposition": f'attachment; filename="{filename}"',
+    }
+    if gzip:
+        body = gzip_stream(body)
+        headers["Content-Encoding"] = "gzip"
+
+    return StreamingResponse(body, media_type=_MEDIA_TYPES[format], headers=headers)
@@ -7,12 +7,13 @@ from uuid import UUID
 from fastapi import APIRouter, Depends, status
 from pydantic import BaseModel, Field
 
+from backend.src.adapters.api.middleware.server_timing import TimedRoute
 from backend.src.adapters.api.routers.common import get_container, get_current_user_id
 from backend.src.application.use_cases.invitations import AcceptInviteInput, CreateInviteInput
 from backend.src.domain.entities import ProjectInvite, ProjectMember, SeniorityLevel
 from backend.src.infrastructure.di import Container
 
-router = APIRouter(tags=["invites"])
+router = APIRouter(tags=["invites"], route_class=TimedRoute)
 
 
 class CreateInviteRequest(BaseModel):
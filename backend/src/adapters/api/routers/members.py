@@ -1,20 +1,31 @@
 """Project membership API endpoints."""
 
-from typing import Annotated
+from typing import Annotated, Any
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, Query, status
 from pydantic import BaseModel
 
-from backend.src.adapters.api.routers.common import get_container, get_current_user_id
+from backend.src.adapters.api.middleware.server_timing import TimedRoute
+from backend.src.adapters.api.responses import ORJSONResponse, paginated
+from backend.src.adapters.api.routers.common import (
+    get_container,
+    get_current_user_id,
+    get_project_cache_headers,
+)
 from backend.src.application.use_cases.project_management import (
     FireEmployeeInput,
+    EnrichedMember,
     ListProjectMembersInput,
     ResignFromProjectInput,
 )
 from backend.src.infrastructure.di import Container
 
-router = APIRouter(prefix="/projects/{project_id}/members", tags=["members"])
+router = APIRouter(
+    prefix="/projects/{project_id}/members",
+    tags=["members"],
+    route_class=TimedRoute,
+)
 
 
 class MemberResponse(BaseModel):
@@ -28,6 +39,21 @@ class MemberResponse(BaseModel):
     user_email: str
     role_name: str
 
+    @staticmethod
+    def row(member: EnrichedMember) -> dict[str, Any]:
+        """Unvalidated JSON row for ORJSONResponse; built from valid entities."""
+        return {
+            "id": member.id,
+            "project_id": member.project_id,
+            "user_id": member.user_id,
+            "role_id": member.role_id,
+            "seniority_level": member.seniority_level,
+            "joined_at": member.joined_at,
+            "user_name": member.user_name,
+            "user_email": member.user_email,
+            "role_name": member.role_name,
+        }
+
 
 class PaginatedMembersResponse(BaseModel):
     items: list[MemberResponse]
@@ -40,14 +66,15 @@ class UnassignedTasksResponse(BaseModel):
     unassigned_task_ids: list[UUID]
 
 
-@router.get("", response_model=PaginatedMembersResponse)
+@router.get("", response_model=PaginatedMembersResponse, response_class=ORJSONResponse)
 async def list_project_members(
     project_id: UUID,
     container: Annotated[Container, Depends(get_container)],
     user_id: Annotated[UUID, Depends(get_current_user_id)],
+    cache_headers: Annotated[dict[str, str], Depends(get_project_cache_headers)],
     limit: int = Query(50, ge=1, le=200),
     offset: int = Query(0, ge=0),
-) -> PaginatedMembersResponse:
+) -> ORJSONResponse:
     use_case = container.list_project_members_use_case()
     result = await use_case.execute(
         ListProjectMembersInput(
@@ -57,24 +84,14 @@ async def list_project_members(
             offset=offset,
         )
     )
-    return PaginatedMembersResponse(
-        items=[
-            MemberResponse(
-                id=m.id,
-                project_id=m.project_id,
-                user_id=m.user_id,
-                role_id=m.role_id,
-                seniority_level=m.seniority_level,
-                joined_at=m.joined_at,
-                user_name=m.user_name,
-                user_email=m.user_email,
-                role_name=m.role_name,
-            )
-            for m in result.items
-        ],
-        total=result.total,
-        limit=limit,
-        offset=offset,
+    return ORJSONResponse(
+        paginated(
+            [MemberResponse.row(m) for m in result.items],
+            total=result.total,
+            limit=limit,
+            offset=offset,
+        ),
+        headers=cache_headers,
     )
 
 
@@ -0,0 +1,69 @@
+"""In-app notification stream endpoints."""
+
+import asyncio
+from collections.abc import AsyncIterator
+from typing import Annotated
+from uuid import UUID
+
+from fastapi import APIRouter, Depends
+from fastapi.responses import StreamingResponse
+
+from backend.src.adapters.api import deps
+from backend.src.adapters.api.middleware.server_timing import TimedRoute
+from backend.src.adapters.api.routers.common import get_current_user_id
+from backend.src.adapters.services import InMemoryToastHub
+from backend.src.config.settings import AppSettings, get_settings
+
+router = APIRouter(
+    prefix="/notifications", tags=["notifications"], route_class=TimedRoute
+)
+
+# Reconnect delay for SSE readers that honour the `retry` field.
+_RETRY_MS = 5000
+
+
+async def toast_events(
+    hub: InMemoryToastHub, user_id: UUID, heartbeat_seconds: float
+) -> AsyncIterator[str]:
+    """Yield SSE frames for the user's toasts, with comment heartbeats."""
+    with hub.subscribe(user_id) as subscription:
+        yield f"retry: {_RETRY_MS}\n\n"
+        while True:
+            try:
+                async with asyncio.timeout(heartbeat_seconds):
+                    event = await subscription.get()
+            except TimeoutError:
+                # Keeps proxies from closing the idle connection.
+                yield ": keep-alive\n\n"
+                continue
+            yield f"event: new_task\ndata: {event}\n\n"
+
+
+@router.get(
+    "/stream",
+    response_class=StreamingResponse,
+    responses={
+        200: {
+            "content": {"text/event-stream": {}},
+            "description": "Server-sent events, one `new_task` event per toast",
+        },
+    },
+)
+async def stream_notifications(
+    user_id: Annotated[UUID, Depends(get_current_user_id)],
+    hub: Annotated[InMemoryToastHub, Depends(deps.get_toast_hub)],
+    settings: Annotated[AppSettings, Depends(get_settings)],
+) -> StreamingResponse:
+    """
+    Stream the current user's new-task toasts (BR-NOTIF-003).
+
+    Toasts are only delivered while the stream is open; clients that
+    reconnect should refresh the task list to catch up. Clients read it
+    with `fetch` (or a fetch-based SSE reader), since the endpoint needs the
+    bearer `Authorization` header, which `EventSource` cannot send.
+    """
+    return StreamingResponse(
+        toast_events(hub, user_id, settings.toast_heartbeat_seconds),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
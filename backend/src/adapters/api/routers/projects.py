@@ -1,13 +1,19 @@
 """Project management API endpoints."""
 
 from datetime import date, datetime
-from typing import Annotated
+from typing import Annotated, Any
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, Query, status
 from pydantic import BaseModel, Field
 
-from backend.src.adapters.api.routers.common import get_container, get_current_user_id
+from backend.src.adapters.api.middleware.server_timing import TimedRoute
+from backend.src.adapters.api.responses import ORJSONResponse, paginated
+from backend.src.adapters.api.routers.common import (
+    get_container,
+    get_current_user_id,
+    get_project_cache_headers,
+)
 from backend.src.application.use_cases.project_management import (
     ConfigureCalendarInput,
     ConfigureProjectLLMInput,
@@ -18,7 +24,7 @@ from backend.src.application.use_cases.project_management import (
 from backend.src.domain.entities import Project
 from backend.src.infrastructure.di import Container
 
-router = APIRouter(prefix="/projects", tags=["projects"])
+router = APIRouter(prefix="/projects", tags=["projects"], route_class=TimedRoute)
 
 
 class CreateProjectRequest(BaseModel):
@@ -36,14 +42,19 @@ class ProjectResponse(BaseModel):
 
     @classmethod
     def from_entity(cls, project: Project) -> "ProjectResponse":
-        return cls(
-            id=project.id,
-            name=project.name,
-            description=project.description,
-            manager_id=project.manager_id,
-            expected_end_date=project.expected_end_date,
-            created_at=project.created_at,
-        )
+        return cls(**cls.row(project))
+
+    @staticmethod
+    def row(project: Project) -> dict[str, Any]:
+        """Unvalidated JSON row for ORJSONResponse; the entity is already valid."""
+        return {
+            "id": project.id,
+            "name": project.name,
+            "description": project.description,
+            "manager_id": project.manager_id,
+            "expected_end_date": project.expected_end_date,
+            "created_at": project.created_at,
+        }
 
 
 class ProjectDetailsResponse(BaseModel):
@@ -68,22 +79,24 @@ class PaginatedProjectsResponse(BaseModel):
     offset: int
 
 
-@router.get("", response_model=PaginatedProjectsResponse)
+@router.get("", response_model=PaginatedProjectsResponse, response_class=ORJSONResponse)
 async def list_projects(
     container: Annotated[Container, Depends(get_container)],
     user_id: Annotated[UUID, Depends(get_current_user_id)],
     limit: int = Query(20, ge=1, le=200),
     offset: int = Query(0, ge=0),
-) -> PaginatedProjectsResponse:
+) -> ORJSONResponse:
     use_case = container.list_user_projects_use_case()
     result = await use_case.execute(
         ListUserProjectsInput(user_id=user_id, limit=limit, offset=offset)
     )
-    return PaginatedProjectsResponse(
-        items=[ProjectResponse.from_entity(p) for p in result.items],
-        total=result.total,
-        limit=limit,
-        offset=offset,
+    return ORJSONResponse(
+        paginated(
+            [ProjectResponse.row(p) for p in result.items],
+            total=result.total,
+            limit=limit,
+            offset=offset,
+        )
     )
 
 
@@ -104,7 +117,11 @@ async def create_project(
     return ProjectResponse.from_entity(project)
 
 
-@router.get("/{project_id}", response_model=ProjectDetailsResponse)
+@router.get(
+    "/{project_id}",
+    response_model=ProjectDetailsResponse,
+    dependencies=[Depends(get_project_cache_headers)],
+)
 async def get_project_details(
     project_id: UUID,
     container: Annotated[Container, Depends(get_container)],
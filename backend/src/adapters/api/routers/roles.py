@@ -7,12 +7,17 @@ from uuid import UUID
 from fastapi import APIRouter, Depends, status
 from pydantic import BaseModel, Field
 
+from backend.src.adapters.api.middleware.server_timing import TimedRoute
 from backend.src.adapters.api.routers.common import get_container, get_current_user_id
 from backend.src.application.use_cases.project_management import CreateRoleInput
 from backend.src.domain.entities import Role
 from backend.src.infrastructure.di import Container
 
-router = APIRouter(prefix="/projects/{project_id}/roles", tags=["roles"])
+router = APIRouter(
+    prefix="/projects/{project_id}/roles",
+    tags=["roles"],
+    route_class=TimedRoute,
+)
 
 
 class CreateRoleRequest(BaseModel):
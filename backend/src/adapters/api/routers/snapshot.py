@@ -0,0 +1,132 @@
+"""Project snapshot API endpoint."""
+
+from datetime import date, datetime
+from typing import Annotated, Any
+from uuid import UUID
+
+from fastapi import APIRouter, Depends, Query
+from pydantic import BaseModel
+
+from backend.src.adapters.api.middleware.server_timing import TimedRoute
+from backend.src.adapters.api.responses import ORJSONResponse
+from backend.src.adapters.api.routers.common import (
+    get_container,
+    get_current_user_id,
+    get_project_cache_headers,
+)
+from backend.src.adapters.api.routers.members import MemberResponse
+from backend.src.adapters.api.routers.projects import ProjectResponse
+from backend.src.adapters.api.routers.tasks import ErrorResponse, TaskResponse
+from backend.src.application.use_cases.project_management import (
+    GetProjectSnapshotInput,
+    SnapshotSection,
+)
+from backend.src.infrastructure.di import Container
+
+router = APIRouter(
+    prefix="/projects/{project_id}/snapshot",
+    tags=["projects"],
+    route_class=TimedRoute,
+)
+
+
+class CalendarResponse(BaseModel):
+    timezone: str
+    working_weekdays: list[int]
+    exclusion_dates: list[date]
+
+
+class DependencyResponse(BaseModel):
+    blocking_task_id: UUID
+    blocked_task_id: UUID
+
+
+class CriticalPathResponse(BaseModel):
+    task_ids: list[UUID]
+    project_end_date: datetime | None
+
+
+class ProjectSnapshotResponse(BaseModel):
+    """Board snapshot; sections left out of `fields` are omitted."""
+
+    is_manager: bool
+    project: ProjectResponse | None = None
+    calendar: CalendarResponse | None = None
+    members: list[MemberResponse] | None = None
+    tasks: list[TaskResponse] | None = None
+    dependencies: list[DependencyResponse] | None = None
+    critical_path: CriticalPathResponse | None = None
+
+
+def parse_sections(fields: str | None) -> frozenset[SnapshotSection]:
+    """Parse a comma-separated section whitelist; empty means everything."""
+    if not fields:
+        return frozenset(SnapshotSection)
+    return frozenset(
+        SnapshotSection(name.strip()) for name in fields.split(",") if name.strip()
+    )
+
+
+@router.get(
+    "",
+    response_model=ProjectSnapshotResponse,
+    response_class=ORJSONResponse,
+    responses={
+        304: {"description": "Project unchanged since the If-None-Match ETag"},
+        400: {"model": ErrorResponse, "description": "Unknown field in whitelist"},
+        403: {"model": ErrorResponse, "description": "Not a project member"},
+        404: {"model": ErrorResponse, "description": "Project not found"},
+    },
+)
+async def get_project_snapshot(
+    project_id: UUID,
+    container: Annotated[Container, Depends(get_container)],
+    user_id: Annotated[UUID, Depends(get_current_user_id)],
+    cache_headers: Annotated[dict[str, str], Depends(get_project_cache_headers)],
+    fields: str | None = Query(
+        None,
+        description=(
+            "Comma-separated sections to include: "
+            + ", ".join(s.value for s in SnapshotSection)
+        ),
+    ),
+) -> ORJSONResponse:
+    """
+    Return project, calendar, members, tasks, dependencies and critical path.
+
+    The snapshot is loaded with a fixed number of queries and its rows are
+    serialized straight to JSON in a single orjson pass.
+    """
+    sections = parse_sections(fields)
+    use_case = container.get_project_snapshot_use_case()
+    result = await use_case.execute(
+        GetProjectSnapshotInput(
+            project_id=project_id, requester_id=user_id, sections=sections
+        )
+    )
+
+    snapshot: dict[str, Any] = {"is_manager": result.is_manager}
+    if SnapshotSection.PROJECT in sections:
+        snapshot["project"] = ProjectResponse.row(result.project)
+    if SnapshotSection.CALENDAR in sections:
+        snapshot["calendar"] = {
+            "timezone": result.calendar.timezone,
+            "working_weekdays": sorted(result.calendar.working_weekdays),
+            "exclusion_dates": sorted(result.calendar.exclusion_dates),
+        }
+    if SnapshotSection.MEMBERS in sections:
+        snapshot["members"] = [MemberResponse.row(m) for m in result.members]
+    if SnapshotSection.TASKS in sections:
+        snapshot["tasks"] = [TaskResponse.row(t) for t in result.tasks]
+    if SnapshotSection.DEPENDENCIES in sections:
+        snapshot["dependencies"] = [
+            {"blocking_task_id": d.blocking_task_id, "blocked_task_id": d.blocked_task_id}
+            for d in result.dependencies
+        ]
+    if SnapshotSection.CRITICAL_PATH in sections:
+        snapshot["critical_path"] = {
+            "task_ids": result.critical_path,
+            "project_end_date": result.project_end_date,
+        }
+
+    return ORJSONResponse(snapshot, headers=cache_headers)
@@ -1,10 +1,21 @@
 """Task management API endpoints."""
 
+import csv
+import io
+import json
+from collections.abc import AsyncIterator
 from datetime import datetime
-from typing import Annotated
+from typing import Annotated, Any
 from uuid import UUID
 
-from backend.src.adapters.api.routers.common import get_container, get_current_user_id
+from backend.src.adapters.api.errors import error_detail, http_status_for
+from backend.src.adapters.api.middleware.server_timing import TimedRoute
+from backend.src.adapters.api.responses import ORJSONResponse, paginated
+from backend.src.adapters.api.routers.common import (
+    get_container,
+    get_current_user_id,
+    get_project_cache_headers,
+)
 from backend.src.application.use_cases.task_management import (
     AbandonTaskInput,
     AddDependencyInput,
@@ -13,16 +24,29 @@ from backend.src.application.use_cases.task_management import (
     CompleteTaskInput,
     CreateTaskInput,
     DeleteTaskInput,
+    EstimateTaskDifficultiesInput,
+    EstimateTaskProgressInput,
+    EstimateTaskProgressOutput,
+    ImportDependencyItem,
+    ImportTaskItem,
+    ImportTasksInput,
     RemoveDependencyInput,
     RemoveFromTaskInput,
     SelectTaskInput,
 )
 from backend.src.domain.entities import Task, TaskLog
+from backend.src.domain.errors import DomainError, ProjectNotFoundError
 from backend.src.infrastructure.di import Container
-from fastapi import APIRouter, Depends, HTTPException, Query, status
-from pydantic import BaseModel, Field
-
-router = APIRouter(prefix="/projects/{project_id}/tasks", tags=["tasks"])
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
+from fastapi.exceptions import RequestValidationError
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel, Field, ValidationError
+
+router = APIRouter(
+    prefix="/projects/{project_id}/tasks",
+    tags=["tasks"],
+    route_class=TimedRoute,
+)
 
 
 # --- Pydantic Schemas ---
@@ -59,6 +83,109 @@ class AddDependencyRequest(BaseModel):
     blocking_task_id: UUID
 
 
+MAX_IMPORT_TASKS = 10_000
+MAX_IMPORT_DEPENDENCIES = 50_000
+
+
+class ImportTaskRow(BaseModel):
+    """A task to import, referenced by `ref` from dependency rows."""
+
+    ref: str = Field(..., min_length=1, max_length=100)
+    title: str = Field(..., min_length=1, max_length=255)
+    description: str = Field(default="", max_length=5000)
+    difficulty_points: int | None = Field(default=None, ge=0, le=100)
+    required_role_id: UUID | None = None
+
+
+class ImportDependencyRow(BaseModel):
+    """Dependency edge; each end is an imported ref or an existing task id."""
+
+    blocking: str = Field(..., min_length=1, max_length=100)
+    blocked: str = Field(..., min_length=1, max_length=100)
+
+
+class ImportTasksRequest(BaseModel):
+    """Request body for bulk importing tasks and dependencies."""
+
+    tasks: list[ImportTaskRow] = Field(default_factory=list, max_length=MAX_IMPORT_TASKS)
+    dependencies: list[ImportDependencyRow] = Field(
+        default_factory=list, max_length=MAX_IMPORT_DEPENDENCIES
+    )
+
+    @classmethod
+    def from_csv(cls, text: str) -> "ImportTasksRequest":
+        """
+        Parse a CSV import.
+
+        Columns: ref, title, description, difficulty_points, required_role_id,
+        depends_on. `depends_on` holds `;`-separated refs or task ids.
+        """
+        tasks: list[dict] = []
+        dependencies: list[dict] = []
+        for row in csv.DictReader(io.StringIO(text)):
+            ref = (row.get("ref") or "").strip()
+            tasks.append(
+                {
+                    "ref": ref,
+                    "title": (row.get("title") or "").strip(),
+                    "description": row.get("description") or "",
+                    "difficulty_points": (row.get("difficulty_points") or "").strip() or None,
+                    "required_role_id": (row.get("required_role_id") or "").strip() or None,
+                }
+            )
+            for blocking in (row.get("depends_on") or "").split(";"):
+                if blocking.strip():
+                    dependencies.append({"blocking": blocking.strip(), "blocked": ref})
+        return cls.model_validate({"tasks": tasks, "dependencies": dependencies})
+
+
+class ImportTasksResponse(BaseModel):
+    """Response schema for a bulk import."""
+
+    task_ids: dict[str, UUID]
+    created_tasks: int
+    created_dependencies: int
+
+
+class EstimateTasksResponse(BaseModel):
+    """Response schema for estimating a project's unestimated tasks."""
+
+    estimated_task_ids: list[UUID]
+    failed_task_ids: list[UUID]
+
+
+class TaskProgressEstimateResponse(BaseModel):
+    """Response schema for a task's LLM progress estimate."""
+
+    task_id: UUID
+    progress_percent: int
+    confidence: float | None
+    reasoning: str | None
+    reused: bool
+    reports_sent: int
+    reports_pending: int
+
+    @classmethod
+    def from_output(
+        cls, result: EstimateTaskProgressOutput
+    ) -> "TaskProgressEstimateResponse":
+        """Create response from the use case output."""
+        estimation = result.estimation
+        return cls(
+            task_id=result.task.id,
+            progress_percent=(
+                estimation.percentage
+                if estimation is not None
+                else result.task.progress_percent
+            ),
+            confidence=estimation.confidence if estimation is not None else None,
+            reasoning=estimation.reasoning if estimation is not None else None,
+            reused=result.reused,
+            reports_sent=result.reports_sent,
+            reports_pending=result.reports_pending,
+        )
+
+
 class TaskResponse(BaseModel):
     """Response schema for a task."""
 
@@ -80,22 +207,27 @@ class TaskResponse(BaseModel):
     @classmethod
     def from_entity(cls, task: Task) -> "TaskResponse":
         """Create response from domain entity."""
-        return cls(
-            id=task.id,
-            project_id=task.project_id,
-            title=task.title,
-            description=task.description,
-            difficulty_points=task.difficulty_points,
-            status=task.status.value,
-            assignee_id=task.assignee_id,
-            required_role_id=task.required_role_id,
-            progress_percent=task.progress_percent,
-            expected_start_date=task.expected_start_date,
-            expected_end_date=task.expected_end_date,
-            actual_end_date=task.actual_end_date,
-            created_at=task.created_at,
-            updated_at=task.updated_at,
-        )
+        return cls(**cls.row(task))
+
+    @staticmethod
+    def row(task: Task) -> dict[str, Any]:
+        """Unvalidated JSON row for ORJSONResponse; the entity is already valid."""
+        return {
+            "id": task.id,
+            "project_id": task.project_id,
+            "title": task.title,
+            "description": task.description,
+            "difficulty_points": task.difficulty_points,
+            "status": task.status.value,
+            "assignee_id": task.assignee_id,
+            "required_role_id": task.required_role_id,
+            "progress_percent": task.progress_percent,
+            "expected_start_date": task.expected_start_date,
+            "expected_end_date": task.expected_end_date,
+            "actual_end_date": task.actual_end_date,
+            "created_at": task.created_at,
+            "updated_at": task.updated_at,
+        }
 
 
 class TaskLogResponse(BaseModel):
@@ -111,14 +243,19 @@ class TaskLogResponse(BaseModel):
     @classmethod
     def from_entity(cls, log: TaskLog) -> "TaskLogResponse":
         """Create response from domain entity."""
-        return cls(
-            id=log.id,
-            task_id=log.task_id,
-            author_id=log.author_id,
-            log_type=log.log_type.value,
-            content=log.content,
-            created_at=log.created_at,
-        )
+        return cls(**cls.row(log))
+
+    @staticmethod
+    def row(log: TaskLog) -> dict[str, Any]:
+        """Unvalidated JSON row for ORJSONResponse; the entity is already valid."""
+        return {
+            "id": log.id,
+            "task_id": log.task_id,
+            "author_id": log.author_id,
+            "log_type": log.log_type.value,
+            "content": log.content,
+            "created_at": log.created_at,
+        }
 
 
 class ErrorResponse(BaseModel):
@@ -135,44 +272,104 @@ class PaginatedTasksResponse(BaseModel):
     offset: int
 
 
+class PaginatedTaskLogsResponse(BaseModel):
+    items: list[TaskLogResponse]
+    total: int
+    limit: int
+    offset: int
+
+
 # --- Endpoints ---
 
 
-@router.get("", response_model=PaginatedTasksResponse)
+async def _require_project_access(
+    container: Container, project_id: UUID, user_id: UUID
+) -> None:
+    """Check that the user manages or belongs to the project (inside an open uow)."""
+    try:
+        access = await container.project_access_resolver().resolve(
+            container.uow.project_repository, project_id, user_id
+        )
+    except ProjectNotFoundError:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Project {project_id} not found",
+        )
+
+    if not access.can_view:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Project access denied",
+        )
+
+
+@router.get("", response_model=PaginatedTasksResponse, response_class=ORJSONResponse)
 async def list_tasks(
     project_id: UUID,
     container: Annotated[Container, Depends(get_container)],
     user_id: Annotated[UUID, Depends(get_current_user_id)],
+    cache_headers: Annotated[dict[str, str], Depends(get_project_cache_headers)],
     limit: int = Query(20, ge=1, le=200),
     offset: int = Query(0, ge=0),
-) -> PaginatedTasksResponse:
+) -> ORJSONResponse:
     async with container.uow:
-        project = await container.uow.project_repository.find_by_id(project_id)
-        if project is None:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"Project {project_id} not found",
-            )
-
-        member = await container.uow.project_member_repository.find_by_project_and_user(
-            project_id, user_id
-        )
-        if member is None and not project.is_manager(user_id):
-            raise HTTPException(
-                status_code=status.HTTP_403_FORBIDDEN,
-                detail="Project access denied",
-            )
-
+        await _require_project_access(container, project_id, user_id)
         items = await container.uow.task_repository.list_by_project(
             project_id, limit=limit, offset=offset
         )
         total = await container.uow.task_repository.count_by_project(project_id)
 
-    return PaginatedTasksResponse(
-        items=[TaskResponse.from_entity(task) for task in items],
-        total=total,
-        limit=limit,
-        offset=offset,
+    return ORJSONResponse(
+        paginated(
+            [TaskResponse.row(task) for task in items],
+            total=total,
+            limit=limit,
+            offset=offset,
+        ),
+        headers=cache_headers,
+    )
+
+
+@router.get(
+    "/{task_id}/logs",
+    response_model=PaginatedTaskLogsResponse,
+    response_class=ORJSONResponse,
+    responses={
+        403: {"model": ErrorResponse, "description": "Not a project member"},
+        404: {"model": ErrorResponse, "description": "Project or task not found"},
+    },
+)
+async def list_task_logs(
+    project_id: UUID,
+    task_id: UUID,
+    container: Annotated[Container, Depends(get_container)],
+    user_id: Annotated[UUID, Depends(get_current_user_id)],
+    cache_headers: Annotated[dict[str, str], Depends(get_project_cache_headers)],
+    limit: int = Query(50, ge=1, le=200),
+    offset: int = Query(0, ge=0),
+) -> ORJSONResponse:
+    """List a task's history (assignments, status changes, reports), newest first."""
+    async with container.uow:
+        await _require_project_access(container, project_id, user_id)
+        task = await container.uow.task_repository.find_by_id(task_id)
+        if task is None or task.project_id != project_id:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Task {task_id} not found",
+            )
+        items = await container.uow.task_log_repository.list_by_task(
+            task_id, limit=limit, offset=offset
+        )
+        total = await container.uow.task_log_repository.count_by_task(task_id)
+
+    return ORJSONResponse(
+        paginated(
+            [TaskLogResponse.row(log) for log in items],
+            total=total,
+            limit=limit,
+            offset=offset,
+        ),
+        headers=cache_headers,
     )
 
 
@@ -211,6 +408,105 @@ async def create_task(
     return TaskResponse.from_entity(task)
 
 
+@router.post(
+    "/import",
+    response_model=ImportTasksResponse,
+    status_code=status.HTTP_201_CREATED,
+    responses={
+        400: {"model": ErrorResponse, "description": "Invalid or circular dependency"},
+        403: {"model": ErrorResponse, "description": "Not authorized (not manager)"},
+        404: {"model": ErrorResponse, "description": "Project or referenced task not found"},
+    },
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "content": {
+                "application/json": {"schema": {"type": "object"}},
+                "text/csv": {"schema": {"type": "string"}},
+            },
+        }
+    },
+)
+async def import_tasks(
+    project_id: UUID,
+    http_request: Request,
+    container: Annotated[Container, Depends(get_container)],
+    user_id: Annotated[UUID, Depends(get_current_user_id)],
+) -> ImportTasksResponse:
+    """
+    Import tasks and dependency edges in one transaction (JSON or CSV).
+
+    BR-TASK-001: Only the Manager can create tasks.
+    BR-DEP-002: The whole graph is validated once; cycles reject the import.
+    The schedule is recalculated once, after every row is written.
+    """
+    body = await http_request.body()
+    content_type = http_request.headers.get("content-type", "")
+    try:
+        if content_type.startswith("text/csv"):
+            payload = ImportTasksRequest.from_csv(body.decode("utf-8-sig"))
+        else:
+            payload = ImportTasksRequest.model_validate_json(body)
+    except ValidationError as exc:
+        raise RequestValidationError(exc.errors()) from exc
+    except UnicodeDecodeError as exc:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="CSV body must be UTF-8 encoded",
+        ) from exc
+
+    use_case = container.import_tasks_use_case()
+    result = await use_case.execute(
+        ImportTasksInput(
+            project_id=project_id,
+            requester_id=user_id,
+            tasks=[ImportTaskItem(**row.model_dump()) for row in payload.tasks],
+            dependencies=[
+                ImportDependencyItem(blocking=row.blocking, blocked=row.blocked)
+                for row in payload.dependencies
+            ],
+        )
+    )
+    return ImportTasksResponse(
+        task_ids=result.task_ids,
+        created_tasks=len(result.tasks),
+        created_dependencies=len(result.dependencies),
+    )
+
+
+@router.post(
+    "/estimate",
+    response_model=EstimateTasksResponse,
+    responses={
+        400: {"model": ErrorResponse, "description": "LLM not enabled for project"},
+        403: {"model": ErrorResponse, "description": "Not authorized (not manager)"},
+        404: {"model": ErrorResponse, "description": "Project not found"},
+        429: {"model": ErrorResponse, "description": "LLM rate limit exceeded"},
+        502: {"model": ErrorResponse, "description": "LLM provider error"},
+    },
+)
+async def estimate_tasks(
+    project_id: UUID,
+    container: Annotated[Container, Depends(get_container)],
+    user_id: Annotated[UUID, Depends(get_current_user_id)],
+) -> EstimateTasksResponse:
+    """
+    Let the LLM estimate every open task that has no difficulty yet.
+
+    BR-LLM-001: Only for projects with LLM features enabled.
+    BR-LLM-003: Difficulty is estimated from each task's description.
+    Tasks the LLM could not estimate are listed and left unchanged.
+    """
+    use_case = container.estimate_task_difficulties_use_case()
+    result = await use_case.execute(
+        EstimateTaskDifficultiesInput(project_id=project_id, requester_id=user_id)
+    )
+    return EstimateTasksResponse(
+        estimated_task_ids=[task.id for task in result.estimated],
+        failed_task_ids=result.failed_task_ids,
+    )
+
+
 @router.post(
     "/{task_id}/select",
     response_model=TaskResponse,
@@ -346,6 +642,117 @@ async def add_task_report(
     return TaskLogResponse.from_entity(log)
 
 
+@router.post(
+    "/{task_id}/progress/estimate",
+    response_model=TaskProgressEstimateResponse,
+    responses={
+        400: {
+            "model": ErrorResponse,
+            "description": "LLM not enabled or task not in Doing status",
+        },
+        403: {"model": ErrorResponse, "description": "Not task owner or manager"},
+        404: {"model": ErrorResponse, "description": "Task not found"},
+        429: {"model": ErrorResponse, "description": "LLM rate limit exceeded"},
+        502: {"model": ErrorResponse, "description": "LLM provider error"},
+    },
+)
+async def estimate_task_progress(
+    project_id: UUID,
+    task_id: UUID,
+    container: Annotated[Container, Depends(get_container)],
+    user_id: Annotated[UUID, Depends(get_current_user_id)],
+) -> TaskProgressEstimateResponse:
+    """
+    Let the LLM estimate a task's progress from its reports.
+
+    UC-043: Only the reports filed since the last estimate are sent, with a
+    summary of the earlier ones; without new reports the last estimate is
+    returned as is.
+    """
+    use_case = container.estimate_task_progress_use_case()
+    result = await use_case.execute(
+        EstimateTaskProgressInput(task_id=task_id, user_id=user_id)
+    )
+    return TaskProgressEstimateResponse.from_output(result)
+
+
+async def progress_estimate_events(
+    first: str | EstimateTaskProgressOutput,
+    events: AsyncIterator[str | EstimateTaskProgressOutput],
+) -> AsyncIterator[str]:
+    """
+    Yield SSE frames for a streamed progress estimate.
+
+    Each piece of reasoning is a `reasoning` event, the final estimate a
+    `result` event; an error after the stream has started is an `error`
+    event with the status the endpoint would have answered with.
+    """
+    try:
+        item = first
+        while True:
+            if isinstance(item, EstimateTaskProgressOutput):
+                data = TaskProgressEstimateResponse.from_output(item)
+                yield f"event: result\ndata: {data.model_dump_json()}\n\n"
+            else:
+                yield f"event: reasoning\ndata: {json.dumps({'text': item})}\n\n"
+            item = await anext(events)
+    except StopAsyncIteration:
+        return
+    except DomainError as exc:
+        error = {"detail": error_detail(exc), "status": http_status_for(exc)}
+        yield f"event: error\ndata: {json.dumps(error)}\n\n"
+    finally:
+        await events.aclose()
+
+
+@router.post(
+    "/{task_id}/progress/estimate/stream",
+    response_class=StreamingResponse,
+    responses={
+        200: {
+            "content": {"text/event-stream": {}},
+            "description": (
+                "Server-sent events: `reasoning` events as the LLM writes, "
+                "then one `result` event with the estimate"
+            ),
+        },
+        400: {
+            "model": ErrorResponse,
+            "description": "LLM not enabled or task not in Doing status",
+        },
+        403: {"model": ErrorResponse, "description": "Not task owner or manager"},
+        404: {"model": ErrorResponse, "description": "Task not found"},
+        429: {"model": ErrorResponse, "description": "LLM rate limit exceeded"},
+        502: {"model": ErrorResponse, "description": "LLM provider error"},
+    },
+)
+async def stream_task_progress_estimate(
+    project_id: UUID,
+    task_id: UUID,
+    container: Annotated[Container, Depends(get_container)],
+    user_id: Annotated[UUID, Depends(get_current_user_id)],
+) -> StreamingResponse:
+    """
+    Like the estimate endpoint, streaming the LLM's reasoning as it arrives.
+
+    UC-043: The response starts with the provider's first tokens instead of
+    after the whole estimate. Clients read it with `fetch`, since
+    `EventSource` cannot send a POST.
+    """
+    use_case = container.estimate_task_progress_use_case()
+    events = use_case.stream(
+        EstimateTaskProgressInput(task_id=task_id, user_id=user_id)
+    )
+    # Pull the first item now so access and provider errors become regular
+    # error responses instead of a truncated stream.
+    first = await anext(events)
+    return StreamingResponse(
+        progress_estimate_events(first, events),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
 @router.post(
     "/{task_id}/remove-assignee",
     response_model=TaskResponse,
@@ -2,24 +2,36 @@
 
 from backend.src.adapters.db.repositories import (
     PostgresCalendarRepository,
+    PostgresDeadlineWarningRepository,
+    PostgresEmailOutboxRepository,
+    PostgresLLMUsageRepository,
     PostgresProjectInviteRepository,
     PostgresProjectMemberRepository,
     PostgresProjectRepository,
+    PostgresReportRepository,
     PostgresRoleRepository,
     PostgresTaskDependencyRepository,
     PostgresTaskLogRepository,
+    PostgresTaskProgressRepository,
     PostgresTaskRepository,
     PostgresUserRepository,
+    PostgresWorkloadAlertRepository,
 )
 
 __all__ = [
     "PostgresCalendarRepository",
+    "PostgresDeadlineWarningRepository",
+    "PostgresEmailOutboxRepository",
+    "PostgresLLMUsageRepository",
     "PostgresProjectInviteRepository",
     "PostgresProjectMemberRepository",
     "PostgresProjectRepository",
+    "PostgresReportRepository",
     "PostgresRoleRepository",
     "PostgresTaskDependencyRepository",
     "PostgresTaskLogRepository",
+    "PostgresTaskProgressRepository",
     "PostgresTaskRepository",
     "PostgresUserRepository",
+    "PostgresWorkloadAlertRepository",
 ]
@@ -2,17 +2,58 @@
 
 from __future__ import annotations
 
-from typing import Iterable
+from datetime import date, datetime, timedelta
+from typing import AsyncIterator, Iterable, Sequence
 from uuid import UUID
 
-from sqlalchemy import delete, exists, func, or_, select
+from sqlalchemy import (
+    and_,
+    delete,
+    exists,
+    func,
+    insert,
+    inspect,
+    literal,
+    or_,
+    select,
+    tuple_,
+    update,
+)
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import aliased
 
 from backend.src.domain.entities import Calendar, Task, TaskDependency, TaskLog
-from backend.src.domain.entities import Project, ProjectInvite, ProjectMember, Role, User
+from backend.src.domain.entities import (
+    Project,
+    ProjectAccess,
+    ProjectInvite,
+    ProjectMember,
+    Role,
+    TaskLogType,
+    TaskStatus,
+    User,
+)
 from backend.src.domain.entities.working_calendar import WorkingCalendar
+from backend.src.domain.ports.repositories import (
+    DeadlineCandidate,
+    DueDeadlineWarning,
+    MemberWorkloadPoints,
+    MemberWorkloadState,
+    OutboxEmail,
+    ProjectTaskCounts,
+    ReportProject,
+    ScheduledDeadlineWarning,
+    TaskProgressState,
+)
+from backend.src.domain.ports.services import EmailMessage
 from backend.src.infrastructure.db.models import (
     CalendarModel,
+    DeadlineWarningModel,
+    EmailOutboxModel,
+    EmailOutboxStatus,
+    JobWatermarkModel,
+    LLMUsageModel,
     ProjectInviteModel,
     ProjectMemberModel,
     ProjectModel,
@@ -20,9 +61,30 @@ from backend.src.infrastructure.db.models import (
     TaskDependencyModel,
     TaskLogModel,
     TaskModel,
+    TaskProgressModel,
     UserModel,
+    WorkloadAlertModel,
+)
+from backend.src.infrastructure.db.versioning import (
+    mark_projects_changed,
+    mark_tasks_changed,
 )
 
+# Rows fetched per round-trip when streaming through a server-side cursor.
+STREAM_BATCH_SIZE = 1000
+
+
+async def _insert_many(session: AsyncSession, model_type, models: Iterable) -> None:
+    """Insert new rows with batched multi-row INSERT statements.
+
+    Unlike merge, this skips the identity-map lookup per row; callers must only
+    pass rows that do not exist yet.
+    """
+    columns = [attr.key for attr in inspect(model_type).column_attrs]
+    rows = [{key: getattr(model, key) for key in columns} for model in models]
+    if rows:
+        await session.execute(insert(model_type), rows)
+
 
 class PostgresProjectRepository:
     """SQLAlchemy repository for Project entities."""
@@ -48,6 +110,51 @@ class PostgresProjectRepository:
             project.calendar = WorkingCalendar.from_calendar(calendar)
         return project
 
+    async def find_version(self, project_id: UUID, user_id: UUID) -> int | None:
+        member_exists = exists(
+            select(1).where(
+                ProjectMemberModel.project_id == ProjectModel.id,
+                ProjectMemberModel.user_id == user_id,
+            )
+        )
+        result = await self._session.execute(
+            select(ProjectModel.version).where(
+                ProjectModel.id == project_id,
+                or_(ProjectModel.manager_id == user_id, member_exists),
+            )
+        )
+        return result.scalar_one_or_none()
+
+    async def find_access(
+        self, project_id: UUID, user_id: UUID
+    ) -> ProjectAccess | None:
+        result = await self._session.execute(
+            select(
+                ProjectModel.manager_id,
+                ProjectMemberModel.id,
+                ProjectMemberModel.role_id,
+                ProjectMemberModel.seniority_level,
+            )
+            .outerjoin(
+                ProjectMemberModel,
+                (ProjectMemberModel.project_id == ProjectModel.id)
+                & (ProjectMemberModel.user_id == user_id),
+            )
+            .where(ProjectModel.id == project_id)
+        )
+        row = result.one_or_none()
+        if row is None:
+            return None
+        manager_id, member_id, role_id, seniority_level = row
+        return ProjectAccess(
+            project_id=project_id,
+            user_id=user_id,
+            is_manager=manager_id == user_id,
+            member_id=member_id,
+            role_id=role_id,
+            seniority_level=seniority_level,
+        )
+
     async def list_by_user(
         self, user_id: UUID, *, limit: int, offset: int
     ) -> list[Project]:
@@ -86,6 +193,7 @@ class PostgresProjectRepository:
         model = ProjectModel.from_entity(project)
         await self._session.merge(model)
         await self._session.flush()
+        mark_projects_changed(self._session, [project.id])
         return project
 
     async def delete(self, project_id: UUID) -> None:
@@ -111,6 +219,7 @@ class PostgresCalendarRepository:
         model = CalendarModel.from_entity(calendar)
         await self._session.merge(model)
         await self._session.flush()
+        mark_projects_changed(self._session, [calendar.project_id])
         return calendar
 
 
@@ -165,16 +274,31 @@ class PostgresProjectMemberRepository:
         model = result.scalar_one_or_none()
         return model.to_entity() if model else None
 
+    async def find_user_ids_by_role(
+        self, project_id: UUID, role_id: UUID | None
+    ) -> list[UUID]:
+        stmt = select(ProjectMemberModel.user_id).where(
+            ProjectMemberModel.project_id == project_id
+        )
+        if role_id is not None:
+            stmt = stmt.where(ProjectMemberModel.role_id == role_id)
+        result = await self._session.execute(stmt)
+        return list(result.scalars().all())
+
     async def save(self, project_member: ProjectMember) -> ProjectMember:
         model = ProjectMemberModel.from_entity(project_member)
         await self._session.merge(model)
         await self._session.flush()
+        mark_projects_changed(self._session, [project_member.project_id])
         return project_member
 
     async def delete(self, project_member_id: UUID) -> None:
-        await self._session.execute(
-            delete(ProjectMemberModel).where(ProjectMemberModel.id == project_member_id)
+        result = await self._session.execute(
+            delete(ProjectMemberModel)
+            .where(ProjectMemberModel.id == project_member_id)
+            .returning(ProjectMemberModel.project_id)
         )
+        mark_projects_changed(self._session, result.scalars().all())
 
 
 class PostgresProjectInviteRepository:
@@ -220,12 +344,16 @@ class PostgresProjectInviteRepository:
         model = ProjectInviteModel.from_entity(project_invite)
         await self._session.merge(model)
         await self._session.flush()
+        mark_projects_changed(self._session, [project_invite.project_id])
         return project_invite
 
     async def delete(self, token: str) -> None:
-        await self._session.execute(
-            delete(ProjectInviteModel).where(ProjectInviteModel.token == token)
+        result = await self._session.execute(
+            delete(ProjectInviteModel)
+            .where(ProjectInviteModel.token == token)
+            .returning(ProjectInviteModel.project_id)
         )
+        mark_projects_changed(self._session, result.scalars().all())
 
 
 class PostgresRoleRepository:
@@ -241,14 +369,27 @@ class PostgresRoleRepository:
         model = result.scalar_one_or_none()
         return model.to_entity() if model else None
 
+    async def find_by_ids(self, role_ids: Iterable[UUID]) -> list[Role]:
+        ids = list(role_ids)
+        if not ids:
+            return []
+        result = await self._session.execute(
+            select(RoleModel).where(RoleModel.id.in_(ids))
+        )
+        return [m.to_entity() for m in result.scalars().all()]
+
     async def save(self, role: Role) -> Role:
         model = RoleModel.from_entity(role)
         await self._session.merge(model)
         await self._session.flush()
+        mark_projects_changed(self._session, [role.project_id])
         return role
 
     async def delete(self, role_id: UUID) -> None:
-        await self._session.execute(delete(RoleModel).where(RoleModel.id == role_id))
+        result = await self._session.execute(
+            delete(RoleModel).where(RoleModel.id == role_id).returning(RoleModel.project_id)
+        )
+        mark_projects_changed(self._session, result.scalars().all())
 
 
 class PostgresTaskRepository:
@@ -288,24 +429,63 @@ class PostgresTaskRepository:
         )
         return int(result.scalar_one())
 
+    async def stream_by_project(self, project_id: UUID) -> AsyncIterator[Task]:
+        result = await self._session.stream_scalars(
+            select(TaskModel)
+            .where(TaskModel.project_id == project_id)
+            .order_by(TaskModel.created_at, TaskModel.id)
+            .execution_options(yield_per=STREAM_BATCH_SIZE)
+        )
+        async for model in result:
+            yield model.to_entity()
+
     async def find_by_assignee(self, assignee_id: UUID) -> list[Task]:
         result = await self._session.execute(
             select(TaskModel).where(TaskModel.assignee_id == assignee_id)
         )
         return [m.to_entity() for m in result.scalars().all()]
 
+    async def find_recently_completed(
+        self, limit: int, completed_after: datetime | None = None
+    ) -> list[Task]:
+        query = select(TaskModel).where(
+            TaskModel.status == TaskStatus.DONE,
+            TaskModel.difficulty_points.is_not(None),
+        )
+        if completed_after is not None:
+            query = query.where(TaskModel.actual_end_date > completed_after)
+        result = await self._session.execute(
+            query.order_by(
+                TaskModel.actual_end_date.desc().nulls_last(), TaskModel.id.desc()
+            )
+            .limit(limit)
+        )
+        return [m.to_entity() for m in result.scalars().all()]
+
     async def save(self, task: Task) -> Task:
         model = TaskModel.from_entity(task)
         await self._session.merge(model)
         await self._session.flush()
+        mark_projects_changed(self._session, [task.project_id])
         return task
 
     async def save_many(self, tasks: list[Task]) -> list[Task]:
         await self._merge_many(TaskModel, (TaskModel.from_entity(t) for t in tasks))
+        mark_projects_changed(self._session, {t.project_id for t in tasks})
+        return tasks
+
+    async def insert_many(self, tasks: list[Task]) -> list[Task]:
+        await _insert_many(
+            self._session, TaskModel, (TaskModel.from_entity(t) for t in tasks)
+        )
+        mark_projects_changed(self._session, {t.project_id for t in tasks})
         return tasks
 
     async def delete(self, task_id: UUID) -> None:
-        await self._session.execute(delete(TaskModel).where(TaskModel.id == task_id))
+        result = await self._session.execute(
+            delete(TaskModel).where(TaskModel.id == task_id).returning(TaskModel.project_id)
+        )
+        mark_projects_changed(self._session, result.scalars().all())
 
     async def _merge_many(self, model_type, models: Iterable) -> None:
         for model in models:
@@ -323,8 +503,20 @@ class PostgresTaskDependencyRepository:
         model = TaskDependencyModel.from_entity(task_dependency)
         await self._session.merge(model)
         await self._session.flush()
+        mark_tasks_changed(self._session, [task_dependency.blocked_task_id])
         return task_dependency
 
+    async def insert_many(
+        self, task_dependencies: list[TaskDependency]
+    ) -> list[TaskDependency]:
+        await _insert_many(
+            self._session,
+            TaskDependencyModel,
+            (TaskDependencyModel.from_entity(d) for d in task_dependencies),
+        )
+        mark_tasks_changed(self._session, {d.blocked_task_id for d in task_dependencies})
+        return task_dependencies
+
     async def find_by_id(self, dependency_id: UUID) -> TaskDependency | None:
         result = await self._session.execute(
             select(TaskDependencyModel).where(
@@ -369,6 +561,21 @@ class PostgresTaskDependencyRepository:
         )
         return int(result.scalar_one())
 
+    async def stream_by_project(self, project_id: UUID) -> AsyncIterator[TaskDependency]:
+        result = await self._session.stream_scalars(
+            select(TaskDependencyModel)
+            .join(TaskModel, TaskDependencyModel.blocking_task_id == TaskModel.id)
+            .where(TaskModel.project_id == project_id)
+            .order_by(
+                TaskDependencyModel.created_at,
+                TaskDependencyModel.blocking_task_id,
+                TaskDependencyModel.blocked_task_id,
+            )
+            .execution_options(yield_per=STREAM_BATCH_SIZE)
+        )
+        async for model in result:
+            yield model.to_entity()
+
     async def find_by_tasks(
         self, blocking_task_id: UUID, blocked_task_id: UUID
     ) -> TaskDependency | None:
@@ -388,6 +595,7 @@ class PostgresTaskDependencyRepository:
                 | (TaskDependencyModel.blocked_task_id == dependency_id)
             )
         )
+        mark_tasks_changed(self._session, [dependency_id])
 
     async def delete_by_tasks(self, blocking_task_id: UUID, blocked_task_id: UUID) -> None:
         await self._session.execute(
@@ -396,6 +604,7 @@ class PostgresTaskDependencyRepository:
                 TaskDependencyModel.blocked_task_id == blocked_task_id,
             )
         )
+        mark_tasks_changed(self._session, [blocked_task_id])
 
 
 class PostgresTaskLogRepository:
@@ -408,6 +617,7 @@ class PostgresTaskLogRepository:
         model = TaskLogModel.from_entity(task_log)
         await self._session.merge(model)
         await self._session.flush()
+        mark_tasks_changed(self._session, [task_log.task_id])
         return task_log
 
     async def find_by_task(self, task_id: UUID) -> list[TaskLog]:
@@ -434,12 +644,93 @@ class PostgresTaskLogRepository:
         )
         return int(result.scalar_one())
 
+    async def stream_by_project(self, project_id: UUID) -> AsyncIterator[TaskLog]:
+        result = await self._session.stream_scalars(
+            select(TaskLogModel)
+            .join(TaskModel, TaskLogModel.task_id == TaskModel.id)
+            .where(TaskModel.project_id == project_id)
+            .order_by(TaskLogModel.created_at, TaskLogModel.id)
+            .execution_options(yield_per=STREAM_BATCH_SIZE)
+        )
+        async for model in result:
+            yield model.to_entity()
+
     async def find_by_author(self, author_id: UUID) -> list[TaskLog]:
         result = await self._session.execute(
             select(TaskLogModel).where(TaskLogModel.author_id == author_id)
         )
         return [m.to_entity() for m in result.scalars().all()]
 
+    async def find_reports_after(
+        self, task_id: UUID, after: tuple[datetime, UUID] | None = None
+    ) -> list[TaskLog]:
+        # Served by ix_task_logs_task_id_created_at.
+        stmt = select(TaskLogModel).where(
+            TaskLogModel.task_id == task_id,
+            TaskLogModel.log_type == TaskLogType.REPORT,
+        )
+        if after is not None:
+            stmt = stmt.where(
+                tuple_(TaskLogModel.created_at, TaskLogModel.id) > tuple_(*after)
+            )
+        result = await self._session.execute(
+            stmt.order_by(TaskLogModel.created_at, TaskLogModel.id)
+        )
+        return [m.to_entity() for m in result.scalars().all()]
+
+
+class PostgresTaskProgressRepository:
+    """SQLAlchemy repository for incremental progress estimates."""
+
+    def __init__(self, session: AsyncSession) -> None:
+        self._session = session
+
+    async def get(self, task_id: UUID) -> TaskProgressState | None:
+        model = await self._session.get(TaskProgressModel, task_id)
+        if model is None:
+            return None
+        return TaskProgressState(
+            task_id=model.task_id,
+            percentage=model.percentage,
+            confidence=model.confidence,
+            reasoning=model.reasoning,
+            summary=model.summary,
+            last_report_at=model.last_report_at,
+            last_report_id=model.last_report_id,
+        )
+
+    async def save(self, state: TaskProgressState) -> bool:
+        stmt = pg_insert(TaskProgressModel).values(
+            task_id=state.task_id,
+            percentage=state.percentage,
+            confidence=state.confidence,
+            reasoning=state.reasoning,
+            summary=state.summary,
+            last_report_at=state.last_report_at,
+            last_report_id=state.last_report_id,
+        )
+        # Never move the watermark back over an estimate of later reports.
+        result = await self._session.execute(
+            stmt.on_conflict_do_update(
+                index_elements=[TaskProgressModel.task_id],
+                set_={
+                    "percentage": stmt.excluded.percentage,
+                    "confidence": stmt.excluded.confidence,
+                    "reasoning": stmt.excluded.reasoning,
+                    "summary": stmt.excluded.summary,
+                    "last_report_at": stmt.excluded.last_report_at,
+                    "last_report_id": stmt.excluded.last_report_id,
+                    "updated_at": func.now(),
+                },
+                where=tuple_(
+                    TaskProgressModel.last_report_at,
+                    TaskProgressModel.last_report_id,
+                )
+                <= tuple_(stmt.excluded.last_report_at, stmt.excluded.last_report_id),
+            ).returning(TaskProgressModel.task_id)
+        )
+        return result.scalar_one_or_none() is not None
+
 
 class PostgresUserRepository:
     """SQLAlchemy repository for User entities."""
@@ -460,6 +751,15 @@ class PostgresUserRepository:
         model = result.scalar_one_or_none()
         return model.to_entity() if model else None
 
+    async def find_by_ids(self, user_ids: Iterable[UUID]) -> list[User]:
+        ids = list(user_ids)
+        if not ids:
+            return []
+        result = await self._session.execute(
+            select(UserModel).where(UserModel.id.in_(ids))
+        )
+        return [m.to_entity() for m in result.scalars().all()]
+
     async def find_by_email(self, email: str) -> User | None:
         result = await self._session.execute(
             select(UserModel).where(UserModel.email == email.strip().lower())
@@ -479,3 +779,473 @@ class PostgresUserRepository:
 
     async def delete(self, user_id: UUID) -> None:
         await self._session.execute(delete(UserModel).where(UserModel.id == user_id))
+
+
+class PostgresEmailOutboxRepository:
+    """SQLAlchemy repository for the transactional email outbox."""
+
+    def __init__(self, session: AsyncSession) -> None:
+        self._session = session
+
+    async def add(self, message: EmailMessage) -> UUID:
+        model = EmailOutboxModel.from_message(message)
+        self._session.add(model)
+        await self._session.flush()
+        return model.id
+
+    async def claim_due(self, limit: int, lease_seconds: float) -> list[OutboxEmail]:
+        # SKIP LOCKED lets concurrent dispatchers claim disjoint batches
+        # without waiting on each other.
+        due = (
+            select(EmailOutboxModel.id)
+            .where(
+                EmailOutboxModel.status == EmailOutboxStatus.PENDING,
+                EmailOutboxModel.available_at <= func.now(),
+            )
+            .order_by(EmailOutboxModel.available_at)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+            .scalar_subquery()
+        )
+        result = await self._session.execute(
+            update(EmailOutboxModel)
+            .where(EmailOutboxModel.id.in_(due))
+            .values(
+                attempts=EmailOutboxModel.attempts + 1,
+                available_at=func.now() + timedelta(seconds=lease_seconds),
+            )
+            .returning(EmailOutboxModel)
+            .execution_options(synchronize_session=False)
+        )
+        return [m.to_outbox_email() for m in result.scalars().all()]
+
+    async def mark_sent(self, email_ids: Sequence[UUID]) -> None:
+        if not email_ids:
+            return
+        await self._session.execute(
+            delete(EmailOutboxModel).where(EmailOutboxModel.id.in_(list(email_ids)))
+        )
+
+    async def retry_later(
+        self, email_id: UUID, delay_seconds: float, error: str
+    ) -> None:
+        await self._session.execute(
+            update(EmailOutboxModel)
+            .where(EmailOutboxModel.id == email_id)
+            .values(
+                available_at=func.now() + timedelta(seconds=delay_seconds),
+                last_error=error,
+            )
+        )
+
+    async def mark_failed(self, email_id: UUID, error: str) -> None:
+        await self._session.execute(
+            update(EmailOutboxModel)
+            .where(EmailOutboxModel.id == email_id)
+            .values(status=EmailOutboxStatus.FAILED, last_error=error)
+        )
+
+
+class PostgresReportRepository:
+    """SQLAlchemy repository for set-based reporting reads."""
+
+    def __init__(self, session: AsyncSession) -> None:
+        self._session = session
+
+    async def list_projects(
+        self, *, after: UUID | None, limit: int
+    ) -> list[ReportProject]:
+        stmt = (
+            select(ProjectModel.id, ProjectModel.name, UserModel.email, CalendarModel)
+            .join(UserModel, UserModel.id == ProjectModel.manager_id)
+            .outerjoin(CalendarModel, CalendarModel.project_id == ProjectModel.id)
+            .order_by(ProjectModel.id)
+            .limit(limit)
+        )
+        if after is not None:
+            stmt = stmt.where(ProjectModel.id > after)
+        result = await self._session.execute(stmt)
+        return [
+            ReportProject(
+                project_id=project_id,
+                project_name=name,
+                manager_email=email,
+                calendar=(
+                    WorkingCalendar.from_calendar(calendar.to_entity())
+                    if calendar is not None
+                    else WorkingCalendar.default()
+                ),
+            )
+            for project_id, name, email, calendar in result.all()
+        ]
+
+    async def count_tasks_by_project(
+        self, project_ids: Sequence[UUID], now: datetime
+    ) -> dict[UUID, ProjectTaskCounts]:
+        ids = list(project_ids)
+        if not ids:
+            return {}
+        tz = func.coalesce(CalendarModel.timezone, "UTC")
+        today = func.date(func.timezone(tz, literal(now)))
+        result = await self._session.execute(
+            select(
+                TaskModel.project_id,
+                func.count(),
+                func.count().filter(
+                    and_(
+                        TaskModel.status == TaskStatus.DONE,
+                        func.date(func.timezone(tz, TaskModel.actual_end_date)) == today,
+                    )
+                ),
+                func.count().filter(TaskModel.status == TaskStatus.BLOCKED),
+                # Same rule as Task.is_delayed.
+                func.count().filter(
+                    and_(
+                        TaskModel.status != TaskStatus.DONE,
+                        TaskModel.expected_end_date < now,
+                    )
+                ),
+            )
+            .outerjoin(CalendarModel, CalendarModel.project_id == TaskModel.project_id)
+            .where(TaskModel.project_id.in_(ids))
+            .group_by(TaskModel.project_id, CalendarModel.timezone)
+        )
+        return {
+            project_id: ProjectTaskCounts(
+                total_tasks=total,
+                completed_today=completed_today,
+                blocked_tasks=blocked,
+                delayed_tasks=delayed,
+            )
+            for project_id, total, completed_today, blocked, delayed in result.all()
+        }
+
+    async def list_member_workloads(
+        self, project_ids: Sequence[UUID]
+    ) -> list[MemberWorkloadPoints]:
+        ids = list(project_ids)
+        if not ids:
+            return []
+        result = await self._session.execute(
+            select(
+                ProjectMemberModel.project_id,
+                UserModel.name,
+                UserModel.email,
+                ProjectMemberModel.seniority_level,
+                func.coalesce(func.sum(TaskModel.difficulty_points), 0),
+            )
+            .join(UserModel, UserModel.id == ProjectMemberModel.user_id)
+            .outerjoin(
+                TaskModel,
+                and_(
+                    TaskModel.assignee_id == ProjectMemberModel.id,
+                    TaskModel.status == TaskStatus.DOING,
+                ),
+            )
+            .where(ProjectMemberModel.project_id.in_(ids))
+            .group_by(ProjectMemberModel.id, UserModel.id)
+            .order_by(ProjectMemberModel.project_id, UserModel.name)
+        )
+        return [
+            MemberWorkloadPoints(
+                project_id=project_id,
+                member_name=name or email,
+                seniority_level=seniority_level,
+                doing_points=int(points),
+            )
+            for project_id, name, email, seniority_level, points in result.all()
+        ]
+
+
+# Tasks that can no longer be late.
+_CLOSED_TASK_STATUSES = (TaskStatus.DONE, TaskStatus.CANCELLED)
+
+
+class PostgresDeadlineWarningRepository:
+    """SQLAlchemy repository for the deadline warning scanner."""
+
+    def __init__(self, session: AsyncSession) -> None:
+        self._session = session
+
+    async def get_watermark(self, name: str) -> datetime | None:
+        result = await self._session.execute(
+            select(JobWatermarkModel.value).where(JobWatermarkModel.name == name)
+        )
+        return result.scalar_one_or_none()
+
+    async def set_watermark(self, name: str, value: datetime) -> None:
+        stmt = pg_insert(JobWatermarkModel).values(name=name, value=value)
+        await self._session.execute(
+            stmt.on_conflict_do_update(
+                index_elements=[JobWatermarkModel.name],
+                set_={"value": stmt.excluded.value},
+            )
+        )
+
+    async def find_by_deadline(
+        self,
+        start: datetime,
+        end: datetime,
+        *,
+        after: tuple[datetime, UUID] | None,
+        limit: int,
+    ) -> list[DeadlineCandidate]:
+        deadline = TaskModel.expected_end_date
+        stmt = self._candidates(deadline).where(deadline > start, deadline <= end)
+        if after is not None:
+            # The plain bound keeps the range on ix_tasks_expected_end_date.
+            stmt = stmt.where(
+                deadline >= after[0], tuple_(deadline, TaskModel.id) > tuple_(*after)
+            )
+        return await self._fetch_candidates(
+            stmt.order_by(deadline, TaskModel.id).limit(limit)
+        )
+
+    async def find_changed(
+        self,
+        since: datetime,
+        deadline_start: datetime,
+        deadline_end: datetime,
+        *,
+        after: tuple[datetime, UUID] | None,
+        limit: int,
+    ) -> list[DeadlineCandidate]:
+        changed = TaskModel.updated_at
+        stmt = self._candidates(changed).where(
+            changed > since,
+            TaskModel.expected_end_date > deadline_start,
+            TaskModel.expected_end_date <= deadline_end,
+        )
+        if after is not None:
+            stmt = stmt.where(
+                changed >= after[0], tuple_(changed, TaskModel.id) > tuple_(*after)
+            )
+        return await self._fetch_candidates(
+            stmt.order_by(changed, TaskModel.id).limit(limit)
+        )
+
+    async def schedule(self, warnings: Sequence[ScheduledDeadlineWarning]) -> None:
+        if not warnings:
+            return
+        await self._session.execute(
+            pg_insert(DeadlineWarningModel)
+            .values(
+                [
+                    {
+                        "task_id": warning.task_id,
+                        "deadline": warning.deadline,
+                        "warn_at": warning.warn_at,
+                    }
+                    for warning in warnings
+                ]
+            )
+            .on_conflict_do_nothing()
+        )
+
+    async def list_due(
+        self, now: datetime, *, after: UUID | None, limit: int
+    ) -> list[DueDeadlineWarning]:
+        stmt = (
+            select(
+                DeadlineWarningModel.task_id,
+                DeadlineWarningModel.deadline,
+                TaskModel.title,
+                UserModel.email,
+            )
+            .join(
+                TaskModel,
+                and_(
+                    TaskModel.id == DeadlineWarningModel.task_id,
+                    TaskModel.expected_end_date == DeadlineWarningModel.deadline,
+                ),
+            )
+            .join(ProjectMemberModel, ProjectMemberModel.id == TaskModel.assignee_id)
+            .join(UserModel, UserModel.id == ProjectMemberModel.user_id)
+            .where(
+                DeadlineWarningModel.sent_at.is_(None),
+                DeadlineWarningModel.warn_at <= now,
+                DeadlineWarningModel.deadline > now,
+                TaskModel.status.not_in(_CLOSED_TASK_STATUSES),
+            )
+            .order_by(DeadlineWarningModel.task_id)
+            .limit(limit)
+            # Concurrent runs skip rows another run is sending.
+            .with_for_update(of=DeadlineWarningModel, skip_locked=True)
+        )
+        if after is not None:
+            stmt = stmt.where(DeadlineWarningModel.task_id > after)
+        result = await self._session.execute(stmt)
+        return [
+            DueDeadlineWarning(
+                task_id=task_id,
+                deadline=deadline,
+                task_title=title,
+                assignee_email=email,
+            )
+            for task_id, deadline, title, email in result.all()
+        ]
+
+    async def mark_sent(
+        self, warnings: Sequence[DueDeadlineWarning], sent_at: datetime
+    ) -> None:
+        if not warnings:
+            return
+        await self._session.execute(
+            update(DeadlineWarningModel)
+            .where(
+                tuple_(DeadlineWarningModel.task_id, DeadlineWarningModel.deadline).in_(
+                    [(warning.task_id, warning.deadline) for warning in warnings]
+                )
+            )
+            .values(sent_at=sent_at)
+        )
+
+    async def prune(self, before: datetime) -> int:
+        result = await self._session.execute(
+            delete(DeadlineWarningModel).where(DeadlineWarningModel.deadline < before)
+        )
+        return result.rowcount
+
+    def _candidates(self, cursor):
+        return (
+            select(
+                TaskModel.id,
+                TaskModel.project_id,
+                TaskModel.expected_end_date,
+                cursor,
+                CalendarModel.timezone,
+                CalendarModel.exclusion_dates,
+            )
+            .outerjoin(CalendarModel, CalendarModel.project_id == TaskModel.project_id)
+            .where(
+                TaskModel.status.not_in(_CLOSED_TASK_STATUSES),
+                TaskModel.assignee_id.is_not(None),
+            )
+        )
+
+    async def _fetch_candidates(self, stmt) -> list[DeadlineCandidate]:
+        result = await self._session.execute(stmt)
+        calendars: dict[UUID, WorkingCalendar] = {}
+        candidates = []
+        for task_id, project_id, deadline, cursor, tz, exclusions in result.all():
+            calendar = calendars.get(project_id)
+            if calendar is None:
+                calendar = calendars[project_id] = WorkingCalendar(
+                    timezone=tz or "UTC",
+                    exclusion_dates=frozenset(exclusions or ()),
+                )
+            candidates.append(
+                DeadlineCandidate(
+                    task_id=task_id,
+                    deadline=deadline,
+                    calendar=calendar,
+                    cursor=cursor,
+                )
+            )
+        return candidates
+
+
+class PostgresWorkloadAlertRepository:
+    """SQLAlchemy repository for event-driven workload alerts."""
+
+    def __init__(self, session: AsyncSession) -> None:
+        self._session = session
+
+    async def get_member_workload(self, member_id: UUID) -> MemberWorkloadState | None:
+        manager = aliased(UserModel)
+        # Served by ix_tasks_assignee_id: one member's tasks, never the table.
+        doing_points = (
+            select(func.coalesce(func.sum(TaskModel.difficulty_points), 0))
+            .where(
+                TaskModel.assignee_id == ProjectMemberModel.id,
+                TaskModel.status == TaskStatus.DOING,
+            )
+            .scalar_subquery()
+        )
+        result = await self._session.execute(
+            select(
+                ProjectMemberModel.project_id,
+                ProjectModel.name,
+                manager.email,
+                ProjectMemberModel.user_id,
+                UserModel.name,
+                UserModel.email,
+                ProjectMemberModel.seniority_level,
+                doing_points,
+            )
+            .join(ProjectModel, ProjectModel.id == ProjectMemberModel.project_id)
+            .join(manager, manager.id == ProjectModel.manager_id)
+            .join(UserModel, UserModel.id == ProjectMemberModel.user_id)
+            .where(ProjectMemberModel.id == member_id)
+        )
+        row = result.one_or_none()
+        if row is None:
+            return None
+        (
+            project_id,
+            project_name,
+            manager_email,
+            user_id,
+            name,
+            email,
+            seniority_level,
+            points,
+        ) = row
+        return MemberWorkloadState(
+            project_id=project_id,
+            project_name=project_name,
+            manager_email=manager_email,
+            member_id=member_id,
+            user_id=user_id,
+            member_name=name or email,
+            member_email=email,
+            seniority_level=seniority_level,
+            doing_points=int(points),
+        )
+
+    async def raise_alert(self, member_id: UUID) -> bool:
+        result = await self._session.execute(
+            pg_insert(WorkloadAlertModel)
+            .values(member_id=member_id)
+            .on_conflict_do_nothing()
+            .returning(WorkloadAlertModel.member_id)
+        )
+        return result.scalar_one_or_none() is not None
+
+    async def clear_alert(self, member_id: UUID) -> bool:
+        result = await self._session.execute(
+            delete(WorkloadAlertModel)
+            .where(WorkloadAlertModel.member_id == member_id)
+            .returning(WorkloadAlertModel.member_id)
+        )
+        return result.scalar_one_or_none() is not None
+
+
+class PostgresLLMUsageRepository:
+    """SQLAlchemy repository for per-project daily LLM token usage."""
+
+    def __init__(self, session: AsyncSession) -> None:
+        self._session = session
+
+    async def get_tokens(self, project_id: UUID, day: date) -> int:
+        result = await self._session.execute(
+            select(LLMUsageModel.tokens).where(
+                LLMUsageModel.project_id == project_id, LLMUsageModel.day == day
+            )
+        )
+        return int(result.scalar_one_or_none() or 0)
+
+    async def add(self, project_id: UUID, day: date, tokens: int) -> int:
+        stmt = pg_insert(LLMUsageModel).values(
+            project_id=project_id, day=day, tokens=tokens, requests=1
+        )
+        result = await self._session.execute(
+            stmt.on_conflict_do_update(
+                index_elements=[LLMUsageModel.project_id, LLMUsageModel.day],
+                set_={
+                    "tokens": LLMUsageModel.tokens + stmt.excluded.tokens,
+                    "requests": LLMUsageModel.requests + 1,
+                },
+            ).returning(LLMUsageModel.tokens)
+        )
+        return int(result.scalar_one())
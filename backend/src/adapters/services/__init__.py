@@ -1,6 +1,7 @@
 """Service adapters for local development."""
 
 from backend.src.adapters.services.basic_services import (
+    InMemoryProjectAccessCache,
     InMemoryRateLimiter,
     InMemoryRevokedTokenStore,
     InMemoryTokenService,
@@ -9,27 +10,77 @@ from backend.src.adapters.services.basic_services import (
     MockNotificationService,
     SimpleEncryptionService,
 )
+from backend.src.adapters.services.bounded_ttl_store import BoundedTTLStore
+from backend.src.adapters.services.caching_llm_service import (
+    CachingLLMService,
+    LLMCacheStats,
+)
+from backend.src.adapters.services.circuit_breaker import (
+    CircuitBreaker,
+    CircuitBreakerRegistry,
+    CircuitBreakerSnapshot,
+    CircuitState,
+)
 from backend.src.adapters.services.email_notification_service import (
     EmailNotificationService,
 )
+from backend.src.adapters.services.event_bus import InProcessEventBus
 from backend.src.adapters.services.fernet_encryption_service import (
     FernetEncryptionService,
 )
 from backend.src.adapters.services.jwt_token_service import JWTTokenService
+from backend.src.adapters.services.llm_client_registry import (
+    LLMClientKey,
+    LLMClientRegistry,
+)
+from backend.src.adapters.services.llm_scheduler import (
+    FairLLMScheduler,
+    LLMTokenBudget,
+    ProjectScopedLLMResolver,
+    ScheduledLLMService,
+    WeightedFairQueue,
+)
 from backend.src.adapters.services.openai_llm_service import OpenAILLMService
+from backend.src.adapters.services.outbox_email_service import OutboxEmailService
+from backend.src.adapters.services.resilient_llm_service import ResilientLLMService
+from backend.src.adapters.services.similarity_llm_service import SimilarityLLMService
 from backend.src.adapters.services.smtp_email_service import SMTPEmailService
+from backend.src.adapters.services.toast_hub import InMemoryToastHub, ToastSubscription
+from backend.src.adapters.services.verified_token_cache import VerifiedTokenCache
 
 __all__ = [
+    "BoundedTTLStore",
+    "CachingLLMService",
+    "CircuitBreaker",
+    "CircuitBreakerRegistry",
+    "CircuitBreakerSnapshot",
+    "CircuitState",
     "EmailNotificationService",
+    "FairLLMScheduler",
     "FernetEncryptionService",
     "InMemoryTokenService",
+    "InMemoryProjectAccessCache",
     "InMemoryRevokedTokenStore",
     "InMemoryRateLimiter",
+    "InMemoryToastHub",
+    "InProcessEventBus",
     "JWTTokenService",
+    "LLMCacheStats",
+    "LLMClientKey",
+    "LLMClientRegistry",
+    "LLMTokenBudget",
     "MockEmailService",
     "MockLLMService",
     "MockNotificationService",
     "OpenAILLMService",
+    "OutboxEmailService",
+    "ProjectScopedLLMResolver",
+    "ResilientLLMService",
+    "ScheduledLLMService",
+    "SimilarityLLMService",
     "SMTPEmailService",
     "SimpleEncryptionService",
+    "ToastSubscription",
+    "VerifiedTokenCache",
+    "WeightedFairQueue",
 ]
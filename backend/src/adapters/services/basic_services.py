@@ -4,16 +4,22 @@ from __future__ import annotations
 
 import base64
 import hashlib
+import math
 import secrets
+import time
+from collections.abc import AsyncIterator, Callable, Sequence
 from dataclasses import dataclass, field
-from datetime import datetime, timedelta, timezone
 from typing import Any, Dict
 from uuid import UUID
 
+from backend.src.adapters.services.bounded_ttl_store import BoundedTTLStore
+from backend.src.domain.entities import ProjectAccess
 from backend.src.domain.ports.services import (
     DifficultyEstimation,
+    DifficultyEstimationRequest,
     EmailMessage,
     ProgressEstimation,
+    RateLimitAlgorithm,
     RateLimitResult,
     TokenPair,
 )
@@ -28,83 +34,179 @@ class MockEmailService:
     async def send_email(self, message: EmailMessage) -> None:
         self.sent_messages.append(message)
 
+    async def send_many(
+        self, messages: Sequence[EmailMessage]
+    ) -> list[BaseException | None]:
+        self.sent_messages.extend(messages)
+        return [None] * len(messages)
+
 
 class InMemoryTokenService:
-    """Basic token service backed by in-memory storage."""
+    """Basic token service backed by bounded in-memory storage."""
 
-    def __init__(self) -> None:
-        self._access_tokens: dict[str, dict[str, Any]] = {}
-        self._refresh_tokens: dict[str, dict[str, Any]] = {}
+    def __init__(
+        self,
+        access_ttl_seconds: int = 30 * 60,
+        refresh_ttl_seconds: int = 7 * 24 * 60 * 60,
+        max_tokens: int = 100_000,
+    ) -> None:
+        self._access_ttl_seconds = access_ttl_seconds
+        self._refresh_ttl_seconds = refresh_ttl_seconds
+        self._access_tokens: BoundedTTLStore[str, dict[str, Any]] = BoundedTTLStore(
+            max_tokens
+        )
+        self._refresh_tokens: BoundedTTLStore[str, dict[str, Any]] = BoundedTTLStore(
+            max_tokens
+        )
 
-    async def generate_tokens(
-        self, user_id: UUID, claims: Dict[str, Any] | None = None
-    ) -> TokenPair:
-        payload = {"user_id": str(user_id), **(claims or {})}
+    def _issue(self, payload: dict[str, Any]) -> TokenPair:
         access_token = secrets.token_urlsafe(32)
         refresh_token = secrets.token_urlsafe(48)
-        self._access_tokens[access_token] = payload
-        self._refresh_tokens[refresh_token] = payload
+        self._access_tokens.set(access_token, payload, self._access_ttl_seconds)
+        self._refresh_tokens.set(refresh_token, payload, self._refresh_ttl_seconds)
         return TokenPair(access_token=access_token, refresh_token=refresh_token)
 
+    async def generate_tokens(
+        self, user_id: UUID, claims: Dict[str, Any] | None = None
+    ) -> TokenPair:
+        return self._issue({"user_id": str(user_id), **(claims or {})})
+
     async def verify_token(self, token: str) -> Dict[str, Any] | None:
         return self._access_tokens.get(token)
 
     async def refresh_token(self, token: str) -> TokenPair | None:
-        payload = self._refresh_tokens.get(token)
+        payload = self._refresh_tokens.pop(token)
         if not payload:
             return None
-        self._refresh_tokens.pop(token, None)
-        access_token = secrets.token_urlsafe(32)
-        refresh_token = secrets.token_urlsafe(48)
-        self._access_tokens[access_token] = payload
-        self._refresh_tokens[refresh_token] = payload
-        return TokenPair(access_token=access_token, refresh_token=refresh_token)
+        return self._issue(payload)
 
     async def revoke_token(self, token: str) -> Dict[str, Any] | None:
-        payload = self._access_tokens.pop(token, None)
+        payload = self._access_tokens.pop(token)
         if payload:
             return payload
-        return self._refresh_tokens.pop(token, None)
+        return self._refresh_tokens.pop(token)
 
 
 class InMemoryRevokedTokenStore:
     """In-memory revoked-token store (for tests/local fallback)."""
 
-    def __init__(self) -> None:
-        self._entries: dict[str, datetime] = {}
+    def __init__(self, clock: Callable[[], float] = time.monotonic) -> None:
+        # No size cap: evicting a live revocation would re-enable its token.
+        # Entries are still reclaimed as soon as the token would expire.
+        self._entries: BoundedTTLStore[str, bool] = BoundedTTLStore(None, clock)
 
     async def revoke(self, jti: str, ttl_seconds: int) -> None:
-        self._entries[jti] = datetime.now(timezone.utc) + timedelta(seconds=ttl_seconds)
+        self._entries.set(jti, True, ttl_seconds)
 
     async def is_revoked(self, jti: str) -> bool:
-        exp = self._entries.get(jti)
-        if exp is None:
-            return False
-        if datetime.now(timezone.utc) >= exp:
-            self._entries.pop(jti, None)
-            return False
-        return True
+        return jti in self._entries
+
+
+class InMemoryProjectAccessCache:
+    """Per-process project access cache (for tests/single-worker deployments)."""
+
+    def __init__(
+        self,
+        ttl_seconds: float = 30,
+        max_entries: int = 100_000,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._ttl_seconds = ttl_seconds
+        self._entries: BoundedTTLStore[tuple[UUID, UUID], ProjectAccess] = (
+            BoundedTTLStore(max_entries, clock)
+        )
+
+    async def get(self, project_id: UUID, user_id: UUID) -> ProjectAccess | None:
+        return self._entries.get((project_id, user_id))
+
+    async def set(self, access: ProjectAccess) -> None:
+        key = (access.project_id, access.user_id)
+        self._entries.set(key, access, self._ttl_seconds)
+
+    async def invalidate(self, project_id: UUID, user_id: UUID) -> None:
+        self._entries.pop((project_id, user_id))
 
 
 class InMemoryRateLimiter:
-    """In-memory fixed-window limiter (fallback for local/tests)."""
-
-    def __init__(self) -> None:
-        self._entries: dict[str, tuple[int, datetime]] = {}
-
-    async def hit(self, key: str, limit: int, window_seconds: int) -> RateLimitResult:
-        now = datetime.now(timezone.utc)
-        current, expires_at = self._entries.get(key, (0, now + timedelta(seconds=window_seconds)))
-        if now >= expires_at:
-            current = 0
-            expires_at = now + timedelta(seconds=window_seconds)
-        current += 1
-        self._entries[key] = (current, expires_at)
-        remaining = max(0, limit - current)
-        if current > limit:
-            retry_after = int((expires_at - now).total_seconds())
-            return RateLimitResult(allowed=False, remaining=0, retry_after_seconds=max(1, retry_after))
-        return RateLimitResult(allowed=True, remaining=remaining)
+    """In-memory sliding-window/token-bucket limiter (fallback for local/tests)."""
+
+    def __init__(
+        self,
+        clock: Callable[[], float] = time.time,
+        max_keys: int = 100_000,
+    ) -> None:
+        self._clock = clock
+        # key -> (window index, hits in that window, hits in the window before)
+        self._windows: BoundedTTLStore[str, tuple[int, int, int]] = BoundedTTLStore(
+            max_keys, clock
+        )
+        # key -> (tokens left, last refill time)
+        self._buckets: BoundedTTLStore[str, tuple[float, float]] = BoundedTTLStore(
+            max_keys, clock
+        )
+
+    async def hit(
+        self,
+        key: str,
+        limit: int,
+        window_seconds: int,
+        algorithm: RateLimitAlgorithm = RateLimitAlgorithm.SLIDING_WINDOW,
+    ) -> RateLimitResult:
+        if algorithm == RateLimitAlgorithm.TOKEN_BUCKET:
+            return self._token_bucket(key, limit, window_seconds)
+        return self._sliding_window(key, limit, window_seconds)
+
+    def _sliding_window(self, key: str, limit: int, window_seconds: int) -> RateLimitResult:
+        now = self._clock()
+        index = int(now // window_seconds)
+        elapsed = now - index * window_seconds
+        stored_index, current, previous = self._windows.get(key, (index, 0, 0))
+        if stored_index == index - 1:
+            current, previous = 0, current
+        elif stored_index != index:
+            current, previous = 0, 0
+        estimate = previous * (window_seconds - elapsed) / window_seconds + current
+        if estimate + 1 > limit:
+            if current + 1 > limit or previous == 0:
+                retry_after = window_seconds - elapsed
+            else:
+                retry_after = (
+                    window_seconds
+                    - elapsed
+                    - (limit - current - 1) * window_seconds / previous
+                )
+            return RateLimitResult(
+                allowed=False,
+                remaining=0,
+                retry_after_seconds=max(1, math.ceil(retry_after)),
+            )
+
+        # Both counters are irrelevant two windows after the current one starts.
+        self._windows.set(
+            key,
+            (index, current + 1, previous),
+            (index + 2) * window_seconds - now,
+        )
+        return RateLimitResult(allowed=True, remaining=max(0, int(limit - estimate - 1)))
+
+    def _token_bucket(self, key: str, limit: int, window_seconds: int) -> RateLimitResult:
+        now = self._clock()
+        rate = limit / window_seconds
+        tokens, updated_at = self._buckets.get(key, (float(limit), now))
+        tokens = min(float(limit), tokens + (now - updated_at) * rate)
+        # Buckets expire after one window: by then an untouched bucket has
+        # refilled completely, which is what a missing one defaults to.
+        if tokens < 1:
+            self._buckets.set(key, (tokens, now), window_seconds)
+            return RateLimitResult(
+                allowed=False,
+                remaining=0,
+                retry_after_seconds=max(1, math.ceil((1 - tokens) / rate)),
+            )
+
+        tokens -= 1
+        self._buckets.set(key, (tokens, now), window_seconds)
+        return RateLimitResult(allowed=True, remaining=int(tokens))
 
 
 class SimpleEncryptionService:
@@ -144,19 +246,51 @@ class MockLLMService:
             reasoning="Mock estimate based on text length.",
         )
 
+    async def estimate_difficulty_batch(
+        self,
+        items: Sequence[DifficultyEstimationRequest],
+        project_context: str | None = None,
+    ) -> list[DifficultyEstimation | None]:
+        return [
+            await self.estimate_difficulty(
+                item.task_title, item.task_description, project_context
+            )
+            for item in items
+        ]
+
     async def estimate_progress(
         self,
         task_title: str,
         task_description: str,
         reports: list[str],
+        previous: ProgressEstimation | None = None,
     ) -> ProgressEstimation:
         total_words = sum(len(r.split()) for r in reports)
-        percentage = min(100, max(0, total_words))
+        base = previous.percentage if previous else 0
+        percentage = min(100, max(0, base + total_words))
+        summary = " ".join(([previous.summary] if previous else []) + reports)
         return ProgressEstimation(
             percentage=percentage,
             confidence=0.2,
             reasoning="Mock estimate based on report size.",
+            summary=summary[-500:],
+        )
+
+    async def estimate_progress_stream(
+        self,
+        task_title: str,
+        task_description: str,
+        reports: list[str],
+        previous: ProgressEstimation | None = None,
+    ) -> AsyncIterator[str | ProgressEstimation]:
+        estimation = await self.estimate_progress(
+            task_title, task_description, reports, previous
         )
+        first, *rest = estimation.reasoning.split(" ")
+        yield first
+        for word in rest:
+            yield f" {word}"
+        yield estimation
 
 
 class MockNotificationService:
@@ -0,0 +1,136 @@
+"""Bounded in-memory key/value store with per-entry expiry."""
+
+from __future__ import annotations
+
+import math
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from typing import Generic, TypeVar
+
+K = TypeVar("K")
+V = TypeVar("V")
+
+_MISSING = object()
+
+
+class BoundedTTLStore(Generic[K, V]):
+    """
+    Dict-like store whose entries expire and whose size can be capped.
+
+    Keys are filed in a timing wheel of one-second slots by expiry time.
+    Every write drains a few keys from slots that are already due, so
+    expired keys are reclaimed at least as fast as new ones arrive even if
+    they are never read again; ``sweep`` drains everything that is due.
+    Past ``max_entries`` the least recently used entry is evicted (``None``
+    disables the cap for data that must not be dropped early). Reads of an
+    expired entry behave as a miss.
+    """
+
+    # Slot keys examined per write; more than one so sweeping outpaces
+    # insertion and catches up after bursts.
+    _SWEEP_PER_WRITE = 8
+
+    def __init__(
+        self,
+        max_entries: int | None = 100_000,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._max_entries = max_entries
+        self._clock = clock
+        self._entries: OrderedDict[K, tuple[float, V]] = OrderedDict()
+        self._slots: dict[int, list[K]] = {}
+        self._slot_refs = 0
+        self._cursor: int | None = None
+
+    def set(self, key: K, value: V, ttl_seconds: float) -> None:
+        """Store `value` under `key` for `ttl_seconds`."""
+        now = self._clock()
+        expires_at = now + ttl_seconds
+        self._entries[key] = (expires_at, value)
+        self._entries.move_to_end(key)
+        self._file(key, expires_at)
+
+        self._sweep(now, self._SWEEP_PER_WRITE)
+        if self._max_entries is not None:
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+        # Overwrites, pops and evictions leave stale keys in the wheel.
+        if self._slot_refs > 2 * len(self._entries) + 64:
+            self._rebuild_wheel()
+
+    def get(self, key: K, default: V | None = None) -> V | None:
+        """Return the live value for `key`, marking it recently used."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return default
+        if self._clock() >= entry[0]:
+            del self._entries[key]
+            return default
+        self._entries.move_to_end(key)
+        return entry[1]
+
+    def pop(self, key: K, default: V | None = None) -> V | None:
+        """Remove `key` and return its value if it was still live."""
+        entry = self._entries.pop(key, None)
+        if entry is None or self._clock() >= entry[0]:
+            return default
+        return entry[1]
+
+    def sweep(self) -> int:
+        """Drop every expired entry; return how many were removed."""
+        return self._sweep(self._clock(), None)
+
+    def __contains__(self, key: object) -> bool:
+        return self.get(key, _MISSING) is not _MISSING  # type: ignore[arg-type]
+
+    def __len__(self) -> int:
+        """Number of stored entries, including expired ones not yet swept."""
+        return len(self._entries)
+
+    def _file(self, key: K, expires_at: float) -> None:
+        slot = math.floor(expires_at)
+        if self._cursor is None:
+            self._cursor = slot
+        # A non-positive TTL can land behind the cursor; file it where the
+        # sweep will still find it.
+        self._slots.setdefault(max(slot, self._cursor), []).append(key)
+        self._slot_refs += 1
+
+    def _advance(self, last_due: int) -> None:
+        """Move the cursor past empty slots, jumping over long idle gaps."""
+        assert self._cursor is not None
+        if not self._slots:
+            self._cursor = max(self._cursor, last_due + 1)
+        elif len(self._slots) < last_due - self._cursor:
+            self._cursor = min(self._slots)
+
+    def _sweep(self, now: float, budget: int | None) -> int:
+        if self._cursor is None:
+            return 0
+        # Slots strictly before the current second hold only expired keys.
+        last_due = math.floor(now) - 1
+        self._advance(last_due)
+
+        examined = removed = 0
+        while self._cursor <= last_due and (budget is None or examined < budget):
+            examined += 1
+            keys = self._slots.get(self._cursor)
+            if not keys:
+                self._slots.pop(self._cursor, None)
+                self._cursor += 1
+                self._advance(last_due)
+                continue
+            key = keys.pop()
+            self._slot_refs -= 1
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] <= now:
+                del self._entries[key]
+                removed += 1
+        return removed
+
+    def _rebuild_wheel(self) -> None:
+        self._slots = {}
+        self._slot_refs = 0
+        for key, (expires_at, _) in self._entries.items():
+            self._file(key, expires_at)
@@ -0,0 +1,285 @@
+"""LLM service decorator caching estimations by content hash."""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import logging
+import time
+import unicodedata
+from collections.abc import AsyncIterator, Awaitable, Callable, Sequence
+from dataclasses import asdict, dataclass
+from typing import TypeVar
+
+from backend.src.adapters.services.bounded_ttl_store import BoundedTTLStore
+from backend.src.domain.ports.services import (
+    DifficultyEstimation,
+    DifficultyEstimationRequest,
+    LLMResultCache,
+    LLMService,
+    ProgressEstimation,
+)
+
+logger = logging.getLogger(__name__)
+
+# Bump when prompts or result fields change so old entries stop matching.
+_KEY_VERSION = "v2"
+
+Estimation = TypeVar("Estimation", DifficultyEstimation, ProgressEstimation)
+
+
+def _normalize(text: str | None) -> str | None:
+    """Canonical form of free text: NFC, trimmed, single spaces."""
+    if text is None:
+        return None
+    return " ".join(unicodedata.normalize("NFC", text).split())
+
+
+def estimation_key(namespace: str, operation: str, payload: dict) -> str:
+    """Key an estimation by provider/model namespace and a hash of its input."""
+    canonical = json.dumps(payload, ensure_ascii=False, separators=(",", ":"))
+    digest = hashlib.sha256(canonical.encode()).hexdigest()
+    return f"{_KEY_VERSION}:{namespace}:{operation}:{digest}"
+
+
+@dataclass
+class LLMCacheStats:
+    """Counters for how estimation requests were served."""
+
+    local_hits: int = 0
+    shared_hits: int = 0
+    coalesced: int = 0
+    misses: int = 0
+
+    @property
+    def hit_ratio(self) -> float:
+        """Share of requests that did not reach the provider."""
+        total = self.local_hits + self.shared_hits + self.coalesced + self.misses
+        return (total - self.misses) / total if total else 0.0
+
+
+class CachingLLMService:
+    """
+    LLMService decorator that answers repeated estimations from a cache.
+
+    Inputs are normalized (Unicode NFC, collapsed whitespace) and hashed,
+    and the hash is keyed by the ``namespace`` naming the provider and
+    model, so a model change never serves another model's answer. Lookups
+    go to an in-process LRU first, then to the optional shared cache, and
+    only then to the wrapped service. Concurrent requests for the same key
+    share one lookup and one upstream call; a batch sends each distinct
+    miss upstream once. Provider errors are not cached.
+    """
+
+    def __init__(
+        self,
+        inner: LLMService,
+        namespace: str,
+        shared_cache: LLMResultCache | None = None,
+        max_entries: int = 1024,
+        ttl_seconds: int = 86400,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._inner = inner
+        self._namespace = namespace
+        self._shared = shared_cache
+        self._ttl_seconds = ttl_seconds
+        self._local: BoundedTTLStore[str, object] = BoundedTTLStore(
+            max_entries=max_entries, clock=clock
+        )
+        self._inflight: dict[str, asyncio.Task] = {}
+        self.stats = LLMCacheStats()
+
+    async def estimate_difficulty(
+        self,
+        task_title: str,
+        task_description: str,
+        project_context: str | None = None,
+    ) -> DifficultyEstimation:
+        key = self._difficulty_key(task_title, task_description, project_context)
+        return await self._cached(
+            key,
+            DifficultyEstimation,
+            lambda: self._inner.estimate_difficulty(
+                task_title, task_description, project_context
+            ),
+        )
+
+    async def estimate_difficulty_batch(
+        self,
+        items: Sequence[DifficultyEstimationRequest],
+        project_context: str | None = None,
+    ) -> list[DifficultyEstimation | None]:
+        """Serve cached items and send only the distinct misses upstream."""
+        results: list[DifficultyEstimation | None] = [None] * len(items)
+        missing: dict[str, list[int]] = {}
+        for index, item in enumerate(items):
+            key = self._difficulty_key(
+                item.task_title, item.task_description, project_context
+            )
+            if key in missing:
+                self.stats.coalesced += 1
+                missing[key].append(index)
+                continue
+            cached = await self._lookup(key, DifficultyEstimation)
+            if cached is not None:
+                results[index] = cached
+            else:
+                missing[key] = [index]
+
+        if missing:
+            self.stats.misses += len(missing)
+            estimates = await self._inner.estimate_difficulty_batch(
+                [items[indexes[0]] for indexes in missing.values()], project_context
+            )
+            for (key, indexes), estimate in zip(missing.items(), estimates):
+                if estimate is None:
+                    continue
+                await self._store(key, estimate)
+                for index in indexes:
+                    results[index] = estimate
+        return results
+
+    async def estimate_progress(
+        self,
+        task_title: str,
+        task_description: str,
+        reports: list[str],
+        previous: ProgressEstimation | None = None,
+    ) -> ProgressEstimation:
+        return await self._cached(
+            self._progress_key(task_title, task_description, reports, previous),
+            ProgressEstimation,
+            lambda: self._inner.estimate_progress(
+                task_title, task_description, reports, previous
+            ),
+        )
+
+    async def estimate_progress_stream(
+        self,
+        task_title: str,
+        task_description: str,
+        reports: list[str],
+        previous: ProgressEstimation | None = None,
+    ) -> AsyncIterator[str | ProgressEstimation]:
+        """Replay a cached estimate, or stream it from upstream and cache it.
+
+        Streams are not shared with concurrent requests for the same key.
+        """
+        key = self._progress_key(task_title, task_description, reports, previous)
+        cached = await self._lookup(key, ProgressEstimation)
+        if cached is not None:
+            if cached.reasoning:
+                yield cached.reasoning
+            yield cached
+            return
+        self.stats.misses += 1
+        async for item in self._inner.estimate_progress_stream(
+            task_title, task_description, reports, previous
+        ):
+            if isinstance(item, ProgressEstimation):
+                await self._store(key, item)
+            yield item
+
+    def _progress_key(
+        self,
+        task_title: str,
+        task_description: str,
+        reports: list[str],
+        previous: ProgressEstimation | None,
+    ) -> str:
+        payload = {
+            "title": _normalize(task_title),
+            "description": _normalize(task_description),
+            "reports": [_normalize(report) for report in reports],
+        }
+        if previous is not None:
+            payload["previous"] = [previous.percentage, _normalize(previous.summary)]
+        return estimation_key(self._namespace, "progress", payload)
+
+    def _difficulty_key(
+        self, task_title: str, task_description: str, project_context: str | None
+    ) -> str:
+        return estimation_key(
+            self._namespace,
+            "difficulty",
+            {
+                "title": _normalize(task_title),
+                "description": _normalize(task_description),
+                "context": _normalize(project_context),
+            },
+        )
+
+    async def _cached(
+        self,
+        key: str,
+        result_type: type[Estimation],
+        load: Callable[[], Awaitable[Estimation]],
+    ) -> Estimation:
+        cached = self._local.get(key)
+        if cached is not None:
+            self.stats.local_hits += 1
+            return cached  # type: ignore[return-value]
+
+        task = self._inflight.get(key)
+        if task is not None:
+            self.stats.coalesced += 1
+        else:
+            task = asyncio.ensure_future(self._load(key, result_type, load))
+            self._inflight[key] = task
+            task.add_done_callback(lambda done: self._forget(key, done))
+        # A cancelled caller must not cancel the call others are waiting on.
+        return await asyncio.shield(task)
+
+    async def _load(
+        self,
+        key: str,
+        result_type: type[Estimation],
+        load: Callable[[], Awaitable[Estimation]],
+    ) -> Estimation:
+        cached = await self._lookup_shared(key, result_type)
+        if cached is not None:
+            return cached
+        self.stats.misses += 1
+        result = await load()
+        await self._store(key, result)
+        return result
+
+    async def _lookup(
+        self, key: str, result_type: type[Estimation]
+    ) -> Estimation | None:
+        cached = self._local.get(key)
+        if cached is not None:
+            self.stats.local_hits += 1
+            return cached  # type: ignore[return-value]
+        return await self._lookup_shared(key, result_type)
+
+    async def _lookup_shared(
+        self, key: str, result_type: type[Estimation]
+    ) -> Estimation | None:
+        if self._shared is None:
+            return None
+        raw = await self._shared.get(key)
+        if raw is None:
+            return None
+        try:
+            result = result_type(**json.loads(raw))
+        except (TypeError, ValueError):
+            logger.warning("llm_cache_entry_invalid key=%s", key)
+            return None
+        self.stats.shared_hits += 1
+        self._local.set(key, result, self._ttl_seconds)
+        return result
+
+    async def _store(self, key: str, result: Estimation) -> None:
+        self._local.set(key, result, self._ttl_seconds)
+        if self._shared is not None:
+            await self._shared.set(key, json.dumps(asdict(result)), self._ttl_seconds)
+
+    def _forget(self, key: str, task: asyncio.Task) -> None:
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        # Every waiter may have been cancelled; retrieve the error anyway.
+        if not task.cancelled():
+            task.exception()
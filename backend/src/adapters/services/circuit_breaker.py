@@ -0,0 +1,127 @@
+"""Circuit breakers for calls to external providers."""
+
+from __future__ import annotations
+
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from dataclasses import dataclass
+from enum import Enum
+
+
+class CircuitState(str, Enum):
+    """Whether calls go through (closed), are refused (open) or probed."""
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+@dataclass(frozen=True)
+class CircuitBreakerSnapshot:
+    """Point-in-time view of a breaker, for metrics."""
+
+    state: CircuitState
+    consecutive_failures: int
+    opened_total: int
+
+
+class CircuitBreaker:
+    """
+    Consecutive-failure circuit breaker.
+
+    After ``failure_threshold`` failures in a row the breaker opens and
+    refuses calls for ``reset_timeout_seconds``. It then lets one probe
+    through (half-open): success closes it, failure opens it again. A probe
+    that never reports back (e.g. its caller was cancelled) is replaced by
+    a new one after another ``reset_timeout_seconds``.
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        reset_timeout_seconds: float = 30.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._failure_threshold = max(1, failure_threshold)
+        self._reset_timeout = reset_timeout_seconds
+        self._clock = clock
+        self._state = CircuitState.CLOSED
+        self._failures = 0
+        self._opened_total = 0
+        # When the breaker opened, or when the current probe started.
+        self._since = 0.0
+
+    @property
+    def state(self) -> CircuitState:
+        return self._state
+
+    def allow(self) -> bool:
+        """Whether a call may go through now; claims the probe when half-open."""
+        if self._state == CircuitState.CLOSED:
+            return True
+        now = self._clock()
+        if now - self._since < self._reset_timeout:
+            return False
+        self._state = CircuitState.HALF_OPEN
+        self._since = now
+        return True
+
+    def record_success(self) -> None:
+        self._state = CircuitState.CLOSED
+        self._failures = 0
+
+    def record_failure(self) -> None:
+        self._failures += 1
+        if (
+            self._state == CircuitState.HALF_OPEN
+            or self._failures >= self._failure_threshold
+        ):
+            if self._state != CircuitState.OPEN:
+                self._opened_total += 1
+            self._state = CircuitState.OPEN
+            self._since = self._clock()
+
+    def snapshot(self) -> CircuitBreakerSnapshot:
+        return CircuitBreakerSnapshot(
+            state=self._state,
+            consecutive_failures=self._failures,
+            opened_total=self._opened_total,
+        )
+
+
+class CircuitBreakerRegistry:
+    """
+    Named breakers sharing one configuration, e.g. one per provider.
+
+    Holds at most ``max_breakers``; the least recently used is dropped
+    first, so a forgotten provider simply starts closed again.
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        reset_timeout_seconds: float = 30.0,
+        max_breakers: int = 1024,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._failure_threshold = failure_threshold
+        self._reset_timeout = reset_timeout_seconds
+        self._max_breakers = max_breakers
+        self._clock = clock
+        self._breakers: OrderedDict[str, CircuitBreaker] = OrderedDict()
+
+    def get(self, name: str) -> CircuitBreaker:
+        breaker = self._breakers.get(name)
+        if breaker is None:
+            breaker = CircuitBreaker(
+                self._failure_threshold, self._reset_timeout, self._clock
+            )
+            self._breakers[name] = breaker
+            while len(self._breakers) > self._max_breakers:
+                self._breakers.popitem(last=False)
+        self._breakers.move_to_end(name)
+        return breaker
+
+    def snapshot(self) -> dict[str, CircuitBreakerSnapshot]:
+        return {name: breaker.snapshot() for name, breaker in self._breakers.items()}
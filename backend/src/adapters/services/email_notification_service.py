@@ -9,15 +9,25 @@ from backend.src.domain.ports.services import (
     EmailMessage,
     EmailService,
     NewTaskToastData,
+    ToastPublisher,
     WorkloadAlertData,
 )
 
 
 class EmailNotificationService:
-    """Notification adapter that renders notifications as emails."""
+    """
+    Notification adapter that renders notifications as emails.
 
-    def __init__(self, email_service: EmailService) -> None:
+    Toasts are in-app only and go to the optional toast publisher.
+    """
+
+    def __init__(
+        self,
+        email_service: EmailService,
+        toast_publisher: ToastPublisher | None = None,
+    ) -> None:
         self._email_service = email_service
+        self._toast_publisher = toast_publisher
 
     async def send_daily_report(
         self,
@@ -67,8 +77,8 @@ class EmailNotificationService:
         employee_ids: list[UUID],
         toast: NewTaskToastData,
     ) -> None:
-        # No employee email directory is available in this adapter.
-        return None
+        if self._toast_publisher is not None and employee_ids:
+            await self._toast_publisher.publish(employee_ids, toast)
 
     async def send_deadline_warning(
         self,
@@ -0,0 +1,49 @@
+"""In-process publisher dispatching domain events to registered handlers."""
+
+from __future__ import annotations
+
+import logging
+from collections.abc import Awaitable, Callable, Sequence
+
+from backend.src.domain.events import DomainEvent
+
+logger = logging.getLogger(__name__)
+
+EventHandler = Callable[[Sequence[DomainEvent]], Awaitable[None]]
+
+
+class InProcessEventBus:
+    """
+    Calls each handler once per publish with the events it subscribed to.
+
+    Handlers get the whole matching batch, so a use case that changes many
+    tasks costs each handler one call. A failing handler is logged and does
+    not stop the others or the publishing use case, whose transaction has
+    already committed.
+    """
+
+    def __init__(self) -> None:
+        self._handlers: list[tuple[tuple[type[DomainEvent], ...], EventHandler]] = []
+
+    def subscribe(
+        self,
+        event_types: type[DomainEvent] | tuple[type[DomainEvent], ...],
+        handler: EventHandler,
+    ) -> None:
+        if not isinstance(event_types, tuple):
+            event_types = (event_types,)
+        self._handlers.append((event_types, handler))
+
+    async def publish(self, events: Sequence[DomainEvent]) -> None:
+        if not events:
+            return
+        for event_types, handler in self._handlers:
+            matching = [event for event in events if isinstance(event, event_types)]
+            if not matching:
+                continue
+            try:
+                await handler(matching)
+            except Exception:
+                logger.exception(
+                    "event_handler_failed handler=%r events=%d", handler, len(matching)
+                )
@@ -6,6 +6,7 @@ from datetime import datetime, timedelta, timezone
 from typing import Any
 from uuid import UUID, uuid4
 
+from backend.src.adapters.services.verified_token_cache import VerifiedTokenCache
 from backend.src.config.settings import AppSettings
 from backend.src.domain.ports.services import RevokedTokenStore, TokenPair
 
@@ -17,6 +18,7 @@ class JWTTokenService:
         self,
         settings: AppSettings,
         revoked_token_store: RevokedTokenStore,
+        verified_cache: VerifiedTokenCache | None = None,
     ) -> None:
         if not settings.jwt_secret_key:
             raise RuntimeError("JWT_SECRET_KEY is required when TOKEN_PROVIDER != mock")
@@ -26,6 +28,9 @@ class JWTTokenService:
         self._access_exp_minutes = settings.access_token_expiry_minutes
         self._refresh_exp_minutes = settings.refresh_token_expiry_minutes
         self._revoked_token_store = revoked_token_store
+        self._verified_cache = verified_cache or VerifiedTokenCache(
+            settings.auth_token_cache_size
+        )
 
     def _jwt(self):
         import jwt
@@ -39,14 +44,17 @@ class JWTTokenService:
         return self._jwt().encode(payload, self._secret, algorithm=self._algorithm)
 
     async def _decode(self, token: str) -> dict[str, Any] | None:
-        try:
-            payload = self._jwt().decode(
-                token,
-                self._secret,
-                algorithms=[self._algorithm],
-            )
-        except Exception:
-            return None
+        payload = self._verified_cache.get(token, self._now().timestamp())
+        if payload is None:
+            try:
+                payload = self._jwt().decode(
+                    token,
+                    self._secret,
+                    algorithms=[self._algorithm],
+                )
+            except Exception:
+                return None
+            self._verified_cache.put(token, payload)
 
         jti = payload.get("jti")
         if isinstance(jti, str) and await self._revoked_token_store.is_revoked(jti):
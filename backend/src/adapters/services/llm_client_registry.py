@@ -0,0 +1,117 @@
+"""Registry of per-project (BYOK) LLM clients."""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import time
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass
+from uuid import UUID
+
+from backend.src.adapters.services.bounded_ttl_store import BoundedTTLStore
+from backend.src.domain.entities import Project
+from backend.src.domain.errors import LLMAPIKeyDecryptionError
+from backend.src.domain.ports.services import EncryptionService, LLMService
+
+logger = logging.getLogger(__name__)
+
+# Providers a project may bring its own key for, with their API base URL
+# (None: the client library's default endpoint).
+DEFAULT_PROVIDER_BASE_URLS: Mapping[str, str | None] = {"openai": None}
+
+
+@dataclass(frozen=True)
+class LLMClientKey:
+    """Identifies a client: projects sharing a key share the client."""
+
+    provider: str
+    base_url: str | None
+    key_fingerprint: str
+
+
+def key_fingerprint(api_key: str) -> str:
+    """Stable, non-reversible identifier of an API key."""
+    return hashlib.sha256(api_key.encode()).hexdigest()[:32]
+
+
+class LLMClientRegistry:
+    """
+    Resolves the LLM service for a project (ADR 009).
+
+    Projects with their own provider and key (BYOK) get a client keyed by
+    (provider, base URL, key fingerprint); everything else, including
+    providers that are not supported here, uses the global ``fallback``.
+    Clients are built by ``client_factory`` (which should share one HTTP
+    connection pool), kept in an LRU of ``max_clients`` and dropped
+    ``secret_ttl_seconds`` after creation, since each one holds a decrypted
+    key. A project whose stored ciphertext is unchanged reuses its client
+    without decrypting again; a changed ciphertext (e.g. another worker
+    configured a new key) is noticed on the next lookup.
+    """
+
+    def __init__(
+        self,
+        encryption_service: EncryptionService,
+        client_factory: Callable[[LLMClientKey, str], LLMService],
+        fallback: LLMService,
+        provider_base_urls: Mapping[str, str | None] = DEFAULT_PROVIDER_BASE_URLS,
+        max_clients: int = 64,
+        max_projects: int = 4096,
+        secret_ttl_seconds: int = 900,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._encryption = encryption_service
+        self._client_factory = client_factory
+        self._fallback = fallback
+        self._base_urls = provider_base_urls
+        self._ttl_seconds = secret_ttl_seconds
+        self._clients: BoundedTTLStore[LLMClientKey, LLMService] = BoundedTTLStore(
+            max_entries=max_clients, clock=clock
+        )
+        # project id -> (ciphertext it was resolved from, client key)
+        self._projects: BoundedTTLStore[UUID, tuple[str, LLMClientKey]] = (
+            BoundedTTLStore(max_entries=max_projects, clock=clock)
+        )
+
+    async def for_project(self, project: Project) -> LLMService:
+        if not project.is_llm_enabled:
+            return self._fallback
+        provider = (project.llm_provider or "").lower()
+        if provider not in self._base_urls:
+            logger.warning(
+                "llm_provider_unsupported project_id=%s provider=%s",
+                project.id,
+                provider,
+            )
+            return self._fallback
+
+        ciphertext = project.llm_api_key_encrypted or ""
+        resolved = self._projects.get(project.id)
+        if resolved is not None and resolved[0] == ciphertext:
+            service = self._clients.get(resolved[1])
+            if service is not None:
+                return service
+
+        try:
+            api_key = await self._encryption.decrypt(ciphertext)
+        except Exception as exc:
+            raise LLMAPIKeyDecryptionError() from exc
+        key = LLMClientKey(
+            provider, self._base_urls[provider], key_fingerprint(api_key)
+        )
+        self._projects.set(project.id, (ciphertext, key), self._ttl_seconds)
+        service = self._clients.get(key)
+        if service is None:
+            service = self._client_factory(key, api_key)
+            self._clients.set(key, service, self._ttl_seconds)
+        return service
+
+    def invalidate(self, project_id: UUID) -> None:
+        resolved = self._projects.pop(project_id)
+        if resolved is not None:
+            self._clients.pop(resolved[1])
+
+    def __len__(self) -> int:
+        """Number of clients held, including expired ones not yet swept."""
+        return len(self._clients)
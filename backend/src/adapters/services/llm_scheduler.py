@@ -0,0 +1,575 @@
+"""Fair sharing of the house LLM between projects, with daily token budgets."""
+
+from __future__ import annotations
+
+import asyncio
+import heapq
+import itertools
+import logging
+from collections.abc import (
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Iterator,
+    Mapping,
+    Sequence,
+)
+from contextlib import (
+    AbstractAsyncContextManager,
+    asynccontextmanager,
+    contextmanager,
+)
+from contextvars import ContextVar
+from dataclasses import dataclass
+from datetime import date
+from functools import partial
+from typing import TypeVar
+from uuid import UUID
+
+from backend.src.adapters.services.llm_usage import LLMUsage
+from backend.src.domain.entities import Project
+from backend.src.domain.errors import (
+    LLMBudgetExceededError,
+    LLMInvalidResponseError,
+    LLMProviderError,
+    LLMRateLimitError,
+)
+from backend.src.domain.ports import UnitOfWork
+from backend.src.domain.ports.services import (
+    DifficultyEstimation,
+    DifficultyEstimationRequest,
+    LLMService,
+    LLMServiceResolver,
+    ProgressEstimation,
+)
+from backend.src.domain.time import utcnow
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# Rough token accounting: prompts are sized at about four characters per
+# token, plus the fixed instructions and the expected answer.
+_CHARS_PER_TOKEN = 4
+_PROMPT_TOKENS = 100
+_DIFFICULTY_OUTPUT_TOKENS = 120
+_PROGRESS_OUTPUT_TOKENS = 300
+
+
+# Project whose LLM calls are being made, set by ProjectScopedLLMResolver.
+_current_project: ContextVar[UUID | None] = ContextVar(
+    "llm_current_project", default=None
+)
+# Queue key shared by calls made outside any project.
+_UNATTRIBUTED = UUID(int=0)
+
+
+def _tokens(*texts: str | None) -> int:
+    return sum(len(text or "") for text in texts) // _CHARS_PER_TOKEN
+
+
+def _progress_tokens(
+    task_title: str,
+    task_description: str,
+    reports: list[str],
+    previous: ProgressEstimation | None,
+) -> int:
+    return (
+        _PROMPT_TOKENS
+        + _PROGRESS_OUTPUT_TOKENS
+        + _tokens(
+            task_title,
+            task_description,
+            previous.summary if previous else None,
+            *reports,
+        )
+    )
+
+
+class WeightedFairQueue:
+    """
+    Concurrency limiter that admits waiting requests in weighted fair order.
+
+    Up to ``max_concurrency`` requests run at once. Waiting requests are
+    ordered by start-time fair queuing: each gets a virtual finish time of
+    ``max(now, the key's last finish) + cost / weight``, so a key that sends
+    a lot of work queues behind keys that sent little, in proportion to
+    their weights, instead of ahead of them in arrival order. A key with
+    ``max_queued`` requests already waiting is refused at once.
+    """
+
+    def __init__(self, max_concurrency: int, max_queued: int = 100) -> None:
+        self._max_concurrency = max(1, max_concurrency)
+        self._max_queued = max_queued
+        self._active = 0
+        self._virtual_time = 0.0
+        self._last_finish: dict[UUID, float] = {}
+        self._queued: dict[UUID, int] = {}
+        self._waiting: list[tuple[float, int, float, UUID, asyncio.Future]] = []
+        self._seq = itertools.count()
+
+    @property
+    def active(self) -> int:
+        return self._active
+
+    def queued(self, key: UUID) -> int:
+        return self._queued.get(key, 0)
+
+    @asynccontextmanager
+    async def slot(self, key: UUID, cost: float, weight: float = 1.0):
+        """Hold one of the concurrent slots for the duration of the block."""
+        await self._acquire(key, cost, weight)
+        try:
+            yield
+        finally:
+            self._release()
+
+    async def _acquire(self, key: UUID, cost: float, weight: float) -> None:
+        if self._active < self._max_concurrency and not self._waiting:
+            self._active += 1
+            self._tag(key, cost, weight)
+            return
+        if self._queued.get(key, 0) >= self._max_queued:
+            raise LLMRateLimitError("house")
+        start, finish = self._tag(key, cost, weight)
+        future = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._waiting, (finish, next(self._seq), start, key, future))
+        self._queued[key] = self._queued.get(key, 0) + 1
+        try:
+            await future
+        except asyncio.CancelledError:
+            # Handed a slot just as we were cancelled: pass it on.
+            if future.done() and not future.cancelled():
+                self._release()
+            raise
+
+    def _tag(self, key: UUID, cost: float, weight: float) -> tuple[float, float]:
+        start = max(self._virtual_time, self._last_finish.get(key, 0.0))
+        finish = start + max(cost, 1.0) / max(weight, 1e-6)
+        self._last_finish[key] = finish
+        if len(self._last_finish) > 4 * self._max_queued:
+            # Keys at or behind virtual time are indistinguishable from new.
+            self._last_finish = {
+                k: f for k, f in self._last_finish.items() if f > self._virtual_time
+            }
+        return start, finish
+
+    def _release(self) -> None:
+        while self._waiting:
+            _, _, start, key, future = heapq.heappop(self._waiting)
+            remaining = self._queued[key] - 1
+            if remaining:
+                self._queued[key] = remaining
+            else:
+                del self._queued[key]
+            if future.done():
+                continue
+            # The slot passes straight to the next request.
+            self._virtual_time = max(self._virtual_time, start)
+            future.set_result(None)
+            return
+        self._active -= 1
+
+
+@dataclass
+class _DailyUsage:
+    day: date
+    used: int
+    reserved: int = 0
+
+
+class LLMTokenBudget:
+    """
+    Per-project daily token budgets over usage persisted per (project, day).
+
+    Requests reserve their estimated tokens up front and are refused at once
+    if the day's usage plus reservations would pass ``daily_tokens``. When
+    they finish the reservation is released and the tokens actually spent
+    are added to the persisted total, which also refreshes the local view
+    with what other workers used. With no budget set, usage is still
+    recorded.
+    """
+
+    def __init__(
+        self,
+        uow_factory: Callable[[], AbstractAsyncContextManager[UnitOfWork]],
+        daily_tokens: int | None = None,
+        today: Callable[[], date] = lambda: utcnow().date(),
+    ) -> None:
+        self._uow_factory = uow_factory
+        self._daily_tokens = daily_tokens
+        self._today = today
+        self._usage: dict[UUID, _DailyUsage] = {}
+
+    async def check(self, project_id: UUID, tokens: int) -> None:
+        """Refuse at once if `tokens` more would pass the project's budget."""
+        await self._admit(project_id, tokens)
+
+    async def reserve(self, project_id: UUID, tokens: int) -> None:
+        """Hold `tokens` of the budget until the request is settled."""
+        usage = await self._admit(project_id, tokens)
+        if usage is not None:
+            usage.reserved += tokens
+
+    async def settle(self, project_id: UUID, reserved: int, spent: int) -> None:
+        """Release a reservation of `reserved` tokens, recording `spent` ones."""
+        day = self._today()
+        usage = self._usage.get(project_id)
+        if usage is not None:
+            usage.reserved = max(0, usage.reserved - reserved)
+            if spent and usage.day == day:
+                usage.used += spent
+        if not spent:
+            return
+        try:
+            async with self._uow_factory() as uow:
+                total = await uow.llm_usage_repository.add(project_id, day, spent)
+                await uow.commit()
+        except Exception:
+            logger.warning(
+                "llm_usage_not_recorded project_id=%s tokens=%d",
+                project_id,
+                spent,
+                exc_info=True,
+            )
+            return
+        if usage is not None and usage.day == day:
+            # The stored total includes what other workers spent today.
+            usage.used = max(usage.used, total)
+
+    async def _admit(self, project_id: UUID, tokens: int) -> _DailyUsage | None:
+        if self._daily_tokens is None:
+            return None
+        usage = await self._load(project_id)
+        if usage.used + usage.reserved + tokens > self._daily_tokens:
+            raise LLMBudgetExceededError(str(project_id), self._daily_tokens)
+        return usage
+
+    async def _load(self, project_id: UUID) -> _DailyUsage:
+        today = self._today()
+        usage = self._usage.get(project_id)
+        if usage is not None and usage.day == today:
+            return usage
+        # Drop figures from earlier days, then read today's total.
+        self._usage = {
+            key: value for key, value in self._usage.items() if value.day == today
+        }
+        async with self._uow_factory() as uow:
+            used = await uow.llm_usage_repository.get_tokens(project_id, today)
+        return self._usage.setdefault(project_id, _DailyUsage(today, used))
+
+
+class FairLLMScheduler:
+    """
+    Shares the house model's concurrency quota and token budgets fairly.
+
+    Calls are admitted through a :class:`WeightedFairQueue` keyed by project
+    and reserve their estimated tokens in the project's
+    :class:`LLMTokenBudget`; once done they are charged the usage the
+    provider reported for every request they made (see :class:`LLMUsage`),
+    so retries and hedges under the same slot are paid for too.
+    ``weights`` raises or lowers a project's share (default 1). Calls made
+    outside any project share one queue key and are not budgeted.
+    """
+
+    def __init__(
+        self,
+        queue: WeightedFairQueue,
+        budget: LLMTokenBudget,
+        weights: Mapping[UUID, float] | None = None,
+    ) -> None:
+        self._queue = queue
+        self._budget = budget
+        self._weights = dict(weights or {})
+
+    async def run(
+        self,
+        project_id: UUID | None,
+        tokens: int,
+        invoke: Callable[[], Awaitable[T]],
+    ) -> T:
+        """Run one provider call within the project's budget and share."""
+        async with self.admitted(project_id, tokens) as usage:
+            with usage.metering():
+                return await invoke()
+
+    @asynccontextmanager
+    async def admitted(
+        self, project_id: UUID | None, tokens: int
+    ) -> AsyncIterator[LLMUsage]:
+        """
+        Hold a slot for the block, reserving `tokens` of the budget.
+
+        Provider requests made while the yielded usage is metering are
+        charged once the block ends, whether it succeeded or not (see
+        :meth:`LLMUsage.charge`); a block that failed before sending any
+        request is not charged.
+        """
+        usage = LLMUsage()
+        if project_id is None:
+            async with self._queue.slot(_UNATTRIBUTED, tokens):
+                yield usage
+            return
+
+        await self._budget.reserve(project_id, tokens)
+        spent = False
+        try:
+            async with self._queue.slot(
+                project_id, tokens, self._weights.get(project_id, 1.0)
+            ):
+                try:
+                    yield usage
+                except LLMInvalidResponseError:
+                    spent = True
+                    raise
+            spent = True
+        finally:
+            await self._budget.settle(
+                project_id,
+                tokens,
+                usage.charge(tokens) if spent or usage.requests else 0,
+            )
+
+    async def run_many(
+        self,
+        project_id: UUID | None,
+        calls: Sequence[tuple[int, Callable[[], Awaitable[T]]]],
+    ) -> list[T | None]:
+        """Run provider calls concurrently, each queued on its own.
+
+        The whole set is refused up front if it does not fit the budget. A
+        call failing with a provider or rate-limit error gives None, so the
+        others still count; only when every call failed is the first error
+        raised.
+        """
+        if project_id is not None:
+            await self._budget.check(project_id, sum(tokens for tokens, _ in calls))
+        results = await asyncio.gather(
+            *(self.run(project_id, tokens, invoke) for tokens, invoke in calls),
+            return_exceptions=True,
+        )
+        errors = [result for result in results if isinstance(result, BaseException)]
+        for error in errors:
+            if not isinstance(error, (LLMProviderError, LLMRateLimitError)):
+                raise error
+        if errors and len(errors) == len(results):
+            raise errors[0]
+        for error in errors:
+            logger.warning("llm_call_failed project_id=%s error=%s", project_id, error)
+        return [
+            None if isinstance(result, BaseException) else result for result in results
+        ]
+
+
+class ScheduledLLMService:
+    """
+    LLM service decorator sending each provider call through the scheduler.
+
+    Sits above the resilient provider client, below caching, so only calls
+    that reach the provider take a slot and count against a budget; the
+    retries and hedges of a call share its slot. Calls are charged to the
+    project set by :class:`ProjectScopedLLMResolver`: an estimated size
+    (about four characters per token plus the expected answer) is reserved
+    up front, and the usage the provider reports is charged. Batches are
+    split into ``batch_size`` chunks queued one by one, so a bulk estimate
+    takes its fair share of slots instead of all of them; a chunk that
+    fails leaves its tasks unestimated (None) without losing the others.
+    """
+
+    def __init__(
+        self, inner: LLMService, scheduler: FairLLMScheduler, batch_size: int = 10
+    ) -> None:
+        self._inner = inner
+        self._scheduler = scheduler
+        self._batch_size = max(1, batch_size)
+
+    async def estimate_difficulty(
+        self,
+        task_title: str,
+        task_description: str,
+        project_context: str | None = None,
+    ) -> DifficultyEstimation:
+        tokens = (
+            _PROMPT_TOKENS
+            + _DIFFICULTY_OUTPUT_TOKENS
+            + _tokens(task_title, task_description, project_context)
+        )
+        return await self._scheduler.run(
+            _current_project.get(),
+            tokens,
+            lambda: self._inner.estimate_difficulty(
+                task_title, task_description, project_context
+            ),
+        )
+
+    async def estimate_difficulty_batch(
+        self,
+        items: Sequence[DifficultyEstimationRequest],
+        project_context: str | None = None,
+    ) -> list[DifficultyEstimation | None]:
+        if not items:
+            return []
+        chunks = [
+            items[start : start + self._batch_size]
+            for start in range(0, len(items), self._batch_size)
+        ]
+        results = await self._scheduler.run_many(
+            _current_project.get(),
+            [
+                (
+                    _PROMPT_TOKENS
+                    + _tokens(project_context)
+                    + sum(
+                        _DIFFICULTY_OUTPUT_TOKENS
+                        + _tokens(item.task_title, item.task_description)
+                        for item in chunk
+                    ),
+                    partial(
+                        self._inner.estimate_difficulty_batch, chunk, project_context
+                    ),
+                )
+                for chunk in chunks
+            ],
+        )
+        return [
+            estimate
+            for chunk, estimates in zip(chunks, results, strict=True)
+            for estimate in (estimates or [None] * len(chunk))
+        ]
+
+    async def estimate_progress(
+        self,
+        task_title: str,
+        task_description: str,
+        reports: list[str],
+        previous: ProgressEstimation | None = None,
+    ) -> ProgressEstimation:
+        tokens = _progress_tokens(task_title, task_description, reports, previous)
+        return await self._scheduler.run(
+            _current_project.get(),
+            tokens,
+            lambda: self._inner.estimate_progress(
+                task_title, task_description, reports, previous
+            ),
+        )
+
+    async def estimate_progress_stream(
+        self,
+        task_title: str,
+        task_description: str,
+        reports: list[str],
+        previous: ProgressEstimation | None = None,
+    ) -> AsyncIterator[str | ProgressEstimation]:
+        """Hold one slot for the whole stream."""
+        tokens = _progress_tokens(task_title, task_description, reports, previous)
+        async with self._scheduler.admitted(_current_project.get(), tokens) as usage:
+            stream = self._inner.estimate_progress_stream(
+                task_title, task_description, reports, previous
+            )
+            try:
+                while True:
+                    # Metered per step: the context is the consumer's between
+                    # items.
+                    with usage.metering():
+                        try:
+                            item = await anext(stream)
+                        except StopAsyncIteration:
+                            return
+                    yield item
+            finally:
+                await stream.aclose()
+
+
+class ProjectScopedLLMResolver:
+    """
+    Resolver decorator attributing every call on a resolved service to its project.
+
+    The project is visible to :class:`ScheduledLLMService` further down the
+    stack, including when a project's own provider falls back to the house
+    model.
+    """
+
+    def __init__(self, resolver: LLMServiceResolver) -> None:
+        self._resolver = resolver
+
+    async def for_project(self, project: Project) -> LLMService:
+        return _ProjectLLMService(await self._resolver.for_project(project), project.id)
+
+    def invalidate(self, project_id: UUID) -> None:
+        self._resolver.invalidate(project_id)
+
+
+class _ProjectLLMService:
+    """Runs each call of ``inner`` with ``project_id`` as the current project."""
+
+    def __init__(self, inner: LLMService, project_id: UUID) -> None:
+        self._inner = inner
+        self._project_id = project_id
+
+    async def estimate_difficulty(
+        self,
+        task_title: str,
+        task_description: str,
+        project_context: str | None = None,
+    ) -> DifficultyEstimation:
+        with _project_scope(self._project_id):
+            return await self._inner.estimate_difficulty(
+                task_title, task_description, project_context
+            )
+
+    async def estimate_difficulty_batch(
+        self,
+        items: Sequence[DifficultyEstimationRequest],
+        project_context: str | None = None,
+    ) -> list[DifficultyEstimation | None]:
+        with _project_scope(self._project_id):
+            return await self._inner.estimate_difficulty_batch(items, project_context)
+
+    async def estimate_progress(
+        self,
+        task_title: str,
+        task_description: str,
+        reports: list[str],
+        previous: ProgressEstimation | None = None,
+    ) -> ProgressEstimation:
+        with _project_scope(self._project_id):
+            return await self._inner.estimate_progress(
+                task_title, task_description, reports, previous
+            )
+
+    async def estimate_progress_stream(
+        self,
+        task_title: str,
+        task_description: str,
+        reports: list[str],
+        previous: ProgressEstimation | None = None,
+    ) -> AsyncIterator[str | ProgressEstimation]:
+        stream = self._inner.estimate_progress_stream(
+            task_title, task_description, reports, previous
+        )
+        try:
+            while True:
+                # Scoped per step: the context is the consumer's between items.
+                with _project_scope(self._project_id):
+                    try:
+                        item = await anext(stream)
+                    except StopAsyncIteration:
+                        return
+                yield item
+        finally:
+            with _project_scope(self._project_id):
+                await stream.aclose()
+
+
+def current_llm_project() -> UUID | None:
+    """Project the LLM call in progress is made for, if it was resolved for one."""
+    return _current_project.get()
+
+
+@contextmanager
+def _project_scope(project_id: UUID) -> Iterator[None]:
+    token = _current_project.set(project_id)
+    try:
+        yield
+    finally:
+        _current_project.reset(token)
@@ -0,0 +1,80 @@
+"""Token usage the provider reports for the LLM requests made in a block."""
+
+from __future__ import annotations
+
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any
+
+# Tally of the block being metered, set by LLMUsage.metering().
+_current_usage: ContextVar[LLMUsage | None] = ContextVar("llm_usage", default=None)
+
+
+class LLMUsage:
+    """
+    Tallies the provider requests made while it is metering.
+
+    Provider clients call :func:`llm_request` for each request they send and
+    report the usage from the reply; the tally then tells what a call really
+    cost, retries and hedges included. Requests still count when they are
+    started from tasks spawned inside the block, since those copy its
+    context.
+    """
+
+    def __init__(self) -> None:
+        self.tokens = 0
+        self.requests = 0
+        self.reported = 0
+        self.refused = 0
+
+    @contextmanager
+    def metering(self) -> Iterator[LLMUsage]:
+        """Count the requests made in the block against this tally."""
+        token = _current_usage.set(self)
+        try:
+            yield self
+        finally:
+            _current_usage.reset(token)
+
+    def charge(self, estimate: int) -> int:
+        """
+        Tokens to charge for the block.
+
+        The reported usage, plus ``estimate`` for each request that was sent
+        but reported none (cancelled hedges, timeouts, broken streams).
+        Refused requests are free. Without any metered request, e.g. from a
+        client that does not report usage, the estimate is charged.
+        """
+        if not self.requests:
+            return estimate
+        unreported = self.requests - self.reported - self.refused
+        return self.tokens + max(0, unreported) * estimate
+
+
+class LLMRequest:
+    """One provider request counted against the current tally, if any."""
+
+    def __init__(self, usage: LLMUsage | None) -> None:
+        self._usage = usage
+        if usage is not None:
+            usage.requests += 1
+
+    def report(self, usage: Any) -> None:
+        """Record the ``usage`` of an OpenAI-style reply (None if absent)."""
+        if self._usage is None or usage is None:
+            return
+        self._usage.tokens += (usage.prompt_tokens or 0) + (
+            usage.completion_tokens or 0
+        )
+        self._usage.reported += 1
+
+    def refuse(self) -> None:
+        """Record that the provider refused the request without billing it."""
+        if self._usage is not None:
+            self._usage.refused += 1
+
+
+def llm_request() -> LLMRequest:
+    """Start counting a provider request against the block being metered."""
+    return LLMRequest(_current_usage.get())
@@ -2,27 +2,90 @@
 
 from __future__ import annotations
 
+import asyncio
 import json
+import logging
+from collections.abc import AsyncIterator, Sequence
+from typing import TYPE_CHECKING
 
+from backend.src.adapters.services.llm_usage import LLMRequest, llm_request
 from backend.src.config.settings import AppSettings
 from backend.src.domain.errors import (
     LLMInvalidResponseError,
     LLMProviderError,
     LLMRateLimitError,
 )
-from backend.src.domain.ports.services import DifficultyEstimation, ProgressEstimation
+from backend.src.domain.ports.services import (
+    DifficultyEstimation,
+    DifficultyEstimationRequest,
+    ProgressEstimation,
+)
+
+if TYPE_CHECKING:
+    import httpx
+
+logger = logging.getLogger(__name__)
+
+_DIFFICULTY_OUTPUT = {
+    "points": "int",
+    "confidence": "float(0..1)",
+    "reasoning": "str",
+}
+
+# Length asked of the rolling report summary sent back with each estimate.
+_SUMMARY_WORDS = 150
+
+
+def _parse_difficulty(data: dict) -> DifficultyEstimation:
+    """Validate one estimate; malformed data raises KeyError/TypeError/ValueError."""
+    points = int(data["points"])
+    confidence = float(data["confidence"])
+    if points < 0 or not 0.0 <= confidence <= 1.0:
+        raise ValueError("difficulty estimation out of range")
+    return DifficultyEstimation(
+        points=points,
+        confidence=confidence,
+        reasoning=str(data["reasoning"]),
+    )
 
 
 class OpenAILLMService:
-    """LLM service using OpenAI chat completions."""
+    """
+    LLM service using OpenAI chat completions.
 
-    def __init__(self, settings: AppSettings) -> None:
-        if not settings.global_llm_api_key:
-            raise RuntimeError("GLOBAL_LLM_API_KEY is required when LLM_PROVIDER != mock")
+    Uses the global key and base URL from settings unless ``api_key`` is
+    given for a project's own key (BYOK), in which case ``base_url`` goes
+    with it. An ``http_client`` lets many services share one connection
+    pool; the service never closes a client it was given. Each request is
+    bounded by ``LLM_TIMEOUT_SECONDS`` and not retried by the client:
+    retries belong to ``ResilientLLMService``. The token usage of every
+    reply, streamed ones included, is reported to the metering scheduler
+    (see ``llm_usage``).
+    """
+
+    def __init__(
+        self,
+        settings: AppSettings,
+        *,
+        api_key: str | None = None,
+        base_url: str | None = None,
+        http_client: httpx.AsyncClient | None = None,
+    ) -> None:
+        if api_key is None:
+            if not settings.global_llm_api_key:
+                raise RuntimeError(
+                    "GLOBAL_LLM_API_KEY is required when LLM_PROVIDER != mock"
+                )
+            api_key = settings.global_llm_api_key
+            base_url = settings.global_llm_base_url
 
-        self._api_key = settings.global_llm_api_key
+        self._api_key = api_key
         self._model = settings.llm_model or "gpt-4o-mini"
-        self._base_url = settings.global_llm_base_url
+        self._base_url = base_url
+        self._http_client = http_client
+        self._timeout = settings.llm_timeout_seconds
+        self._batch_size = max(1, settings.llm_batch_size)
+        self._batch_concurrency = max(1, settings.llm_batch_concurrency)
         self._client_instance = None
 
     def _client(self):
@@ -30,12 +93,16 @@ class OpenAILLMService:
 
         if self._client_instance is not None:
             return self._client_instance
+        options: dict = {
+            "api_key": self._api_key,
+            "timeout": self._timeout,
+            "max_retries": 0,
+        }
         if self._base_url:
-            self._client_instance = AsyncOpenAI(
-                api_key=self._api_key, base_url=self._base_url
-            )
-        else:
-            self._client_instance = AsyncOpenAI(api_key=self._api_key)
+            options["base_url"] = self._base_url
+        if self._http_client is not None:
+            options["http_client"] = self._http_client
+        self._client_instance = AsyncOpenAI(**options)
         return self._client_instance
 
     async def estimate_difficulty(
@@ -48,72 +115,341 @@ class OpenAILLMService:
             "task_title": task_title,
             "task_description": task_description,
             "project_context": project_context,
-            "output": {
-                "points": "int",
-                "confidence": "float(0..1)",
-                "reasoning": "str",
-            },
+            "output": _DIFFICULTY_OUTPUT,
         }
         data = await self._complete_json(prompt)
         try:
-            return DifficultyEstimation(
-                points=int(data["points"]),
-                confidence=float(data["confidence"]),
-                reasoning=str(data["reasoning"]),
-            )
+            return _parse_difficulty(data)
         except (KeyError, TypeError, ValueError) as exc:
             raise LLMInvalidResponseError("difficulty estimation json") from exc
 
+    async def estimate_difficulty_batch(
+        self,
+        items: Sequence[DifficultyEstimationRequest],
+        project_context: str | None = None,
+    ) -> list[DifficultyEstimation | None]:
+        """
+        Estimate tasks ``LLM_BATCH_SIZE`` per prompt, with up to
+        ``LLM_BATCH_CONCURRENCY`` prompts in flight.
+
+        Each item of a reply is validated on its own; items that are
+        missing or malformed are retried as single estimations. Items whose
+        request failed at the provider are left as None, like items that
+        stay malformed; only when no item could be estimated is the first
+        provider error raised.
+        """
+        results: list[DifficultyEstimation | None] = [None] * len(items)
+        errors: list[LLMProviderError | LLMRateLimitError] = []
+        semaphore = asyncio.Semaphore(self._batch_concurrency)
+
+        async def run_chunk(start: int) -> None:
+            chunk = items[start : start + self._batch_size]
+            async with semaphore:
+                estimates = await self._estimate_chunk(chunk, project_context, errors)
+            results[start : start + len(chunk)] = estimates
+
+        await asyncio.gather(
+            *(run_chunk(start) for start in range(0, len(items), self._batch_size))
+        )
+        if errors and all(result is None for result in results):
+            raise errors[0]
+        return results
+
+    async def _estimate_chunk(
+        self,
+        chunk: Sequence[DifficultyEstimationRequest],
+        project_context: str | None,
+        errors: list[LLMProviderError | LLMRateLimitError],
+    ) -> list[DifficultyEstimation | None]:
+        estimates: dict[int, DifficultyEstimation] = {}
+        if len(chunk) > 1:
+            prompt = {
+                "project_context": project_context,
+                "tasks": [
+                    {
+                        "id": index,
+                        "task_title": item.task_title,
+                        "task_description": item.task_description,
+                    }
+                    for index, item in enumerate(chunk)
+                ],
+                "output": {"estimates": [{"id": "int", **_DIFFICULTY_OUTPUT}]},
+            }
+            try:
+                data = await self._complete_json(prompt)
+                replies = data["estimates"]
+            except (LLMInvalidResponseError, KeyError, TypeError):
+                replies = []
+            except (LLMProviderError, LLMRateLimitError) as exc:
+                # Retrying each task alone would only add load to a failing
+                # provider.
+                logger.warning("llm_batch_failed size=%d error=%s", len(chunk), exc)
+                errors.append(exc)
+                return [None] * len(chunk)
+            if not isinstance(replies, list):
+                replies = []
+            for reply in replies:
+                try:
+                    index = reply["id"]
+                    if type(index) is not int or not 0 <= index < len(chunk):
+                        raise ValueError("unknown task id")
+                    estimates.setdefault(index, _parse_difficulty(reply))
+                except (KeyError, TypeError, ValueError):
+                    continue
+
+        results: list[DifficultyEstimation | None] = []
+        for index, item in enumerate(chunk):
+            estimate = estimates.get(index)
+            if estimate is None:
+                if len(chunk) > 1:
+                    logger.info("llm_batch_item_fallback index=%d", index)
+                try:
+                    estimate = await self.estimate_difficulty(
+                        item.task_title, item.task_description, project_context
+                    )
+                except LLMInvalidResponseError:
+                    logger.warning("llm_estimate_invalid title=%r", item.task_title)
+                except (LLMProviderError, LLMRateLimitError) as exc:
+                    logger.warning(
+                        "llm_estimate_failed title=%r error=%s", item.task_title, exc
+                    )
+                    errors.append(exc)
+            results.append(estimate)
+        return results
+
     async def estimate_progress(
         self,
         task_title: str,
         task_description: str,
         reports: list[str],
+        previous: ProgressEstimation | None = None,
     ) -> ProgressEstimation:
-        prompt = {
-            "task_title": task_title,
-            "task_description": task_description,
-            "reports": reports,
-            "output": {
-                "percentage": "int(0..100)",
-                "confidence": "float(0..1)",
-                "reasoning": "str",
-            },
-        }
-        data = await self._complete_json(prompt)
+        data = await self._complete_json(
+            _progress_prompt(task_title, task_description, reports, previous)
+        )
+        return _parse_progress(data)
+
+    async def estimate_progress_stream(
+        self,
+        task_title: str,
+        task_description: str,
+        reports: list[str],
+        previous: ProgressEstimation | None = None,
+    ) -> AsyncIterator[str | ProgressEstimation]:
+        """
+        Stream the completion, yielding the reasoning while the JSON arrives.
+
+        The prompt asks for the reasoning first, so it starts with the
+        provider's first tokens; the whole reply is validated at the end.
+        """
+        prompt = _progress_prompt(task_title, task_description, reports, previous)
+        reader = _JsonStringReader("reasoning")
+        content: list[str] = []
+        request = llm_request()
         try:
-            return ProgressEstimation(
-                percentage=int(data["percentage"]),
-                confidence=float(data["confidence"]),
-                reasoning=str(data["reasoning"]),
+            stream = await self._client().chat.completions.create(
+                model=self._model,
+                messages=_messages(prompt),
+                response_format={"type": "json_object"},
+                stream=True,
+                # The last chunk then carries the usage, with no choices.
+                stream_options={"include_usage": True},
             )
-        except (KeyError, TypeError, ValueError) as exc:
-            raise LLMInvalidResponseError("progress estimation json") from exc
+            async for chunk in stream:
+                request.report(getattr(chunk, "usage", None))
+                delta = chunk.choices[0].delta.content if chunk.choices else None
+                if not delta:
+                    continue
+                content.append(delta)
+                text = reader.feed(delta)
+                if text:
+                    yield text
+        except Exception as exc:
+            raise _request_error(request, exc) from exc
+
+        try:
+            data = json.loads("".join(content) or "{}")
+        except ValueError as exc:
+            raise LLMInvalidResponseError("json_object") from exc
+        yield _parse_progress(data)
 
     async def _complete_json(self, payload: dict) -> dict:
+        request = llm_request()
         try:
             response = await self._client().chat.completions.create(
                 model=self._model,
-                messages=[
-                    {
-                        "role": "system",
-                        "content": "Return strict JSON only.",
-                    },
-                    {
-                        "role": "user",
-                        "content": json.dumps(payload),
-                    },
-                ],
+                messages=_messages(payload),
                 response_format={"type": "json_object"},
             )
         except Exception as exc:
-            error_type = exc.__class__.__name__.lower()
-            if "rate" in error_type or "429" in str(exc):
-                raise LLMRateLimitError("openai") from exc
-            raise LLMProviderError("openai", str(exc)) from exc
+            raise _request_error(request, exc) from exc
+        request.report(getattr(response, "usage", None))
 
         try:
             content = response.choices[0].message.content or "{}"
             return json.loads(content)
         except Exception as exc:
             raise LLMInvalidResponseError("json_object") from exc
+
+
+def _messages(payload: dict) -> list[dict]:
+    return [
+        {
+            "role": "system",
+            "content": "Return strict JSON only.",
+        },
+        {
+            "role": "user",
+            "content": json.dumps(payload),
+        },
+    ]
+
+
+def _provider_error(exc: Exception) -> LLMProviderError | LLMRateLimitError:
+    error_type = exc.__class__.__name__.lower()
+    if "rate" in error_type or "429" in str(exc):
+        return LLMRateLimitError("openai")
+    return LLMProviderError("openai", str(exc))
+
+
+def _request_error(
+    request: LLMRequest, exc: Exception
+) -> LLMProviderError | LLMRateLimitError:
+    error = _provider_error(exc)
+    if isinstance(error, LLMRateLimitError):
+        # Rate-limited requests are refused before any tokens are used.
+        request.refuse()
+    return error
+
+
+def _progress_prompt(
+    task_title: str,
+    task_description: str,
+    reports: list[str],
+    previous: ProgressEstimation | None,
+) -> dict:
+    return {
+        "task_title": task_title,
+        "task_description": task_description,
+        "previous": (
+            {"percentage": previous.percentage, "summary": previous.summary}
+            if previous is not None
+            else None
+        ),
+        "new_reports": reports,
+        # Reasoning first, so a streamed reply can be shown while it arrives.
+        "output": {
+            "reasoning": "str",
+            "percentage": "int(0..100)",
+            "confidence": "float(0..1)",
+            "summary": f"str(<= {_SUMMARY_WORDS} words, previous summary "
+            "plus new reports)",
+        },
+    }
+
+
+def _parse_progress(data: dict) -> ProgressEstimation:
+    try:
+        return ProgressEstimation(
+            percentage=int(data["percentage"]),
+            confidence=float(data["confidence"]),
+            reasoning=str(data["reasoning"]),
+            summary=str(data.get("summary") or ""),
+        )
+    except (KeyError, TypeError, ValueError) as exc:
+        raise LLMInvalidResponseError("progress estimation json") from exc
+
+
+class _JsonStringReader:
+    """
+    Decodes one top-level string field of a JSON object fed in pieces.
+
+    ``feed`` returns the part of the field's value decoded so far that was
+    not returned before, unescaped, so it can be shown while the rest of
+    the object is still arriving. Everything else is only scanned.
+    """
+
+    _ESCAPES = {
+        '"': '"',
+        "\\": "\\",
+        "/": "/",
+        "b": "\b",
+        "f": "\f",
+        "n": "\n",
+        "r": "\r",
+        "t": "\t",
+    }
+
+    def __init__(self, field: str) -> None:
+        self._field = field
+        self._depth = 0
+        self._in_string = False
+        self._escape = False
+        self._unicode: str | None = None  # Hex digits of a \uXXXX escape
+        self._high_surrogate: int | None = None
+        self._expect_key = False
+        self._key: str | None = None
+        self._key_chars: list[str] | None = None
+        self._capturing = False
+
+    def feed(self, text: str) -> str:
+        out: list[str] = []
+        for char in text:
+            if self._in_string:
+                self._string_char(char, out)
+            elif char == '"':
+                self._in_string = True
+                if self._depth == 1 and self._expect_key:
+                    self._key_chars = []
+                else:
+                    self._capturing = self._depth == 1 and self._key == self._field
+            elif char in "{[":
+                self._depth += 1
+                self._expect_key = char == "{"
+            elif char in "}]":
+                self._depth -= 1
+            elif char == "," and self._depth == 1:
+                self._expect_key = True
+                self._key = None
+        return "".join(out)
+
+    def _string_char(self, char: str, out: list[str]) -> None:
+        if self._unicode is not None:
+            self._unicode += char
+            if len(self._unicode) == 4:
+                self._emit_code_point(int(self._unicode, 16), out)
+                self._unicode = None
+            return
+        if self._escape:
+            self._escape = False
+            if char == "u":
+                self._unicode = ""
+            else:
+                self._emit(self._ESCAPES.get(char, char), out)
+            return
+        if char == "\\":
+            self._escape = True
+        elif char == '"':
+            self._in_string = False
+            self._capturing = False
+            if self._key_chars is not None:
+                self._key = "".join(self._key_chars)
+                self._key_chars = None
+                self._expect_key = False
+        else:
+            self._emit(char, out)
+
+    def _emit(self, char: str, out: list[str]) -> None:
+        if self._key_chars is not None:
+            self._key_chars.append(char)
+        elif self._capturing:
+            out.append(char)
+
+    def _emit_code_point(self, code_point: int, out: list[str]) -> None:
+        if 0xD800 <= code_point < 0xDC00:
+            self._high_surrogate = code_point
+            return
+        high, self._high_surrogate = self._high_surrogate, None
+        if high is not None and 0xDC00 <= code_point < 0xE000:
+            code_point = 0x10000 + ((high - 0xD800) << 10) + (code_point - 0xDC00)
+        self._emit(chr(code_point), out)
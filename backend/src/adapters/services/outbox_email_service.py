@@ -0,0 +1,45 @@
+"""Email service that queues messages in the transactional outbox."""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Sequence
+from contextlib import AbstractAsyncContextManager
+
+from backend.src.domain.ports import EmailMessage, UnitOfWork
+
+
+class OutboxEmailService:
+    """
+    Queues each message in the outbox instead of sending it.
+
+    For callers that send email outside a use-case transaction; use cases
+    that change data add to ``uow.email_outbox_repository`` directly so the
+    email commits with the change. Delivery is left to the dispatcher.
+    """
+
+    def __init__(
+        self,
+        uow_factory: Callable[[], AbstractAsyncContextManager[UnitOfWork]],
+        on_enqueued: Callable[[], None] | None = None,
+    ) -> None:
+        self._uow_factory = uow_factory
+        self._on_enqueued = on_enqueued
+
+    async def send_email(self, message: EmailMessage) -> None:
+        async with self._uow_factory() as uow:
+            await uow.email_outbox_repository.add(message)
+            await uow.commit()
+        if self._on_enqueued is not None:
+            self._on_enqueued()
+
+    async def send_many(
+        self, messages: Sequence[EmailMessage]
+    ) -> list[BaseException | None]:
+        """Queue all messages in one transaction."""
+        async with self._uow_factory() as uow:
+            for message in messages:
+                await uow.email_outbox_repository.add(message)
+            await uow.commit()
+        if self._on_enqueued is not None:
+            self._on_enqueued()
+        return [None] * len(messages)
@@ -0,0 +1,312 @@
+"""LLM service decorator adding deadlines, retries, a breaker and fallback."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import random
+from collections.abc import AsyncIterator, Awaitable, Callable, Sequence
+from typing import TypeVar
+
+from backend.src.adapters.services.circuit_breaker import CircuitBreaker
+from backend.src.domain.errors import (
+    LLMInvalidResponseError,
+    LLMProviderError,
+    LLMRateLimitError,
+)
+from backend.src.domain.ports.services import (
+    DifficultyEstimation,
+    DifficultyEstimationRequest,
+    LLMService,
+    ProgressEstimation,
+)
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class ResilientLLMService:
+    """
+    Keeps a slow or failing provider from hanging or failing requests.
+
+    - Every call has a deadline (``timeout_seconds``; batches get
+      ``batch_timeout_seconds``) covering retries; running past it counts
+      as a provider error.
+    - Rate-limited calls are retried up to ``max_retries`` times with
+      full-jitter exponential backoff, honouring ``retry_after`` when the
+      provider sends one, as long as the deadline allows.
+    - Provider errors, timeouts and exhausted retries are recorded on the
+      ``breaker``; while it is open the provider is not called at all.
+    - Whenever the provider cannot answer, the call goes to ``fallback``
+      (e.g. the house model for a project's own key) if there is one, and
+      the error is raised otherwise.
+    - With ``hedge_after_seconds`` set, a single estimation still running
+      after that long is sent a second time and the first answer wins.
+
+    Invalid responses come from a healthy provider: they are raised as is
+    and count as a success for the breaker.
+    """
+
+    def __init__(
+        self,
+        inner: LLMService,
+        name: str,
+        breaker: CircuitBreaker,
+        fallback: LLMService | None = None,
+        timeout_seconds: float = 20.0,
+        batch_timeout_seconds: float = 120.0,
+        max_retries: int = 2,
+        retry_base_delay_seconds: float = 0.5,
+        retry_max_delay_seconds: float = 8.0,
+        hedge_after_seconds: float | None = None,
+        sleep: Callable[[float], Awaitable[None]] = asyncio.sleep,
+        jitter: Callable[[], float] = random.random,
+    ) -> None:
+        self._inner = inner
+        self._name = name
+        self._breaker = breaker
+        self._fallback = fallback
+        self._timeout = timeout_seconds
+        self._batch_timeout = batch_timeout_seconds
+        self._max_retries = max_retries
+        self._retry_base_delay = retry_base_delay_seconds
+        self._retry_max_delay = retry_max_delay_seconds
+        self._hedge_after = hedge_after_seconds
+        self._sleep = sleep
+        self._jitter = jitter
+
+    async def estimate_difficulty(
+        self,
+        task_title: str,
+        task_description: str,
+        project_context: str | None = None,
+    ) -> DifficultyEstimation:
+        return await self._call(
+            lambda service: service.estimate_difficulty(
+                task_title, task_description, project_context
+            ),
+            self._timeout,
+            hedge=True,
+        )
+
+    async def estimate_difficulty_batch(
+        self,
+        items: Sequence[DifficultyEstimationRequest],
+        project_context: str | None = None,
+    ) -> list[DifficultyEstimation | None]:
+        return await self._call(
+            lambda service: service.estimate_difficulty_batch(items, project_context),
+            self._batch_timeout,
+            hedge=False,
+        )
+
+    async def estimate_progress(
+        self,
+        task_title: str,
+        task_description: str,
+        reports: list[str],
+        previous: ProgressEstimation | None = None,
+    ) -> ProgressEstimation:
+        return await self._call(
+            lambda service: service.estimate_progress(
+                task_title, task_description, reports, previous
+            ),
+            self._timeout,
+            hedge=True,
+        )
+
+    async def estimate_progress_stream(
+        self,
+        task_title: str,
+        task_description: str,
+        reports: list[str],
+        previous: ProgressEstimation | None = None,
+    ) -> AsyncIterator[str | ProgressEstimation]:
+        """
+        Stream a progress estimate with the same protections as a call.
+
+        The deadline and retries cover the wait for the first item, and
+        each later item must follow within the deadline too. Once an item
+        has been passed on the stream cannot fall back or be retried, so
+        later errors are recorded and raised. Streams are not hedged.
+        """
+
+        def invoke(service: LLMService) -> AsyncIterator[str | ProgressEstimation]:
+            return service.estimate_progress_stream(
+                task_title, task_description, reports, previous
+            )
+
+        error: Exception | None = None
+        if not self._breaker.allow():
+            error = LLMProviderError(self._name, "circuit open")
+        else:
+            try:
+                stream, first = await self._open_stream(invoke)
+            except LLMInvalidResponseError:
+                self._breaker.record_success()
+                raise
+            except (LLMProviderError, LLMRateLimitError) as exc:
+                self._breaker.record_failure()
+                error = exc
+        if error is not None:
+            if self._fallback is None:
+                raise error
+            logger.warning("llm_fallback provider=%s reason=%s", self._name, error)
+            async for item in invoke(self._fallback):
+                yield item
+            return
+
+        try:
+            yield first
+            while True:
+                try:
+                    async with asyncio.timeout(self._timeout):
+                        item = await anext(stream)
+                except StopAsyncIteration:
+                    break
+                except TimeoutError:
+                    raise LLMProviderError(
+                        self._name, f"stream stalled for {self._timeout:g}s"
+                    ) from None
+                yield item
+        except LLMInvalidResponseError:
+            self._breaker.record_success()
+            raise
+        except (LLMProviderError, LLMRateLimitError):
+            self._breaker.record_failure()
+            raise
+        finally:
+            await stream.aclose()
+        self._breaker.record_success()
+
+    async def _open_stream(
+        self, invoke: Callable[[LLMService], AsyncIterator[T]]
+    ) -> tuple[AsyncIterator[T], T]:
+        """Start a stream and wait for its first item, retrying rate limits."""
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self._timeout
+        attempt = 0
+        while True:
+            stream = invoke(self._inner)
+            try:
+                async with asyncio.timeout_at(deadline):
+                    return stream, await anext(stream)
+            except StopAsyncIteration:
+                raise LLMInvalidResponseError("empty stream") from None
+            except TimeoutError:
+                await stream.aclose()
+                raise LLMProviderError(
+                    self._name, f"no response within {self._timeout:g}s"
+                ) from None
+            except LLMRateLimitError as exc:
+                await stream.aclose()
+                delay = self._retry_delay(attempt, exc, deadline)
+                if delay is None:
+                    raise
+                attempt += 1
+                await self._sleep(delay)
+            except BaseException:
+                await stream.aclose()
+                raise
+
+    async def _call(
+        self,
+        invoke: Callable[[LLMService], Awaitable[T]],
+        timeout: float,
+        hedge: bool,
+    ) -> T:
+        if not self._breaker.allow():
+            return await self._fall_back(
+                invoke, LLMProviderError(self._name, "circuit open")
+            )
+        try:
+            result = await self._with_retries(invoke, timeout, hedge)
+        except LLMInvalidResponseError:
+            self._breaker.record_success()
+            raise
+        except (LLMProviderError, LLMRateLimitError) as exc:
+            self._breaker.record_failure()
+            return await self._fall_back(invoke, exc)
+        self._breaker.record_success()
+        return result
+
+    async def _fall_back(
+        self, invoke: Callable[[LLMService], Awaitable[T]], error: Exception
+    ) -> T:
+        if self._fallback is None:
+            raise error
+        logger.warning("llm_fallback provider=%s reason=%s", self._name, error)
+        return await invoke(self._fallback)
+
+    async def _with_retries(
+        self,
+        invoke: Callable[[LLMService], Awaitable[T]],
+        timeout: float,
+        hedge: bool,
+    ) -> T:
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        attempt = 0
+        while True:
+            try:
+                return await asyncio.wait_for(
+                    self._attempt(invoke, hedge), deadline - loop.time()
+                )
+            except TimeoutError:
+                raise LLMProviderError(
+                    self._name, f"no response within {timeout:g}s"
+                ) from None
+            except LLMRateLimitError as exc:
+                delay = self._retry_delay(attempt, exc, deadline)
+                if delay is None:
+                    raise
+                attempt += 1
+                await self._sleep(delay)
+
+    def _retry_delay(
+        self, attempt: int, error: LLMRateLimitError, deadline: float
+    ) -> float | None:
+        """Backoff before retry ``attempt + 1``, or None to give up."""
+        delay = self._backoff(attempt, error.retry_after)
+        loop = asyncio.get_running_loop()
+        if attempt >= self._max_retries or loop.time() + delay >= deadline:
+            return None
+        logger.info(
+            "llm_rate_limited provider=%s retry=%d delay=%.2f",
+            self._name,
+            attempt + 1,
+            delay,
+        )
+        return delay
+
+    def _backoff(self, attempt: int, retry_after: int | None) -> float:
+        ceiling = min(self._retry_max_delay, self._retry_base_delay * 2**attempt)
+        return max(float(retry_after or 0), self._jitter() * ceiling)
+
+    async def _attempt(
+        self, invoke: Callable[[LLMService], Awaitable[T]], hedge: bool
+    ) -> T:
+        if not hedge or self._hedge_after is None:
+            return await invoke(self._inner)
+
+        pending = {asyncio.ensure_future(invoke(self._inner))}
+        try:
+            done, _ = await asyncio.wait(pending, timeout=self._hedge_after)
+            if not done:
+                logger.info("llm_hedged provider=%s", self._name)
+                pending.add(asyncio.ensure_future(invoke(self._inner)))
+            error: BaseException | None = None
+            while pending:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    if task.exception() is None:
+                        return task.result()
+                    error = task.exception()
+            assert error is not None
+            raise error
+        finally:
+            for task in pending:
+                task.cancel()
@@ -0,0 +1,112 @@
+"""LLM service decorator answering near-duplicate tasks from completed ones."""
+
+from __future__ import annotations
+
+import logging
+from collections.abc import AsyncIterator, Sequence
+
+from backend.src.adapters.services.llm_scheduler import current_llm_project
+from backend.src.domain.ports.services import (
+    DifficultyEstimation,
+    DifficultyEstimationRequest,
+    LLMService,
+    ProgressEstimation,
+    SimilarTaskIndex,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class SimilarityLLMService:
+    """
+    Estimates difficulty from the closest completed task when it is close enough.
+
+    A task whose title and description match a completed task with at least
+    ``threshold`` similarity gets that task's final difficulty, with the
+    similarity as confidence, without calling ``inner``. Batches send only
+    the unmatched tasks on. Progress estimation always goes to ``inner``.
+
+    Only the completed tasks of the project the call was resolved for (see
+    :class:`ProjectScopedLLMResolver`) are searched; calls made outside a
+    project always go to ``inner``.
+    """
+
+    def __init__(
+        self, inner: LLMService, index: SimilarTaskIndex, threshold: float = 0.9
+    ) -> None:
+        self._inner = inner
+        self._index = index
+        self._threshold = threshold
+
+    async def estimate_difficulty(
+        self,
+        task_title: str,
+        task_description: str,
+        project_context: str | None = None,
+    ) -> DifficultyEstimation:
+        match = self._match(task_title, task_description)
+        if match is not None:
+            return match
+        return await self._inner.estimate_difficulty(
+            task_title, task_description, project_context
+        )
+
+    async def estimate_difficulty_batch(
+        self,
+        items: Sequence[DifficultyEstimationRequest],
+        project_context: str | None = None,
+    ) -> list[DifficultyEstimation | None]:
+        results = [
+            self._match(item.task_title, item.task_description) for item in items
+        ]
+        missing = [i for i, result in enumerate(results) if result is None]
+        if missing:
+            estimates = await self._inner.estimate_difficulty_batch(
+                [items[i] for i in missing], project_context
+            )
+            for i, estimate in zip(missing, estimates):
+                results[i] = estimate
+        return results
+
+    async def estimate_progress(
+        self,
+        task_title: str,
+        task_description: str,
+        reports: list[str],
+        previous: ProgressEstimation | None = None,
+    ) -> ProgressEstimation:
+        return await self._inner.estimate_progress(
+            task_title, task_description, reports, previous
+        )
+
+    def estimate_progress_stream(
+        self,
+        task_title: str,
+        task_description: str,
+        reports: list[str],
+        previous: ProgressEstimation | None = None,
+    ) -> AsyncIterator[str | ProgressEstimation]:
+        return self._inner.estimate_progress_stream(
+            task_title, task_description, reports, previous
+        )
+
+    def _match(self, title: str, description: str) -> DifficultyEstimation | None:
+        project_id = current_llm_project()
+        if project_id is None:
+            return None
+        similar = self._index.nearest(project_id, title, description)
+        if similar is None or similar.similarity < self._threshold:
+            return None
+        logger.debug(
+            "llm_similarity_hit task_id=%s similarity=%.3f",
+            similar.task_id,
+            similar.similarity,
+        )
+        return DifficultyEstimation(
+            points=similar.difficulty_points,
+            confidence=round(similar.similarity, 3),
+            reasoning=(
+                f"Matches a completed task ({similar.similarity:.0%} similar) "
+                f"that took {similar.difficulty_points} points."
+            ),
+        )
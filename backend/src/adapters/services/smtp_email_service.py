@@ -2,14 +2,49 @@
 
 from __future__ import annotations
 
+import asyncio
+import logging
+import time
+from collections.abc import Callable, Sequence
+from email.message import EmailMessage as MIMEEmailMessage
+
+import aiosmtplib
+
 from backend.src.config.settings import AppSettings
 from backend.src.domain.ports.services import EmailMessage
 
+logger = logging.getLogger(__name__)
+
+# Idle connections older than this are checked with NOOP before reuse.
+_HEALTH_CHECK_AFTER_SECONDS = 5.0
+
+# Errors meaning the connection itself is gone, not that the message was refused.
+_CONNECTION_ERRORS = (
+    aiosmtplib.SMTPServerDisconnected,
+    aiosmtplib.SMTPTimeoutError,
+    ConnectionError,
+)
+
+# The server answered and rejected the message; the session itself is fine.
+_REFUSALS = (aiosmtplib.SMTPResponseException, aiosmtplib.SMTPRecipientsRefused)
+
 
 class SMTPEmailService:
-    """Sends emails using SMTP."""
+    """
+    Sends emails using SMTP over a small pool of authenticated connections.
+
+    Up to ``SMTP_POOL_SIZE`` connections are opened on demand and kept
+    after each message, so consecutive sends skip the TCP, TLS and AUTH
+    handshakes. Connections idle for longer than ``SMTP_POOL_IDLE_SECONDS``
+    are closed instead of reused. A pooled connection the server has
+    dropped is replaced and the message retried once on a fresh one.
+    """
 
-    def __init__(self, settings: AppSettings) -> None:
+    def __init__(
+        self,
+        settings: AppSettings,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
         required = {
             "SMTP_HOST": settings.smtp_host,
             "SMTP_USER": settings.smtp_user,
@@ -29,12 +64,104 @@ class SMTPEmailService:
         self._password = settings.smtp_password
         self._from_email = settings.smtp_from_email
         self._use_tls = settings.smtp_use_tls
+        self._idle_timeout = settings.smtp_pool_idle_seconds
+        self._clock = clock
+        self._slots = asyncio.Semaphore(settings.smtp_pool_size)
+        # Most recently released last, so reuse favours warm connections
+        # and the rest age out.
+        self._idle: list[tuple[aiosmtplib.SMTP, float]] = []
 
     async def send_email(self, message: EmailMessage) -> None:
-        from email.message import EmailMessage as MIMEEmailMessage
+        mime = self._to_mime(message)
+        recipients = list(message.recipients)
+        if message.cc:
+            recipients.extend(message.cc)
+        if message.bcc:
+            recipients.extend(message.bcc)
+
+        async with self._slots:
+            smtp, reused = await self._acquire()
+            try:
+                await smtp.send_message(mime, recipients=recipients)
+            except _CONNECTION_ERRORS:
+                smtp.close()
+                if not reused:
+                    raise
+                logger.info("smtp_pooled_connection_lost; reconnecting")
+                smtp = await self._connect()
+                try:
+                    await smtp.send_message(mime, recipients=recipients)
+                except _REFUSALS:
+                    self._release(smtp)
+                    raise
+                except BaseException:
+                    smtp.close()
+                    raise
+            except _REFUSALS:
+                # aiosmtplib resets the envelope, so the session is reusable.
+                self._release(smtp)
+                raise
+            except BaseException:
+                # The transaction state is unknown; do not hand it out again.
+                smtp.close()
+                raise
+            self._release(smtp)
+
+    async def send_many(
+        self, messages: Sequence[EmailMessage]
+    ) -> list[BaseException | None]:
+        """Send messages back-to-back over the pooled connections."""
+        results = await asyncio.gather(
+            *(self.send_email(message) for message in messages),
+            return_exceptions=True,
+        )
+        return [
+            result if isinstance(result, BaseException) else None for result in results
+        ]
 
-        import aiosmtplib
+    async def aclose(self) -> None:
+        """Close every idle pooled connection."""
+        idle, self._idle = self._idle, []
+        for smtp, _ in idle:
+            try:
+                await smtp.quit()
+            except (aiosmtplib.SMTPException, OSError):
+                smtp.close()
 
+    def _release(self, smtp: aiosmtplib.SMTP) -> None:
+        if smtp.is_connected:
+            self._idle.append((smtp, self._clock()))
+
+    async def _acquire(self) -> tuple[aiosmtplib.SMTP, bool]:
+        """Return a live connection and whether it came from the pool."""
+        now = self._clock()
+        while self._idle:
+            smtp, released_at = self._idle.pop()
+            idle_for = now - released_at
+            if idle_for > self._idle_timeout or not smtp.is_connected:
+                smtp.close()
+                continue
+            if idle_for > _HEALTH_CHECK_AFTER_SECONDS:
+                try:
+                    await smtp.noop()
+                except (aiosmtplib.SMTPException, OSError):
+                    smtp.close()
+                    continue
+            return smtp, True
+        return await self._connect(), False
+
+    async def _connect(self) -> aiosmtplib.SMTP:
+        smtp = aiosmtplib.SMTP(
+            hostname=self._host,
+            port=self._port,
+            username=self._username,
+            password=self._password,
+            use_tls=self._use_tls,
+        )
+        await smtp.connect()
+        return smtp
+
+    def _to_mime(self, message: EmailMessage) -> MIMEEmailMessage:
         mime = MIMEEmailMessage()
         mime["From"] = self._from_email
         mime["To"] = ", ".join(message.recipients)
@@ -48,19 +175,4 @@ class SMTPEmailService:
             mime.add_alternative(message.body_html, subtype="html")
         else:
             mime.set_content(message.body_text)
-
-        recipients = list(message.recipients)
-        if message.cc:
-            recipients.extend(message.cc)
-        if message.bcc:
-            recipients.extend(message.bcc)
-
-        await aiosmtplib.send(
-            mime,
-            hostname=self._host,
-            port=self._port,
-            username=self._username,
-            password=self._password,
-            use_tls=self._use_tls,
-            recipients=recipients,
-        )
+        return mime
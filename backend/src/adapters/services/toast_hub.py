@@ -0,0 +1,103 @@
+"""In-process hub fanning toasts out to open server-sent event streams."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from collections import deque
+from collections.abc import Iterable, Iterator, Sequence
+from contextlib import contextmanager
+from uuid import UUID
+
+from backend.src.domain.ports.services import NewTaskToastData
+
+
+def encode_toast(toast: NewTaskToastData) -> str:
+    """Encode a toast once as the JSON `data` of an SSE event."""
+    return json.dumps(
+        {
+            "type": "new_task",
+            "project_id": str(toast.project_id),
+            "project_name": toast.project_name,
+            "task_id": str(toast.task_id),
+            "task_title": toast.task_title,
+            "required_role": toast.required_role,
+        },
+        separators=(",", ":"),
+    )
+
+
+class ToastSubscription:
+    """
+    One open stream: a bounded queue of encoded events.
+
+    An idle subscription holds an empty deque and, while a reader waits,
+    one future. When a slow client falls behind, the oldest toasts are
+    dropped instead of growing the queue.
+    """
+
+    __slots__ = ("user_id", "_events", "_waiter")
+
+    def __init__(self, user_id: UUID, max_pending: int) -> None:
+        self.user_id = user_id
+        self._events: deque[str] = deque(maxlen=max_pending)
+        self._waiter: asyncio.Future[None] | None = None
+
+    def push(self, event: str) -> None:
+        self._events.append(event)
+        if self._waiter is not None and not self._waiter.done():
+            self._waiter.set_result(None)
+
+    async def get(self) -> str:
+        """Wait for the next event."""
+        while not self._events:
+            self._waiter = asyncio.get_running_loop().create_future()
+            try:
+                await self._waiter
+            finally:
+                self._waiter = None
+        return self._events.popleft()
+
+
+class InMemoryToastHub:
+    """
+    Per-worker toast hub (BR-NOTIF-003).
+
+    Streams subscribe by user; a publish encodes the toast once and hands
+    the same string to every open stream of the recipients. Only reaches
+    streams on this worker; see RedisToastHub for multi-worker deployments.
+    """
+
+    def __init__(self, max_pending: int = 16) -> None:
+        self._max_pending = max_pending
+        self._subscribers: dict[UUID, set[ToastSubscription]] = {}
+
+    @property
+    def connection_count(self) -> int:
+        return sum(len(subscriptions) for subscriptions in self._subscribers.values())
+
+    @contextmanager
+    def subscribe(self, user_id: UUID) -> Iterator[ToastSubscription]:
+        """Register a stream for the user for the duration of the block."""
+        subscription = ToastSubscription(user_id, self._max_pending)
+        self._subscribers.setdefault(user_id, set()).add(subscription)
+        try:
+            yield subscription
+        finally:
+            subscriptions = self._subscribers.get(user_id)
+            if subscriptions is not None:
+                subscriptions.discard(subscription)
+                if not subscriptions:
+                    del self._subscribers[user_id]
+
+    async def publish(self, user_ids: Sequence[UUID], toast: NewTaskToastData) -> None:
+        self.deliver(user_ids, encode_toast(toast))
+
+    def deliver(self, user_ids: Iterable[UUID], event: str) -> int:
+        """Push an encoded event to local streams; return how many got it."""
+        delivered = 0
+        for user_id in user_ids:
+            for subscription in self._subscribers.get(user_id, ()):
+                subscription.push(event)
+                delivered += 1
+        return delivered
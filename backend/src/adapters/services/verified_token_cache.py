@@ -0,0 +1,52 @@
+"""In-process cache of verified token payloads."""
+
+from __future__ import annotations
+
+import hashlib
+from collections import OrderedDict
+from typing import Any
+
+
+class VerifiedTokenCache:
+    """
+    Bounded LRU of decoded token payloads, keyed by token hash.
+
+    Entries live until the token's ``exp`` claim, so a hit is exactly as
+    valid as re-verifying the signature. Only signature and expiry checks
+    are skipped; revocation must still be checked by the caller.
+    """
+
+    def __init__(self, max_entries: int = 10_000) -> None:
+        self._max_entries = max_entries
+        self._entries: OrderedDict[bytes, tuple[float, dict[str, Any]]] = OrderedDict()
+
+    @staticmethod
+    def _key(token: str) -> bytes:
+        return hashlib.sha256(token.encode()).digest()
+
+    def get(self, token: str, now: float) -> dict[str, Any] | None:
+        """Return a copy of the cached payload, or None if missing or expired."""
+        key = self._key(token)
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, payload = entry
+        if now >= expires_at:
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return dict(payload)
+
+    def put(self, token: str, payload: dict[str, Any]) -> None:
+        """Cache a verified payload until its ``exp`` claim."""
+        exp = payload.get("exp")
+        if self._max_entries <= 0 or not isinstance(exp, (int, float)):
+            return
+        key = self._key(token)
+        self._entries[key] = (float(exp), dict(payload))
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -3,47 +3,70 @@
 from __future__ import annotations
 
 from contextlib import asynccontextmanager
+from functools import partial
+from uuid import UUID
 
-from fastapi import FastAPI, Request, status
+from fastapi import Depends, FastAPI, Request, status
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, PlainTextResponse
 from sqlalchemy import text
 
 from backend.src.adapters.api import deps
+from backend.src.adapters.api.errors import error_detail, http_status_for
 from backend.src.adapters.api.routers import (
     auth_router,
+    batch_router,
+    exports_router,
     invites_router,
     members_router,
+    notifications_router,
     projects_router,
     roles_router,
+    snapshot_router,
     tasks_router,
 )
+from backend.src.adapters.api.routers.common import RateLimitScope, rate_limit
+from backend.src.application.use_cases.notifications import CheckWorkloadAlertsUseCase
+from backend.src.application.use_cases.task_management import (
+    IndexCompletedTasksUseCase,
+)
 from backend.src.adapters.services import (
+    CachingLLMService,
+    CircuitBreakerRegistry,
     EmailNotificationService,
+    FairLLMScheduler,
     FernetEncryptionService,
+    InMemoryProjectAccessCache,
+    InProcessEventBus,
     InMemoryRateLimiter,
+    InMemoryToastHub,
     InMemoryTokenService,
     JWTTokenService,
+    LLMClientKey,
+    LLMClientRegistry,
+    LLMTokenBudget,
     MockEmailService,
     MockLLMService,
     MockNotificationService,
     OpenAILLMService,
+    OutboxEmailService,
+    ProjectScopedLLMResolver,
+    ResilientLLMService,
+    ScheduledLLMService,
     SMTPEmailService,
+    SimilarityLLMService,
     SimpleEncryptionService,
+    WeightedFairQueue,
 )
 from backend.src.config.settings import get_settings
 from backend.src.observability.logging_config import configure_logging
-from backend.src.domain.errors import (
-    DomainError,
-    ManagerRequiredError,
-    ProjectAccessDeniedError,
-    ProjectNotFoundError,
-    TaskNotAssignedError,
-    TaskNotFoundError,
-    TaskNotOwnedError,
-    TaskNotSelectableError,
-    WorkloadExceededError,
+from backend.src.observability.metrics import (
+    render_circuit_breakers,
+    render_llm_cache,
 )
+from backend.src.domain.errors import DomainError
+from backend.src.domain.events import TaskCompleted, TaskWorkloadEvent
+from backend.src.domain.ports.services import LLMService, RateLimitAlgorithm
 from backend.src.domain.services.time_provider import SystemTimeProvider
 from backend.src.domain.time import reset_time_provider, set_time_provider
 from backend.src.infrastructure.db.session import (
@@ -51,7 +74,9 @@ from backend.src.infrastructure.db.session import (
     get_session_factory,
     init_db,
 )
+from backend.src.infrastructure.db.unit_of_work import open_unit_of_work
 from backend.src.infrastructure.di import ContainerFactory
+from backend.src.infrastructure.outbox import EmailOutboxDispatcher
 
 
 def _validate_settings(settings) -> None:
@@ -66,28 +91,24 @@ def _validate_settings(settings) -> None:
     if (
         settings.token_provider != "mock"
         or settings.rate_limit_provider == "redis"
+        or settings.project_access_cache_provider == "redis"
+        or settings.toast_provider == "redis"
+        or settings.llm_cache_provider == "redis"
     ) and not settings.redis_url:
         raise RuntimeError(
-            "REDIS_URL is required when TOKEN_PROVIDER != mock or RATE_LIMIT_PROVIDER=redis"
+            "REDIS_URL is required when TOKEN_PROVIDER != mock, "
+            "RATE_LIMIT_PROVIDER=redis, PROJECT_ACCESS_CACHE_PROVIDER=redis, "
+            "TOAST_PROVIDER=redis or LLM_CACHE_PROVIDER=redis"
         )
 
 
 def _register_exception_handlers(app: FastAPI) -> None:
     @app.exception_handler(DomainError)
     async def handle_domain_error(request: Request, exc: DomainError) -> JSONResponse:
-        status_override = {
-            TaskNotFoundError: status.HTTP_404_NOT_FOUND,
-            ProjectNotFoundError: status.HTTP_404_NOT_FOUND,
-            ManagerRequiredError: status.HTTP_403_FORBIDDEN,
-            ProjectAccessDeniedError: status.HTTP_403_FORBIDDEN,
-            TaskNotOwnedError: status.HTTP_403_FORBIDDEN,
-            TaskNotSelectableError: status.HTTP_422_UNPROCESSABLE_ENTITY,
-            WorkloadExceededError: status.HTTP_422_UNPROCESSABLE_ENTITY,
-            TaskNotAssignedError: status.HTTP_422_UNPROCESSABLE_ENTITY,
-        }
-
-        status_code = status_override.get(type(exc), exc.status)
-        return JSONResponse(status_code=status_code, content={"detail": exc.message})
+        return JSONResponse(
+            status_code=http_status_for(exc),
+            content={"detail": error_detail(exc)},
+        )
 
     @app.exception_handler(ValueError)
     async def handle_value_error(request: Request, exc: ValueError) -> JSONResponse:
@@ -107,22 +128,43 @@ def create_app() -> FastAPI:
         configure_logging(settings.log_level)
         time_token = set_time_provider(SystemTimeProvider())
         redis = None
+        revoked_store = None
+        redis_toast_hub = None
 
         if settings.email_provider == "mock":
-            email_service = MockEmailService()
+            email_transport = MockEmailService()
         else:
-            email_service = SMTPEmailService(settings)
+            email_transport = SMTPEmailService(settings)
+        # Consumers queue email in the outbox; only the dispatcher talks to
+        # the transport.
+        uow_factory = partial(open_unit_of_work, get_session_factory())
+        email_dispatcher = EmailOutboxDispatcher(
+            uow_factory,
+            email_transport,
+            batch_size=settings.email_outbox_batch_size,
+            max_attempts=settings.email_outbox_max_attempts,
+            poll_interval_seconds=settings.email_outbox_poll_seconds,
+        )
+        email_service = OutboxEmailService(
+            uow_factory, on_enqueued=email_dispatcher.wake
+        )
 
         if settings.token_provider == "mock":
-            token_service = InMemoryTokenService()
+            token_service = InMemoryTokenService(
+                access_ttl_seconds=settings.access_token_expiry_minutes * 60,
+                refresh_ttl_seconds=settings.refresh_token_expiry_minutes * 60,
+            )
         else:
             from backend.src.infrastructure.cache import (
-                RedisRevokedTokenStore,
+                SyncedRedisRevokedTokenStore,
                 create_redis_client,
             )
 
             redis = create_redis_client(settings.redis_url or "")
-            revoked_store = RedisRevokedTokenStore(redis)
+            revoked_store = SyncedRedisRevokedTokenStore(
+                redis, sync_interval_seconds=settings.auth_revocation_sync_seconds
+            )
+            await revoked_store.start()
             token_service = JWTTokenService(settings, revoked_token_store=revoked_store)
 
         if settings.encryption_provider == "mock":
@@ -130,15 +172,170 @@ def create_app() -> FastAPI:
         else:
             encryption_service = FernetEncryptionService(settings.encryption_key or "")
 
+        llm_breakers = CircuitBreakerRegistry(
+            failure_threshold=settings.llm_breaker_failure_threshold,
+            reset_timeout_seconds=settings.llm_breaker_reset_seconds,
+        )
+
+        def resilient(
+            inner: LLMService, name: str, fallback: LLMService | None = None
+        ) -> LLMService:
+            return ResilientLLMService(
+                inner,
+                name=name,
+                breaker=llm_breakers.get(name),
+                fallback=fallback,
+                timeout_seconds=settings.llm_timeout_seconds,
+                batch_timeout_seconds=settings.llm_batch_timeout_seconds,
+                max_retries=settings.llm_max_retries,
+                hedge_after_seconds=settings.llm_hedge_after_seconds,
+            )
+
         if settings.llm_provider == "mock":
             llm_service = MockLLMService()
         else:
-            llm_service = OpenAILLMService(settings)
+            # Projects share the house quota in weighted fair order, within
+            # their daily token budgets; cache hits below never reach it.
+            # Retries and hedges run under the call's slot and are charged
+            # the usage the provider reports.
+            llm_scheduler = FairLLMScheduler(
+                WeightedFairQueue(
+                    settings.llm_max_concurrency,
+                    max_queued=settings.llm_project_max_queued,
+                ),
+                LLMTokenBudget(
+                    uow_factory,
+                    daily_tokens=settings.llm_project_daily_token_budget,
+                ),
+                weights={
+                    UUID(project_id): weight
+                    for project_id, weight in settings.llm_project_weights.items()
+                },
+            )
+            llm_service = ScheduledLLMService(
+                resilient(
+                    OpenAILLMService(settings), f"house:{settings.llm_provider}"
+                ),
+                llm_scheduler,
+                batch_size=settings.llm_batch_size,
+            )
+        llm_cache_stats = None
+        if settings.llm_cache_provider != "none":
+            llm_result_cache = None
+            if settings.llm_cache_provider == "redis":
+                from backend.src.infrastructure.cache import (
+                    RedisLLMResultCache,
+                    create_redis_client,
+                )
+
+                if redis is None:
+                    redis = create_redis_client(settings.redis_url or "")
+                llm_result_cache = RedisLLMResultCache(redis)
+            llm_service = CachingLLMService(
+                llm_service,
+                namespace=f"{settings.llm_provider}:{settings.llm_model or 'default'}",
+                shared_cache=llm_result_cache,
+                max_entries=settings.llm_cache_size,
+                ttl_seconds=settings.llm_cache_ttl_seconds,
+            )
+            llm_cache_stats = llm_service.stats
+
+        # Near-duplicates of completed tasks are estimated from them, locally.
+        similar_tasks = None
+        similar_tasks_sync = None
+        if settings.llm_similarity_provider == "numpy":
+            from backend.src.infrastructure.similarity import (
+                NumpySimilarTaskIndex,
+                SimilarTaskIndexSync,
+            )
+
+            similar_tasks = NumpySimilarTaskIndex(
+                max_entries=settings.llm_similarity_index_size
+            )
+            llm_service = SimilarityLLMService(
+                llm_service,
+                similar_tasks,
+                threshold=settings.llm_similarity_threshold,
+            )
+
+        # ADR 009: projects with their own key get pooled clients that share
+        # one HTTP connection pool and fall back to the house model while
+        # their provider is unhealthy; the rest use the global service above.
+        llm_http_client = None
+        if settings.llm_provider == "mock":
+
+            def build_llm_client(key: LLMClientKey, api_key: str) -> LLMService:
+                return llm_service
+
+        else:
+            from openai import DefaultAsyncHttpxClient
+
+            llm_http_client = DefaultAsyncHttpxClient()
+
+            def build_llm_client(key: LLMClientKey, api_key: str) -> LLMService:
+                client = resilient(
+                    OpenAILLMService(
+                        settings,
+                        api_key=api_key,
+                        base_url=key.base_url,
+                        http_client=llm_http_client,
+                    ),
+                    f"{key.provider}:{key.key_fingerprint[:8]}",
+                    fallback=llm_service,
+                )
+                if similar_tasks is not None:
+                    client = SimilarityLLMService(
+                        client,
+                        similar_tasks,
+                        threshold=settings.llm_similarity_threshold,
+                    )
+                return client
+
+        llm_registry = LLMClientRegistry(
+            encryption_service,
+            client_factory=build_llm_client,
+            fallback=llm_service,
+            max_clients=settings.llm_client_pool_size,
+            secret_ttl_seconds=settings.llm_secret_ttl_seconds,
+        )
+
+        if settings.toast_provider == "redis":
+            from backend.src.infrastructure.cache import RedisToastHub, create_redis_client
+
+            if redis is None:
+                redis = create_redis_client(settings.redis_url or "")
+            redis_toast_hub = RedisToastHub(
+                redis, max_pending=settings.toast_queue_size
+            )
+            await redis_toast_hub.start()
+            toast_hub: InMemoryToastHub = redis_toast_hub
+        else:
+            toast_hub = InMemoryToastHub(max_pending=settings.toast_queue_size)
 
         if settings.notification_provider == "mock":
             notification_service = MockNotificationService()
         else:
-            notification_service = EmailNotificationService(email_service)
+            notification_service = EmailNotificationService(
+                email_service, toast_publisher=toast_hub
+            )
+
+        # BR-NOTIF-002: workload alerts follow task events instead of a scan.
+        event_bus = InProcessEventBus()
+        event_bus.subscribe(
+            TaskWorkloadEvent,
+            CheckWorkloadAlertsUseCase(uow_factory, notification_service).handle_events,
+        )
+        if similar_tasks is not None:
+            task_indexer = IndexCompletedTasksUseCase(
+                uow_factory, similar_tasks, limit=settings.llm_similarity_index_size
+            )
+            await task_indexer.warm_up()
+            event_bus.subscribe(TaskCompleted, task_indexer.handle_events)
+            # Tasks completed on other workers arrive with the periodic sync.
+            similar_tasks_sync = SimilarTaskIndexSync(
+                task_indexer, settings.llm_similarity_sync_seconds
+            )
+            await similar_tasks_sync.start()
 
         if settings.rate_limit_provider == "redis":
             from backend.src.infrastructure.cache import RedisRateLimiter, create_redis_client
@@ -149,6 +346,22 @@ def create_app() -> FastAPI:
         else:
             rate_limiter = InMemoryRateLimiter()
 
+        if settings.project_access_cache_provider == "redis":
+            from backend.src.infrastructure.cache import (
+                RedisProjectAccessCache,
+                create_redis_client,
+            )
+
+            if redis is None:
+                redis = create_redis_client(settings.redis_url or "")
+            project_access_cache = RedisProjectAccessCache(
+                redis, ttl_seconds=settings.project_access_cache_ttl_seconds
+            )
+        else:
+            project_access_cache = InMemoryProjectAccessCache(
+                ttl_seconds=settings.project_access_cache_ttl_seconds
+            )
+
         factory = ContainerFactory(
             session_factory=get_session_factory(),
             email_service=email_service,
@@ -157,24 +370,51 @@ def create_app() -> FastAPI:
             llm_service=llm_service,
             notification_service=notification_service,
             public_base_url=settings.public_base_url,
+            project_access_cache=project_access_cache,
+            event_publisher=event_bus,
+            llm_resolver=ProjectScopedLLMResolver(llm_registry),
         )
 
         deps.set_container_factory(factory)
         deps.set_current_user_provider(deps.JWTUserIdProvider(token_service))
         deps.set_rate_limiter(rate_limiter)
+        deps.set_email_outbox_dispatcher(email_dispatcher)
+        deps.set_toast_hub(toast_hub)
+        deps.set_llm_circuit_breakers(llm_breakers)
+        deps.set_llm_cache_stats(llm_cache_stats)
+        await email_dispatcher.start()
 
         try:
             yield
         finally:
             reset_time_provider(time_token)
+            await email_dispatcher.stop()
+            if isinstance(email_transport, SMTPEmailService):
+                await email_transport.aclose()
+            deps.set_email_outbox_dispatcher(None)
+            deps.set_toast_hub(None)
+            deps.set_llm_circuit_breakers(None)
+            deps.set_llm_cache_stats(None)
+            if redis_toast_hub is not None:
+                await redis_toast_hub.stop()
             deps.set_rate_limiter(None)
+            if revoked_store is not None:
+                await revoked_store.stop()
+            if similar_tasks_sync is not None:
+                await similar_tasks_sync.stop()
+            if llm_http_client is not None:
+                await llm_http_client.aclose()
             if redis is not None:
                 await redis.aclose()
             await dispose_db()
 
     app = FastAPI(lifespan=lifespan)
     from backend.src.adapters.api.middleware.request_id import RequestIdMiddleware
+    from backend.src.adapters.api.middleware.server_timing import (
+        ServerTimingMiddleware,
+    )
 
+    app.add_middleware(ServerTimingMiddleware)
     app.add_middleware(RequestIdMiddleware)
     app.add_middleware(
         CORSMiddleware,
@@ -186,12 +426,32 @@ def create_app() -> FastAPI:
 
     _register_exception_handlers(app)
 
+    # API-wide buckets for authenticated routes: a bursty per-user token
+    # bucket plus a per-project sliding window shared by all its members.
+    api_rate_limits = [
+        Depends(
+            rate_limit(
+                "api",
+                per=RateLimitScope.USER,
+                algorithm=RateLimitAlgorithm.TOKEN_BUCKET,
+            )
+        ),
+        Depends(rate_limit("api", per=RateLimitScope.PROJECT)),
+    ]
+
     app.include_router(auth_router)
-    app.include_router(projects_router)
-    app.include_router(roles_router)
-    app.include_router(invites_router)
-    app.include_router(members_router)
-    app.include_router(tasks_router)
+    for router in (
+        projects_router,
+        roles_router,
+        invites_router,
+        members_router,
+        notifications_router,
+        tasks_router,
+        batch_router,
+        exports_router,
+        snapshot_router,
+    ):
+        app.include_router(router, dependencies=api_rate_limits)
 
     @app.get("/health")
     async def health():
@@ -210,4 +470,13 @@ def create_app() -> FastAPI:
             content={"liveness": "ok", "readiness": readiness},
         )
 
+    @app.get("/metrics", response_class=PlainTextResponse)
+    async def metrics() -> PlainTextResponse:
+        breakers = deps.get_llm_circuit_breakers()
+        return PlainTextResponse(
+            render_circuit_breakers(breakers.snapshot() if breakers else {})
+            + render_llm_cache(deps.get_llm_cache_stats()),
+            media_type="text/plain; version=0.0.4",
+        )
+
     return app
@@ -28,7 +28,8 @@ class RequestMagicLinkUseCase:
         """
         Request a magic link for the given email.
 
-        Creates user if not exists, generates token, and sends email.
+        Creates user if not exists, generates token, and sends email. With a
+        Unit of Work the email is queued in the outbox rather than sent inline.
         Always returns success to prevent email enumeration (BR-AUTH-003).
         """
         email = input.email.strip().lower()
@@ -41,22 +42,29 @@ class RequestMagicLinkUseCase:
 
                 token = user.generate_magic_link_token()
                 await self.uow.user_repository.save(user)
+                # Queued in the same transaction: the link is sent if and
+                # only if its token hash was stored.
+                message = _magic_link_email(email, token)
+                await self.uow.email_outbox_repository.add(message)
                 await self.uow.commit()
-        else:
-            if self.user_repository is None:
-                raise RuntimeError(
-                    "RequestMagicLinkUseCase requires uow or user_repository"
-                )
-            user = await self.user_repository.find_by_email(email)
-            if user is None:
-                user = User(email=email, name="")
-            token = user.generate_magic_link_token()
-            await self.user_repository.save(user)
-
-        message = EmailMessage(
-            recipients=[email],
-            subject="Your Magic Link Login",
-            body_text=f"Click here to login: {token}",
-            body_html=f"<p>Click <a href='?token={token}'>here</a> to login.</p>",
-        )
-        await self.email_service.send_email(message)
+            return
+
+        if self.user_repository is None:
+            raise RuntimeError(
+                "RequestMagicLinkUseCase requires uow or user_repository"
+            )
+        user = await self.user_repository.find_by_email(email)
+        if user is None:
+            user = User(email=email, name="")
+        token = user.generate_magic_link_token()
+        await self.user_repository.save(user)
+        await self.email_service.send_email(_magic_link_email(email, token))
+
+
+def _magic_link_email(email: str, token: str) -> EmailMessage:
+    return EmailMessage(
+        recipients=[email],
+        subject="Your Magic Link Login",
+        body_text=f"Click here to login: {token}",
+        body_html=f"<p>Click <a href='?token={token}'>here</a> to login.</p>",
+    )
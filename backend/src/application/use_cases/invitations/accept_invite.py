@@ -12,6 +12,7 @@ from backend.src.domain.errors import (
     UserNotFoundError,
 )
 from backend.src.domain.ports.unit_of_work import UnitOfWork
+from backend.src.domain.services.project_access_resolver import ProjectAccessResolver
 
 
 @dataclass
@@ -33,8 +34,13 @@ class AcceptInviteOutput:
 class AcceptInviteUseCase:
     """Use case for accepting a project invitation."""
 
-    def __init__(self, uow: UnitOfWork):
+    def __init__(
+        self,
+        uow: UnitOfWork,
+        access_resolver: ProjectAccessResolver | None = None,
+    ):
         self.uow = uow
+        self.access = access_resolver or ProjectAccessResolver()
 
     async def execute(self, input: AcceptInviteInput) -> AcceptInviteOutput:
         """
@@ -92,4 +98,6 @@ class AcceptInviteUseCase:
 
             await self.uow.commit()
 
+        # A cached "not a member" answer would otherwise outlive the join.
+        await self.access.invalidate(invite.project_id, input.user_id)
         return AcceptInviteOutput(member=member)
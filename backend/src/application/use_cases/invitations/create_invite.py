@@ -4,13 +4,13 @@ from dataclasses import dataclass
 from uuid import UUID
 
 from backend.src.domain.entities import ProjectInvite
-from backend.src.domain.errors import ManagerRequiredError, ProjectNotFoundError
 from backend.src.domain.ports.repositories import (
     ProjectInviteRepository,
     ProjectRepository,
     RoleRepository,
 )
 from backend.src.domain.ports.unit_of_work import UnitOfWork
+from backend.src.domain.services.project_access_resolver import ProjectAccessResolver
 
 
 @dataclass
@@ -40,12 +40,14 @@ class CreateInviteUseCase:
         project_repository: ProjectRepository | None = None,
         role_repository: RoleRepository | None = None,
         project_invite_repository: ProjectInviteRepository | None = None,
+        access_resolver: ProjectAccessResolver | None = None,
     ):
         self.uow = uow
         self.project_repository = project_repository
         self.role_repository = role_repository
         self.project_invite_repository = project_invite_repository
         self.base_url = base_url
+        self.access = access_resolver or ProjectAccessResolver()
 
     async def execute(self, input: CreateInviteInput) -> CreateInviteOutput:
         """
@@ -61,12 +63,12 @@ class CreateInviteUseCase:
         """
         if self.uow is not None:
             async with self.uow:
-                project = await self.uow.project_repository.find_by_id(input.project_id)
-                if project is None:
-                    raise ProjectNotFoundError(str(input.project_id))
-
-                if not project.is_manager(input.requester_id):
-                    raise ManagerRequiredError("create invitation")
+                await self.access.require_manager(
+                    self.uow.project_repository,
+                    input.project_id,
+                    input.requester_id,
+                    "create invitation",
+                )
 
                 role = await self.uow.role_repository.find_by_id(input.role_id)
                 if role is None or role.project_id != input.project_id:
@@ -88,11 +90,12 @@ class CreateInviteUseCase:
             or self.project_invite_repository is None
         ):
             raise RuntimeError("CreateInviteUseCase requires uow or repositories")
-        project = await self.project_repository.find_by_id(input.project_id)
-        if project is None:
-            raise ProjectNotFoundError(str(input.project_id))
-        if not project.is_manager(input.requester_id):
-            raise ManagerRequiredError("create invitation")
+        await self.access.require_manager(
+            self.project_repository,
+            input.project_id,
+            input.requester_id,
+            "create invitation",
+        )
         role = await self.role_repository.find_by_id(input.role_id)
         if role is None or role.project_id != input.project_id:
             raise ValueError(f"Role {input.role_id} not found in project")
@@ -0,0 +1,29 @@
+"""Scheduled and event-driven notification use cases."""
+
+from backend.src.application.use_cases.notifications.check_workload_alerts import (
+    CheckWorkloadAlertsInput,
+    CheckWorkloadAlertsOutput,
+    CheckWorkloadAlertsUseCase,
+)
+from backend.src.application.use_cases.notifications.send_daily_reports import (
+    SendDailyReportsInput,
+    SendDailyReportsOutput,
+    SendDailyReportsUseCase,
+)
+from backend.src.application.use_cases.notifications.send_deadline_warnings import (
+    SendDeadlineWarningsInput,
+    SendDeadlineWarningsOutput,
+    SendDeadlineWarningsUseCase,
+)
+
+__all__ = [
+    "CheckWorkloadAlertsInput",
+    "CheckWorkloadAlertsOutput",
+    "CheckWorkloadAlertsUseCase",
+    "SendDailyReportsInput",
+    "SendDailyReportsOutput",
+    "SendDailyReportsUseCase",
+    "SendDeadlineWarningsInput",
+    "SendDeadlineWarningsOutput",
+    "SendDeadlineWarningsUseCase",
+]
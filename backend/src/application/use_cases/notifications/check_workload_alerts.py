@@ -0,0 +1,122 @@
+"""Event-driven workload alert use case (BR-NOTIF-002)."""
+
+from __future__ import annotations
+
+import logging
+from collections.abc import Callable, Sequence
+from contextlib import AbstractAsyncContextManager
+from dataclasses import dataclass
+from uuid import UUID
+
+from backend.src.domain.entities import ProjectConfig, Workload, WorkloadStatus
+from backend.src.domain.events import DomainEvent, TaskWorkloadEvent
+from backend.src.domain.ports import NotificationService, UnitOfWork
+from backend.src.domain.ports.services import WorkloadAlertData
+
+logger = logging.getLogger(__name__)
+
+# Statuses that keep a raised alert in place; below them the next
+# Impossible episode is reported again.
+_ALERT_HOLD_STATUSES = (WorkloadStatus.TIGHT, WorkloadStatus.IMPOSSIBLE)
+
+
+@dataclass
+class CheckWorkloadAlertsInput:
+    """Members whose Doing tasks changed."""
+
+    member_ids: Sequence[UUID]
+
+
+@dataclass
+class CheckWorkloadAlertsOutput:
+    """How many members were checked, alerted about or re-armed."""
+
+    checked: int = 0
+    alerted: int = 0
+    rearmed: int = 0
+
+
+class CheckWorkloadAlertsUseCase:
+    """
+    Alert the Manager when an Employee's Workload becomes Impossible.
+
+    BR-NOTIF-002: Alerts are sent to Managers if an Employee's workload
+    becomes Impossible.
+
+    Runs on the task events that move a Workload (select, complete,
+    abandon, difficulty change) rather than on a schedule: each affected
+    member costs one indexed query over their own tasks. An alert is raised
+    once per episode; it stays raised while the member is Tight or
+    Impossible and is re-armed once they are back to Healthy or lower, so
+    edits around the threshold do not repeat it. The alert row is inserted
+    before the notification is sent and committed after it, so a
+    concurrent worker waits on the uncommitted row instead of sending a
+    second alert, and a failed send rolls the alert back to be retried on
+    the next change. The notification service queues the email in its own
+    transaction, though: if the final commit fails after that, the alert
+    is not recorded and may be sent again (at least once, not exactly
+    once).
+    """
+
+    def __init__(
+        self,
+        uow_factory: Callable[[], AbstractAsyncContextManager[UnitOfWork]],
+        notification_service: NotificationService,
+        config: ProjectConfig | None = None,
+    ):
+        self.uow_factory = uow_factory
+        self.notification_service = notification_service
+        self.config = config or ProjectConfig()
+
+    async def handle_events(self, events: Sequence[DomainEvent]) -> None:
+        """Event handler: check each affected member once per batch."""
+        member_ids = dict.fromkeys(
+            event.member_id for event in events if isinstance(event, TaskWorkloadEvent)
+        )
+        if member_ids:
+            await self.execute(CheckWorkloadAlertsInput(member_ids=list(member_ids)))
+
+    async def execute(self, input: CheckWorkloadAlertsInput) -> CheckWorkloadAlertsOutput:
+        output = CheckWorkloadAlertsOutput()
+        for member_id in input.member_ids:
+            try:
+                await self._check(member_id, output)
+            except Exception:
+                logger.warning(
+                    "workload_alert_failed member_id=%s", member_id, exc_info=True
+                )
+        return output
+
+    async def _check(self, member_id: UUID, output: CheckWorkloadAlertsOutput) -> None:
+        async with self.uow_factory() as uow:
+            alerts = uow.workload_alert_repository
+            state = await alerts.get_member_workload(member_id)
+            if state is None:
+                return
+            output.checked += 1
+            workload = Workload.calculate(
+                [state.doing_points],
+                state.seniority_level,
+                base_capacity=self.config.base_capacity,
+            )
+
+            if workload.status == WorkloadStatus.IMPOSSIBLE:
+                if not await alerts.raise_alert(member_id):
+                    return
+                await self.notification_service.send_workload_alert(
+                    state.manager_email,
+                    WorkloadAlertData(
+                        project_id=state.project_id,
+                        project_name=state.project_name,
+                        employee_id=state.user_id,
+                        employee_name=state.member_name,
+                        employee_email=state.member_email,
+                        current_workload_ratio=float(workload.ratio),
+                    ),
+                )
+                await uow.commit()
+                output.alerted += 1
+            elif workload.status not in _ALERT_HOLD_STATUSES:
+                if await alerts.clear_alert(member_id):
+                    await uow.commit()
+                    output.rearmed += 1
@@ -0,0 +1,151 @@
+"""Scheduled manager daily report use case (UC-080)."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from collections import defaultdict
+from collections.abc import Iterator
+from dataclasses import dataclass
+from datetime import datetime
+from uuid import UUID
+
+from backend.src.domain.entities import ProjectConfig, Workload
+from backend.src.domain.ports import NotificationService, UnitOfWork
+from backend.src.domain.ports.repositories import (
+    MemberWorkloadPoints,
+    ProjectTaskCounts,
+    ReportProject,
+)
+from backend.src.domain.ports.services import DailyReportData
+from backend.src.domain.time import utcnow
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class SendDailyReportsInput:
+    """Input for a daily report run; `now` defaults to the current time."""
+
+    now: datetime | None = None
+
+
+@dataclass
+class SendDailyReportsOutput:
+    """How many reports were sent, skipped or failed in a run."""
+
+    sent: int = 0
+    skipped: int = 0
+    failed: int = 0
+
+
+class SendDailyReportsUseCase:
+    """
+    Send every Manager the Daily Report for each of their projects.
+
+    BR-NOTIF-001: Managers receive a Daily Report summarizing progress and
+    blockers, only on working days of the Project's Working Calendar.
+
+    Projects are read in pages; each page costs three grouped queries
+    (projects with calendars, task counters, member workloads) however many
+    projects or tasks it holds, and its reports are sent with bounded
+    concurrency before the next page is read. A failed send is logged and
+    counted without stopping the run.
+    """
+
+    def __init__(
+        self,
+        uow: UnitOfWork,
+        notification_service: NotificationService,
+        config: ProjectConfig | None = None,
+        page_size: int = 500,
+        concurrency: int = 8,
+    ):
+        self.uow = uow
+        self.notification_service = notification_service
+        self.config = config or ProjectConfig()
+        self.page_size = page_size
+        self.concurrency = concurrency
+
+    async def execute(self, input: SendDailyReportsInput) -> SendDailyReportsOutput:
+        now = input.now or utcnow()
+        output = SendDailyReportsOutput()
+        semaphore = asyncio.Semaphore(self.concurrency)
+
+        async with self.uow:
+            reports = self.uow.report_repository
+            after = None
+            while True:
+                projects = await reports.list_projects(after=after, limit=self.page_size)
+                if not projects:
+                    break
+                after = projects[-1].project_id
+
+                working = [p for p in projects if p.calendar.is_working_day(now)]
+                output.skipped += len(projects) - len(working)
+                if working:
+                    project_ids = [p.project_id for p in working]
+                    counts = await reports.count_tasks_by_project(project_ids, now)
+                    workloads = await reports.list_member_workloads(project_ids)
+                    sent = await asyncio.gather(
+                        *(
+                            self._send(semaphore, report_project, report)
+                            for report_project, report in self._build_reports(
+                                working, counts, workloads
+                            )
+                        )
+                    )
+                    output.sent += sum(sent)
+                    output.failed += len(sent) - sum(sent)
+
+                if len(projects) < self.page_size:
+                    break
+
+        return output
+
+    def _build_reports(
+        self,
+        projects: list[ReportProject],
+        counts: dict[UUID, ProjectTaskCounts],
+        workloads: list[MemberWorkloadPoints],
+    ) -> Iterator[tuple[ReportProject, DailyReportData]]:
+        summaries: dict[UUID, dict[str, str]] = defaultdict(dict)
+        for member in workloads:
+            workload = Workload.calculate(
+                [member.doing_points],
+                member.seniority_level,
+                base_capacity=self.config.base_capacity,
+            )
+            summaries[member.project_id][member.member_name] = workload.status.value
+
+        for project in projects:
+            project_counts = counts.get(project.project_id, ProjectTaskCounts())
+            yield project, DailyReportData(
+                project_id=project.project_id,
+                project_name=project.project_name,
+                total_tasks=project_counts.total_tasks,
+                completed_today=project_counts.completed_today,
+                blocked_tasks=project_counts.blocked_tasks,
+                delayed_tasks=project_counts.delayed_tasks,
+                team_workload_summary=summaries.get(project.project_id, {}),
+            )
+
+    async def _send(
+        self,
+        semaphore: asyncio.Semaphore,
+        project: ReportProject,
+        report: DailyReportData,
+    ) -> bool:
+        async with semaphore:
+            try:
+                await self.notification_service.send_daily_report(
+                    project.manager_email, report
+                )
+            except Exception:
+                logger.warning(
+                    "daily_report_failed project_id=%s",
+                    project.project_id,
+                    exc_info=True,
+                )
+                return False
+        return True
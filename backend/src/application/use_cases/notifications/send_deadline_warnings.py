@@ -0,0 +1,181 @@
+"""Scheduled deadline warning use case (UC-084)."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import math
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from uuid import UUID
+
+from backend.src.domain.ports import NotificationService, UnitOfWork
+from backend.src.domain.ports.repositories import (
+    DeadlineCandidate,
+    DueDeadlineWarning,
+    ScheduledDeadlineWarning,
+)
+from backend.src.domain.time import utcnow
+
+logger = logging.getLogger(__name__)
+
+# Deadlines up to this point have been scheduled.
+DEADLINES_WATERMARK = "deadline_warnings.deadlines"
+# Task edits up to this point have been rescheduled.
+CHANGES_WATERMARK = "deadline_warnings.changes"
+
+# Re-read edits this far behind the changes watermark, so rows committed
+# while the previous run was scanning are not missed.
+_CHANGES_OVERLAP = timedelta(minutes=5)
+
+
+@dataclass
+class SendDeadlineWarningsInput:
+    """Input for a deadline scan; `now` defaults to the current time."""
+
+    now: datetime | None = None
+
+
+@dataclass
+class SendDeadlineWarningsOutput:
+    """How many deadlines were scanned and warnings sent or failed in a run."""
+
+    scanned: int = 0
+    sent: int = 0
+    failed: int = 0
+
+
+class SendDeadlineWarningsUseCase:
+    """
+    Warn Assignees of open Tasks one working day before the deadline.
+
+    UC-084: the warning goes out on the working day before the deadline,
+    or the last working day before that (BR-NOTIF-004).
+
+    Each run only reads tasks that entered the scan window since the last
+    run: deadlines between the persisted deadline watermark and
+    `now + lookahead`, plus tasks edited since the changes watermark whose
+    deadline is already behind it. Both are index range scans. Every such
+    deadline is stored with its due time; due, unsent warnings whose Task
+    still has that deadline are then sent and marked, so a deadline is
+    warned about once. The lookahead must exceed the longest run of
+    non-working days; longer runs only make warnings late, never lost.
+    """
+
+    def __init__(
+        self,
+        uow: UnitOfWork,
+        notification_service: NotificationService,
+        lookahead: timedelta = timedelta(days=14),
+        page_size: int = 1000,
+        concurrency: int = 8,
+    ):
+        self.uow = uow
+        self.notification_service = notification_service
+        self.lookahead = lookahead
+        self.page_size = page_size
+        self.concurrency = concurrency
+
+    async def execute(
+        self, input: SendDeadlineWarningsInput
+    ) -> SendDeadlineWarningsOutput:
+        now = input.now or utcnow()
+        output = SendDeadlineWarningsOutput()
+
+        async with self.uow:
+            output.scanned = await self._schedule(now)
+            await self.uow.deadline_warning_repository.prune(now)
+            await self.uow.commit()
+
+            semaphore = asyncio.Semaphore(self.concurrency)
+            after: UUID | None = None
+            while True:
+                due = await self.uow.deadline_warning_repository.list_due(
+                    now, after=after, limit=self.page_size
+                )
+                if not due:
+                    break
+                after = due[-1].task_id
+                results = await asyncio.gather(
+                    *(self._send(semaphore, warning, now) for warning in due)
+                )
+                sent = [warning for warning, ok in zip(due, results) if ok]
+                await self.uow.deadline_warning_repository.mark_sent(sent, now)
+                await self.uow.commit()
+                output.sent += len(sent)
+                output.failed += len(due) - len(sent)
+                if len(due) < self.page_size:
+                    break
+
+        return output
+
+    async def _schedule(self, now: datetime) -> int:
+        """Store due times for deadlines new to the window; return the count."""
+        repo = self.uow.deadline_warning_repository
+        scanned_until = max(await repo.get_watermark(DEADLINES_WATERMARK) or now, now)
+        changes_since = await repo.get_watermark(CHANGES_WATERMARK)
+        horizon = max(now + self.lookahead, scanned_until)
+        scanned = 0
+
+        async def find_new(after):
+            return await repo.find_by_deadline(
+                scanned_until, horizon, after=after, limit=self.page_size
+            )
+
+        async def find_changed(after):
+            return await repo.find_changed(
+                changes_since - _CHANGES_OVERLAP,
+                now,
+                scanned_until,
+                after=after,
+                limit=self.page_size,
+            )
+
+        finders = [find_new]
+        if changes_since is not None:
+            finders.append(find_changed)
+        for find in finders:
+            after: tuple[datetime, UUID] | None = None
+            while True:
+                candidates = await find(after)
+                await repo.schedule([self._warning(c) for c in candidates])
+                scanned += len(candidates)
+                if len(candidates) < self.page_size:
+                    break
+                after = (candidates[-1].cursor, candidates[-1].task_id)
+
+        await repo.set_watermark(DEADLINES_WATERMARK, horizon)
+        await repo.set_watermark(CHANGES_WATERMARK, now)
+        return scanned
+
+    @staticmethod
+    def _warning(candidate: DeadlineCandidate) -> ScheduledDeadlineWarning:
+        return ScheduledDeadlineWarning(
+            task_id=candidate.task_id,
+            deadline=candidate.deadline,
+            warn_at=candidate.calendar.deadline_warning_at(candidate.deadline),
+        )
+
+    async def _send(
+        self,
+        semaphore: asyncio.Semaphore,
+        warning: DueDeadlineWarning,
+        now: datetime,
+    ) -> bool:
+        hours_remaining = math.ceil((warning.deadline - now).total_seconds() / 3600)
+        async with semaphore:
+            try:
+                await self.notification_service.send_deadline_warning(
+                    warning.assignee_email,
+                    warning.task_id,
+                    warning.task_title,
+                    hours_remaining,
+                )
+            except Exception:
+                logger.warning(
+                    "deadline_warning_failed task_id=%s",
+                    warning.task_id,
+                    exc_info=True,
+                )
+                return False
+        return True
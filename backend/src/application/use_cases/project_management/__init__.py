@@ -16,6 +16,11 @@ from backend.src.application.use_cases.project_management.create_role import (
     CreateRoleInput,
     CreateRoleUseCase,
 )
+from backend.src.application.use_cases.project_management.export_project_data import (
+    ExportProjectDataInput,
+    ExportProjectDataUseCase,
+    ExportResource,
+)
 from backend.src.application.use_cases.project_management.fire_employee import (
     FireEmployeeInput,
     FireEmployeeUseCase,
@@ -26,6 +31,16 @@ from backend.src.application.use_cases.project_management.get_project_details im
     GetProjectDetailsOutput,
     GetProjectDetailsUseCase,
 )
+from backend.src.application.use_cases.project_management.get_project_snapshot import (
+    GetProjectSnapshotInput,
+    GetProjectSnapshotOutput,
+    GetProjectSnapshotUseCase,
+    SnapshotSection,
+)
+from backend.src.application.use_cases.project_management.get_project_version import (
+    GetProjectVersionInput,
+    GetProjectVersionUseCase,
+)
 from backend.src.application.use_cases.project_management.list_project_members import (
     EnrichedMember,
     ListProjectMembersInput,
@@ -57,11 +72,19 @@ __all__ = [
     "CreateRoleInput",
     "CreateRoleUseCase",
     "EnrichedMember",
+    "ExportProjectDataInput",
+    "ExportProjectDataUseCase",
+    "ExportResource",
     "FireEmployeeInput",
     "FireEmployeeUseCase",
     "GetProjectDetailsInput",
     "GetProjectDetailsOutput",
     "GetProjectDetailsUseCase",
+    "GetProjectSnapshotInput",
+    "GetProjectSnapshotOutput",
+    "GetProjectSnapshotUseCase",
+    "GetProjectVersionInput",
+    "GetProjectVersionUseCase",
     "ListProjectMembersInput",
     "ListProjectMembersOutput",
     "ListProjectMembersUseCase",
@@ -74,4 +97,5 @@ __all__ = [
     "RecalculateProjectScheduleUseCase",
     "ResignFromProjectInput",
     "ResignFromProjectUseCase",
+    "SnapshotSection",
 ]
@@ -9,9 +9,9 @@ from backend.src.application.use_cases.project_management.recalculate_project_sc
     RecalculateProjectScheduleUseCase,
 )
 from backend.src.domain.entities import Calendar, ExclusionDate
-from backend.src.domain.errors import ManagerRequiredError, ProjectNotFoundError
 from backend.src.domain.ports.repositories import CalendarRepository, ProjectRepository
 from backend.src.domain.ports.unit_of_work import UnitOfWork
+from backend.src.domain.services.project_access_resolver import ProjectAccessResolver
 
 
 @dataclass
@@ -33,21 +33,23 @@ class ConfigureCalendarUseCase:
         uow: UnitOfWork | None = None,
         project_repository: ProjectRepository | None = None,
         calendar_repository: CalendarRepository | None = None,
+        access_resolver: ProjectAccessResolver | None = None,
     ) -> None:
         self.uow = uow
         self.project_repository = project_repository
         self.calendar_repository = calendar_repository
         self.recalculate_schedule_use_case = recalculate_schedule_use_case
+        self.access = access_resolver or ProjectAccessResolver()
 
     async def execute(self, input: ConfigureCalendarInput) -> Calendar:
         if self.uow is not None:
             async with self.uow:
-                project = await self.uow.project_repository.find_by_id(input.project_id)
-                if project is None:
-                    raise ProjectNotFoundError(str(input.project_id))
-
-                if not project.is_manager(input.requester_id):
-                    raise ManagerRequiredError("configure calendar")
+                await self.access.require_manager(
+                    self.uow.project_repository,
+                    input.project_id,
+                    input.requester_id,
+                    "configure calendar",
+                )
 
                 calendar = await self.uow.calendar_repository.get_by_project_id(
                     input.project_id
@@ -67,11 +69,12 @@ class ConfigureCalendarUseCase:
 
         if self.project_repository is None or self.calendar_repository is None:
             raise RuntimeError("ConfigureCalendarUseCase requires uow or repositories")
-        project = await self.project_repository.find_by_id(input.project_id)
-        if project is None:
-            raise ProjectNotFoundError(str(input.project_id))
-        if not project.is_manager(input.requester_id):
-            raise ManagerRequiredError("configure calendar")
+        await self.access.require_manager(
+            self.project_repository,
+            input.project_id,
+            input.requester_id,
+            "configure calendar",
+        )
         calendar = await self.calendar_repository.get_by_project_id(input.project_id)
         if calendar is None:
             calendar = Calendar(project_id=input.project_id)
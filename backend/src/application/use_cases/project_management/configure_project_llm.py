@@ -1,13 +1,11 @@
 from dataclasses import dataclass
 from uuid import UUID
 
-from backend.src.domain.errors import (
-    ManagerRequiredError,
-    ProjectNotFoundError,
-)
+from backend.src.domain.errors import ProjectNotFoundError
 from backend.src.domain.ports import ProjectRepository
 from backend.src.domain.ports.unit_of_work import UnitOfWork
-from backend.src.domain.ports.services import EncryptionService
+from backend.src.domain.ports.services import EncryptionService, LLMServiceResolver
+from backend.src.domain.services.project_access_resolver import ProjectAccessResolver
 
 
 @dataclass
@@ -28,10 +26,14 @@ class ConfigureProjectLLMUseCase:
         encryption_service: EncryptionService,
         uow: UnitOfWork | None = None,
         project_repository: ProjectRepository | None = None,
+        llm_resolver: LLMServiceResolver | None = None,
+        access_resolver: ProjectAccessResolver | None = None,
     ):
         self.uow = uow
         self.project_repository = project_repository
         self.encryption_service = encryption_service
+        self.llm_resolver = llm_resolver
+        self.access = access_resolver or ProjectAccessResolver()
 
     async def execute(self, input: ConfigureProjectLLMInput) -> None:
         """
@@ -47,28 +49,42 @@ class ConfigureProjectLLMUseCase:
         """
         if self.uow is not None:
             async with self.uow:
+                await self.access.require_manager(
+                    self.uow.project_repository,
+                    input.project_id,
+                    input.requester_id,
+                    "configure LLM",
+                )
                 project = await self.uow.project_repository.find_by_id(input.project_id)
                 if project is None:
                     raise ProjectNotFoundError(str(input.project_id))
 
-                if not project.is_manager(input.requester_id):
-                    raise ManagerRequiredError("configure LLM")
-
                 encrypted_key = await self.encryption_service.encrypt(input.api_key)
                 project.configure_llm(input.provider, encrypted_key)
                 await self.uow.project_repository.save(project)
                 await self.uow.commit()
+            self._invalidate_client(input.project_id)
             return
 
         if self.project_repository is None:
             raise RuntimeError(
                 "ConfigureProjectLLMUseCase requires uow or project_repository"
             )
+        await self.access.require_manager(
+            self.project_repository,
+            input.project_id,
+            input.requester_id,
+            "configure LLM",
+        )
         project = await self.project_repository.find_by_id(input.project_id)
         if project is None:
             raise ProjectNotFoundError(str(input.project_id))
-        if not project.is_manager(input.requester_id):
-            raise ManagerRequiredError("configure LLM")
         encrypted_key = await self.encryption_service.encrypt(input.api_key)
         project.configure_llm(input.provider, encrypted_key)
         await self.project_repository.save(project)
+        self._invalidate_client(input.project_id)
+
+    def _invalidate_client(self, project_id: UUID) -> None:
+        """Drop the client built from the previous key, if any."""
+        if self.llm_resolver is not None:
+            self.llm_resolver.invalidate(project_id)
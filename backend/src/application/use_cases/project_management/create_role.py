@@ -2,9 +2,9 @@ from dataclasses import dataclass
 from uuid import UUID
 
 from backend.src.domain.entities import Role
-from backend.src.domain.errors import ManagerRequiredError, ProjectNotFoundError
 from backend.src.domain.ports.repositories import ProjectRepository, RoleRepository
 from backend.src.domain.ports.unit_of_work import UnitOfWork
+from backend.src.domain.services.project_access_resolver import ProjectAccessResolver
 
 
 @dataclass
@@ -24,10 +24,12 @@ class CreateRoleUseCase:
         uow: UnitOfWork | None = None,
         project_repository: ProjectRepository | None = None,
         role_repository: RoleRepository | None = None,
+        access_resolver: ProjectAccessResolver | None = None,
     ):
         self.uow = uow
         self.project_repository = project_repository
         self.role_repository = role_repository
+        self.access = access_resolver or ProjectAccessResolver()
 
     async def execute(self, input: CreateRoleInput) -> Role:
         """
@@ -41,26 +43,24 @@ class CreateRoleUseCase:
         """
         if self.uow is not None:
             async with self.uow:
-                project = await self.uow.project_repository.find_by_id(input.project_id)
-                if not project:
-                    raise ProjectNotFoundError(str(input.project_id))
+                await self.access.require_manager(
+                    self.uow.project_repository,
+                    input.project_id,
+                    input.requester_id,
+                    "create role",
+                )
 
-                if not project.is_manager(input.requester_id):
-                    raise ManagerRequiredError("create role")
-
-                role = Role(project_id=project.id, name=input.role_name)
+                role = Role(project_id=input.project_id, name=input.role_name)
                 await self.uow.role_repository.save(role)
                 await self.uow.commit()
             return role
 
         if self.project_repository is None or self.role_repository is None:
             raise RuntimeError("CreateRoleUseCase requires uow or repositories")
-        project = await self.project_repository.find_by_id(input.project_id)
-        if not project:
-            raise ProjectNotFoundError(str(input.project_id))
-        if not project.is_manager(input.requester_id):
-            raise ManagerRequiredError("create role")
-        role = Role(project_id=project.id, name=input.role_name)
+        await self.access.require_manager(
+            self.project_repository, input.project_id, input.requester_id, "create role"
+        )
+        role = Role(project_id=input.project_id, name=input.role_name)
         await self.role_repository.save(role)
 
         return role
@@ -0,0 +1,74 @@
+from collections.abc import AsyncIterator
+from dataclasses import dataclass
+from enum import Enum
+from uuid import UUID
+
+from backend.src.domain.entities import Task, TaskDependency, TaskLog
+from backend.src.domain.ports.unit_of_work import UnitOfWork
+from backend.src.domain.services.project_access_resolver import ProjectAccessResolver
+
+
+class ExportResource(str, Enum):
+    """Project-scoped record sets that can be exported."""
+
+    TASKS = "tasks"
+    DEPENDENCIES = "dependencies"
+    LOGS = "logs"
+
+
+@dataclass
+class ExportProjectDataInput:
+    """Input for exporting project records."""
+
+    project_id: UUID
+    requester_id: UUID
+    resource: ExportResource
+
+
+class ExportProjectDataUseCase:
+    """
+    Use case for streaming every task, dependency or log of a project.
+
+    Records are read through a server-side cursor and yielded one by one, so
+    memory stays constant regardless of project size. The unit of work stays
+    open until the caller exhausts (or closes) the iterator.
+    """
+
+    def __init__(
+        self,
+        uow: UnitOfWork,
+        access_resolver: ProjectAccessResolver | None = None,
+    ) -> None:
+        self.uow = uow
+        self.access = access_resolver or ProjectAccessResolver()
+
+    async def execute(
+        self, input: ExportProjectDataInput
+    ) -> AsyncIterator[Task | TaskDependency | TaskLog]:
+        """
+        Stream the requested records.
+
+        BR-PROJ-002: Only project members can read project data. Access is
+        checked before the first record is yielded, so callers can prime the
+        iterator to surface authorization errors before streaming a response.
+
+        Raises:
+            ProjectNotFoundError: If project doesn't exist.
+            ProjectAccessDeniedError: If requester is not a project member.
+        """
+        async with self.uow:
+            await self.access.require_access(
+                self.uow.project_repository, input.project_id, input.requester_id
+            )
+
+            if input.resource is ExportResource.TASKS:
+                records = self.uow.task_repository.stream_by_project(input.project_id)
+            elif input.resource is ExportResource.DEPENDENCIES:
+                records = self.uow.task_dependency_repository.stream_by_project(
+                    input.project_id
+                )
+            else:
+                records = self.uow.task_log_repository.stream_by_project(input.project_id)
+
+            async for record in records:
+                yield record
@@ -4,12 +4,9 @@ from dataclasses import dataclass
 from uuid import UUID
 
 from backend.src.domain.entities import Task, TaskStatus
-from backend.src.domain.errors import (
-    DomainError,
-    ManagerRequiredError,
-    ProjectNotFoundError,
-)
+from backend.src.domain.errors import DomainError
 from backend.src.domain.ports.unit_of_work import UnitOfWork
+from backend.src.domain.services.project_access_resolver import ProjectAccessResolver
 
 
 @dataclass
@@ -43,8 +40,13 @@ class FireEmployeeUseCase:
     - Outcome: Employee removed from Project. All their active tasks return to Todo.
     """
 
-    def __init__(self, uow: UnitOfWork):
+    def __init__(
+        self,
+        uow: UnitOfWork,
+        access_resolver: ProjectAccessResolver | None = None,
+    ):
         self.uow = uow
+        self.access = access_resolver or ProjectAccessResolver()
 
     async def execute(self, input: FireEmployeeInput) -> list[Task]:
         """
@@ -58,14 +60,13 @@ class FireEmployeeUseCase:
             MemberNotFoundError: If employee is not a member of the project.
         """
         async with self.uow:
-            # Verify project exists
-            project = await self.uow.project_repository.find_by_id(input.project_id)
-            if project is None:
-                raise ProjectNotFoundError(str(input.project_id))
-
-            # Verify requester is the manager
-            if not project.is_manager(input.manager_user_id):
-                raise ManagerRequiredError("fire employee")
+            # Verify project exists and the requester is its manager
+            await self.access.require_manager(
+                self.uow.project_repository,
+                input.project_id,
+                input.manager_user_id,
+                "fire employee",
+            )
 
             # Find the employee's membership
             member = await self.uow.project_member_repository.find_by_project_and_user(
@@ -77,7 +78,7 @@ class FireEmployeeUseCase:
                 )
 
             # Cannot fire the manager
-            if project.is_manager(input.employee_user_id):
+            if input.employee_user_id == input.manager_user_id:
                 raise ValueError("Cannot fire the project manager")
 
             # Find all tasks assigned to this member and unassign them
@@ -98,4 +99,5 @@ class FireEmployeeUseCase:
 
             await self.uow.commit()
 
+        await self.access.invalidate(input.project_id, input.employee_user_id)
         return affected_tasks
@@ -2,9 +2,10 @@ from dataclasses import dataclass
 from uuid import UUID
 
 from backend.src.domain.entities import Project
-from backend.src.domain.errors import ProjectAccessDeniedError, ProjectNotFoundError
+from backend.src.domain.errors import ProjectNotFoundError
 from backend.src.domain.ports import ProjectMemberRepository, ProjectRepository
 from backend.src.domain.ports.unit_of_work import UnitOfWork
+from backend.src.domain.services.project_access_resolver import ProjectAccessResolver
 
 
 @dataclass
@@ -31,10 +32,12 @@ class GetProjectDetailsUseCase:
         uow: UnitOfWork | None = None,
         project_repository: ProjectRepository | None = None,
         project_member_repository: ProjectMemberRepository | None = None,
+        access_resolver: ProjectAccessResolver | None = None,
     ):
         self.uow = uow
         self.project_repository = project_repository
         self.project_member_repository = project_member_repository
+        self.access = access_resolver or ProjectAccessResolver()
 
     async def execute(self, input: GetProjectDetailsInput) -> GetProjectDetailsOutput:
         """
@@ -48,34 +51,19 @@ class GetProjectDetailsUseCase:
         """
         if self.uow is not None:
             async with self.uow:
-                project = await self.uow.project_repository.find_by_id(input.project_id)
-                if project is None:
-                    raise ProjectNotFoundError(str(input.project_id))
+                return await self._details(self.uow.project_repository, input)
 
-                member = await self.uow.project_member_repository.find_by_project_and_user(
-                    input.project_id, input.requester_id
-                )
-                if member is None and not project.is_manager(input.requester_id):
-                    raise ProjectAccessDeniedError(
-                        str(input.requester_id), str(input.project_id)
-                    )
-            return GetProjectDetailsOutput(
-                project=project,
-                is_manager=project.is_manager(input.requester_id),
-            )
-
-        if self.project_repository is None or self.project_member_repository is None:
+        if self.project_repository is None:
             raise RuntimeError("GetProjectDetailsUseCase requires uow or repositories")
-        project = await self.project_repository.find_by_id(input.project_id)
-        if project is None:
-            raise ProjectNotFoundError(str(input.project_id))
-        member = await self.project_member_repository.find_by_project_and_user(
-            input.project_id, input.requester_id
-        )
-        if member is None and not project.is_manager(input.requester_id):
-            raise ProjectAccessDeniedError(str(input.requester_id), str(input.project_id))
+        return await self._details(self.project_repository, input)
 
-        return GetProjectDetailsOutput(
-            project=project,
-            is_manager=project.is_manager(input.requester_id),
+    async def _details(
+        self, projects: ProjectRepository, input: GetProjectDetailsInput
+    ) -> GetProjectDetailsOutput:
+        access = await self.access.require_access(
+            projects, input.project_id, input.requester_id
         )
+        project = await projects.find_by_id(input.project_id)
+        if project is None:
+            raise ProjectNotFoundError(str(input.project_id))
+        return GetProjectDetailsOutput(project=project, is_manager=access.is_manager)
@@ -0,0 +1,177 @@
+"""Project snapshot use case for rendering a whole board at once."""
+
+from dataclasses import dataclass, field
+from datetime import datetime
+from enum import Enum
+from uuid import UUID
+
+from backend.src.application.use_cases.project_management.list_project_members import (
+    EnrichedMember,
+)
+from backend.src.domain.entities import (
+    Project,
+    SeniorityLevel,
+    Task,
+    TaskDependency,
+    WorkingCalendar,
+)
+from backend.src.domain.errors import ProjectAccessDeniedError, ProjectNotFoundError
+from backend.src.domain.ports.unit_of_work import UnitOfWork
+from backend.src.domain.services.schedule_calculator import ScheduleCalculator
+
+
+class SnapshotSection(str, Enum):
+    """Sections that can be requested from a project snapshot."""
+
+    PROJECT = "project"
+    CALENDAR = "calendar"
+    MEMBERS = "members"
+    TASKS = "tasks"
+    DEPENDENCIES = "dependencies"
+    CRITICAL_PATH = "critical_path"
+
+
+@dataclass
+class GetProjectSnapshotInput:
+    """Input for loading a project snapshot."""
+
+    project_id: UUID
+    requester_id: UUID
+    sections: frozenset[SnapshotSection] = frozenset(SnapshotSection)
+
+
+@dataclass
+class GetProjectSnapshotOutput:
+    """
+    Everything needed to render a project board.
+
+    Sections that were not requested are left empty.
+    """
+
+    project: Project
+    is_manager: bool
+    calendar: WorkingCalendar
+    members: list[EnrichedMember] = field(default_factory=list)
+    tasks: list[Task] = field(default_factory=list)
+    dependencies: list[TaskDependency] = field(default_factory=list)
+    critical_path: list[UUID] = field(default_factory=list)
+    project_end_date: datetime | None = None
+
+
+class GetProjectSnapshotUseCase:
+    """
+    Use case for loading a project, its members, tasks and dependencies together.
+
+    The snapshot is read with a fixed number of queries regardless of project
+    size: project (with calendar), members, users, roles, tasks and
+    dependencies. The critical path is computed in memory and not persisted.
+    """
+
+    def __init__(self, uow: UnitOfWork, schedule_calculator: ScheduleCalculator):
+        self.uow = uow
+        self.schedule_calculator = schedule_calculator
+
+    async def execute(self, input: GetProjectSnapshotInput) -> GetProjectSnapshotOutput:
+        """
+        Load the requested snapshot sections.
+
+        BR-PROJ-002: Only project members can view project details.
+
+        Raises:
+            ProjectNotFoundError: If project doesn't exist.
+            ProjectAccessDeniedError: If requester is not a project member.
+        """
+        sections = input.sections
+        need_critical_path = SnapshotSection.CRITICAL_PATH in sections
+        need_tasks = need_critical_path or SnapshotSection.TASKS in sections
+        need_deps = need_critical_path or SnapshotSection.DEPENDENCIES in sections
+
+        async with self.uow:
+            project = await self.uow.project_repository.find_by_id(input.project_id)
+            if project is None:
+                raise ProjectNotFoundError(str(input.project_id))
+
+            # One query serves the access check, the members section and the
+            # seniority lookup for the critical path.
+            members = await self.uow.project_member_repository.find_by_project(
+                input.project_id
+            )
+            is_manager = project.is_manager(input.requester_id)
+            if not is_manager and not any(
+                m.user_id == input.requester_id for m in members
+            ):
+                raise ProjectAccessDeniedError(
+                    str(input.requester_id), str(input.project_id)
+                )
+
+            users = {}
+            roles = {}
+            if SnapshotSection.MEMBERS in sections and members:
+                users = {
+                    u.id: u
+                    for u in await self.uow.user_repository.find_by_ids(
+                        {m.user_id for m in members}
+                    )
+                }
+                roles = {
+                    r.id: r
+                    for r in await self.uow.role_repository.find_by_ids(
+                        {m.role_id for m in members}
+                    )
+                }
+
+            tasks = (
+                await self.uow.task_repository.find_by_project(project.id)
+                if need_tasks
+                else []
+            )
+            dependencies = (
+                await self.uow.task_dependency_repository.find_by_project(project.id)
+                if need_deps
+                else []
+            )
+
+        output = GetProjectSnapshotOutput(
+            project=project,
+            is_manager=is_manager,
+            calendar=project.calendar,
+        )
+
+        if SnapshotSection.MEMBERS in sections:
+            for m in members:
+                user = users.get(m.user_id)
+                role = roles.get(m.role_id)
+                output.members.append(
+                    EnrichedMember(
+                        id=m.id,
+                        project_id=m.project_id,
+                        user_id=m.user_id,
+                        role_id=m.role_id,
+                        seniority_level=m.seniority_level.value,
+                        joined_at=m.joined_at.isoformat(),
+                        user_name=user.name if user else "Unknown",
+                        user_email=user.email if user else "",
+                        role_name=role.name if role else "Unknown",
+                    )
+                )
+
+        if SnapshotSection.TASKS in sections:
+            output.tasks = tasks
+        if SnapshotSection.DEPENDENCIES in sections:
+            output.dependencies = dependencies
+
+        if need_critical_path:
+            member_seniority = {m.id: m.seniority_level for m in members}
+            schedule = self.schedule_calculator.calculate_schedule(
+                tasks=tasks,
+                dependencies=dependencies,
+                assignee_seniority={
+                    t.id: member_seniority.get(t.assignee_id, SeniorityLevel.MID)
+                    for t in tasks
+                },
+                working_calendar=project.calendar,
+            )
+            output.critical_path = schedule.critical_path
+            output.project_end_date = schedule.project_end_date
+
+        return output
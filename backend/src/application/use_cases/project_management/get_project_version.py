@@ -0,0 +1,43 @@
+"""Project version lookup use case for conditional GETs."""
+
+from dataclasses import dataclass
+from uuid import UUID
+
+from backend.src.domain.ports.unit_of_work import UnitOfWork
+
+
+@dataclass
+class GetProjectVersionInput:
+    """Input for looking up a project's version."""
+
+    project_id: UUID
+    requester_id: UUID
+
+
+class GetProjectVersionUseCase:
+    """
+    Use case for reading a project's version with a single indexed lookup.
+
+    The version changes with every committed unit of work that touches the
+    project's rows, so it can be used as an ETag for project-scoped reads.
+    """
+
+    def __init__(self, uow: UnitOfWork):
+        self.uow = uow
+
+    async def execute(self, input: GetProjectVersionInput) -> int | None:
+        """
+        Return the project version, or None if the project does not exist or
+        the requester is neither its manager nor a member.
+
+        None never raises so that callers fall through to the regular handler,
+        which reports the appropriate error.
+        """
+        async with self.uow:
+            version = await self.uow.project_repository.find_version(
+                input.project_id, input.requester_id
+            )
+            # End the read-only transaction so the request's main use case can
+            # open its own unit of work on the same session.
+            await self.uow.rollback()
+        return version
@@ -1,8 +1,8 @@
 from dataclasses import dataclass
 from uuid import UUID
 
-from backend.src.domain.errors import ProjectAccessDeniedError, ProjectNotFoundError
 from backend.src.domain.ports.unit_of_work import UnitOfWork
+from backend.src.domain.services.project_access_resolver import ProjectAccessResolver
 
 
 @dataclass
@@ -41,24 +41,20 @@ class ListProjectMembersOutput:
 class ListProjectMembersUseCase:
     """Use case for listing project members with enriched user/role info."""
 
-    def __init__(self, uow: UnitOfWork) -> None:
+    def __init__(
+        self,
+        uow: UnitOfWork,
+        access_resolver: ProjectAccessResolver | None = None,
+    ) -> None:
         self.uow = uow
+        self.access = access_resolver or ProjectAccessResolver()
 
     async def execute(self, input: ListProjectMembersInput) -> ListProjectMembersOutput:
         async with self.uow:
-            project = await self.uow.project_repository.find_by_id(input.project_id)
-            if project is None:
-                raise ProjectNotFoundError(str(input.project_id))
-
             # Auth check: requester must be manager or member
-            if not project.is_manager(input.requester_id):
-                member = await self.uow.project_member_repository.find_by_project_and_user(
-                    input.project_id, input.requester_id
-                )
-                if member is None:
-                    raise ProjectAccessDeniedError(
-                        str(input.requester_id), str(input.project_id)
-                    )
+            await self.access.require_access(
+                self.uow.project_repository, input.project_id, input.requester_id
+            )
 
             members = await self.uow.project_member_repository.list_by_project(
                 input.project_id, limit=input.limit, offset=input.offset
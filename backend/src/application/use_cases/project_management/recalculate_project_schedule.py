@@ -44,52 +44,60 @@ class RecalculateProjectScheduleUseCase:
         Uses member seniority for assigned tasks; default_seniority for unassigned.
         """
         async with self.uow:
-            tasks = await self.uow.task_repository.find_by_project(input.project_id)
-            deps = await self.uow.task_dependency_repository.find_by_project(
-                input.project_id
-            )
-            members = await self.uow.project_member_repository.find_by_project(
-                input.project_id
-            )
-            project = await self.uow.project_repository.find_by_id(input.project_id)
-            working_calendar = project.calendar if project else None
-
-            # Build member lookup: member_id -> seniority (for assignee duration)
-            member_seniority = {m.id: m.seniority_level for m in members}
-
-            # Per-task assignee seniority (task_id -> SeniorityLevel)
-            assignee_seniority = {
-                t.id: member_seniority.get(t.assignee_id, input.default_seniority)
-                for t in tasks
-            }
-
-            schedule = self.schedule_calculator.calculate_schedule(
-                tasks=tasks,
-                dependencies=deps,
-                assignee_seniority=assignee_seniority,
-                working_calendar=working_calendar,
-            )
-
-            # Update tasks with calculated dates
-            # BR-SCHED-005: For in-progress tasks, only update end date (not start date)
-            tasks_to_save: list[Task] = []
-            for task in tasks:
-                if task.id in schedule.task_schedules:
-                    sched = schedule.task_schedules[task.id]
-                    if task.status == TaskStatus.DOING:
-                        # Only update end date for in-progress tasks
-                        task.update_schedule(
-                            expected_start_date=None,
-                            expected_end_date=sched.expected_end_date,
-                        )
-                    else:
-                        task.update_schedule(
-                            sched.expected_start_date, sched.expected_end_date
-                        )
-                    tasks_to_save.append(task)
-
-            if tasks_to_save:
-                await self.uow.task_repository.save_many(tasks_to_save)
+            schedule = await self.recalculate_in_transaction(input)
+            if schedule.task_schedules:
                 await self.uow.commit()
 
         return schedule
+
+    async def recalculate_in_transaction(
+        self, input: RecalculateProjectScheduleInput
+    ) -> ProjectSchedule:
+        """
+        Recalculate and save task dates inside an already-open unit of work.
+
+        The caller owns the transaction and is responsible for committing, so
+        several changes and a single recalculation can be applied atomically.
+        """
+        tasks = await self.uow.task_repository.find_by_project(input.project_id)
+        deps = await self.uow.task_dependency_repository.find_by_project(input.project_id)
+        members = await self.uow.project_member_repository.find_by_project(input.project_id)
+        project = await self.uow.project_repository.find_by_id(input.project_id)
+        working_calendar = project.calendar if project else None
+
+        # Build member lookup: member_id -> seniority (for assignee duration)
+        member_seniority = {m.id: m.seniority_level for m in members}
+
+        # Per-task assignee seniority (task_id -> SeniorityLevel)
+        assignee_seniority = {
+            t.id: member_seniority.get(t.assignee_id, input.default_seniority)
+            for t in tasks
+        }
+
+        schedule = self.schedule_calculator.calculate_schedule(
+            tasks=tasks,
+            dependencies=deps,
+            assignee_seniority=assignee_seniority,
+            working_calendar=working_calendar,
+        )
+
+        # Update tasks with calculated dates
+        # BR-SCHED-005: For in-progress tasks, only update end date (not start date)
+        tasks_to_save: list[Task] = []
+        for task in tasks:
+            if task.id in schedule.task_schedules:
+                sched = schedule.task_schedules[task.id]
+                if task.status == TaskStatus.DOING:
+                    # Only update end date for in-progress tasks
+                    task.update_schedule(
+                        expected_start_date=None,
+                        expected_end_date=sched.expected_end_date,
+                    )
+                else:
+                    task.update_schedule(sched.expected_start_date, sched.expected_end_date)
+                tasks_to_save.append(task)
+
+        if tasks_to_save:
+            await self.uow.task_repository.save_many(tasks_to_save)
+
+        return schedule
@@ -9,6 +9,7 @@ from backend.src.domain.errors import (
     ProjectNotFoundError,
 )
 from backend.src.domain.ports.unit_of_work import UnitOfWork
+from backend.src.domain.services.project_access_resolver import ProjectAccessResolver
 
 
 @dataclass
@@ -52,8 +53,13 @@ class ResignFromProjectUseCase:
     - Outcome: Employee removed. Active tasks return to Todo.
     """
 
-    def __init__(self, uow: UnitOfWork):
+    def __init__(
+        self,
+        uow: UnitOfWork,
+        access_resolver: ProjectAccessResolver | None = None,
+    ):
         self.uow = uow
+        self.access = access_resolver or ProjectAccessResolver()
 
     async def execute(self, input: ResignFromProjectInput) -> list[Task]:
         """
@@ -101,4 +107,5 @@ class ResignFromProjectUseCase:
 
             await self.uow.commit()
 
+        await self.access.invalidate(input.project_id, input.user_id)
         return affected_tasks
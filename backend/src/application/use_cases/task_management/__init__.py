@@ -28,6 +28,27 @@ from backend.src.application.use_cases.task_management.delete_task import (
     DeleteTaskInput,
     DeleteTaskUseCase,
 )
+from backend.src.application.use_cases.task_management.estimate_task_difficulties import (
+    EstimateTaskDifficultiesInput,
+    EstimateTaskDifficultiesOutput,
+    EstimateTaskDifficultiesUseCase,
+)
+from backend.src.application.use_cases.task_management.estimate_task_progress import (
+    EstimateTaskProgressInput,
+    EstimateTaskProgressOutput,
+    EstimateTaskProgressUseCase,
+)
+from backend.src.application.use_cases.task_management.index_completed_tasks import (
+    IndexCompletedTasksInput,
+    IndexCompletedTasksUseCase,
+)
+from backend.src.application.use_cases.task_management.import_tasks import (
+    ImportDependencyItem,
+    ImportTaskItem,
+    ImportTasksInput,
+    ImportTasksOutput,
+    ImportTasksUseCase,
+)
 from backend.src.application.use_cases.task_management.remove_from_task import (
     RemoveFromTaskInput,
     RemoveFromTaskUseCase,
@@ -36,6 +57,16 @@ from backend.src.application.use_cases.task_management.remove_dependency import
     RemoveDependencyInput,
     RemoveDependencyUseCase,
 )
+from backend.src.application.use_cases.task_management.run_task_batch import (
+    BatchCommand,
+    BatchCommandError,
+    BatchCommandResult,
+    BatchMode,
+    BatchOperation,
+    RunTaskBatchInput,
+    RunTaskBatchOutput,
+    RunTaskBatchUseCase,
+)
 from backend.src.application.use_cases.task_management.select_task import (
     SelectTaskInput,
     SelectTaskUseCase,
@@ -48,6 +79,11 @@ __all__ = [
     "AddTaskReportUseCase",
     "AddDependencyInput",
     "AddDependencyUseCase",
+    "BatchCommand",
+    "BatchCommandError",
+    "BatchCommandResult",
+    "BatchMode",
+    "BatchOperation",
     "CompleteTaskInput",
     "CompleteTaskUseCase",
     "CancelTaskInput",
@@ -56,10 +92,26 @@ __all__ = [
     "CreateTaskUseCase",
     "DeleteTaskInput",
     "DeleteTaskUseCase",
+    "EstimateTaskDifficultiesInput",
+    "EstimateTaskDifficultiesOutput",
+    "EstimateTaskDifficultiesUseCase",
+    "EstimateTaskProgressInput",
+    "EstimateTaskProgressOutput",
+    "EstimateTaskProgressUseCase",
+    "ImportDependencyItem",
+    "IndexCompletedTasksInput",
+    "IndexCompletedTasksUseCase",
+    "ImportTaskItem",
+    "ImportTasksInput",
+    "ImportTasksOutput",
+    "ImportTasksUseCase",
     "RemoveFromTaskInput",
     "RemoveFromTaskUseCase",
     "RemoveDependencyInput",
     "RemoveDependencyUseCase",
+    "RunTaskBatchInput",
+    "RunTaskBatchOutput",
+    "RunTaskBatchUseCase",
     "SelectTaskInput",
     "SelectTaskUseCase",
 ]
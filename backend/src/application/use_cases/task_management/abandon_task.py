@@ -8,7 +8,9 @@ from backend.src.domain.errors import (
     TaskNotFoundError,
     TaskNotOwnedError,
 )
+from backend.src.domain.ports.services import EventPublisher
 from backend.src.domain.ports.unit_of_work import UnitOfWork
+from backend.src.domain.services.project_access_resolver import ProjectAccessResolver
 
 
 @dataclass
@@ -23,8 +25,15 @@ class AbandonTaskInput:
 class AbandonTaskUseCase:
     """Use case for abandoning a task."""
 
-    def __init__(self, uow: UnitOfWork):
+    def __init__(
+        self,
+        uow: UnitOfWork,
+        access_resolver: ProjectAccessResolver | None = None,
+        event_publisher: EventPublisher | None = None,
+    ):
         self.uow = uow
+        self.access = access_resolver or ProjectAccessResolver()
+        self.event_publisher = event_publisher
 
     async def execute(self, input: AbandonTaskInput) -> Task:
         """
@@ -54,10 +63,10 @@ class AbandonTaskUseCase:
             if task.assignee_id is None:
                 raise TaskNotOwnedError(str(input.task_id), str(input.user_id))
 
-            member = await self.uow.project_member_repository.find_by_project_and_user(
-                task.project_id, input.user_id
+            access = await self.access.resolve(
+                self.uow.project_repository, task.project_id, input.user_id
             )
-            if member is None or member.id != task.assignee_id:
+            if access.member_id != task.assignee_id:
                 raise TaskNotOwnedError(str(input.task_id), str(input.user_id))
 
             # Abandon the task
@@ -67,11 +76,13 @@ class AbandonTaskUseCase:
             # Create audit log (BR-ABANDON-002, BR-ASSIGN-005)
             log = TaskLog.create_abandon_log(
                 task_id=task.id,
-                author_id=member.id,
+                author_id=access.member_id,
                 reason=input.reason,
             )
             await self.uow.task_log_repository.save(log)
 
             await self.uow.commit()
 
+        if self.event_publisher is not None:
+            await self.event_publisher.publish(task.pull_events())
         return task
@@ -8,13 +8,9 @@ from backend.src.application.use_cases.project_management.recalculate_project_sc
     RecalculateProjectScheduleUseCase,
 )
 from backend.src.domain.entities import TaskDependency, TaskStatus, detect_circular_dependency
-from backend.src.domain.errors import (
-    CircularDependencyError,
-    ManagerRequiredError,
-    ProjectNotFoundError,
-    TaskNotFoundError,
-)
+from backend.src.domain.errors import CircularDependencyError, TaskNotFoundError
 from backend.src.domain.ports.unit_of_work import UnitOfWork
+from backend.src.domain.services.project_access_resolver import ProjectAccessResolver
 
 
 @dataclass
@@ -34,9 +30,11 @@ class AddDependencyUseCase:
         self,
         uow: UnitOfWork,
         recalculate_schedule_use_case: RecalculateProjectScheduleUseCase,
+        access_resolver: ProjectAccessResolver | None = None,
     ):
         self.uow = uow
         self.recalculate_schedule_use_case = recalculate_schedule_use_case
+        self.access = access_resolver or ProjectAccessResolver()
 
     async def execute(self, input: AddDependencyInput) -> TaskDependency:
         dependency = TaskDependency(
@@ -45,12 +43,12 @@ class AddDependencyUseCase:
         )
 
         async with self.uow:
-            project = await self.uow.project_repository.find_by_id(input.project_id)
-            if project is None:
-                raise ProjectNotFoundError(str(input.project_id))
-
-            if not project.is_manager(input.manager_user_id):
-                raise ManagerRequiredError("add dependency")
+            await self.access.require_manager(
+                self.uow.project_repository,
+                input.project_id,
+                input.manager_user_id,
+                "add dependency",
+            )
 
             blocking_task = await self.uow.task_repository.find_by_id(
                 input.blocking_task_id
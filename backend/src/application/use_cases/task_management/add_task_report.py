@@ -14,6 +14,7 @@ from backend.src.domain.ports.repositories import (
     TaskRepository,
 )
 from backend.src.domain.ports.unit_of_work import UnitOfWork
+from backend.src.domain.services.project_access_resolver import ProjectAccessResolver
 
 
 @dataclass
@@ -44,11 +45,13 @@ class AddTaskReportUseCase:
         project_member_repository: ProjectMemberRepository | None = None,
         task_repository: TaskRepository | None = None,
         task_log_repository: TaskLogRepository | None = None,
+        access_resolver: ProjectAccessResolver | None = None,
     ):
         self.uow = uow
         self.project_member_repository = project_member_repository
         self.task_repository = task_repository
         self.task_log_repository = task_log_repository
+        self.access = access_resolver or ProjectAccessResolver()
 
     async def execute(self, input: AddTaskReportInput) -> TaskLog:
         """
@@ -88,16 +91,16 @@ class AddTaskReportUseCase:
                     raise TaskNotOwnedError(str(input.task_id), str(input.user_id))
 
                 # Find the member and verify ownership
-                member = await self.uow.project_member_repository.find_by_project_and_user(
-                    task.project_id, input.user_id
+                access = await self.access.resolve(
+                    self.uow.project_repository, task.project_id, input.user_id
                 )
-                if member is None or member.id != task.assignee_id:
+                if access.member_id != task.assignee_id:
                     raise TaskNotOwnedError(str(input.task_id), str(input.user_id))
 
                 # Create the report log entry
                 log = TaskLog.create_report_log(
                     task_id=task.id,
-                    author_id=member.id,
+                    author_id=access.member_id,
                     report_text=input.report_text.strip(),
                 )
                 await self.uow.task_log_repository.save(log)
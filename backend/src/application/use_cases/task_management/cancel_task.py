@@ -8,12 +8,9 @@ from backend.src.application.use_cases.project_management.recalculate_project_sc
     RecalculateProjectScheduleUseCase,
 )
 from backend.src.domain.entities import Task
-from backend.src.domain.errors import (
-    ManagerRequiredError,
-    ProjectNotFoundError,
-    TaskNotFoundError,
-)
+from backend.src.domain.errors import TaskNotFoundError
 from backend.src.domain.ports.unit_of_work import UnitOfWork
+from backend.src.domain.services.project_access_resolver import ProjectAccessResolver
 
 
 @dataclass
@@ -32,18 +29,20 @@ class CancelTaskUseCase:
         self,
         uow: UnitOfWork,
         recalculate_schedule_use_case: RecalculateProjectScheduleUseCase,
+        access_resolver: ProjectAccessResolver | None = None,
     ):
         self.uow = uow
         self.recalculate_schedule_use_case = recalculate_schedule_use_case
+        self.access = access_resolver or ProjectAccessResolver()
 
     async def execute(self, input: CancelTaskInput) -> Task:
         async with self.uow:
-            project = await self.uow.project_repository.find_by_id(input.project_id)
-            if project is None:
-                raise ProjectNotFoundError(str(input.project_id))
-
-            if not project.is_manager(input.manager_user_id):
-                raise ManagerRequiredError("cancel task")
+            await self.access.require_manager(
+                self.uow.project_repository,
+                input.project_id,
+                input.manager_user_id,
+                "cancel task",
+            )
 
             task = await self.uow.task_repository.find_by_id(input.task_id)
             if task is None or task.project_id != input.project_id:
@@ -8,7 +8,9 @@ from backend.src.domain.errors import (
     TaskNotFoundError,
     TaskNotOwnedError,
 )
+from backend.src.domain.ports.services import EventPublisher
 from backend.src.domain.ports.unit_of_work import UnitOfWork
+from backend.src.domain.services.project_access_resolver import ProjectAccessResolver
 
 
 @dataclass
@@ -22,8 +24,15 @@ class CompleteTaskInput:
 class CompleteTaskUseCase:
     """Use case for completing a task."""
 
-    def __init__(self, uow: UnitOfWork):
+    def __init__(
+        self,
+        uow: UnitOfWork,
+        access_resolver: ProjectAccessResolver | None = None,
+        event_publisher: EventPublisher | None = None,
+    ):
         self.uow = uow
+        self.access = access_resolver or ProjectAccessResolver()
+        self.event_publisher = event_publisher
 
     async def execute(self, input: CompleteTaskInput) -> Task:
         """
@@ -47,10 +56,10 @@ class CompleteTaskUseCase:
             if task.assignee_id is None:
                 raise TaskNotOwnedError(str(input.task_id), str(input.user_id))
 
-            member = await self.uow.project_member_repository.find_by_project_and_user(
-                task.project_id, input.user_id
+            access = await self.access.resolve(
+                self.uow.project_repository, task.project_id, input.user_id
             )
-            if member is None or member.id != task.assignee_id:
+            if access.member_id != task.assignee_id:
                 raise TaskNotOwnedError(str(input.task_id), str(input.user_id))
 
             old_status = task.status.value
@@ -60,7 +69,7 @@ class CompleteTaskUseCase:
             # Create audit log (BR-ASSIGN-005)
             log = TaskLog.create_status_change_log(
                 task_id=task.id,
-                author_id=member.id,
+                author_id=access.member_id,
                 old_status=old_status,
                 new_status=task.status.value,
             )
@@ -68,4 +77,6 @@ class CompleteTaskUseCase:
 
             await self.uow.commit()
 
+        if self.event_publisher is not None:
+            await self.event_publisher.publish(task.pull_events())
         return task
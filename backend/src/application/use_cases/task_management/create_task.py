@@ -1,12 +1,16 @@
 """Create task use case."""
 
+import logging
 from dataclasses import dataclass
 from uuid import UUID
 
 from backend.src.domain.entities import Task
-from backend.src.domain.errors import ManagerRequiredError, ProjectNotFoundError
 from backend.src.domain.ports.repositories import ProjectRepository, TaskRepository
+from backend.src.domain.ports.services import NewTaskToastData, NotificationService
 from backend.src.domain.ports.unit_of_work import UnitOfWork
+from backend.src.domain.services.project_access_resolver import ProjectAccessResolver
+
+logger = logging.getLogger(__name__)
 
 
 @dataclass
@@ -29,16 +33,22 @@ class CreateTaskUseCase:
         uow: UnitOfWork | None = None,
         project_repository: ProjectRepository | None = None,
         task_repository: TaskRepository | None = None,
+        access_resolver: ProjectAccessResolver | None = None,
+        notification_service: NotificationService | None = None,
     ):
         self.uow = uow
         self.project_repository = project_repository
         self.task_repository = task_repository
+        self.access = access_resolver or ProjectAccessResolver()
+        self.notification_service = notification_service
 
     async def execute(self, input: CreateTaskInput) -> Task:
         """
         Create a new task in a project.
 
         BR-TASK-001: Only the Manager can create, edit, or delete Tasks.
+        BR-NOTIF-003: Once the task is committed, Employees whose Role
+        matches its required Role (all Employees if it has none) get a toast.
 
         Raises:
             ProjectNotFoundError: If project doesn't exist.
@@ -46,15 +56,15 @@ class CreateTaskUseCase:
         """
         if self.uow is not None:
             async with self.uow:
-                project = await self.uow.project_repository.find_by_id(input.project_id)
-                if project is None:
-                    raise ProjectNotFoundError(str(input.project_id))
-
-                if not project.is_manager(input.requester_id):
-                    raise ManagerRequiredError("create task")
+                await self.access.require_manager(
+                    self.uow.project_repository,
+                    input.project_id,
+                    input.requester_id,
+                    "create task",
+                )
 
                 task = Task(
-                    project_id=project.id,
+                    project_id=input.project_id,
                     title=input.title,
                     description=input.description,
                     difficulty_points=input.difficulty_points,
@@ -62,18 +72,19 @@ class CreateTaskUseCase:
                 )
 
                 await self.uow.task_repository.save(task)
+                toast = await self._new_task_toast(task)
                 await self.uow.commit()
+            if toast is not None:
+                await self._send_toast(*toast)
             return task
 
         if self.project_repository is None or self.task_repository is None:
             raise RuntimeError("CreateTaskUseCase requires uow or repositories")
-        project = await self.project_repository.find_by_id(input.project_id)
-        if project is None:
-            raise ProjectNotFoundError(str(input.project_id))
-        if not project.is_manager(input.requester_id):
-            raise ManagerRequiredError("create task")
+        await self.access.require_manager(
+            self.project_repository, input.project_id, input.requester_id, "create task"
+        )
         task = Task(
-            project_id=project.id,
+            project_id=input.project_id,
             title=input.title,
             description=input.description,
             difficulty_points=input.difficulty_points,
@@ -82,3 +93,36 @@ class CreateTaskUseCase:
         await self.task_repository.save(task)
 
         return task
+
+    async def _new_task_toast(
+        self, task: Task
+    ) -> tuple[list[UUID], NewTaskToastData] | None:
+        if self.notification_service is None:
+            return None
+        user_ids = await self.uow.project_member_repository.find_user_ids_by_role(
+            task.project_id, task.required_role_id
+        )
+        if not user_ids:
+            return None
+        project = await self.uow.project_repository.find_by_id(task.project_id)
+        role = (
+            await self.uow.role_repository.find_by_id(task.required_role_id)
+            if task.required_role_id is not None
+            else None
+        )
+        return user_ids, NewTaskToastData(
+            project_id=task.project_id,
+            project_name=project.name if project else "",
+            task_id=task.id,
+            task_title=task.title,
+            required_role=role.name if role else None,
+        )
+
+    async def _send_toast(self, user_ids: list[UUID], toast: NewTaskToastData) -> None:
+        # The task is already committed; a lost toast must not fail the request.
+        try:
+            await self.notification_service.send_new_task_toast(user_ids, toast)
+        except Exception:
+            logger.warning(
+                "new_task_toast_failed task_id=%s", toast.task_id, exc_info=True
+            )
@@ -0,0 +1,147 @@
+"""Estimate all unestimated tasks of a project use case."""
+
+from dataclasses import dataclass, field
+from uuid import UUID
+
+from backend.src.domain.entities import Task, TaskStatus
+from backend.src.domain.errors import LLMNotConfiguredError, ProjectNotFoundError
+from backend.src.domain.ports.services import (
+    DifficultyEstimationRequest,
+    EventPublisher,
+    LLMService,
+    LLMServiceResolver,
+)
+from backend.src.domain.ports.unit_of_work import UnitOfWork
+from backend.src.domain.services.project_access_resolver import ProjectAccessResolver
+
+# Tasks whose difficulty no longer matters.
+_CLOSED_STATUSES = (TaskStatus.DONE, TaskStatus.CANCELLED)
+
+
+@dataclass
+class EstimateTaskDifficultiesInput:
+    """Input for estimating a project's unestimated tasks."""
+
+    project_id: UUID
+    requester_id: UUID
+
+
+@dataclass
+class EstimateTaskDifficultiesOutput:
+    """Tasks that received a difficulty and those the LLM could not estimate."""
+
+    estimated: list[Task] = field(default_factory=list)
+    failed_task_ids: list[UUID] = field(default_factory=list)
+
+
+class EstimateTaskDifficultiesUseCase:
+    """
+    Let the LLM set the difficulty of every open task that has none.
+
+    BR-LLM-001: Only for projects with LLM features enabled.
+    BR-LLM-003: LLM can estimate Task Difficulty based on description.
+    BR-TASK-001: Only the Manager can edit tasks.
+
+    Tasks are sent in one batched call with the project description as
+    shared context, to the project's own provider when `llm_resolver` is
+    given and the global service otherwise. No transaction is held while
+    the LLM works: tasks are read first, and the estimates are written in a
+    second transaction only to tasks that are still unestimated by then.
+    """
+
+    def __init__(
+        self,
+        uow: UnitOfWork,
+        llm_service: LLMService,
+        event_publisher: EventPublisher | None = None,
+        llm_resolver: LLMServiceResolver | None = None,
+        access_resolver: ProjectAccessResolver | None = None,
+    ):
+        self.uow = uow
+        self.llm_service = llm_service
+        self.event_publisher = event_publisher
+        self.llm_resolver = llm_resolver
+        self.access = access_resolver or ProjectAccessResolver()
+
+    async def execute(
+        self, input: EstimateTaskDifficultiesInput
+    ) -> EstimateTaskDifficultiesOutput:
+        """
+        Estimate the project's open tasks without difficulty.
+
+        Raises:
+            ProjectNotFoundError: If project doesn't exist.
+            ManagerRequiredError: If requester is not the project manager.
+            LLMNotConfiguredError: If LLM is not enabled for the project.
+            LLMAPIKeyDecryptionError: If the project's API key cannot be decrypted.
+            LLMProviderError: If the LLM provider fails.
+            LLMRateLimitError: If the LLM rate limit is exceeded.
+        """
+        async with self.uow:
+            await self.access.require_manager(
+                self.uow.project_repository,
+                input.project_id,
+                input.requester_id,
+                "estimate task difficulties",
+            )
+            project = await self.uow.project_repository.find_by_id(input.project_id)
+            if project is None:
+                raise ProjectNotFoundError(str(input.project_id))
+            if not project.is_llm_enabled:
+                raise LLMNotConfiguredError(str(input.project_id))
+
+            pending = _unestimated(
+                await self.uow.task_repository.find_by_project(project.id)
+            )
+            # Release the connection while the LLM works.
+            await self.uow.rollback()
+
+        output = EstimateTaskDifficultiesOutput()
+        if not pending:
+            return output
+
+        llm_service = self.llm_service
+        if self.llm_resolver is not None:
+            llm_service = await self.llm_resolver.for_project(project)
+        estimates = await llm_service.estimate_difficulty_batch(
+            [
+                DifficultyEstimationRequest(
+                    task_title=task.title, task_description=task.description
+                )
+                for task in pending
+            ],
+            project_context=project.description or None,
+        )
+        points = {
+            task.id: estimate.points
+            for task, estimate in zip(pending, estimates)
+            if estimate is not None
+        }
+        output.failed_task_ids = [task.id for task in pending if task.id not in points]
+        if not points:
+            return output
+
+        async with self.uow:
+            for task in _unestimated(
+                await self.uow.task_repository.find_by_project(project.id)
+            ):
+                if task.id in points:
+                    task.set_difficulty(points[task.id])
+                    output.estimated.append(task)
+            if output.estimated:
+                await self.uow.task_repository.save_many(output.estimated)
+                await self.uow.commit()
+
+        if self.event_publisher is not None:
+            await self.event_publisher.publish(
+                [event for task in output.estimated for event in task.pull_events()]
+            )
+        return output
+
+
+def _unestimated(tasks: list[Task]) -> list[Task]:
+    return [
+        task
+        for task in tasks
+        if task.difficulty_points is None and task.status not in _CLOSED_STATUSES
+    ]
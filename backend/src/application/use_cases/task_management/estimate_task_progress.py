@@ -0,0 +1,270 @@
+"""Estimate task progress from its reports use case."""
+
+from __future__ import annotations
+
+from collections.abc import AsyncIterator
+from dataclasses import dataclass
+from uuid import UUID
+
+from backend.src.domain.entities import Task, TaskLog, TaskStatus
+from backend.src.domain.errors import (
+    LLMInvalidResponseError,
+    LLMNotConfiguredError,
+    TaskNotFoundError,
+    TaskNotOwnedError,
+)
+from backend.src.domain.ports.repositories import TaskProgressState
+from backend.src.domain.ports.services import (
+    LLMService,
+    LLMServiceResolver,
+    ProgressEstimation,
+)
+from backend.src.domain.ports.unit_of_work import UnitOfWork
+from backend.src.domain.services.project_access_resolver import ProjectAccessResolver
+
+# Rough size of a prompt token, used to keep prompts within the budget.
+_CHARS_PER_TOKEN = 4
+# Longest rolling summary carried from one estimate to the next.
+_MAX_SUMMARY_CHARS = 4000
+
+
+@dataclass
+class EstimateTaskProgressInput:
+    """Input for estimating a task's progress."""
+
+    task_id: UUID
+    user_id: UUID
+
+
+@dataclass
+class EstimateTaskProgressOutput:
+    """The task, its estimate and how the estimate was obtained."""
+
+    task: Task
+    estimation: ProgressEstimation | None  # None: no reports yet
+    reused: bool = False  # No new reports, the stored estimate still holds
+    reports_sent: int = 0
+    reports_pending: int = 0  # Left over budget, sent by the next estimate
+
+
+class EstimateTaskProgressUseCase:
+    """
+    Let the LLM estimate a task's progress from its reports.
+
+    UC-043: Reports can be analyzed by LLM to estimate progress percentage.
+    BR-LLM-001: Only for projects with LLM features enabled.
+    BR-LLM-003: LLM can calculate % progress based on textual reports.
+
+    Estimates are incremental: the last one is stored with a rolling summary
+    of the reports it covered, and the next call sends only that summary and
+    the reports filed since. Without new reports the stored estimate is
+    returned as is. Summary and reports together are kept within
+    ``token_budget`` (about four characters per token): when the new reports
+    do not all fit, the oldest that fit are sent, the stored estimate covers
+    reports up to the last one sent, and later calls catch up on the rest.
+    """
+
+    def __init__(
+        self,
+        uow: UnitOfWork,
+        llm_service: LLMService,
+        llm_resolver: LLMServiceResolver | None = None,
+        access_resolver: ProjectAccessResolver | None = None,
+        token_budget: int = 2000,
+    ):
+        self.uow = uow
+        self.llm_service = llm_service
+        self.llm_resolver = llm_resolver
+        self.access = access_resolver or ProjectAccessResolver()
+        self.token_budget = token_budget
+
+    async def execute(
+        self, input: EstimateTaskProgressInput
+    ) -> EstimateTaskProgressOutput:
+        """
+        Estimate the progress of a task in Doing status.
+
+        The assignee and the project manager may ask for an estimate.
+
+        Raises:
+            TaskNotFoundError: If task doesn't exist.
+            TaskNotOwnedError: If user is neither the assignee nor the manager.
+            ValueError: If task is not in Doing status.
+            LLMNotConfiguredError: If LLM is not enabled for the project.
+            LLMProviderError: If the LLM provider fails.
+            LLMRateLimitError: If the LLM rate limit is exceeded.
+        """
+        prepared = await self._prepare(input)
+        if isinstance(prepared, EstimateTaskProgressOutput):
+            return prepared
+        estimation = await prepared.llm_service.estimate_progress(
+            prepared.task.title,
+            prepared.task.description,
+            prepared.texts,
+            prepared.previous,
+        )
+        return await self._store(prepared, estimation)
+
+    async def stream(
+        self, input: EstimateTaskProgressInput
+    ) -> AsyncIterator[str | EstimateTaskProgressOutput]:
+        """
+        Like `execute`, yielding the LLM's reasoning as it is written.
+
+        Yields pieces of the reasoning text, then the output last. Access
+        and state are checked before the first item, so errors raised there
+        are the same as those of `execute`.
+        """
+        prepared = await self._prepare(input)
+        if isinstance(prepared, EstimateTaskProgressOutput):
+            yield prepared
+            return
+        estimation: ProgressEstimation | None = None
+        async for item in prepared.llm_service.estimate_progress_stream(
+            prepared.task.title,
+            prepared.task.description,
+            prepared.texts,
+            prepared.previous,
+        ):
+            if isinstance(item, ProgressEstimation):
+                estimation = item
+            else:
+                yield item
+        if estimation is None:
+            raise LLMInvalidResponseError("progress estimation stream")
+        yield await self._store(prepared, estimation)
+
+    async def _prepare(
+        self, input: EstimateTaskProgressInput
+    ) -> _PreparedEstimate | EstimateTaskProgressOutput:
+        """Check access and load what to send; the output if nothing is new."""
+        async with self.uow:
+            task = await self.uow.task_repository.find_by_id(input.task_id)
+            if task is None:
+                raise TaskNotFoundError(str(input.task_id))
+            access = await self.access.resolve(
+                self.uow.project_repository, task.project_id, input.user_id
+            )
+            if not access.is_manager and (
+                access.member_id is None or access.member_id != task.assignee_id
+            ):
+                raise TaskNotOwnedError(str(input.task_id), str(input.user_id))
+            if task.status != TaskStatus.DOING:
+                raise ValueError(
+                    f"Cannot estimate progress of task with status "
+                    f"{task.status.value}. Task must be in Doing status."
+                )
+            project = await self.uow.project_repository.find_by_id(task.project_id)
+            if project is None or not project.is_llm_enabled:
+                raise LLMNotConfiguredError(str(task.project_id))
+
+            state = await self.uow.task_progress_repository.get(task.id)
+            watermark = (
+                (state.last_report_at, state.last_report_id) if state else None
+            )
+            reports = await self.uow.task_log_repository.find_reports_after(
+                task.id, watermark
+            )
+            # Release the connection while the LLM works.
+            await self.uow.rollback()
+
+        previous = _estimation(state) if state is not None else None
+        if not reports:
+            return EstimateTaskProgressOutput(
+                task=task, estimation=previous, reused=previous is not None
+            )
+
+        budget_chars = self.token_budget * _CHARS_PER_TOKEN
+        if previous is not None and len(previous.summary) > budget_chars // 2:
+            previous = ProgressEstimation(
+                percentage=previous.percentage,
+                confidence=previous.confidence,
+                reasoning=previous.reasoning,
+                summary=previous.summary[-(budget_chars // 2) :],
+            )
+        texts = _within_budget(
+            reports, budget_chars - len(previous.summary if previous else "")
+        )
+
+        llm_service = self.llm_service
+        if self.llm_resolver is not None:
+            llm_service = await self.llm_resolver.for_project(project)
+        return _PreparedEstimate(
+            task=task,
+            llm_service=llm_service,
+            previous=previous,
+            texts=texts,
+            covered=reports[len(texts) - 1],
+            pending=len(reports) - len(texts),
+        )
+
+    async def _store(
+        self, prepared: _PreparedEstimate, estimation: ProgressEstimation
+    ) -> EstimateTaskProgressOutput:
+        task = prepared.task
+        covered = prepared.covered
+        async with self.uow:
+            stored = await self.uow.task_progress_repository.save(
+                TaskProgressState(
+                    task_id=task.id,
+                    percentage=estimation.percentage,
+                    confidence=estimation.confidence,
+                    reasoning=estimation.reasoning,
+                    summary=estimation.summary[-_MAX_SUMMARY_CHARS:],
+                    last_report_at=covered.created_at,
+                    last_report_id=covered.id,
+                )
+            )
+            if stored:
+                current = await self.uow.task_repository.find_by_id(task.id)
+                if current is not None and current.status == TaskStatus.DOING:
+                    current.update_progress(estimation.percentage)
+                    await self.uow.task_repository.save(current)
+                    task = current
+                await self.uow.commit()
+            else:
+                # A concurrent estimate already covered later reports.
+                await self.uow.rollback()
+
+        return EstimateTaskProgressOutput(
+            task=task,
+            estimation=estimation,
+            reports_sent=len(prepared.texts),
+            reports_pending=prepared.pending,
+        )
+
+
+@dataclass
+class _PreparedEstimate:
+    """What one estimate sends to the LLM, and the report it covers up to."""
+
+    task: Task
+    llm_service: LLMService
+    previous: ProgressEstimation | None
+    texts: list[str]
+    covered: TaskLog
+    pending: int
+
+
+def _estimation(state: TaskProgressState) -> ProgressEstimation:
+    return ProgressEstimation(
+        percentage=state.percentage,
+        confidence=state.confidence,
+        reasoning=state.reasoning,
+        summary=state.summary,
+    )
+
+
+def _within_budget(reports: list[TaskLog], budget_chars: int) -> list[str]:
+    """The oldest reports fitting the budget, in order; at least one."""
+    selected: list[str] = []
+    used = 0
+    for report in reports:
+        remaining = budget_chars - used
+        if len(report.content) > remaining:
+            if not selected:
+                selected.append(report.content[: max(remaining, 1)])
+            break
+        selected.append(report.content)
+        used += len(report.content)
+    return selected
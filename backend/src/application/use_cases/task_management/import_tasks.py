@@ -0,0 +1,186 @@
+"""Bulk task import use case."""
+
+from dataclasses import dataclass, field
+from uuid import UUID
+
+from backend.src.application.use_cases.project_management.recalculate_project_schedule import (
+    RecalculateProjectScheduleInput,
+    RecalculateProjectScheduleUseCase,
+)
+from backend.src.domain.entities import (
+    Task,
+    TaskDependency,
+    TaskStatus,
+    find_circular_dependency,
+)
+from backend.src.domain.errors import (
+    CircularDependencyError,
+    ManagerRequiredError,
+    ProjectNotFoundError,
+    TaskNotFoundError,
+)
+from backend.src.domain.ports.unit_of_work import UnitOfWork
+
+
+@dataclass
+class ImportTaskItem:
+    """A task to create, identified by a client-chosen reference."""
+
+    ref: str
+    title: str
+    description: str = ""
+    difficulty_points: int | None = None
+    required_role_id: UUID | None = None
+
+
+@dataclass
+class ImportDependencyItem:
+    """
+    A dependency edge: blocked depends on blocking.
+
+    Each end is either the ref of an imported task or the id of a task
+    already in the project.
+    """
+
+    blocking: str
+    blocked: str
+
+
+@dataclass
+class ImportTasksInput:
+    """Input for importing tasks and dependencies in bulk."""
+
+    project_id: UUID
+    requester_id: UUID
+    tasks: list[ImportTaskItem] = field(default_factory=list)
+    dependencies: list[ImportDependencyItem] = field(default_factory=list)
+
+
+@dataclass
+class ImportTasksOutput:
+    """Output containing the created tasks and dependencies."""
+
+    task_ids: dict[str, UUID]
+    tasks: list[Task]
+    dependencies: list[TaskDependency]
+
+
+class ImportTasksUseCase:
+    """
+    Create many tasks and dependency edges in a single transaction.
+
+    The whole dependency graph is validated once, rows are written with
+    multi-row inserts, and the schedule is recalculated exactly once before
+    the commit.
+    """
+
+    def __init__(
+        self,
+        uow: UnitOfWork,
+        recalculate_schedule_use_case: RecalculateProjectScheduleUseCase,
+    ):
+        self.uow = uow
+        self.recalculate_schedule_use_case = recalculate_schedule_use_case
+
+    async def execute(self, input: ImportTasksInput) -> ImportTasksOutput:
+        """
+        Import tasks and dependencies.
+
+        BR-TASK-001: Only the Manager can create tasks.
+        BR-DEP-002: The resulting graph must stay acyclic.
+        BR-DEP-003: Tasks depending on unfinished tasks start Blocked.
+
+        Raises:
+            ProjectNotFoundError: If project doesn't exist.
+            ManagerRequiredError: If requester is not the project manager.
+            TaskNotFoundError: If an edge references an unknown task.
+            CircularDependencyError: If the edges would create a cycle.
+            ValueError: On duplicate refs, duplicate or self-referencing edges.
+        """
+        async with self.uow:
+            project = await self.uow.project_repository.find_by_id(input.project_id)
+            if project is None:
+                raise ProjectNotFoundError(str(input.project_id))
+
+            if not project.is_manager(input.requester_id):
+                raise ManagerRequiredError("import tasks")
+
+            new_tasks: dict[str, Task] = {}
+            for item in input.tasks:
+                if item.ref in new_tasks:
+                    raise ValueError(f"Duplicate task reference: {item.ref}")
+                new_tasks[item.ref] = Task(
+                    project_id=project.id,
+                    title=item.title,
+                    description=item.description,
+                    difficulty_points=item.difficulty_points,
+                    required_role_id=item.required_role_id,
+                )
+
+            existing_tasks = {
+                task.id: task
+                for task in await self.uow.task_repository.find_by_project(project.id)
+            }
+            existing_deps = await self.uow.task_dependency_repository.find_by_project(
+                project.id
+            )
+
+            def resolve(reference: str) -> Task:
+                task = new_tasks.get(reference)
+                if task is None:
+                    try:
+                        task = existing_tasks.get(UUID(reference))
+                    except ValueError:
+                        task = None
+                if task is None:
+                    raise TaskNotFoundError(reference)
+                return task
+
+            known_pairs = set(existing_deps)
+            new_deps: list[TaskDependency] = []
+            for item in input.dependencies:
+                dependency = TaskDependency(
+                    blocking_task_id=resolve(item.blocking).id,
+                    blocked_task_id=resolve(item.blocked).id,
+                )
+                if dependency in known_pairs:
+                    raise ValueError(
+                        f"Dependency already exists: {item.blocking} -> {item.blocked}"
+                    )
+                known_pairs.add(dependency)
+                new_deps.append(dependency)
+
+            cycle = find_circular_dependency([*existing_deps, *new_deps])
+            if cycle is not None:
+                raise CircularDependencyError(
+                    str(cycle.blocking_task_id), str(cycle.blocked_task_id)
+                )
+
+            tasks_by_id = {**existing_tasks, **{t.id: t for t in new_tasks.values()}}
+            blocked_existing: dict[UUID, Task] = {}
+            for dependency in new_deps:
+                blocking_task = tasks_by_id[dependency.blocking_task_id]
+                blocked_task = tasks_by_id[dependency.blocked_task_id]
+                if blocking_task.status != TaskStatus.DONE and blocked_task.status in {
+                    TaskStatus.TODO,
+                    TaskStatus.DOING,
+                }:
+                    blocked_task.block()
+                    if blocked_task.id in existing_tasks:
+                        blocked_existing[blocked_task.id] = blocked_task
+
+            await self.uow.task_repository.insert_many(list(new_tasks.values()))
+            await self.uow.task_dependency_repository.insert_many(new_deps)
+            if blocked_existing:
+                await self.uow.task_repository.save_many(list(blocked_existing.values()))
+
+            await self.recalculate_schedule_use_case.recalculate_in_transaction(
+                RecalculateProjectScheduleInput(project_id=project.id)
+            )
+            await self.uow.commit()
+
+        return ImportTasksOutput(
+            task_ids={ref: task.id for ref, task in new_tasks.items()},
+            tasks=list(new_tasks.values()),
+            dependencies=new_deps,
+        )
@@ -0,0 +1,103 @@
+"""Keep the similar-task index in step with completed tasks."""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Sequence
+from contextlib import AbstractAsyncContextManager
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from uuid import UUID
+
+from backend.src.domain.entities import Task, TaskStatus
+from backend.src.domain.events import DomainEvent, TaskCompleted
+from backend.src.domain.ports import UnitOfWork
+from backend.src.domain.ports.services import SimilarTaskIndex
+from backend.src.domain.time import utcnow
+
+# How far back each sync looks past the previous one, to catch completions
+# whose transaction committed after that sync had already read.
+_SYNC_OVERLAP = timedelta(minutes=5)
+
+
+@dataclass
+class IndexCompletedTasksInput:
+    """Tasks that were just completed."""
+
+    task_ids: Sequence[UUID]
+
+
+class IndexCompletedTasksUseCase:
+    """
+    Feed completed tasks and their final difficulty to the similar-task index.
+
+    BR-LLM-003: New tasks that closely match a completed one are estimated
+    from it instead of by the LLM.
+
+    `warm_up` loads the most recently completed tasks (up to `limit`) once at
+    startup; after that each task is added as it is completed, so the index
+    is never rebuilt. Completion events only reach the worker that handled
+    the request, so each worker also calls `sync` periodically to pick up
+    the tasks other workers completed since its last look.
+    """
+
+    def __init__(
+        self,
+        uow_factory: Callable[[], AbstractAsyncContextManager[UnitOfWork]],
+        index: SimilarTaskIndex,
+        limit: int = 10000,
+    ):
+        self.uow_factory = uow_factory
+        self.index = index
+        self.limit = limit
+        self._synced_at: datetime | None = None
+
+    async def handle_events(self, events: Sequence[DomainEvent]) -> None:
+        """Event handler: index the tasks completed in this batch."""
+        task_ids = dict.fromkeys(
+            event.task_id for event in events if isinstance(event, TaskCompleted)
+        )
+        if task_ids:
+            await self.execute(IndexCompletedTasksInput(task_ids=list(task_ids)))
+
+    async def execute(self, input: IndexCompletedTasksInput) -> int:
+        """Index the given tasks; returns how many were added."""
+        async with self.uow_factory() as uow:
+            tasks = [
+                await uow.task_repository.find_by_id(task_id)
+                for task_id in input.task_ids
+            ]
+        return self._add([task for task in tasks if task is not None])
+
+    async def warm_up(self) -> int:
+        """Index the most recently completed tasks; returns how many."""
+        self._synced_at = utcnow()
+        async with self.uow_factory() as uow:
+            tasks = await uow.task_repository.find_recently_completed(self.limit)
+        # Oldest first, so a full index keeps the most recent ones.
+        return self._add(list(reversed(tasks)))
+
+    async def sync(self) -> int:
+        """Index tasks completed since the last sync; returns how many."""
+        if self._synced_at is None:
+            return await self.warm_up()
+        since, self._synced_at = self._synced_at - _SYNC_OVERLAP, utcnow()
+        async with self.uow_factory() as uow:
+            tasks = await uow.task_repository.find_recently_completed(
+                self.limit, completed_after=since
+            )
+        return self._add(list(reversed(tasks)))
+
+    def _add(self, tasks: list[Task]) -> int:
+        added = 0
+        for task in tasks:
+            if task.status != TaskStatus.DONE or task.difficulty_points is None:
+                continue
+            self.index.add(
+                task.project_id,
+                task.id,
+                task.title,
+                task.description,
+                task.difficulty_points,
+            )
+            added += 1
+        return added
@@ -4,13 +4,10 @@ from dataclasses import dataclass
 from uuid import UUID
 
 from backend.src.domain.entities import Task, TaskLog, TaskStatus
-from backend.src.domain.errors import (
-    ManagerRequiredError,
-    ProjectNotFoundError,
-    TaskNotAssignedError,
-    TaskNotFoundError,
-)
+from backend.src.domain.errors import TaskNotAssignedError, TaskNotFoundError
+from backend.src.domain.ports.services import EventPublisher
 from backend.src.domain.ports.unit_of_work import UnitOfWork
+from backend.src.domain.services.project_access_resolver import ProjectAccessResolver
 
 
 @dataclass
@@ -34,8 +31,15 @@ class RemoveFromTaskUseCase:
     returning it to the Todo pool for someone else to pick up.
     """
 
-    def __init__(self, uow: UnitOfWork):
+    def __init__(
+        self,
+        uow: UnitOfWork,
+        access_resolver: ProjectAccessResolver | None = None,
+        event_publisher: EventPublisher | None = None,
+    ):
         self.uow = uow
+        self.access = access_resolver or ProjectAccessResolver()
+        self.event_publisher = event_publisher
 
     async def execute(self, input: RemoveFromTaskInput) -> Task:
         """
@@ -59,12 +63,12 @@ class RemoveFromTaskUseCase:
                 raise TaskNotFoundError(str(input.task_id))
 
             # Verify project exists and user is manager
-            project = await self.uow.project_repository.find_by_id(task.project_id)
-            if project is None:
-                raise ProjectNotFoundError(str(task.project_id))
-
-            if not project.is_manager(input.manager_user_id):
-                raise ManagerRequiredError("remove employee from task")
+            manager_access = await self.access.require_manager(
+                self.uow.project_repository,
+                task.project_id,
+                input.manager_user_id,
+                "remove employee from task",
+            )
 
             # Verify task is assigned
             if task.assignee_id is None:
@@ -77,13 +81,6 @@ class RemoveFromTaskUseCase:
                     "Task must be in Doing status."
                 )
 
-            # Get the manager's member record for audit attribution
-            manager_member = (
-                await self.uow.project_member_repository.find_by_project_and_user(
-                    task.project_id, input.manager_user_id
-                )
-            )
-
             # Store the previous assignee for the log content
             previous_assignee_id = task.assignee_id
 
@@ -94,11 +91,13 @@ class RemoveFromTaskUseCase:
             # Create audit log (BR-ASSIGN-005)
             log = TaskLog.create_unassignment_log(
                 task_id=task.id,
-                author_id=manager_member.id if manager_member else previous_assignee_id,
+                author_id=manager_access.member_id or previous_assignee_id,
                 content=f"Forcibly removed from task by manager (previous assignee: {previous_assignee_id})",
             )
             await self.uow.task_log_repository.save(log)
 
             await self.uow.commit()
 
+        if self.event_publisher is not None:
+            await self.event_publisher.publish(task.pull_events())
         return task
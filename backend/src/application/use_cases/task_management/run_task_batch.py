@@ -0,0 +1,420 @@
+"""Run an ordered batch of task commands use case."""
+
+from dataclasses import dataclass, field
+from enum import Enum
+from uuid import UUID
+
+from backend.src.application.use_cases.project_management.recalculate_project_schedule import (
+    RecalculateProjectScheduleInput,
+    RecalculateProjectScheduleUseCase,
+)
+from backend.src.application.use_cases.task_management.select_task import (
+    raise_for_selection_violation,
+)
+from backend.src.domain.entities import (
+    Project,
+    ProjectAccess,
+    ProjectConfig,
+    ProjectMember,
+    Task,
+    TaskDependency,
+    TaskLog,
+    TaskStatus,
+    detect_circular_dependency,
+)
+from backend.src.domain.errors import (
+    CircularDependencyError,
+    DomainError,
+    ManagerRequiredError,
+    ProjectAccessDeniedError,
+    ProjectNotFoundError,
+    TaskNotFoundError,
+    TaskNotOwnedError,
+)
+from backend.src.domain.events import DomainEvent
+from backend.src.domain.ports.services import EventPublisher
+from backend.src.domain.ports.unit_of_work import UnitOfWork
+from backend.src.domain.services.project_access_resolver import ProjectAccessResolver
+from backend.src.domain.services.task_selection_policy import (
+    SelectionContext,
+    TaskSelectionPolicy,
+)
+
+
+class BatchOperation(str, Enum):
+    """Task commands accepted in a batch."""
+
+    SELECT = "select"
+    COMPLETE = "complete"
+    ABANDON = "abandon"
+    CANCEL = "cancel"
+    DELETE = "delete"
+    ADD_DEPENDENCY = "add_dependency"
+    REMOVE_DEPENDENCY = "remove_dependency"
+
+
+class BatchMode(str, Enum):
+    """How a batch reacts to a failing command."""
+
+    ATOMIC = "atomic"  # First failure rolls back the whole batch
+    PARTIAL = "partial"  # Failures are reported per command; the rest commits
+
+
+# Commands that change the dependency graph or the set of scheduled tasks.
+_SCHEDULE_OPERATIONS = {
+    BatchOperation.CANCEL,
+    BatchOperation.DELETE,
+    BatchOperation.ADD_DEPENDENCY,
+    BatchOperation.REMOVE_DEPENDENCY,
+}
+
+
+@dataclass
+class BatchCommand:
+    """
+    One command of a batch.
+
+    For dependency commands, task_id is the blocked task. Abandon requires a
+    reason (BR-ABANDON-002).
+    """
+
+    operation: BatchOperation
+    task_id: UUID
+    blocking_task_id: UUID | None = None
+    reason: str = ""
+
+
+@dataclass
+class BatchCommandResult:
+    """Outcome of a single command; error is set when the command failed."""
+
+    index: int
+    operation: BatchOperation
+    task: Task | None = None
+    error: DomainError | ValueError | None = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+@dataclass
+class RunTaskBatchInput:
+    """Input for running a batch of task commands."""
+
+    project_id: UUID
+    user_id: UUID
+    commands: list[BatchCommand]
+    mode: BatchMode = BatchMode.ATOMIC
+
+
+@dataclass
+class RunTaskBatchOutput:
+    """Output with one result per command, in order."""
+
+    results: list[BatchCommandResult] = field(default_factory=list)
+
+
+class BatchCommandError(DomainError):
+    """Raised when a command fails in an all-or-nothing batch."""
+
+    def __init__(self, index: int, operation: BatchOperation, cause: DomainError | ValueError):
+        self.index = index
+        self.operation = operation
+        self.cause = cause
+        message = cause.message if isinstance(cause, DomainError) else str(cause)
+        super().__init__(
+            f"Command {index} ({operation.value}) failed: {message}",
+            status=cause.status if isinstance(cause, DomainError) else 400,
+        )
+
+
+class RunTaskBatchUseCase:
+    """
+    Apply an ordered list of task commands in a single unit of work.
+
+    The requester's access, the project's tasks and its dependencies are
+    loaded once (the project and membership entities only when a command
+    selects a task); every command is then checked and applied
+    against that snapshot. The schedule is recalculated at most once, inside
+    the same transaction, when a command changed the dependency graph.
+    """
+
+    def __init__(
+        self,
+        uow: UnitOfWork,
+        recalculate_schedule_use_case: RecalculateProjectScheduleUseCase,
+        selection_policy: TaskSelectionPolicy | None = None,
+        config: ProjectConfig | None = None,
+        event_publisher: EventPublisher | None = None,
+        access_resolver: ProjectAccessResolver | None = None,
+    ):
+        self.uow = uow
+        self.recalculate_schedule_use_case = recalculate_schedule_use_case
+        self.selection_policy = selection_policy or TaskSelectionPolicy()
+        self.config = config or ProjectConfig.default()
+        self.event_publisher = event_publisher
+        self.access = access_resolver or ProjectAccessResolver()
+
+    async def execute(self, input: RunTaskBatchInput) -> RunTaskBatchOutput:
+        """
+        Run the batch.
+
+        Each command enforces the same rules as its standalone endpoint.
+
+        Raises:
+            ProjectNotFoundError: If project doesn't exist.
+            ProjectAccessDeniedError: If requester is neither manager nor member.
+            BatchCommandError: On the first failing command in atomic mode.
+        """
+        output = RunTaskBatchOutput()
+        events: list[DomainEvent] = []
+
+        async with self.uow:
+            access = await self.access.require_access(
+                self.uow.project_repository, input.project_id, input.user_id
+            )
+            state = _BatchState(
+                access=access,
+                tasks={
+                    t.id: t
+                    for t in await self.uow.task_repository.find_by_project(
+                        input.project_id
+                    )
+                },
+                dependencies=await self.uow.task_dependency_repository.find_by_project(
+                    input.project_id
+                ),
+            )
+
+            reschedule = False
+            for index, command in enumerate(input.commands):
+                try:
+                    task = await self._apply(state, command)
+                except (DomainError, ValueError) as exc:
+                    if input.mode is BatchMode.ATOMIC:
+                        raise BatchCommandError(index, command.operation, exc) from exc
+                    output.results.append(
+                        BatchCommandResult(
+                            index=index, operation=command.operation, error=exc
+                        )
+                    )
+                    continue
+
+                reschedule = reschedule or command.operation in _SCHEDULE_OPERATIONS
+                output.results.append(
+                    BatchCommandResult(index=index, operation=command.operation, task=task)
+                )
+
+            if any(result.ok for result in output.results):
+                if reschedule:
+                    await self.recalculate_schedule_use_case.recalculate_in_transaction(
+                        RecalculateProjectScheduleInput(project_id=input.project_id)
+                    )
+                await self.uow.commit()
+                events = [
+                    event for task in state.tasks.values() for event in task.pull_events()
+                ]
+
+        if self.event_publisher is not None:
+            await self.event_publisher.publish(events)
+        return output
+
+    async def _apply(self, state: "_BatchState", command: BatchCommand) -> Task | None:
+        handlers = {
+            BatchOperation.SELECT: self._select,
+            BatchOperation.COMPLETE: self._complete,
+            BatchOperation.ABANDON: self._abandon,
+            BatchOperation.CANCEL: self._cancel,
+            BatchOperation.DELETE: self._delete,
+            BatchOperation.ADD_DEPENDENCY: self._add_dependency,
+            BatchOperation.REMOVE_DEPENDENCY: self._remove_dependency,
+        }
+        return await handlers[command.operation](state, command)
+
+    async def _select(self, state: "_BatchState", command: BatchCommand) -> Task:
+        if not state.access.is_member:
+            raise ProjectAccessDeniedError(
+                str(state.access.user_id), str(state.access.project_id)
+            )
+        task = state.task(command.task_id)
+        # The selection policy needs the full project and membership.
+        project, member = await self._selector(state)
+        all_tasks = list(state.tasks.values())
+        context = SelectionContext(
+            task=task,
+            project=project,
+            member=member,
+            assigned_tasks=[t for t in all_tasks if t.assignee_id == member.id],
+            dependencies=state.dependencies,
+            all_project_tasks=all_tasks,
+            config=self.config,
+        )
+        violation = self.selection_policy.get_first_violation(context)
+        if violation:
+            raise_for_selection_violation(violation, task.id)
+
+        task.select(member.id)
+        await self.uow.task_repository.save(task)
+        # BR-ASSIGN-005: All assignments are logged
+        await self.uow.task_log_repository.save(
+            TaskLog.create_assignment_log(task_id=task.id, author_id=member.id)
+        )
+        return task
+
+    async def _selector(self, state: "_BatchState") -> tuple[Project, ProjectMember]:
+        """Load the project and the requester's membership once per batch."""
+        if state.project is None:
+            project_id, user_id = state.access.project_id, state.access.user_id
+            state.project = await self.uow.project_repository.find_by_id(project_id)
+            if state.project is None:
+                raise ProjectNotFoundError(str(project_id))
+            state.member = (
+                await self.uow.project_member_repository.find_by_project_and_user(
+                    project_id, user_id
+                )
+            )
+        if state.member is None:
+            raise ProjectAccessDeniedError(
+                str(state.access.user_id), str(state.access.project_id)
+            )
+        return state.project, state.member
+
+    async def _complete(self, state: "_BatchState", command: BatchCommand) -> Task:
+        task = state.owned_task(command.task_id)
+        old_status = task.status.value
+        task.complete()
+        await self.uow.task_repository.save(task)
+        await self.uow.task_log_repository.save(
+            TaskLog.create_status_change_log(
+                task_id=task.id,
+                author_id=task.assignee_id,
+                old_status=old_status,
+                new_status=task.status.value,
+            )
+        )
+        return task
+
+    async def _abandon(self, state: "_BatchState", command: BatchCommand) -> Task:
+        # BR-ABANDON-002: Reason is required
+        if not command.reason or not command.reason.strip():
+            raise ValueError("Abandonment reason is required (BR-ABANDON-002)")
+        task = state.owned_task(command.task_id)
+        member_id = task.assignee_id
+        task.abandon()
+        await self.uow.task_repository.save(task)
+        await self.uow.task_log_repository.save(
+            TaskLog.create_abandon_log(
+                task_id=task.id, author_id=member_id, reason=command.reason
+            )
+        )
+        return task
+
+    async def _cancel(self, state: "_BatchState", command: BatchCommand) -> Task:
+        state.require_manager("cancel task")
+        task = state.task(command.task_id)
+        task.cancel()
+        await self.uow.task_repository.save(task)
+        return task
+
+    async def _delete(self, state: "_BatchState", command: BatchCommand) -> None:
+        state.require_manager("delete task")
+        task = state.task(command.task_id)
+        await self.uow.task_dependency_repository.delete(task.id)
+        await self.uow.task_repository.delete(task.id)
+        del state.tasks[task.id]
+        state.dependencies = [
+            dep
+            for dep in state.dependencies
+            if task.id not in (dep.blocking_task_id, dep.blocked_task_id)
+        ]
+        return None
+
+    async def _add_dependency(self, state: "_BatchState", command: BatchCommand) -> Task:
+        state.require_manager("add dependency")
+        blocking_task = state.task(_require_blocking_id(command))
+        blocked_task = state.task(command.task_id)
+        dependency = TaskDependency(
+            blocking_task_id=blocking_task.id, blocked_task_id=blocked_task.id
+        )
+        if detect_circular_dependency(dependency, state.dependencies):
+            raise CircularDependencyError(str(blocking_task.id), str(blocked_task.id))
+        if dependency in state.dependencies:
+            raise ValueError("Dependency already exists")
+
+        await self.uow.task_dependency_repository.save(dependency)
+        state.dependencies.append(dependency)
+
+        # BR-DEP-003: Child of an unfinished task is Blocked
+        if blocking_task.status != TaskStatus.DONE and blocked_task.status in {
+            TaskStatus.TODO,
+            TaskStatus.DOING,
+        }:
+            blocked_task.block()
+            await self.uow.task_repository.save(blocked_task)
+        return blocked_task
+
+    async def _remove_dependency(self, state: "_BatchState", command: BatchCommand) -> Task:
+        state.require_manager("remove dependency")
+        blocking_task_id = _require_blocking_id(command)
+        blocked_task = state.task(command.task_id)
+        dependency = TaskDependency(
+            blocking_task_id=blocking_task_id, blocked_task_id=blocked_task.id
+        )
+        if dependency not in state.dependencies:
+            raise TaskNotFoundError(f"dependency {blocking_task_id}->{blocked_task.id}")
+
+        await self.uow.task_dependency_repository.delete_by_tasks(
+            blocking_task_id, blocked_task.id
+        )
+        state.dependencies.remove(dependency)
+
+        if blocked_task.status == TaskStatus.BLOCKED:
+            has_open_blocker = any(
+                dep.blocked_task_id == blocked_task.id
+                and dep.blocking_task_id in state.tasks
+                and state.tasks[dep.blocking_task_id].status != TaskStatus.DONE
+                for dep in state.dependencies
+            )
+            if not has_open_blocker:
+                blocked_task.unblock()
+                await self.uow.task_repository.save(blocked_task)
+        return blocked_task
+
+
+@dataclass
+class _BatchState:
+    """In-memory snapshot of the project that commands are applied to."""
+
+    access: ProjectAccess
+    tasks: dict[UUID, Task]
+    dependencies: list[TaskDependency]
+    project: Project | None = None
+    member: ProjectMember | None = None
+
+    def task(self, task_id: UUID) -> Task:
+        task = self.tasks.get(task_id)
+        if task is None:
+            raise TaskNotFoundError(str(task_id))
+        return task
+
+    def owned_task(self, task_id: UUID) -> Task:
+        """Return a task assigned to the requester."""
+        task = self.task(task_id)
+        if (
+            self.access.member_id is None
+            or task.assignee_id is None
+            or task.assignee_id != self.access.member_id
+        ):
+            raise TaskNotOwnedError(str(task_id), str(self.access.user_id))
+        return task
+
+    def require_manager(self, action: str) -> None:
+        if not self.access.is_manager:
+            raise ManagerRequiredError(action)
+
+
+def _require_blocking_id(command: BatchCommand) -> UUID:
+    if command.blocking_task_id is None:
+        raise ValueError(f"{command.operation.value} requires blocking_task_id")
+    return command.blocking_task_id
@@ -1,6 +1,8 @@
 """Select task use case."""
 
+import re
 from dataclasses import dataclass
+from typing import NoReturn
 from uuid import UUID
 
 from backend.src.domain.entities import ProjectConfig, Task, TaskLog
@@ -12,9 +14,11 @@ from backend.src.domain.errors import (
     TaskNotSelectableError,
     WorkloadExceededError,
 )
+from backend.src.domain.ports.services import EventPublisher
 from backend.src.domain.ports.unit_of_work import UnitOfWork
 from backend.src.domain.services.task_selection_policy import (
     SelectionContext,
+    SelectionViolation,
     TaskSelectionPolicy,
 )
 
@@ -47,10 +51,12 @@ class SelectTaskUseCase:
         uow: UnitOfWork,
         selection_policy: TaskSelectionPolicy | None = None,
         config: ProjectConfig | None = None,
+        event_publisher: EventPublisher | None = None,
     ):
         self.uow = uow
         self.selection_policy = selection_policy or TaskSelectionPolicy()
         self.config = config or ProjectConfig.default()
+        self.event_publisher = event_publisher
 
     async def execute(self, input: SelectTaskInput) -> Task:
         """
@@ -125,39 +131,37 @@ class SelectTaskUseCase:
 
             await self.uow.commit()
 
+        if self.event_publisher is not None:
+            await self.event_publisher.publish(task.pull_events())
         return task
 
     def _raise_appropriate_error(
         self,
-        violation,
+        violation: SelectionViolation,
         task: Task,
         input: SelectTaskInput,
     ) -> None:
         """Map policy violations to appropriate domain errors."""
-        rule_id = violation.rule_id
-
-        if rule_id == "BR-PROJ-002":
-            raise ManagerRequiredError("Managers cannot select tasks (BR-PROJ-002)")
-        elif rule_id == "BR-ASSIGN-003":
-            # Extract ratio from violation message (format: "... (current ratio: X.XX).")
-            ratio = self._extract_ratio_from_message(violation.message)
-            raise WorkloadExceededError(ratio)
-        elif rule_id in (
-            "BR-TASK-004",
-            "BR-TASK-003",
-            "BR-ASSIGN-002",
-            "BR-DEP-001",
-            "BR-ASSIGN-004",
-        ):
-            raise TaskNotSelectableError(str(input.task_id), violation.message)
-        else:
-            raise TaskNotSelectableError(str(input.task_id), violation.message)
-
-    def _extract_ratio_from_message(self, message: str) -> float:
-        """Extract workload ratio from violation message."""
-        import re
-
-        match = re.search(r"current ratio: (\d+\.?\d*)", message)
-        if match:
-            return float(match.group(1))
-        return 0.0
+        raise_for_selection_violation(violation, input.task_id)
+
+
+def raise_for_selection_violation(violation: SelectionViolation, task_id: UUID) -> NoReturn:
+    """Map a task selection policy violation to the matching domain error."""
+    rule_id = violation.rule_id
+
+    if rule_id == "BR-PROJ-002":
+        raise ManagerRequiredError("Managers cannot select tasks (BR-PROJ-002)")
+    elif rule_id == "BR-ASSIGN-003":
+        # Extract ratio from violation message (format: "... (current ratio: X.XX).")
+        ratio = _extract_ratio_from_message(violation.message)
+        raise WorkloadExceededError(ratio)
+    else:
+        raise TaskNotSelectableError(str(task_id), violation.message)
+
+
+def _extract_ratio_from_message(message: str) -> float:
+    """Extract workload ratio from violation message."""
+    match = re.search(r"current ratio: (\d+\.?\d*)", message)
+    if match:
+        return float(match.group(1))
+    return 0.0
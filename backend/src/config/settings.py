@@ -25,10 +25,33 @@ class AppSettings(BaseSettings):
     encryption_provider: str = "mock"
     notification_provider: str = "mock"
     rate_limit_provider: str = "memory"
+    project_access_cache_provider: str = "memory"
+    toast_provider: str = "memory"
+    llm_cache_provider: str = "memory"
+    llm_similarity_provider: str = "none"
 
     global_llm_api_key: str | None = None
     global_llm_base_url: str | None = None
     llm_model: str | None = None
+    llm_batch_size: int = 10
+    llm_batch_concurrency: int = 4
+    llm_cache_size: int = 1024
+    llm_cache_ttl_seconds: int = 86400
+    llm_client_pool_size: int = 64
+    llm_secret_ttl_seconds: int = 900
+    llm_timeout_seconds: float = 20.0
+    llm_batch_timeout_seconds: float = 120.0
+    llm_max_retries: int = 2
+    llm_hedge_after_seconds: float | None = None
+    llm_breaker_failure_threshold: int = 5
+    llm_breaker_reset_seconds: float = 30.0
+    llm_similarity_threshold: float = 0.9
+    llm_similarity_index_size: int = 10000
+    llm_similarity_sync_seconds: float = 60.0
+    llm_max_concurrency: int = 8
+    llm_project_max_queued: int = 100
+    llm_project_daily_token_budget: int | None = None
+    llm_project_weights: dict[str, float] = {}
 
     jwt_secret_key: str | None = None
     jwt_algorithm: str = "HS256"
@@ -41,6 +64,19 @@ class AppSettings(BaseSettings):
     smtp_password: str | None = None
     smtp_from_email: str | None = None
     smtp_use_tls: bool = True
+    smtp_pool_size: int = 4
+    smtp_pool_idle_seconds: float = 30.0
+
+    email_outbox_batch_size: int = 50
+    email_outbox_max_attempts: int = 8
+    email_outbox_poll_seconds: float = 1.0
+
+    daily_report_page_size: int = 500
+    daily_report_concurrency: int = 8
+
+    deadline_warning_lookahead_days: int = 14
+    deadline_warning_page_size: int = 1000
+    deadline_warning_concurrency: int = 8
 
     encryption_key: str | None = None
     redis_url: str | None = None
@@ -58,6 +94,15 @@ class AppSettings(BaseSettings):
     auth_refresh_window_seconds: int = 300
     auth_revoke_limit: int = 30
     auth_revoke_window_seconds: int = 300
+    api_user_rate_limit: int = 600
+    api_user_rate_window_seconds: int = 60
+    api_project_rate_limit: int = 1200
+    api_project_rate_window_seconds: int = 60
+    auth_token_cache_size: int = 10000
+    auth_revocation_sync_seconds: float = 5.0
+    project_access_cache_ttl_seconds: int = 30
+    toast_queue_size: int = 16
+    toast_heartbeat_seconds: float = 15.0
 
 
 @lru_cache(maxsize=1)
@@ -1,6 +1,7 @@
 """Domain entities for Orchestra Planner."""
 
 from .project import Project
+from .project_access import ProjectAccess
 from .project_config import ProjectConfig, WorkloadThresholds
 from .project_invite import INVITE_EXPIRATION_DAYS, InviteStatus, ProjectInvite
 from .calendar import Calendar, ExclusionDate
@@ -8,7 +9,11 @@ from .project_member import ProjectMember
 from .role import Role
 from .seniority_level import SeniorityLevel
 from .task import VALID_STATUS_TRANSITIONS, Task, TaskStatus
-from .task_dependency import TaskDependency, detect_circular_dependency
+from .task_dependency import (
+    TaskDependency,
+    detect_circular_dependency,
+    find_circular_dependency,
+)
 from .task_log import TaskLog, TaskLogType
 from .user import MAGIC_LINK_EXPIRATION_MINUTES, User
 from .workload import DEFAULT_BASE_CAPACITY, Workload, WorkloadStatus
@@ -20,6 +25,7 @@ __all__ = [
     "MAGIC_LINK_EXPIRATION_MINUTES",
     # Project
     "Project",
+    "ProjectAccess",
     "ProjectConfig",
     "Calendar",
     "ExclusionDate",
@@ -36,6 +42,7 @@ __all__ = [
     "VALID_STATUS_TRANSITIONS",
     "TaskDependency",
     "detect_circular_dependency",
+    "find_circular_dependency",
     "TaskLog",
     "TaskLogType",
     # Workload
@@ -0,0 +1,68 @@
+"""ProjectAccess value object definition."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+from uuid import UUID
+
+from .seniority_level import SeniorityLevel
+
+if TYPE_CHECKING:
+    from .project import Project
+    from .project_member import ProjectMember
+
+
+@dataclass(frozen=True)
+class ProjectAccess:
+    """
+    What a User may do in a Project: manage it, work in it, or nothing.
+
+    Membership fields are None when the User is not an Employee of the
+    Project. A Manager is never required to be an Employee (BR-PROJ-001).
+    """
+
+    project_id: UUID
+    user_id: UUID
+    is_manager: bool
+    member_id: UUID | None = None
+    role_id: UUID | None = None
+    seniority_level: SeniorityLevel | None = None
+
+    @property
+    def is_member(self) -> bool:
+        """True if the User is an Employee of the Project."""
+        return self.member_id is not None
+
+    @property
+    def can_view(self) -> bool:
+        """True if the User manages or belongs to the Project."""
+        return self.is_manager or self.is_member
+
+    @classmethod
+    def of(
+        cls,
+        project: Project,
+        user_id: UUID,
+        member: ProjectMember | None = None,
+    ) -> ProjectAccess:
+        """Build the access of `user_id` from a loaded project and membership."""
+        if member is not None:
+            return cls.of_member(member, is_manager=project.is_manager(user_id))
+        return cls(
+            project_id=project.id,
+            user_id=user_id,
+            is_manager=project.is_manager(user_id),
+        )
+
+    @classmethod
+    def of_member(cls, member: ProjectMember, is_manager: bool = False) -> ProjectAccess:
+        """Build the access granted by a membership."""
+        return cls(
+            project_id=member.project_id,
+            user_id=member.user_id,
+            is_manager=is_manager,
+            member_id=member.id,
+            role_id=member.role_id,
+            seniority_level=member.seniority_level,
+        )
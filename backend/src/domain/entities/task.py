@@ -5,6 +5,13 @@ from datetime import datetime
 from enum import Enum
 from uuid import UUID, uuid4
 
+from backend.src.domain.events import (
+    DomainEvent,
+    TaskAbandoned,
+    TaskCompleted,
+    TaskDifficultyChanged,
+    TaskSelected,
+)
 from backend.src.domain.time import utcnow
 
 
@@ -60,6 +67,10 @@ class Task:
     actual_end_date: datetime | None = field(default=None)
     created_at: datetime = field(default_factory=utcnow)
     updated_at: datetime = field(default_factory=utcnow)
+    # Recorded by state changes, drained by the use case after commit.
+    _events: list[DomainEvent] = field(
+        default_factory=list, init=False, repr=False, compare=False
+    )
 
     def __post_init__(self) -> None:
         """Validate task attributes."""
@@ -83,6 +94,11 @@ class Task:
         """Update the updated_at timestamp."""
         self.updated_at = utcnow()
 
+    def pull_events(self) -> list[DomainEvent]:
+        """Return and forget the events recorded since the last pull."""
+        events, self._events = self._events, []
+        return events
+
     def can_transition_to(self, new_status: TaskStatus) -> bool:
         """Check if transition to new status is valid per BR-TASK-003."""
         return new_status in VALID_STATUS_TRANSITIONS.get(self.status, set())
@@ -126,6 +142,7 @@ class Task:
 
         self.transition_to(TaskStatus.DOING)
         self.assignee_id = assignee_id
+        self._events.append(TaskSelected(self.id, self.project_id, assignee_id))
 
     def abandon(self) -> None:
         """
@@ -136,14 +153,21 @@ class Task:
         if self.status != TaskStatus.DOING:
             raise ValueError("Can only abandon tasks that are in progress")
 
+        assignee_id = self.assignee_id
         self.transition_to(TaskStatus.TODO)
         self.assignee_id = None
+        if assignee_id is not None:
+            self._events.append(TaskAbandoned(self.id, self.project_id, assignee_id))
 
     def complete(self) -> None:
         """Complete the task."""
         if self.status != TaskStatus.DOING:
             raise ValueError("Can only complete tasks that are in progress")
         self.transition_to(TaskStatus.DONE)
+        if self.assignee_id is not None:
+            self._events.append(
+                TaskCompleted(self.id, self.project_id, self.assignee_id)
+            )
 
     def block(self) -> None:
         """Block the task (due to dependency issues)."""
@@ -167,8 +191,19 @@ class Task:
         """Set the difficulty points for the task."""
         if points < 0:
             raise ValueError("Difficulty points cannot be negative")
-        self.difficulty_points = points
+        old_points, self.difficulty_points = self.difficulty_points, points
         self._update_timestamp()
+        # Only Doing tasks count toward Workload (BR-WORK-001).
+        if (
+            old_points != points
+            and self.status == TaskStatus.DOING
+            and self.assignee_id is not None
+        ):
+            self._events.append(
+                TaskDifficultyChanged(
+                    self.id, self.project_id, self.assignee_id, old_points, points
+                )
+            )
 
     def update_progress(self, percent: int) -> None:
         """Update task progress (0-100)."""
@@ -2,6 +2,7 @@
 
 from dataclasses import dataclass, field
 from datetime import datetime
+from typing import Iterable
 from uuid import UUID
 
 from backend.src.domain.time import utcnow
@@ -52,8 +53,6 @@ def detect_circular_dependency(
 
     BR-DEP-002: Circular dependencies are strictly prohibited.
 
-    Uses DFS to detect cycles in the dependency graph.
-
     Args:
         new_dependency: The new dependency to add.
         existing_dependencies: List of existing dependencies.
@@ -61,47 +60,57 @@ def detect_circular_dependency(
     Returns:
         True if a cycle would be created, False otherwise.
     """
-    # Build adjacency list (blocking_task -> list of blocked_tasks)
-    graph: dict[UUID, list[UUID]] = {}
-    for dep in existing_dependencies:
-        if dep.blocking_task_id not in graph:
-            graph[dep.blocking_task_id] = []
-        graph[dep.blocking_task_id].append(dep.blocked_task_id)
-
-    # Add the new dependency to the graph
-    if new_dependency.blocking_task_id not in graph:
-        graph[new_dependency.blocking_task_id] = []
-    graph[new_dependency.blocking_task_id].append(new_dependency.blocked_task_id)
-
-    # DFS to detect cycle starting from the blocked task of new dependency
-    # We need to check if we can reach the blocking task from the blocked task
-    visited: set[UUID] = set()
-    stack: set[UUID] = set()
-
-    def has_cycle(node: UUID) -> bool:
-        if node in stack:
-            return True
-        if node in visited:
-            return False
+    return find_circular_dependency([*existing_dependencies, new_dependency]) is not None
 
-        visited.add(node)
-        stack.add(node)
 
-        for neighbor in graph.get(node, []):
-            if has_cycle(neighbor):
-                return True
+def find_circular_dependency(
+    dependencies: Iterable[TaskDependency],
+) -> TaskDependency | None:
+    """
+    Find a dependency that lies on a cycle of the given dependency graph.
 
-        stack.remove(node)
-        return False
+    BR-DEP-002: Circular dependencies are strictly prohibited.
 
-    # Check all nodes for cycles
-    all_nodes = set(graph.keys())
-    for deps in graph.values():
-        all_nodes.update(deps)
+    Uses Kahn's algorithm, so a whole graph is validated in O(V + E) without
+    recursion (deep chains from bulk imports cannot exhaust the stack).
 
-    for node in all_nodes:
-        if node not in visited:
-            if has_cycle(node):
-                return True
+    Args:
+        dependencies: Every dependency of the graph to validate.
 
-    return False
+    Returns:
+        A dependency that is part of a cycle, or None if the graph is acyclic.
+    """
+    successors: dict[UUID, list[UUID]] = {}
+    in_degree: dict[UUID, int] = {}
+    edges = list(dependencies)
+    for dep in edges:
+        successors.setdefault(dep.blocking_task_id, []).append(dep.blocked_task_id)
+        in_degree.setdefault(dep.blocking_task_id, 0)
+        in_degree[dep.blocked_task_id] = in_degree.get(dep.blocked_task_id, 0) + 1
+
+    ready = [node for node, degree in in_degree.items() if degree == 0]
+    while ready:
+        node = ready.pop()
+        for successor in successors.get(node, []):
+            in_degree[successor] -= 1
+            if in_degree[successor] == 0:
+                ready.append(successor)
+
+    # Nodes left with incoming edges are on a cycle or downstream of one.
+    # Every such node has a remaining predecessor, so walking predecessors
+    # must eventually revisit a node, which is then on a cycle.
+    remaining = {node for node, degree in in_degree.items() if degree > 0}
+    if not remaining:
+        return None
+
+    incoming: dict[UUID, TaskDependency] = {}
+    for dep in edges:
+        if dep.blocking_task_id in remaining and dep.blocked_task_id in remaining:
+            incoming[dep.blocked_task_id] = dep
+
+    node = next(iter(remaining))
+    visited: set[UUID] = set()
+    while node not in visited:
+        visited.add(node)
+        node = incoming[node].blocking_task_id
+    return incoming[node]
@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from datetime import date, datetime, timezone
+from datetime import date, datetime, time, timedelta, timezone
 from zoneinfo import ZoneInfo
 
 from backend.src.domain.entities.calendar import Calendar
@@ -29,6 +29,23 @@ class WorkingCalendar:
             return False
         return local_date.weekday() in self.working_weekdays
 
+    def deadline_warning_at(self, deadline: datetime) -> datetime:
+        """
+        Return when the deadline warning for `deadline` is due (UC-084).
+
+        The warning goes out at the start of the last working day before the
+        deadline's local date, which is the previous day unless that falls on
+        a non-working day (BR-NOTIF-004).
+        """
+        day = self._local_date(deadline)
+        for _ in range(366):
+            day -= timedelta(days=1)
+            if day in self.exclusion_dates or day.weekday() not in self.working_weekdays:
+                continue
+            start = datetime.combine(day, time.min, tzinfo=ZoneInfo(self.timezone))
+            return start.astimezone(timezone.utc)
+        raise ValueError("Working calendar has no working day in the past year")
+
     def _local_date(self, dt: datetime) -> date:
         if dt.tzinfo is None:
             dt = dt.replace(tzinfo=timezone.utc)
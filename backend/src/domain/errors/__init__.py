@@ -22,6 +22,7 @@ from backend.src.domain.errors.invite import (
 )
 from backend.src.domain.errors.llm import (
     LLMAPIKeyDecryptionError,
+    LLMBudgetExceededError,
     LLMError,
     LLMInvalidResponseError,
     LLMNotConfiguredError,
@@ -93,6 +94,7 @@ __all__ = [
     "LLMNotConfiguredError",
     "LLMProviderError",
     "LLMRateLimitError",
+    "LLMBudgetExceededError",
     "LLMInvalidResponseError",
     "LLMAPIKeyDecryptionError",
     # Notification
@@ -43,6 +43,19 @@ class LLMRateLimitError(LLMError):
         self.retry_after = retry_after
 
 
+class LLMBudgetExceededError(LLMError):
+    """Raised when a project has used up its daily LLM token budget."""
+
+    def __init__(self, project_id: str, budget: int):
+        super().__init__(
+            f"Daily LLM token budget of {budget} exhausted for project: "
+            f"{project_id}",
+            status=429,
+        )
+        self.project_id = project_id
+        self.budget = budget
+
+
 class LLMInvalidResponseError(LLMError):
     """Raised when LLM response cannot be parsed."""
 
@@ -0,0 +1,52 @@
+"""Domain events raised by entities and published after commit.
+
+Entities record events as their state changes; use cases publish them once
+the unit of work has committed, so handlers only ever see durable changes.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from uuid import UUID
+
+
+@dataclass(frozen=True)
+class DomainEvent:
+    """Base class for everything the domain announces."""
+
+
+@dataclass(frozen=True)
+class TaskWorkloadEvent(DomainEvent):
+    """
+    A Task change that may move its assignee's Workload (BR-WORK-001).
+
+    `member_id` is the ProjectMember whose Doing tasks changed, captured
+    before the Task was unassigned.
+    """
+
+    task_id: UUID
+    project_id: UUID
+    member_id: UUID
+
+
+@dataclass(frozen=True)
+class TaskSelected(TaskWorkloadEvent):
+    """An Employee moved a Task into Doing."""
+
+
+@dataclass(frozen=True)
+class TaskCompleted(TaskWorkloadEvent):
+    """A Doing Task was finished."""
+
+
+@dataclass(frozen=True)
+class TaskAbandoned(TaskWorkloadEvent):
+    """A Doing Task went back to Todo and lost its assignee."""
+
+
+@dataclass(frozen=True)
+class TaskDifficultyChanged(TaskWorkloadEvent):
+    """The difficulty of a Doing Task changed."""
+
+    old_points: int | None
+    new_points: int
@@ -7,28 +7,44 @@ requirements from the outside world.
 """
 
 from backend.src.domain.ports.repositories import (
+    DeadlineWarningRepository,
+    EmailOutboxRepository,
+    LLMUsageRepository,
+    OutboxEmail,
     ProjectInviteRepository,
     ProjectMemberRepository,
     ProjectRepository,
+    ReportRepository,
     RoleRepository,
     TaskDependencyRepository,
     TaskLogRepository,
+    TaskProgressRepository,
     TaskRepository,
     UserRepository,
+    WorkloadAlertRepository,
 )
 from backend.src.domain.ports.services import (
     DailyReportData,
     DifficultyEstimation,
+    DifficultyEstimationRequest,
     EmailMessage,
     EmailService,
     EncryptionService,
+    EventPublisher,
+    LLMResultCache,
     LLMService,
+    LLMServiceResolver,
     NewTaskToastData,
     NotificationService,
     ProgressEstimation,
+    ProjectAccessCache,
+    RateLimitAlgorithm,
     RateLimitResult,
     RateLimiter,
     RevokedTokenStore,
+    SimilarTask,
+    SimilarTaskIndex,
+    ToastPublisher,
     TokenPair,
     TokenService,
     WorkloadAlertData,
@@ -39,28 +55,44 @@ __all__ = [
     # Unit of Work
     "UnitOfWork",
     # Repositories
+    "DeadlineWarningRepository",
+    "EmailOutboxRepository",
+    "LLMUsageRepository",
+    "OutboxEmail",
     "ProjectInviteRepository",
     "ProjectMemberRepository",
     "ProjectRepository",
+    "ReportRepository",
     "RoleRepository",
     "TaskDependencyRepository",
     "TaskLogRepository",
+    "TaskProgressRepository",
     "TaskRepository",
     "UserRepository",
+    "WorkloadAlertRepository",
     # Services
     "EmailService",
     "EmailMessage",
     "EncryptionService",
+    "EventPublisher",
     "TokenService",
     "TokenPair",
     "RevokedTokenStore",
+    "ProjectAccessCache",
+    "RateLimitAlgorithm",
     "RateLimiter",
     "RateLimitResult",
     "LLMService",
+    "LLMResultCache",
+    "LLMServiceResolver",
     "DifficultyEstimation",
+    "DifficultyEstimationRequest",
     "ProgressEstimation",
+    "SimilarTask",
+    "SimilarTaskIndex",
     "NotificationService",
     "DailyReportData",
     "WorkloadAlertData",
     "NewTaskToastData",
+    "ToastPublisher",
 ]
@@ -1,5 +1,18 @@
 """Repository port interfaces."""
 
+from backend.src.domain.ports.repositories.deadline_warning_repository import (
+    DeadlineCandidate,
+    DeadlineWarningRepository,
+    DueDeadlineWarning,
+    ScheduledDeadlineWarning,
+)
+from backend.src.domain.ports.repositories.email_outbox_repository import (
+    EmailOutboxRepository,
+    OutboxEmail,
+)
+from backend.src.domain.ports.repositories.llm_usage_repository import (
+    LLMUsageRepository,
+)
 from backend.src.domain.ports.repositories.project_invite_repository import (
     ProjectInviteRepository,
 )
@@ -8,22 +21,51 @@ from backend.src.domain.ports.repositories.project_member_repository import (
 )
 from backend.src.domain.ports.repositories.project_repository import ProjectRepository
 from backend.src.domain.ports.repositories.calendar_repository import CalendarRepository
+from backend.src.domain.ports.repositories.report_repository import (
+    MemberWorkloadPoints,
+    ProjectTaskCounts,
+    ReportProject,
+    ReportRepository,
+)
 from backend.src.domain.ports.repositories.role_repository import RoleRepository
 from backend.src.domain.ports.repositories.task_dependency_repository import (
     TaskDependencyRepository,
 )
 from backend.src.domain.ports.repositories.task_log_repository import TaskLogRepository
+from backend.src.domain.ports.repositories.task_progress_repository import (
+    TaskProgressRepository,
+    TaskProgressState,
+)
 from backend.src.domain.ports.repositories.task_repository import TaskRepository
 from backend.src.domain.ports.repositories.user_repository import UserRepository
+from backend.src.domain.ports.repositories.workload_alert_repository import (
+    MemberWorkloadState,
+    WorkloadAlertRepository,
+)
 
 __all__ = [
+    "DeadlineCandidate",
+    "DeadlineWarningRepository",
+    "DueDeadlineWarning",
+    "ScheduledDeadlineWarning",
+    "EmailOutboxRepository",
+    "OutboxEmail",
+    "LLMUsageRepository",
     "ProjectInviteRepository",
     "ProjectMemberRepository",
     "ProjectRepository",
     "CalendarRepository",
+    "MemberWorkloadPoints",
+    "ProjectTaskCounts",
+    "ReportProject",
+    "ReportRepository",
     "RoleRepository",
     "TaskDependencyRepository",
     "TaskLogRepository",
+    "TaskProgressRepository",
+    "TaskProgressState",
     "TaskRepository",
     "UserRepository",
+    "MemberWorkloadState",
+    "WorkloadAlertRepository",
 ]
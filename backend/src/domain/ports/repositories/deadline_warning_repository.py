@@ -0,0 +1,89 @@
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Optional, Protocol, Sequence
+from uuid import UUID
+
+from backend.src.domain.entities import WorkingCalendar
+
+
+@dataclass(frozen=True)
+class DeadlineCandidate:
+    """A non-Done, assigned Task with a deadline, as found by a scan."""
+
+    task_id: UUID
+    deadline: datetime
+    calendar: WorkingCalendar
+    # Sort key of the scan that found it, for keyset paging.
+    cursor: datetime
+
+
+@dataclass(frozen=True)
+class ScheduledDeadlineWarning:
+    """When the UC-084 warning for one Task deadline becomes due."""
+
+    task_id: UUID
+    deadline: datetime
+    warn_at: datetime
+
+
+@dataclass(frozen=True)
+class DueDeadlineWarning:
+    """A due warning whose Task is still open and still has that deadline."""
+
+    task_id: UUID
+    deadline: datetime
+    task_title: str
+    assignee_email: str
+
+
+class DeadlineWarningRepository(Protocol):
+    """Port for the incremental deadline warning scanner (UC-084).
+
+    Scans read tasks through indexed ranges only; scheduled warnings are
+    keyed by (task, deadline), so a deadline is warned about at most once.
+    """
+
+    async def get_watermark(self, name: str) -> Optional[datetime]: ...
+
+    async def set_watermark(self, name: str, value: datetime) -> None: ...
+
+    async def find_by_deadline(
+        self,
+        start: datetime,
+        end: datetime,
+        *,
+        after: Optional[tuple[datetime, UUID]],
+        limit: int,
+    ) -> list[DeadlineCandidate]:
+        """Page through tasks with start < deadline <= end, by deadline."""
+        ...
+
+    async def find_changed(
+        self,
+        since: datetime,
+        deadline_start: datetime,
+        deadline_end: datetime,
+        *,
+        after: Optional[tuple[datetime, UUID]],
+        limit: int,
+    ) -> list[DeadlineCandidate]:
+        """Page through tasks updated after `since` with a deadline in range."""
+        ...
+
+    async def schedule(self, warnings: Sequence[ScheduledDeadlineWarning]) -> None:
+        """Store warnings, ignoring (task, deadline) pairs already stored."""
+        ...
+
+    async def list_due(
+        self, now: datetime, *, after: Optional[UUID], limit: int
+    ) -> list[DueDeadlineWarning]:
+        """Page through unsent warnings due at `now`, by task id."""
+        ...
+
+    async def mark_sent(
+        self, warnings: Sequence[DueDeadlineWarning], sent_at: datetime
+    ) -> None: ...
+
+    async def prune(self, before: datetime) -> int:
+        """Delete warnings for deadlines before `before`; return the count."""
+        ...
@@ -0,0 +1,42 @@
+from dataclasses import dataclass
+from typing import Protocol, Sequence
+from uuid import UUID
+
+from backend.src.domain.ports.services.email_service import EmailMessage
+
+
+@dataclass(frozen=True)
+class OutboxEmail:
+    """An email waiting in the outbox, as claimed by a dispatcher."""
+
+    id: UUID
+    message: EmailMessage
+    attempts: int
+
+
+class EmailOutboxRepository(Protocol):
+    """Port for the transactional email outbox.
+
+    Emails are added in the same transaction as the change that caused them,
+    so they are sent if and only if that change commits.
+    """
+
+    async def add(self, message: EmailMessage) -> UUID: ...
+
+    async def claim_due(self, limit: int, lease_seconds: float) -> list[OutboxEmail]:
+        """Lease up to `limit` due emails, counting the attempt.
+
+        A claimed email is not handed out again until the lease expires, so a
+        dispatcher that dies mid-send only delays it.
+        """
+        ...
+
+    async def mark_sent(self, email_ids: Sequence[UUID]) -> None: ...
+
+    async def retry_later(
+        self, email_id: UUID, delay_seconds: float, error: str
+    ) -> None: ...
+
+    async def mark_failed(self, email_id: UUID, error: str) -> None:
+        """Give up on an email; it stays in the outbox for inspection."""
+        ...
@@ -0,0 +1,15 @@
+from datetime import date
+from typing import Protocol
+from uuid import UUID
+
+
+class LLMUsageRepository(Protocol):
+    """Port for per-project daily LLM token accounting."""
+
+    async def get_tokens(self, project_id: UUID, day: date) -> int:
+        """Tokens the project has used on `day` (0 if none recorded)."""
+        ...
+
+    async def add(self, project_id: UUID, day: date, tokens: int) -> int:
+        """Record one request of `tokens`; returns the day's new total."""
+        ...
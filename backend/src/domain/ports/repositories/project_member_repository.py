@@ -21,6 +21,12 @@ class ProjectMemberRepository(Protocol):
         self, project_id: UUID, user_id: UUID
     ) -> Optional[ProjectMember]: ...
 
+    async def find_user_ids_by_role(
+        self, project_id: UUID, role_id: Optional[UUID]
+    ) -> list[UUID]:
+        """User IDs of the project's members with the role, or of all if None."""
+        ...
+
     async def save(self, project_member: ProjectMember) -> ProjectMember: ...
 
     async def delete(self, project_member_id: UUID) -> None: ...
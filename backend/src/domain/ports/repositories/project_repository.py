@@ -1,7 +1,7 @@
 from typing import Optional, Protocol
 from uuid import UUID
 
-from backend.src.domain.entities import Project
+from backend.src.domain.entities import Project, ProjectAccess
 
 
 class ProjectRepository(Protocol):
@@ -9,6 +9,14 @@ class ProjectRepository(Protocol):
 
     async def find_by_id(self, project_id: UUID) -> Optional[Project]: ...
 
+    # Version of a project the user manages or belongs to; None otherwise.
+    async def find_version(self, project_id: UUID, user_id: UUID) -> Optional[int]: ...
+
+    # Manager flag and membership of the user in one lookup; None if no project.
+    async def find_access(
+        self, project_id: UUID, user_id: UUID
+    ) -> Optional[ProjectAccess]: ...
+
     async def list_by_user(
         self, user_id: UUID, *, limit: int, offset: int
     ) -> list[Project]: ...
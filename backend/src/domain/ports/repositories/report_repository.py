@@ -0,0 +1,63 @@
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Optional, Protocol, Sequence
+from uuid import UUID
+
+from backend.src.domain.entities import SeniorityLevel, WorkingCalendar
+
+
+@dataclass(frozen=True)
+class ReportProject:
+    """A project to report on, with its manager and working calendar."""
+
+    project_id: UUID
+    project_name: str
+    manager_email: str
+    calendar: WorkingCalendar
+
+
+@dataclass(frozen=True)
+class ProjectTaskCounts:
+    """Task counters for a project's daily report (UC-080)."""
+
+    total_tasks: int = 0
+    completed_today: int = 0
+    blocked_tasks: int = 0
+    delayed_tasks: int = 0
+
+
+@dataclass(frozen=True)
+class MemberWorkloadPoints:
+    """Sum of difficulty of an Employee's Doing tasks (BR-WORK-001)."""
+
+    project_id: UUID
+    member_name: str
+    seniority_level: SeniorityLevel
+    doing_points: int
+
+
+class ReportRepository(Protocol):
+    """Port for set-based reads behind scheduled notifications.
+
+    Every method covers many projects per query, so a job's cost grows with
+    the number of pages, not the number of projects.
+    """
+
+    async def list_projects(
+        self, *, after: Optional[UUID], limit: int
+    ) -> list[ReportProject]:
+        """Page through all projects in id order, starting after `after`."""
+        ...
+
+    async def count_tasks_by_project(
+        self, project_ids: Sequence[UUID], now: datetime
+    ) -> dict[UUID, ProjectTaskCounts]:
+        """Count tasks per project; "today" is the project's local date at `now`.
+
+        Projects without tasks are absent from the result.
+        """
+        ...
+
+    async def list_member_workloads(
+        self, project_ids: Sequence[UUID]
+    ) -> list[MemberWorkloadPoints]: ...
@@ -1,3 +1,4 @@
+from collections.abc import Iterable
 from typing import Optional, Protocol
 from uuid import UUID
 
@@ -9,6 +10,8 @@ class RoleRepository(Protocol):
 
     async def find_by_id(self, role_id: UUID) -> Optional[Role]: ...
 
+    async def find_by_ids(self, role_ids: Iterable[UUID]) -> list[Role]: ...
+
     async def save(self, role: Role) -> Role: ...
 
     async def delete(self, role_id: UUID) -> None: ...
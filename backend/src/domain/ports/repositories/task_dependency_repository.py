@@ -1,4 +1,4 @@
-from typing import Optional, Protocol
+from typing import AsyncIterator, Optional, Protocol
 from uuid import UUID
 
 from backend.src.domain.entities import TaskDependency
@@ -9,6 +9,10 @@ class TaskDependencyRepository(Protocol):
 
     async def save(self, task_dependency: TaskDependency) -> TaskDependency: ...
 
+    async def insert_many(
+        self, task_dependencies: list[TaskDependency]
+    ) -> list[TaskDependency]: ...
+
     async def find_by_id(self, dependency_id: UUID) -> Optional[TaskDependency]: ...
 
     async def find_by_project(self, project_id: UUID) -> list[TaskDependency]: ...
@@ -19,6 +23,8 @@ class TaskDependencyRepository(Protocol):
 
     async def count_by_project(self, project_id: UUID) -> int: ...
 
+    def stream_by_project(self, project_id: UUID) -> AsyncIterator[TaskDependency]: ...
+
     async def find_by_tasks(
         self, blocking_task_id: UUID, blocked_task_id: UUID
     ) -> Optional[TaskDependency]: ...
@@ -1,4 +1,5 @@
-from typing import Protocol
+from datetime import datetime
+from typing import AsyncIterator, Optional, Protocol
 from uuid import UUID
 
 from backend.src.domain.entities import TaskLog
@@ -21,4 +22,12 @@ class TaskLogRepository(Protocol):
 
     async def count_by_task(self, task_id: UUID) -> int: ...
 
+    async def find_reports_after(
+        self, task_id: UUID, after: Optional[tuple[datetime, UUID]] = None
+    ) -> list[TaskLog]:
+        """Reports filed after the (created_at, id) watermark, oldest first."""
+        ...
+
+    def stream_by_project(self, project_id: UUID) -> AsyncIterator[TaskLog]: ...
+
     async def find_by_author(self, author_id: UUID) -> list[TaskLog]: ...
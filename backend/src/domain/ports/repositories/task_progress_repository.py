@@ -0,0 +1,34 @@
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Optional, Protocol
+from uuid import UUID
+
+
+@dataclass(frozen=True)
+class TaskProgressState:
+    """A task's last LLM progress estimate and the newest report it covered.
+
+    `summary` is the rolling digest of every report up to the watermark
+    (`last_report_at`, `last_report_id`), so later estimates only need the
+    reports filed after it.
+    """
+
+    task_id: UUID
+    percentage: int
+    confidence: float
+    reasoning: str
+    summary: str
+    last_report_at: datetime
+    last_report_id: UUID
+
+
+class TaskProgressRepository(Protocol):
+    """Port for incremental LLM progress estimation (UC-043)."""
+
+    async def get(self, task_id: UUID) -> Optional[TaskProgressState]:
+        """Return the task's last estimate, if any."""
+        ...
+
+    async def save(self, state: TaskProgressState) -> bool:
+        """Store the estimate; False if one covering later reports is stored."""
+        ...
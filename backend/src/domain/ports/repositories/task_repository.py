@@ -1,4 +1,5 @@
-from typing import Optional, Protocol
+from datetime import datetime
+from typing import AsyncIterator, Optional, Protocol
 from uuid import UUID
 
 from backend.src.domain.entities import Task
@@ -13,14 +14,24 @@ class TaskRepository(Protocol):
 
     async def find_by_assignee(self, assignee_id: UUID) -> list[Task]: ...
 
+    async def find_recently_completed(
+        self, limit: int, completed_after: Optional[datetime] = None
+    ) -> list[Task]:
+        """Done tasks with a difficulty, most recently completed first."""
+        ...
+
     async def list_by_project(
         self, project_id: UUID, *, limit: int, offset: int
     ) -> list[Task]: ...
 
     async def count_by_project(self, project_id: UUID) -> int: ...
 
+    def stream_by_project(self, project_id: UUID) -> AsyncIterator[Task]: ...
+
     async def save(self, task: Task) -> Task: ...
 
     async def save_many(self, tasks: list[Task]) -> list[Task]: ...
 
+    async def insert_many(self, tasks: list[Task]) -> list[Task]: ...
+
     async def delete(self, task_id: UUID) -> None: ...
@@ -1,3 +1,4 @@
+from collections.abc import Iterable
 from typing import Optional, Protocol
 from uuid import UUID
 
@@ -11,6 +12,8 @@ class UserRepository(Protocol):
 
     async def find_by_id(self, user_id: UUID) -> Optional[User]: ...
 
+    async def find_by_ids(self, user_ids: Iterable[UUID]) -> list[User]: ...
+
     async def find_by_email(self, email: str) -> Optional[User]: ...
 
     async def find_by_magic_link_token_hash(
@@ -0,0 +1,42 @@
+from dataclasses import dataclass
+from typing import Optional, Protocol
+from uuid import UUID
+
+from backend.src.domain.entities import SeniorityLevel
+
+
+@dataclass(frozen=True)
+class MemberWorkloadState:
+    """One Employee's current Doing points and who to alert about them."""
+
+    project_id: UUID
+    project_name: str
+    manager_email: str
+    member_id: UUID
+    user_id: UUID
+    member_name: str
+    member_email: str
+    seniority_level: SeniorityLevel
+    doing_points: int
+
+
+class WorkloadAlertRepository(Protocol):
+    """Port for event-driven workload alerts (BR-NOTIF-002).
+
+    Reads cover a single member, and the alert flag is what keeps a member
+    who stays Impossible from being reported on every change.
+    """
+
+    async def get_member_workload(
+        self, member_id: UUID
+    ) -> Optional[MemberWorkloadState]:
+        """Sum the member's Doing points; None if the member is gone."""
+        ...
+
+    async def raise_alert(self, member_id: UUID) -> bool:
+        """Flag the member as alerted; False if the flag was already set."""
+        ...
+
+    async def clear_alert(self, member_id: UUID) -> bool:
+        """Re-arm alerts for the member; False if no flag was set."""
+        ...
@@ -2,19 +2,33 @@
 
 from backend.src.domain.ports.services.email_service import EmailMessage, EmailService
 from backend.src.domain.ports.services.encryption_service import EncryptionService
+from backend.src.domain.ports.services.event_publisher import EventPublisher
+from backend.src.domain.ports.services.llm_result_cache import LLMResultCache
 from backend.src.domain.ports.services.llm_service import (
     DifficultyEstimation,
+    DifficultyEstimationRequest,
     LLMService,
     ProgressEstimation,
 )
+from backend.src.domain.ports.services.llm_service_resolver import LLMServiceResolver
 from backend.src.domain.ports.services.notification_service import (
     DailyReportData,
     NewTaskToastData,
     NotificationService,
     WorkloadAlertData,
 )
-from backend.src.domain.ports.services.rate_limiter import RateLimitResult, RateLimiter
+from backend.src.domain.ports.services.project_access_cache import ProjectAccessCache
+from backend.src.domain.ports.services.rate_limiter import (
+    RateLimitAlgorithm,
+    RateLimitResult,
+    RateLimiter,
+)
 from backend.src.domain.ports.services.revoked_token_store import RevokedTokenStore
+from backend.src.domain.ports.services.similar_task_index import (
+    SimilarTask,
+    SimilarTaskIndex,
+)
+from backend.src.domain.ports.services.toast_publisher import ToastPublisher
 from backend.src.domain.ports.services.token_service import TokenPair, TokenService
 from backend.src.domain.ports.services.time_provider import TimeProvider
 
@@ -22,17 +36,26 @@ __all__ = [
     "EmailService",
     "EmailMessage",
     "EncryptionService",
+    "EventPublisher",
     "TokenService",
     "TokenPair",
     "LLMService",
+    "LLMResultCache",
+    "LLMServiceResolver",
     "DifficultyEstimation",
+    "DifficultyEstimationRequest",
     "ProgressEstimation",
+    "SimilarTask",
+    "SimilarTaskIndex",
     "NotificationService",
     "DailyReportData",
     "WorkloadAlertData",
     "NewTaskToastData",
+    "ToastPublisher",
     "TimeProvider",
     "RevokedTokenStore",
+    "ProjectAccessCache",
+    "RateLimitAlgorithm",
     "RateLimiter",
     "RateLimitResult",
 ]
@@ -1,5 +1,5 @@
 from dataclasses import dataclass
-from typing import List, Optional, Protocol
+from typing import List, Optional, Protocol, Sequence
 
 
 @dataclass
@@ -18,3 +18,9 @@ class EmailService(Protocol):
     """Port for email sending operations."""
 
     async def send_email(self, message: EmailMessage) -> None: ...
+
+    async def send_many(
+        self, messages: Sequence[EmailMessage]
+    ) -> List[Optional[BaseException]]:
+        """Send several messages; one result per message, None if it was sent."""
+        ...
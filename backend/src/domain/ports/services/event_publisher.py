@@ -0,0 +1,16 @@
+"""Port for publishing domain events after a unit of work commits."""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+from typing import Protocol
+
+from backend.src.domain.events import DomainEvent
+
+
+class EventPublisher(Protocol):
+    """Hands committed domain events to their handlers."""
+
+    async def publish(self, events: Sequence[DomainEvent]) -> None:
+        """Deliver events in order; handler failures must not propagate."""
+        ...
@@ -0,0 +1,17 @@
+"""Port for sharing LLM estimation results between workers."""
+
+from __future__ import annotations
+
+from typing import Protocol
+
+
+class LLMResultCache(Protocol):
+    """Shared store of serialized estimations, keyed by content hash."""
+
+    async def get(self, key: str) -> str | None:
+        """Return the stored value, or None on a miss or store failure."""
+        ...
+
+    async def set(self, key: str, value: str, ttl_seconds: int) -> None:
+        """Store `value` for `ttl_seconds`; failures are not raised."""
+        ...
@@ -1,5 +1,6 @@
 """LLM service port (BR-LLM-003)."""
 
+from collections.abc import AsyncIterator, Sequence
 from dataclasses import dataclass
 from typing import Protocol
 
@@ -13,6 +14,14 @@ class DifficultyEstimation:
     reasoning: str  # Explanation for the estimate
 
 
+@dataclass(frozen=True)
+class DifficultyEstimationRequest:
+    """One task to estimate in a batch."""
+
+    task_title: str
+    task_description: str
+
+
 @dataclass(frozen=True)
 class ProgressEstimation:
     """Result of LLM progress estimation."""
@@ -20,6 +29,7 @@ class ProgressEstimation:
     percentage: int  # 0-100
     confidence: float  # 0.0 to 1.0
     reasoning: str  # Explanation for the estimate
+    summary: str = ""  # Rolling digest of every report seen so far
 
 
 class LLMService(Protocol):
@@ -57,11 +67,36 @@ class LLMService(Protocol):
         """
         ...
 
+    async def estimate_difficulty_batch(
+        self,
+        items: Sequence[DifficultyEstimationRequest],
+        project_context: str | None = None,
+    ) -> list[DifficultyEstimation | None]:
+        """
+        Estimate many tasks at once, sharing one project context.
+
+        BR-LLM-003: LLM can estimate Task Difficulty based on description.
+
+        Args:
+            items: Tasks to estimate.
+            project_context: Optional project context applied to every task.
+
+        Returns:
+            Estimations in the order of `items`; None for an item that could
+            not be estimated even on its own.
+
+        Raises:
+            LLMProviderError: If LLM provider returns an error.
+            LLMRateLimitError: If rate limit is exceeded.
+        """
+        ...
+
     async def estimate_progress(
         self,
         task_title: str,
         task_description: str,
         reports: list[str],
+        previous: ProgressEstimation | None = None,
     ) -> ProgressEstimation:
         """
         Calculate % progress based on textual reports.
@@ -71,10 +106,39 @@ class LLMService(Protocol):
         Args:
             task_title: The task title.
             task_description: Original task description.
-            reports: List of progress reports submitted by the employee.
+            reports: Progress reports submitted by the employee; with
+                `previous`, only those submitted since it.
+            previous: The last estimate, whose summary stands in for the
+                reports it covered.
 
         Returns:
-            ProgressEstimation with percentage, confidence, and reasoning.
+            ProgressEstimation with percentage, confidence, reasoning, and
+            a summary covering `previous` and `reports`.
+
+        Raises:
+            LLMProviderError: If LLM provider returns an error.
+            LLMRateLimitError: If rate limit is exceeded.
+            LLMInvalidResponseError: If response cannot be parsed.
+        """
+        ...
+
+    def estimate_progress_stream(
+        self,
+        task_title: str,
+        task_description: str,
+        reports: list[str],
+        previous: ProgressEstimation | None = None,
+    ) -> AsyncIterator[str | ProgressEstimation]:
+        """
+        Calculate % progress, streaming the reasoning as it is written.
+
+        BR-LLM-003: LLM can calculate % progress based on textual reports.
+
+        Takes the same arguments as `estimate_progress`.
+
+        Yields:
+            Pieces of the reasoning text as they arrive, then the validated
+            ProgressEstimation as the last item.
 
         Raises:
             LLMProviderError: If LLM provider returns an error.
@@ -0,0 +1,28 @@
+"""Port for choosing the LLM service that serves a project (ADR 009)."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Protocol
+from uuid import UUID
+
+from backend.src.domain.ports.services.llm_service import LLMService
+
+if TYPE_CHECKING:
+    from backend.src.domain.entities import Project
+
+
+class LLMServiceResolver(Protocol):
+    """Resolves a project's own provider and key, or the global house model."""
+
+    async def for_project(self, project: Project) -> LLMService:
+        """
+        Return the service for `project`'s LLM configuration.
+
+        Raises:
+            LLMAPIKeyDecryptionError: If the stored API key cannot be decrypted.
+        """
+        ...
+
+    def invalidate(self, project_id: UUID) -> None:
+        """Forget anything held for `project_id` after its key changed."""
+        ...
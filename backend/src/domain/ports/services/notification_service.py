@@ -117,7 +117,7 @@ class NotificationService(Protocol):
         matching their role is added.
 
         Args:
-            employee_ids: List of employee IDs to notify.
+            employee_ids: User IDs of the employees to notify.
             toast: New task notification data.
 
         Raises:
@@ -0,0 +1,20 @@
+"""Port for caching project access checks."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Protocol
+from uuid import UUID
+
+if TYPE_CHECKING:
+    # Entities import the time port from this package; avoid the cycle.
+    from backend.src.domain.entities import ProjectAccess
+
+
+class ProjectAccessCache(Protocol):
+    """Short-lived cache of (project, user) access, shared across workers."""
+
+    async def get(self, project_id: UUID, user_id: UUID) -> ProjectAccess | None: ...
+
+    async def set(self, access: ProjectAccess) -> None: ...
+
+    async def invalidate(self, project_id: UUID, user_id: UUID) -> None: ...
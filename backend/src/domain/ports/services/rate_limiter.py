@@ -3,9 +3,24 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from enum import Enum
 from typing import Protocol
 
 
+class RateLimitAlgorithm(str, Enum):
+    """
+    How a limiter counts hits.
+
+    SLIDING_WINDOW allows ``limit`` hits in any ``window_seconds`` span,
+    estimated from the current and previous fixed windows. TOKEN_BUCKET
+    allows bursts of up to ``limit`` hits, refilled at
+    ``limit / window_seconds`` per second.
+    """
+
+    SLIDING_WINDOW = "sliding_window"
+    TOKEN_BUCKET = "token_bucket"
+
+
 @dataclass(frozen=True)
 class RateLimitResult:
     """Result of a rate-limit check."""
@@ -16,6 +31,12 @@ class RateLimitResult:
 
 
 class RateLimiter(Protocol):
-    """Leaky/bucket-like limiter abstraction."""
-
-    async def hit(self, key: str, limit: int, window_seconds: int) -> RateLimitResult: ...
+    """Sliding-window/token-bucket limiter abstraction."""
+
+    async def hit(
+        self,
+        key: str,
+        limit: int,
+        window_seconds: int,
+        algorithm: RateLimitAlgorithm = RateLimitAlgorithm.SLIDING_WINDOW,
+    ) -> RateLimitResult: ...
@@ -0,0 +1,46 @@
+"""Port for finding completed tasks similar to a new one."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Protocol
+from uuid import UUID
+
+
+@dataclass(frozen=True)
+class SimilarTask:
+    """A completed task and how closely it matches the query (0.0 to 1.0)."""
+
+    task_id: UUID
+    difficulty_points: int
+    similarity: float
+
+
+class SimilarTaskIndex(Protocol):
+    """
+    Local index of completed tasks and their final difficulty.
+
+    Entries belong to a project and lookups only see their own project's
+    tasks, so one project's history never estimates another's.
+    """
+
+    def add(
+        self,
+        project_id: UUID,
+        task_id: UUID,
+        title: str,
+        description: str,
+        difficulty_points: int,
+    ) -> None:
+        """Index a completed task, replacing an earlier entry for it."""
+        ...
+
+    def remove(self, task_id: UUID) -> None:
+        """Drop a task from the index, if present."""
+        ...
+
+    def nearest(
+        self, project_id: UUID, title: str, description: str
+    ) -> SimilarTask | None:
+        """Return the project's closest indexed task, or None if it has none."""
+        ...
@@ -0,0 +1,17 @@
+"""Port for pushing in-app toasts to connected users."""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+from typing import Protocol
+from uuid import UUID
+
+from backend.src.domain.ports.services.notification_service import NewTaskToastData
+
+
+class ToastPublisher(Protocol):
+    """Delivers toasts to the open sessions of users, on any worker."""
+
+    async def publish(self, user_ids: Sequence[UUID], toast: NewTaskToastData) -> None:
+        """Deliver to whoever is connected now; offline users miss the toast."""
+        ...
@@ -6,14 +6,20 @@ from typing import Protocol
 
 from backend.src.domain.ports.repositories import (
     CalendarRepository,
+    DeadlineWarningRepository,
+    EmailOutboxRepository,
+    LLMUsageRepository,
     ProjectInviteRepository,
     ProjectMemberRepository,
     ProjectRepository,
+    ReportRepository,
     RoleRepository,
     TaskDependencyRepository,
     TaskLogRepository,
+    TaskProgressRepository,
     TaskRepository,
     UserRepository,
+    WorkloadAlertRepository,
 )
 
 
@@ -41,6 +47,12 @@ class UnitOfWork(Protocol):
     task_repository: TaskRepository
     task_dependency_repository: TaskDependencyRepository
     task_log_repository: TaskLogRepository
+    email_outbox_repository: EmailOutboxRepository
+    report_repository: ReportRepository
+    deadline_warning_repository: DeadlineWarningRepository
+    workload_alert_repository: WorkloadAlertRepository
+    task_progress_repository: TaskProgressRepository
+    llm_usage_repository: LLMUsageRepository
 
     async def __aenter__(self) -> UnitOfWork: ...
 
@@ -3,6 +3,7 @@
 from typing import Any
 
 __all__ = [
+    "ProjectAccessResolver",
     "ScheduleCalculator",
     "TaskSchedule",
     "FixedTimeProvider",
@@ -11,6 +12,12 @@ __all__ = [
 
 
 def __getattr__(name: str) -> Any:
+    if name == "ProjectAccessResolver":
+        from backend.src.domain.services.project_access_resolver import (
+            ProjectAccessResolver,
+        )
+
+        return ProjectAccessResolver
     if name in ("ScheduleCalculator", "TaskSchedule"):
         from backend.src.domain.services.schedule_calculator import (
             ScheduleCalculator,
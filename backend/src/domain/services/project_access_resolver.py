@@ -0,0 +1,87 @@
+"""Project access resolution shared by use cases and routers."""
+
+from uuid import UUID
+
+from backend.src.domain.entities import ProjectAccess
+from backend.src.domain.errors import (
+    ManagerRequiredError,
+    ProjectAccessDeniedError,
+    ProjectNotFoundError,
+)
+from backend.src.domain.ports.repositories import ProjectRepository
+from backend.src.domain.ports.services import ProjectAccessCache
+
+
+class ProjectAccessResolver:
+    """
+    Answers "may this user touch this project?" with one cached lookup.
+
+    Replaces loading the project and then the membership on every request.
+    Hits come from the optional short-TTL cache; misses run a single
+    repository query and are cached unless the project does not exist.
+    Use cases that change membership must call `invalidate` once their
+    transaction has committed.
+    """
+
+    def __init__(self, cache: ProjectAccessCache | None = None) -> None:
+        self.cache = cache
+
+    async def resolve(
+        self, projects: ProjectRepository, project_id: UUID, user_id: UUID
+    ) -> ProjectAccess:
+        """
+        Return the user's access to the project.
+
+        Raises:
+            ProjectNotFoundError: If the project doesn't exist.
+        """
+        if self.cache is not None:
+            access = await self.cache.get(project_id, user_id)
+            if access is not None:
+                return access
+
+        access = await projects.find_access(project_id, user_id)
+        if access is None:
+            raise ProjectNotFoundError(str(project_id))
+        if self.cache is not None:
+            await self.cache.set(access)
+        return access
+
+    async def require_access(
+        self, projects: ProjectRepository, project_id: UUID, user_id: UUID
+    ) -> ProjectAccess:
+        """
+        Return the access of a manager or member of the project.
+
+        Raises:
+            ProjectNotFoundError: If the project doesn't exist.
+            ProjectAccessDeniedError: If the user neither manages nor belongs to it.
+        """
+        access = await self.resolve(projects, project_id, user_id)
+        if not access.can_view:
+            raise ProjectAccessDeniedError(str(user_id), str(project_id))
+        return access
+
+    async def require_manager(
+        self,
+        projects: ProjectRepository,
+        project_id: UUID,
+        user_id: UUID,
+        operation: str,
+    ) -> ProjectAccess:
+        """
+        Return the access of the project manager.
+
+        Raises:
+            ProjectNotFoundError: If the project doesn't exist.
+            ManagerRequiredError: If the user is not the project manager.
+        """
+        access = await self.resolve(projects, project_id, user_id)
+        if not access.is_manager:
+            raise ManagerRequiredError(operation)
+        return access
+
+    async def invalidate(self, project_id: UUID, user_id: UUID) -> None:
+        """Drop any cached access of the user to the project."""
+        if self.cache is not None:
+            await self.cache.invalidate(project_id, user_id)
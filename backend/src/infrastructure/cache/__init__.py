@@ -1,9 +1,23 @@
 """Cache/Redis infrastructure adapters."""
 
 from backend.src.infrastructure.cache.redis_client import create_redis_client
+from backend.src.infrastructure.cache.redis_llm_result_cache import RedisLLMResultCache
+from backend.src.infrastructure.cache.redis_project_access_cache import (
+    RedisProjectAccessCache,
+)
 from backend.src.infrastructure.cache.redis_rate_limiter import RedisRateLimiter
 from backend.src.infrastructure.cache.redis_revoked_token_store import (
     RedisRevokedTokenStore,
+    SyncedRedisRevokedTokenStore,
 )
+from backend.src.infrastructure.cache.redis_toast_hub import RedisToastHub
 
-__all__ = ["create_redis_client", "RedisRateLimiter", "RedisRevokedTokenStore"]
+__all__ = [
+    "create_redis_client",
+    "RedisLLMResultCache",
+    "RedisProjectAccessCache",
+    "RedisRateLimiter",
+    "RedisRevokedTokenStore",
+    "RedisToastHub",
+    "SyncedRedisRevokedTokenStore",
+]
@@ -0,0 +1,39 @@
+"""Redis-backed cache of LLM estimation results."""
+
+from __future__ import annotations
+
+import logging
+
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+
+logger = logging.getLogger(__name__)
+
+
+class RedisLLMResultCache:
+    """
+    Estimations shared by every worker under ``{prefix}:{key}``.
+
+    Values are opaque strings with a TTL. Redis errors count as misses and
+    skipped writes, so estimation keeps working against the provider while
+    Redis is unavailable.
+    """
+
+    def __init__(self, redis: Redis, prefix: str = "llm:estimates") -> None:
+        self._redis = redis
+        self._prefix = prefix
+
+    async def get(self, key: str) -> str | None:
+        try:
+            return await self._redis.get(f"{self._prefix}:{key}")
+        except RedisError:
+            logger.warning("llm result cache read failed", exc_info=True)
+            return None
+
+    async def set(self, key: str, value: str, ttl_seconds: int) -> None:
+        try:
+            await self._redis.set(
+                f"{self._prefix}:{key}", value, ex=max(1, ttl_seconds)
+            )
+        except RedisError:
+            logger.warning("llm result cache write failed", exc_info=True)
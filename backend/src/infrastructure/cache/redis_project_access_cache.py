@@ -0,0 +1,86 @@
+"""Redis-backed project access cache."""
+
+from __future__ import annotations
+
+import json
+import logging
+from uuid import UUID
+
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+
+from backend.src.domain.entities import ProjectAccess, SeniorityLevel
+
+logger = logging.getLogger(__name__)
+
+
+def _optional_uuid(value: str | None) -> UUID | None:
+    return UUID(value) if value else None
+
+
+class RedisProjectAccessCache:
+    """
+    Project access entries shared by every worker, expiring after a short TTL.
+
+    Entries are JSON under ``{prefix}:{project_id}:{user_id}``; invalidating
+    deletes the key, so the next lookup on any worker reads the database.
+    Redis errors on reads and writes count as misses so access checks keep
+    working from the database while Redis is unavailable.
+    """
+
+    def __init__(
+        self,
+        redis: Redis,
+        ttl_seconds: int = 30,
+        prefix: str = "authz:project_access",
+    ) -> None:
+        self._redis = redis
+        self._ttl_seconds = ttl_seconds
+        self._prefix = prefix
+
+    def _key(self, project_id: UUID, user_id: UUID) -> str:
+        return f"{self._prefix}:{project_id}:{user_id}"
+
+    async def get(self, project_id: UUID, user_id: UUID) -> ProjectAccess | None:
+        try:
+            raw = await self._redis.get(self._key(project_id, user_id))
+        except RedisError:
+            logger.warning("project access cache read failed", exc_info=True)
+            return None
+        if raw is None:
+            return None
+        data = json.loads(raw)
+        seniority = data.get("seniority_level")
+        return ProjectAccess(
+            project_id=project_id,
+            user_id=user_id,
+            is_manager=bool(data["is_manager"]),
+            member_id=_optional_uuid(data.get("member_id")),
+            role_id=_optional_uuid(data.get("role_id")),
+            seniority_level=SeniorityLevel(seniority) if seniority else None,
+        )
+
+    async def set(self, access: ProjectAccess) -> None:
+        payload = {
+            "is_manager": access.is_manager,
+            "member_id": str(access.member_id) if access.member_id else None,
+            "role_id": str(access.role_id) if access.role_id else None,
+            "seniority_level": (
+                access.seniority_level.value if access.seniority_level else None
+            ),
+        }
+        try:
+            await self._redis.set(
+                self._key(access.project_id, access.user_id),
+                json.dumps(payload),
+                ex=max(1, self._ttl_seconds),
+            )
+        except RedisError:
+            logger.warning("project access cache write failed", exc_info=True)
+
+    async def invalidate(self, project_id: UUID, user_id: UUID) -> None:
+        try:
+            await self._redis.delete(self._key(project_id, user_id))
+        except RedisError:
+            # The change is already committed; the entry expires within the TTL.
+            logger.error("project access cache invalidation failed", exc_info=True)
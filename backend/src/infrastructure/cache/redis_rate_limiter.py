@@ -1,33 +1,98 @@
-"""Redis-backed fixed-window rate limiter."""
+"""Redis-backed sliding-window and token-bucket rate limiter."""
 
 from __future__ import annotations
 
-from backend.src.domain.ports.services import RateLimitResult
+import math
+
+from backend.src.domain.ports.services import RateLimitAlgorithm, RateLimitResult
 from redis.asyncio import Redis
 
+# Both scripts read the clock from Redis so every worker agrees on windows,
+# and return {allowed, remaining, retry_after_ms}. Derived keys share the
+# caller's hash tag, so they live in the same cluster slot as KEYS[1].
+_SLIDING_WINDOW_SCRIPT = """
+local t = redis.call('TIME')
+local now = tonumber(t[1]) * 1000 + math.floor(tonumber(t[2]) / 1000)
+local limit = tonumber(ARGV[1])
+local window = tonumber(ARGV[2])
+local index = math.floor(now / window)
+local elapsed = now - index * window
+local current_key = KEYS[1] .. ':' .. index
+local current = tonumber(redis.call('GET', current_key) or '0')
+local previous = tonumber(redis.call('GET', KEYS[1] .. ':' .. (index - 1)) or '0')
+local estimate = previous * (window - elapsed) / window + current
+if estimate + 1 > limit then
+  local retry = window - elapsed
+  if current + 1 <= limit and previous > 0 then
+    retry = retry - (limit - current - 1) * window / previous
+  end
+  return {0, 0, math.ceil(retry)}
+end
+redis.call('INCR', current_key)
+redis.call('PEXPIRE', current_key, window * 2)
+return {1, math.floor(limit - estimate - 1), 0}
+"""
+
+_TOKEN_BUCKET_SCRIPT = """
+local t = redis.call('TIME')
+local now = tonumber(t[1]) * 1000 + math.floor(tonumber(t[2]) / 1000)
+local capacity = tonumber(ARGV[1])
+local window = tonumber(ARGV[2])
+local rate = capacity / window
+local state = redis.call('HMGET', KEYS[1], 'tokens', 'ts')
+local tokens = tonumber(state[1]) or capacity
+local ts = tonumber(state[2]) or now
+tokens = math.min(capacity, tokens + math.max(0, now - ts) * rate)
+local allowed = 0
+local retry = 0
+if tokens >= 1 then
+  tokens = tokens - 1
+  allowed = 1
+else
+  retry = math.ceil((1 - tokens) / rate)
+end
+redis.call('HSET', KEYS[1], 'tokens', tostring(tokens), 'ts', tostring(now))
+redis.call('PEXPIRE', KEYS[1], window)
+return {allowed, math.floor(tokens), retry}
+"""
+
 
 class RedisRateLimiter:
-    """Rate limiter that uses Redis counters with TTL."""
+    """
+    Rate limiter evaluated atomically by a Lua script in one round-trip.
+
+    Every key gets its TTL in the same script that updates it, so no key is
+    left behind without expiry.
+    """
 
     def __init__(self, redis: Redis, prefix: str = "ratelimit") -> None:
         self._redis = redis
         self._prefix = prefix
+        self._scripts = {
+            RateLimitAlgorithm.SLIDING_WINDOW: redis.register_script(_SLIDING_WINDOW_SCRIPT),
+            RateLimitAlgorithm.TOKEN_BUCKET: redis.register_script(_TOKEN_BUCKET_SCRIPT),
+        }
 
-    def _key(self, key: str) -> str:
-        return f"{self._prefix}:{key}"
-
-    async def hit(self, key: str, limit: int, window_seconds: int) -> RateLimitResult:
-        redis_key = self._key(key)
-        current = await self._redis.incr(redis_key)
-        if current == 1:
-            await self._redis.expire(redis_key, window_seconds)
+    def _key(self, key: str, algorithm: RateLimitAlgorithm) -> str:
+        return f"{self._prefix}:{algorithm.value}:{{{key}}}"
 
-        ttl = await self._redis.ttl(redis_key)
-        remaining = max(0, limit - current)
-        if current > limit:
+    async def hit(
+        self,
+        key: str,
+        limit: int,
+        window_seconds: int,
+        algorithm: RateLimitAlgorithm = RateLimitAlgorithm.SLIDING_WINDOW,
+    ) -> RateLimitResult:
+        allowed, remaining, retry_after_ms = await self._scripts[algorithm](
+            keys=[self._key(key, algorithm)],
+            args=[limit, window_seconds * 1000],
+        )
+        if not allowed:
             return RateLimitResult(
                 allowed=False,
                 remaining=0,
-                retry_after_seconds=max(1, ttl) if ttl and ttl > 0 else window_seconds,
+                retry_after_seconds=max(1, math.ceil(int(retry_after_ms) / 1000)),
             )
-        return RateLimitResult(allowed=True, remaining=remaining, retry_after_seconds=None)
+        return RateLimitResult(
+            allowed=True, remaining=max(0, int(remaining)), retry_after_seconds=None
+        )
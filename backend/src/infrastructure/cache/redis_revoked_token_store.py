@@ -2,8 +2,14 @@
 
 from __future__ import annotations
 
+import asyncio
+import logging
+import time
+
 from redis.asyncio import Redis
 
+logger = logging.getLogger(__name__)
+
 
 class RedisRevokedTokenStore:
     """Store revoked JWT ids in Redis with TTL."""
@@ -21,3 +27,148 @@ class RedisRevokedTokenStore:
     async def is_revoked(self, jti: str) -> bool:
         value = await self._redis.get(self._key(jti))
         return value is not None
+
+
+class SyncedRedisRevokedTokenStore(RedisRevokedTokenStore):
+    """
+    Revoked-token store answered from a local set kept in sync over pub/sub.
+
+    Every revocation is written to Redis as before, added to a ``live``
+    sorted set scored by expiry, numbered with a version counter and
+    published. Each worker applies published revocations to its local set,
+    so ``is_revoked`` normally costs no round-trip.
+
+    A version gap, a reconnect or a version poll finding the counter ahead
+    triggers a reload of the live set. While the subscription is down or
+    has not synced recently, lookups fall back to a Redis ``GET``.
+    """
+
+    def __init__(
+        self,
+        redis: Redis,
+        prefix: str = "auth:revoked_jti",
+        sync_interval_seconds: float = 5.0,
+    ) -> None:
+        super().__init__(redis, prefix)
+        self._channel = f"{prefix}:events"
+        self._live_key = f"{prefix}:live"
+        self._version_key = f"{prefix}:version"
+        self._sync_interval = sync_interval_seconds
+        self._revoked: dict[str, float] = {}
+        self._version = 0
+        self._ready = False
+        self._last_sync = 0.0
+        self._task: asyncio.Task[None] | None = None
+
+    @property
+    def in_sync(self) -> bool:
+        """Whether local lookups can be trusted without asking Redis."""
+        return (
+            self._ready
+            and time.monotonic() - self._last_sync < self._sync_interval * 3
+        )
+
+    async def start(self) -> None:
+        """Start following revocations published by other workers."""
+        if self._task is None:
+            self._task = asyncio.create_task(self._follow())
+
+    async def stop(self) -> None:
+        """Stop the subscription; lookups fall back to Redis."""
+        self._ready = False
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def revoke(self, jti: str, ttl_seconds: int) -> None:
+        ttl_seconds = max(1, ttl_seconds)
+        now = time.time()
+        expires_at = now + ttl_seconds
+        self._revoked[jti] = expires_at
+
+        async with self._redis.pipeline(transaction=True) as pipe:
+            pipe.set(self._key(jti), "1", ex=ttl_seconds)
+            pipe.zadd(self._live_key, {jti: expires_at})
+            pipe.zremrangebyscore(self._live_key, "-inf", now)
+            pipe.incr(self._version_key)
+            results = await pipe.execute()
+        await self._redis.publish(self._channel, f"{results[-1]}:{expires_at}:{jti}")
+
+    async def is_revoked(self, jti: str) -> bool:
+        expires_at = self._revoked.get(jti)
+        if expires_at is not None:
+            if time.time() < expires_at:
+                return True
+            self._revoked.pop(jti, None)
+        if self.in_sync:
+            return False
+        return await super().is_revoked(jti)
+
+    async def _reload(self) -> None:
+        # Read the version first: revocations racing with the reload are
+        # either in the live set or arrive later with a higher version.
+        version = int(await self._redis.get(self._version_key) or 0)
+        now = time.time()
+        entries = await self._redis.zrangebyscore(
+            self._live_key, now, "+inf", withscores=True
+        )
+        self._revoked.update({jti: float(score) for jti, score in entries})
+        self._prune(now)
+        self._version = max(self._version, version)
+        self._last_sync = time.monotonic()
+
+    def _prune(self, now: float) -> None:
+        expired = [jti for jti, expires_at in self._revoked.items() if expires_at <= now]
+        for jti in expired:
+            del self._revoked[jti]
+
+    async def _apply(self, data: str) -> None:
+        version_text, expires_text, jti = data.split(":", 2)
+        version = int(version_text)
+        self._revoked[jti] = float(expires_text)
+        if version > self._version + 1:
+            await self._reload()
+        else:
+            self._version = max(self._version, version)
+
+    async def _poll(self) -> None:
+        version = int(await self._redis.get(self._version_key) or 0)
+        if version > self._version:
+            await self._reload()
+        else:
+            self._prune(time.time())
+            self._last_sync = time.monotonic()
+
+    async def _follow(self) -> None:
+        backoff = 0.5
+        while True:
+            pubsub = self._redis.pubsub()
+            try:
+                await pubsub.subscribe(self._channel)
+                await self._reload()
+                self._ready = True
+                backoff = 0.5
+                next_poll = time.monotonic() + self._sync_interval
+                while True:
+                    message = await pubsub.get_message(
+                        ignore_subscribe_messages=True,
+                        timeout=self._sync_interval,
+                    )
+                    if message is not None and message["type"] == "message":
+                        await self._apply(message["data"])
+                    if time.monotonic() >= next_poll:
+                        await self._poll()
+                        next_poll = time.monotonic() + self._sync_interval
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                self._ready = False
+                logger.warning("revocation_sync_lost", exc_info=True)
+                await asyncio.sleep(backoff)
+                backoff = min(backoff * 2, 30.0)
+            finally:
+                await pubsub.aclose()
@@ -0,0 +1,88 @@
+"""Redis pub/sub fan-out for in-app toasts."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+from collections.abc import Sequence
+from uuid import UUID
+
+from redis.asyncio import Redis
+
+from backend.src.adapters.services.toast_hub import InMemoryToastHub, encode_toast
+from backend.src.domain.ports.services import NewTaskToastData
+
+logger = logging.getLogger(__name__)
+
+
+class RedisToastHub(InMemoryToastHub):
+    """
+    Toast hub shared by every worker through one Redis channel.
+
+    Publishing sends a single message carrying the recipients and the
+    encoded event; each worker holds one subscription and delivers it to
+    its own open streams. The number of open streams never changes the
+    number of Redis connections. If Redis cannot take the publish, the
+    toast still reaches streams on this worker.
+    """
+
+    def __init__(
+        self,
+        redis: Redis,
+        channel: str = "toasts:events",
+        max_pending: int = 16,
+    ) -> None:
+        super().__init__(max_pending)
+        self._redis = redis
+        self._channel = channel
+        self._task: asyncio.Task[None] | None = None
+
+    async def start(self) -> None:
+        """Start delivering toasts published by any worker."""
+        if self._task is None:
+            self._task = asyncio.create_task(self._follow())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def publish(self, user_ids: Sequence[UUID], toast: NewTaskToastData) -> None:
+        event = encode_toast(toast)
+        message = json.dumps(
+            {"user_ids": [str(user_id) for user_id in user_ids], "event": event}
+        )
+        try:
+            await self._redis.publish(self._channel, message)
+        except Exception:
+            logger.warning("toast_publish_failed; delivering locally", exc_info=True)
+            self.deliver(user_ids, event)
+
+    def _apply(self, data: str) -> None:
+        message = json.loads(data)
+        user_ids = (UUID(user_id) for user_id in message["user_ids"])
+        self.deliver(user_ids, message["event"])
+
+    async def _follow(self) -> None:
+        backoff = 0.5
+        while True:
+            pubsub = self._redis.pubsub()
+            try:
+                await pubsub.subscribe(self._channel)
+                backoff = 0.5
+                async for message in pubsub.listen():
+                    if message["type"] == "message":
+                        self._apply(message["data"])
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.warning("toast_subscription_lost", exc_info=True)
+                await asyncio.sleep(backoff)
+                backoff = min(backoff * 2, 30.0)
+            finally:
+                await pubsub.aclose()
@@ -1,6 +1,15 @@
 """SQLAlchemy models for persistence."""
 
 from backend.src.infrastructure.db.models.calendar_model import CalendarModel
+from backend.src.infrastructure.db.models.deadline_warning_model import (
+    DeadlineWarningModel,
+)
+from backend.src.infrastructure.db.models.email_outbox_model import (
+    EmailOutboxModel,
+    EmailOutboxStatus,
+)
+from backend.src.infrastructure.db.models.job_watermark_model import JobWatermarkModel
+from backend.src.infrastructure.db.models.llm_usage_model import LLMUsageModel
 from backend.src.infrastructure.db.models.project_invite_model import ProjectInviteModel
 from backend.src.infrastructure.db.models.project_member_model import ProjectMemberModel
 from backend.src.infrastructure.db.models.project_model import ProjectModel
@@ -8,10 +17,17 @@ from backend.src.infrastructure.db.models.role_model import RoleModel
 from backend.src.infrastructure.db.models.task_model import TaskModel
 from backend.src.infrastructure.db.models.task_dependency_model import TaskDependencyModel
 from backend.src.infrastructure.db.models.task_log_model import TaskLogModel
+from backend.src.infrastructure.db.models.task_progress_model import TaskProgressModel
 from backend.src.infrastructure.db.models.user_model import UserModel
+from backend.src.infrastructure.db.models.workload_alert_model import WorkloadAlertModel
 
 __all__ = [
     "CalendarModel",
+    "DeadlineWarningModel",
+    "EmailOutboxModel",
+    "EmailOutboxStatus",
+    "JobWatermarkModel",
+    "LLMUsageModel",
     "ProjectMemberModel",
     "ProjectModel",
     "ProjectInviteModel",
@@ -19,5 +35,7 @@ __all__ = [
     "TaskModel",
     "TaskDependencyModel",
     "TaskLogModel",
+    "TaskProgressModel",
     "UserModel",
+    "WorkloadAlertModel",
 ]
@@ -0,0 +1,45 @@
+"""SQLAlchemy model for scheduled deadline warnings (UC-084)."""
+
+from __future__ import annotations
+
+from datetime import datetime
+from uuid import UUID
+
+from sqlalchemy import DateTime, ForeignKey, Index, text
+from sqlalchemy.dialects.postgresql import UUID as PG_UUID
+from sqlalchemy.orm import Mapped, mapped_column
+
+from backend.src.infrastructure.db.base import Base
+
+
+class DeadlineWarningModel(Base):
+    """
+    Database model for deadline warnings, one per Task deadline.
+
+    The (task_id, deadline) key deduplicates warnings across scans; a Task
+    whose deadline moves gets a new row.
+    """
+
+    __tablename__ = "deadline_warnings"
+    __table_args__ = (
+        # The sender only scans unsent rows in due order.
+        Index(
+            "ix_deadline_warnings_due",
+            "warn_at",
+            postgresql_where=text("sent_at IS NULL"),
+        ),
+        Index("ix_deadline_warnings_deadline", "deadline"),
+    )
+
+    task_id: Mapped[UUID] = mapped_column(
+        PG_UUID(as_uuid=True),
+        ForeignKey("tasks.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    deadline: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), primary_key=True
+    )
+    warn_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+    sent_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True), nullable=True
+    )
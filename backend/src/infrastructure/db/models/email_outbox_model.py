@@ -0,0 +1,96 @@
+"""SQLAlchemy model for the transactional email outbox."""
+
+from __future__ import annotations
+
+from datetime import datetime
+from enum import Enum as PyEnum
+from typing import Self
+from uuid import UUID, uuid4
+
+import sqlalchemy as sa
+from sqlalchemy import DateTime, Enum, Index, Integer, Text, func, text
+from sqlalchemy.dialects.postgresql import ARRAY, UUID as PG_UUID
+from sqlalchemy.orm import Mapped, mapped_column
+
+from backend.src.domain.ports.repositories import OutboxEmail
+from backend.src.domain.ports.services import EmailMessage
+from backend.src.infrastructure.db.base import Base
+
+
+class EmailOutboxStatus(str, PyEnum):
+    """Delivery state of an outbox row; sent rows are deleted."""
+
+    PENDING = "PENDING"
+    FAILED = "FAILED"
+
+
+class EmailOutboxModel(Base):
+    """Database model for emails waiting to be dispatched."""
+
+    __tablename__ = "email_outbox"
+    __table_args__ = (
+        # Dispatchers only ever scan pending rows in due order.
+        Index(
+            "ix_email_outbox_due",
+            "available_at",
+            postgresql_where=text("status = 'PENDING'"),
+        ),
+    )
+
+    id: Mapped[UUID] = mapped_column(PG_UUID(as_uuid=True), primary_key=True)
+    recipients: Mapped[list[str]] = mapped_column(ARRAY(sa.Text), nullable=False)
+    cc: Mapped[list[str] | None] = mapped_column(ARRAY(sa.Text), nullable=True)
+    bcc: Mapped[list[str] | None] = mapped_column(ARRAY(sa.Text), nullable=True)
+    subject: Mapped[str] = mapped_column(Text, nullable=False)
+    body_text: Mapped[str] = mapped_column(Text, nullable=False)
+    body_html: Mapped[str | None] = mapped_column(Text, nullable=True)
+    status: Mapped[EmailOutboxStatus] = mapped_column(
+        Enum(EmailOutboxStatus, name="email_outbox_status", native_enum=False),
+        default=EmailOutboxStatus.PENDING,
+        server_default=EmailOutboxStatus.PENDING.value,
+        nullable=False,
+    )
+    attempts: Mapped[int] = mapped_column(
+        Integer, default=0, server_default="0", nullable=False
+    )
+    available_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        nullable=False,
+    )
+    last_error: Mapped[str | None] = mapped_column(Text, nullable=True)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        nullable=False,
+    )
+
+    @classmethod
+    def from_message(cls, message: EmailMessage) -> Self:
+        """Create a pending outbox row for an email message."""
+        return cls(
+            id=uuid4(),
+            recipients=list(message.recipients),
+            cc=list(message.cc) if message.cc else None,
+            bcc=list(message.bcc) if message.bcc else None,
+            subject=message.subject,
+            body_text=message.body_text,
+            body_html=message.body_html,
+            status=EmailOutboxStatus.PENDING,
+            attempts=0,
+        )
+
+    def to_outbox_email(self) -> OutboxEmail:
+        """Convert this row into the message a dispatcher sends."""
+        return OutboxEmail(
+            id=self.id,
+            message=EmailMessage(
+                recipients=list(self.recipients),
+                subject=self.subject,
+                body_text=self.body_text,
+                body_html=self.body_html,
+                cc=list(self.cc) if self.cc else None,
+                bcc=list(self.bcc) if self.bcc else None,
+            ),
+            attempts=self.attempts,
+        )
@@ -0,0 +1,19 @@
+"""SQLAlchemy model for scheduled job watermarks."""
+
+from __future__ import annotations
+
+from datetime import datetime
+
+from sqlalchemy import DateTime, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from backend.src.infrastructure.db.base import Base
+
+
+class JobWatermarkModel(Base):
+    """How far an incremental job has processed, by watermark name."""
+
+    __tablename__ = "job_watermarks"
+
+    name: Mapped[str] = mapped_column(String(64), primary_key=True)
+    value: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
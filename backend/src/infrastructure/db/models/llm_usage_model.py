@@ -0,0 +1,32 @@
+"""SQLAlchemy model for per-project daily LLM token usage."""
+
+from __future__ import annotations
+
+from datetime import date
+from uuid import UUID
+
+from sqlalchemy import BigInteger, Date, ForeignKey, Integer
+from sqlalchemy.dialects.postgresql import UUID as PG_UUID
+from sqlalchemy.orm import Mapped, mapped_column
+
+from backend.src.infrastructure.db.base import Base
+
+
+class LLMUsageModel(Base):
+    """
+    Tokens and requests a project sent to the house LLM on one (UTC) day.
+
+    Rows are incremented in place after each request, so every worker sees
+    the day's total when it checks the project's budget.
+    """
+
+    __tablename__ = "llm_usage_daily"
+
+    project_id: Mapped[UUID] = mapped_column(
+        PG_UUID(as_uuid=True),
+        ForeignKey("projects.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    day: Mapped[date] = mapped_column(Date, primary_key=True)
+    tokens: Mapped[int] = mapped_column(BigInteger, nullable=False, default=0)
+    requests: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
@@ -6,7 +6,7 @@ from datetime import datetime
 from typing import Self
 from uuid import UUID
 
-from sqlalchemy import DateTime, ForeignKey, String, Text, func
+from sqlalchemy import BigInteger, DateTime, ForeignKey, String, Text, func
 from sqlalchemy.dialects.postgresql import UUID as PG_UUID
 from sqlalchemy.orm import Mapped, mapped_column
 
@@ -37,6 +37,11 @@ class ProjectModel(Base):
         server_default=func.now(),
         nullable=False,
     )
+    # Bumped once per committed unit of work that changes project-scoped rows;
+    # not part of the entity, see infrastructure.db.versioning.
+    version: Mapped[int] = mapped_column(
+        BigInteger, default=1, server_default="1", nullable=False
+    )
 
     @classmethod
     def from_entity(cls, project: Project) -> Self:
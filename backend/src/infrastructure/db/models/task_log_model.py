@@ -6,7 +6,7 @@ from datetime import datetime
 from typing import Self
 from uuid import UUID
 
-from sqlalchemy import DateTime, Enum, ForeignKey, Text, func
+from sqlalchemy import DateTime, Enum, ForeignKey, Index, Text, func
 from sqlalchemy.dialects.postgresql import UUID as PG_UUID
 from sqlalchemy.orm import Mapped, mapped_column
 
@@ -18,6 +18,10 @@ class TaskLogModel(Base):
     """Database model for task logs."""
 
     __tablename__ = "task_logs"
+    __table_args__ = (
+        # History pages and progress watermarks read a task's logs in order.
+        Index("ix_task_logs_task_id_created_at", "task_id", "created_at", "id"),
+    )
 
     id: Mapped[UUID] = mapped_column(PG_UUID(as_uuid=True), primary_key=True)
     task_id: Mapped[UUID] = mapped_column(
@@ -70,6 +70,7 @@ class TaskModel(Base):
         server_default=func.now(),
         onupdate=func.now(),
         nullable=False,
+        index=True,
     )
 
     @classmethod
@@ -0,0 +1,43 @@
+"""SQLAlchemy model for incremental LLM progress estimates (UC-043)."""
+
+from __future__ import annotations
+
+from datetime import datetime
+from uuid import UUID
+
+from sqlalchemy import DateTime, Float, ForeignKey, Integer, Text, func
+from sqlalchemy.dialects.postgresql import UUID as PG_UUID
+from sqlalchemy.orm import Mapped, mapped_column
+
+from backend.src.infrastructure.db.base import Base
+
+
+class TaskProgressModel(Base):
+    """
+    A task's last LLM progress estimate and its report watermark.
+
+    The summary digests every report up to (last_report_at, last_report_id),
+    so the next estimate sends only the reports filed after that point.
+    """
+
+    __tablename__ = "task_progress_estimates"
+
+    task_id: Mapped[UUID] = mapped_column(
+        PG_UUID(as_uuid=True),
+        ForeignKey("tasks.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    percentage: Mapped[int] = mapped_column(Integer, nullable=False)
+    confidence: Mapped[float] = mapped_column(Float, nullable=False)
+    reasoning: Mapped[str] = mapped_column(Text, default="", server_default="")
+    summary: Mapped[str] = mapped_column(Text, default="", server_default="")
+    last_report_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False
+    )
+    last_report_id: Mapped[UUID] = mapped_column(PG_UUID(as_uuid=True), nullable=False)
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        onupdate=func.now(),
+        nullable=False,
+    )
@@ -0,0 +1,34 @@
+"""SQLAlchemy model for raised workload alerts (BR-NOTIF-002)."""
+
+from __future__ import annotations
+
+from datetime import datetime
+from uuid import UUID
+
+from sqlalchemy import DateTime, ForeignKey, func
+from sqlalchemy.dialects.postgresql import UUID as PG_UUID
+from sqlalchemy.orm import Mapped, mapped_column
+
+from backend.src.infrastructure.db.base import Base
+
+
+class WorkloadAlertModel(Base):
+    """
+    A member whose manager was already alerted about an Impossible workload.
+
+    The row is inserted when the alert is sent and deleted once the workload
+    falls back to Healthy or lower, so each episode is reported once.
+    """
+
+    __tablename__ = "workload_alerts"
+
+    member_id: Mapped[UUID] = mapped_column(
+        PG_UUID(as_uuid=True),
+        ForeignKey("project_members.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    raised_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        nullable=False,
+    )
@@ -12,6 +12,7 @@ from sqlalchemy.ext.asyncio import (
 )
 
 from backend.src.config.settings import AppSettings
+from backend.src.observability.server_timing import instrument_engine
 
 
 _engine: AsyncEngine | None = None
@@ -34,6 +35,7 @@ def init_db(settings: AppSettings) -> None:
         # pool_pre_ping checks connections before handing them out (prevents 'gone away' errors)
         pool_pre_ping=True,
     )
+    instrument_engine(_engine)
     _session_factory = async_sessionmaker(
         bind=_engine,
         class_=AsyncSession,
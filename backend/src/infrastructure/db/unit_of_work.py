@@ -2,7 +2,12 @@
 
 from __future__ import annotations
 
-from sqlalchemy.ext.asyncio import AsyncSession
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from backend.src.infrastructure.db.versioning import bump_project_versions, reset_changes
 
 
 class SqlAlchemyUnitOfWork:
@@ -27,12 +32,18 @@ class SqlAlchemyUnitOfWork:
             PostgresProjectInviteRepository,
             PostgresProjectMemberRepository,
             PostgresProjectRepository,
+            PostgresReportRepository,
             PostgresRoleRepository,
             PostgresCalendarRepository,
+            PostgresDeadlineWarningRepository,
+            PostgresEmailOutboxRepository,
+            PostgresLLMUsageRepository,
             PostgresTaskDependencyRepository,
             PostgresTaskLogRepository,
+            PostgresTaskProgressRepository,
             PostgresTaskRepository,
             PostgresUserRepository,
+            PostgresWorkloadAlertRepository,
         )
 
         self.user_repository = PostgresUserRepository(self._session)
@@ -46,16 +57,27 @@ class SqlAlchemyUnitOfWork:
             self._session
         )
         self.task_log_repository = PostgresTaskLogRepository(self._session)
+        self.email_outbox_repository = PostgresEmailOutboxRepository(self._session)
+        self.report_repository = PostgresReportRepository(self._session)
+        self.deadline_warning_repository = PostgresDeadlineWarningRepository(
+            self._session
+        )
+        self.workload_alert_repository = PostgresWorkloadAlertRepository(self._session)
+        self.task_progress_repository = PostgresTaskProgressRepository(self._session)
+        self.llm_usage_repository = PostgresLLMUsageRepository(self._session)
 
         return self
 
     async def commit(self) -> None:
-        """Commit the current transaction."""
+        """Bump versions of touched projects, then commit the current transaction."""
+        await bump_project_versions(self._session)
         await self._session.commit()
+        reset_changes(self._session)
 
     async def rollback(self) -> None:
         """Roll back the current transaction."""
         await self._session.rollback()
+        reset_changes(self._session)
 
     async def __aexit__(
         self,
@@ -65,3 +87,13 @@ class SqlAlchemyUnitOfWork:
     ) -> None:
         if exc_type is not None:
             await self.rollback()
+
+
+@asynccontextmanager
+async def open_unit_of_work(
+    session_factory: async_sessionmaker[AsyncSession],
+) -> AsyncIterator[SqlAlchemyUnitOfWork]:
+    """Open a Unit of Work on its own session, for work outside a request."""
+    async with session_factory() as session:
+        async with SqlAlchemyUnitOfWork(session) as uow:
+            yield uow
@@ -0,0 +1,63 @@
+"""Project version tracking for HTTP caching.
+
+Repositories record which projects (or tasks, whose project is resolved in
+SQL) a transaction touched. The unit of work then bumps ``projects.version``
+once per touched project right before committing, so every committed change
+to project-scoped rows produces a new version and a new ETag.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+from uuid import UUID
+
+from sqlalchemy import or_, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from backend.src.infrastructure.db.models import ProjectModel, TaskModel
+
+_PROJECT_IDS_KEY = "touched_project_ids"
+_TASK_IDS_KEY = "touched_task_ids"
+
+
+def mark_projects_changed(session: AsyncSession, project_ids: Iterable[UUID]) -> None:
+    """Record projects whose rows were changed in the current transaction."""
+    session.info.setdefault(_PROJECT_IDS_KEY, set()).update(project_ids)
+
+
+def mark_tasks_changed(session: AsyncSession, task_ids: Iterable[UUID]) -> None:
+    """Record tasks whose project must be bumped in the current transaction."""
+    session.info.setdefault(_TASK_IDS_KEY, set()).update(task_ids)
+
+
+def reset_changes(session: AsyncSession) -> None:
+    """Forget recorded changes (after commit or rollback)."""
+    session.info.pop(_PROJECT_IDS_KEY, None)
+    session.info.pop(_TASK_IDS_KEY, None)
+
+
+async def bump_project_versions(session: AsyncSession) -> None:
+    """Increment the version of every project touched in this transaction.
+
+    Issues at most one UPDATE, whatever the number of changed rows.
+    """
+    project_ids = session.info.get(_PROJECT_IDS_KEY) or set()
+    task_ids = session.info.get(_TASK_IDS_KEY) or set()
+    if not project_ids and not task_ids:
+        return
+
+    conditions = []
+    if project_ids:
+        conditions.append(ProjectModel.id.in_(project_ids))
+    if task_ids:
+        conditions.append(
+            ProjectModel.id.in_(
+                select(TaskModel.project_id).where(TaskModel.id.in_(task_ids))
+            )
+        )
+    await session.execute(
+        update(ProjectModel)
+        .where(or_(*conditions))
+        .values(version=ProjectModel.version + 1)
+        .execution_options(synchronize_session=False)
+    )
@@ -20,8 +20,11 @@ from backend.src.application.use_cases.project_management import (
     ConfigureProjectLLMUseCase,
     CreateProjectUseCase,
     CreateRoleUseCase,
+    ExportProjectDataUseCase,
     FireEmployeeUseCase,
     GetProjectDetailsUseCase,
+    GetProjectSnapshotUseCase,
+    GetProjectVersionUseCase,
     ListProjectMembersUseCase,
     ListUserProjectsUseCase,
     RecalculateProjectScheduleUseCase,
@@ -35,8 +38,12 @@ from backend.src.application.use_cases.task_management import (
     CompleteTaskUseCase,
     CreateTaskUseCase,
     DeleteTaskUseCase,
+    EstimateTaskDifficultiesUseCase,
+    EstimateTaskProgressUseCase,
+    ImportTasksUseCase,
     RemoveDependencyUseCase,
     RemoveFromTaskUseCase,
+    RunTaskBatchUseCase,
     SelectTaskUseCase,
 )
 from backend.src.domain.ports.repositories import (
@@ -53,11 +60,15 @@ from backend.src.domain.ports.repositories import (
 from backend.src.domain.ports.services import (
     EmailService,
     EncryptionService,
+    EventPublisher,
     LLMService,
+    LLMServiceResolver,
     NotificationService,
+    ProjectAccessCache,
     TokenService,
 )
 from backend.src.domain.ports.unit_of_work import UnitOfWork
+from backend.src.domain.services.project_access_resolver import ProjectAccessResolver
 from backend.src.domain.services.schedule_calculator import ScheduleCalculator
 from backend.src.domain.services.task_selection_policy import TaskSelectionPolicy
 
@@ -89,6 +100,9 @@ class Services:
     encryption: EncryptionService
     llm: LLMService | None = None
     notification: NotificationService | None = None
+    project_access_cache: ProjectAccessCache | None = None
+    event_publisher: EventPublisher | None = None
+    llm_resolver: LLMServiceResolver | None = None
 
 
 @dataclass
@@ -117,6 +131,10 @@ class Container:
     domain_services: DomainServices = field(default_factory=DomainServices)
     config: "ProjectConfig | None" = None
 
+    def project_access_resolver(self) -> ProjectAccessResolver:
+        """Create ProjectAccessResolver backed by the shared access cache."""
+        return ProjectAccessResolver(self.services.project_access_cache)
+
     # --- Auth Use Cases ---
 
     def request_magic_link_use_case(self) -> RequestMagicLinkUseCase:
@@ -144,6 +162,8 @@ class Container:
         return ConfigureProjectLLMUseCase(
             uow=self.uow,
             encryption_service=self.services.encryption,
+            llm_resolver=self.services.llm_resolver,
+            access_resolver=self.project_access_resolver(),
         )
 
     def configure_calendar_use_case(self) -> ConfigureCalendarUseCase:
@@ -151,11 +171,15 @@ class Container:
         return ConfigureCalendarUseCase(
             uow=self.uow,
             recalculate_schedule_use_case=self.recalculate_project_schedule_use_case(),
+            access_resolver=self.project_access_resolver(),
         )
 
     def create_role_use_case(self) -> CreateRoleUseCase:
         """Create CreateRoleUseCase with dependencies."""
-        return CreateRoleUseCase(uow=self.uow)
+        return CreateRoleUseCase(
+            uow=self.uow,
+            access_resolver=self.project_access_resolver(),
+        )
 
     def list_user_projects_use_case(self) -> ListUserProjectsUseCase:
         """Create ListUserProjectsUseCase with dependencies."""
@@ -163,19 +187,48 @@ class Container:
 
     def list_project_members_use_case(self) -> ListProjectMembersUseCase:
         """Create ListProjectMembersUseCase with dependencies."""
-        return ListProjectMembersUseCase(uow=self.uow)
+        return ListProjectMembersUseCase(
+            uow=self.uow,
+            access_resolver=self.project_access_resolver(),
+        )
 
     def get_project_details_use_case(self) -> GetProjectDetailsUseCase:
         """Create GetProjectDetailsUseCase with dependencies."""
-        return GetProjectDetailsUseCase(uow=self.uow)
+        return GetProjectDetailsUseCase(
+            uow=self.uow, access_resolver=self.project_access_resolver()
+        )
+
+    def get_project_snapshot_use_case(self) -> GetProjectSnapshotUseCase:
+        """Create GetProjectSnapshotUseCase with dependencies."""
+        return GetProjectSnapshotUseCase(
+            uow=self.uow,
+            schedule_calculator=self.domain_services.schedule_calculator,
+        )
+
+    def get_project_version_use_case(self) -> GetProjectVersionUseCase:
+        """Create GetProjectVersionUseCase with dependencies."""
+        return GetProjectVersionUseCase(uow=self.uow)
+
+    def export_project_data_use_case(self) -> ExportProjectDataUseCase:
+        """Create ExportProjectDataUseCase with dependencies."""
+        return ExportProjectDataUseCase(
+            uow=self.uow,
+            access_resolver=self.project_access_resolver(),
+        )
 
     def fire_employee_use_case(self) -> FireEmployeeUseCase:
         """Create FireEmployeeUseCase with dependencies."""
-        return FireEmployeeUseCase(uow=self.uow)
+        return FireEmployeeUseCase(
+            uow=self.uow,
+            access_resolver=self.project_access_resolver(),
+        )
 
     def resign_from_project_use_case(self) -> ResignFromProjectUseCase:
         """Create ResignFromProjectUseCase with dependencies."""
-        return ResignFromProjectUseCase(uow=self.uow)
+        return ResignFromProjectUseCase(
+            uow=self.uow,
+            access_resolver=self.project_access_resolver(),
+        )
 
     def recalculate_project_schedule_use_case(
         self,
@@ -193,23 +246,32 @@ class Container:
         return CreateInviteUseCase(
             uow=self.uow,
             base_url=self.public_base_url,
+            access_resolver=self.project_access_resolver(),
         )
 
     def accept_invite_use_case(self) -> AcceptInviteUseCase:
         """Create AcceptInviteUseCase with dependencies."""
-        return AcceptInviteUseCase(uow=self.uow)
+        return AcceptInviteUseCase(
+            uow=self.uow,
+            access_resolver=self.project_access_resolver(),
+        )
 
     # --- Task Management Use Cases ---
 
     def create_task_use_case(self) -> CreateTaskUseCase:
         """Create CreateTaskUseCase with dependencies."""
-        return CreateTaskUseCase(uow=self.uow)
+        return CreateTaskUseCase(
+            uow=self.uow,
+            access_resolver=self.project_access_resolver(),
+            notification_service=self.services.notification,
+        )
 
     def cancel_task_use_case(self) -> CancelTaskUseCase:
         """Create CancelTaskUseCase with dependencies."""
         return CancelTaskUseCase(
             uow=self.uow,
             recalculate_schedule_use_case=self.recalculate_project_schedule_use_case(),
+            access_resolver=self.project_access_resolver(),
         )
 
     def delete_task_use_case(self) -> DeleteTaskUseCase:
@@ -217,6 +279,33 @@ class Container:
         return DeleteTaskUseCase(
             uow=self.uow,
             recalculate_schedule_use_case=self.recalculate_project_schedule_use_case(),
+            access_resolver=self.project_access_resolver(),
+        )
+
+    def estimate_task_difficulties_use_case(self) -> EstimateTaskDifficultiesUseCase:
+        """Create EstimateTaskDifficultiesUseCase with dependencies."""
+        return EstimateTaskDifficultiesUseCase(
+            uow=self.uow,
+            llm_service=self.services.llm,
+            event_publisher=self.services.event_publisher,
+            llm_resolver=self.services.llm_resolver,
+            access_resolver=self.project_access_resolver(),
+        )
+
+    def estimate_task_progress_use_case(self) -> EstimateTaskProgressUseCase:
+        """Create EstimateTaskProgressUseCase with dependencies."""
+        return EstimateTaskProgressUseCase(
+            uow=self.uow,
+            llm_service=self.services.llm,
+            llm_resolver=self.services.llm_resolver,
+            access_resolver=self.project_access_resolver(),
+        )
+
+    def import_tasks_use_case(self) -> ImportTasksUseCase:
+        """Create ImportTasksUseCase with dependencies."""
+        return ImportTasksUseCase(
+            uow=self.uow,
+            recalculate_schedule_use_case=self.recalculate_project_schedule_use_case(),
         )
 
     def add_dependency_use_case(self) -> AddDependencyUseCase:
@@ -224,6 +313,7 @@ class Container:
         return AddDependencyUseCase(
             uow=self.uow,
             recalculate_schedule_use_case=self.recalculate_project_schedule_use_case(),
+            access_resolver=self.project_access_resolver(),
         )
 
     def remove_dependency_use_case(self) -> RemoveDependencyUseCase:
@@ -231,6 +321,7 @@ class Container:
         return RemoveDependencyUseCase(
             uow=self.uow,
             recalculate_schedule_use_case=self.recalculate_project_schedule_use_case(),
+            access_resolver=self.project_access_resolver(),
         )
 
     def select_task_use_case(self) -> SelectTaskUseCase:
@@ -239,23 +330,50 @@ class Container:
             uow=self.uow,
             selection_policy=self.domain_services.task_selection_policy,
             config=self.config,
+            event_publisher=self.services.event_publisher,
+        )
+
+    def run_task_batch_use_case(self) -> RunTaskBatchUseCase:
+        """Create RunTaskBatchUseCase with dependencies."""
+        return RunTaskBatchUseCase(
+            uow=self.uow,
+            recalculate_schedule_use_case=self.recalculate_project_schedule_use_case(),
+            selection_policy=self.domain_services.task_selection_policy,
+            config=self.config,
+            event_publisher=self.services.event_publisher,
+            access_resolver=self.project_access_resolver(),
         )
 
     def complete_task_use_case(self) -> CompleteTaskUseCase:
         """Create CompleteTaskUseCase with dependencies."""
-        return CompleteTaskUseCase(uow=self.uow)
+        return CompleteTaskUseCase(
+            uow=self.uow,
+            access_resolver=self.project_access_resolver(),
+            event_publisher=self.services.event_publisher,
+        )
 
     def abandon_task_use_case(self) -> AbandonTaskUseCase:
         """Create AbandonTaskUseCase with dependencies."""
-        return AbandonTaskUseCase(uow=self.uow)
+        return AbandonTaskUseCase(
+            uow=self.uow,
+            access_resolver=self.project_access_resolver(),
+            event_publisher=self.services.event_publisher,
+        )
 
     def add_task_report_use_case(self) -> AddTaskReportUseCase:
         """Create AddTaskReportUseCase with dependencies."""
-        return AddTaskReportUseCase(uow=self.uow)
+        return AddTaskReportUseCase(
+            uow=self.uow,
+            access_resolver=self.project_access_resolver(),
+        )
 
     def remove_from_task_use_case(self) -> RemoveFromTaskUseCase:
         """Create RemoveFromTaskUseCase with dependencies."""
-        return RemoveFromTaskUseCase(uow=self.uow)
+        return RemoveFromTaskUseCase(
+            uow=self.uow,
+            access_resolver=self.project_access_resolver(),
+            event_publisher=self.services.event_publisher,
+        )
 
 
 class ContainerFactory:
@@ -275,6 +393,9 @@ class ContainerFactory:
         llm_service: LLMService | None = None,
         notification_service: NotificationService | None = None,
         public_base_url: str = "http://localhost:8000",
+        project_access_cache: ProjectAccessCache | None = None,
+        event_publisher: EventPublisher | None = None,
+        llm_resolver: LLMServiceResolver | None = None,
     ):
         """
         Initialize the factory with service implementations.
@@ -290,6 +411,9 @@ class ContainerFactory:
         self._llm_service = llm_service
         self._notification_service = notification_service
         self._public_base_url = public_base_url
+        self._project_access_cache = project_access_cache
+        self._event_publisher = event_publisher
+        self._llm_resolver = llm_resolver
 
     def get_email_service(self) -> EmailService:
         """Expose configured email service (used for local debugging)."""
@@ -344,6 +468,9 @@ class ContainerFactory:
             encryption=self._encryption_service,
             llm=self._llm_service,
             notification=self._notification_service,
+            project_access_cache=self._project_access_cache,
+            event_publisher=self._event_publisher,
+            llm_resolver=self._llm_resolver,
         )
 
         uow = SqlAlchemyUnitOfWork(session)
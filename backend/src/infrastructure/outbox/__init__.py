@@ -0,0 +1,7 @@
+"""Transactional outbox infrastructure."""
+
+from backend.src.infrastructure.outbox.email_dispatcher import EmailOutboxDispatcher
+
+__all__ = [
+    "EmailOutboxDispatcher",
+]
@@ -0,0 +1,181 @@
+"""Background dispatcher that drains the transactional email outbox."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import random
+from collections.abc import Callable
+from contextlib import AbstractAsyncContextManager
+
+from backend.src.domain.ports import EmailService, OutboxEmail, UnitOfWork
+
+logger = logging.getLogger(__name__)
+
+# Longest error text kept on an outbox row.
+_MAX_ERROR_LENGTH = 1000
+
+
+class EmailOutboxDispatcher:
+    """
+    Sends queued emails through the real transport, off the request path.
+
+    Each pass leases a batch of due emails in one short transaction, hands
+    the whole batch to the transport's ``send_many`` (which bounds its own
+    concurrency, e.g. the SMTP connection pool), then records every outcome
+    in a second transaction: sent emails are deleted, failures are retried with
+    exponential backoff and jitter, and emails that exhaust
+    ``max_attempts`` are marked failed. Leases make several dispatchers
+    (one per worker) safe to run side by side; an email whose dispatcher
+    dies mid-send is picked up again once its lease expires.
+    """
+
+    def __init__(
+        self,
+        uow_factory: Callable[[], AbstractAsyncContextManager[UnitOfWork]],
+        transport: EmailService,
+        *,
+        batch_size: int = 50,
+        max_attempts: int = 8,
+        poll_interval_seconds: float = 1.0,
+        lease_seconds: float = 120.0,
+        send_timeout_seconds: float = 60.0,
+        backoff_base_seconds: float = 2.0,
+        backoff_max_seconds: float = 900.0,
+        rng: Callable[[], float] = random.random,
+    ) -> None:
+        self._uow_factory = uow_factory
+        self._transport = transport
+        self._batch_size = batch_size
+        self._max_attempts = max_attempts
+        self._poll_interval = poll_interval_seconds
+        self._lease_seconds = lease_seconds
+        self._send_timeout = send_timeout_seconds
+        self._backoff_base = backoff_base_seconds
+        self._backoff_max = backoff_max_seconds
+        self._rng = rng
+        # Serialises passes in this process so drain() sees every email the
+        # background loop already claimed as sent or rescheduled.
+        self._lock = asyncio.Lock()
+        self._wakeup = asyncio.Event()
+        self._task: asyncio.Task[None] | None = None
+
+    @property
+    def transport(self) -> EmailService:
+        """The email service that actually delivers messages."""
+        return self._transport
+
+    async def start(self) -> None:
+        """Start draining the outbox in the background."""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop the background loop; queued emails stay in the outbox."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    def wake(self) -> None:
+        """Start the next pass now instead of at the next poll."""
+        self._wakeup.set()
+
+    async def dispatch_once(self) -> int:
+        """Send one batch of due emails; return how many were claimed."""
+        async with self._lock:
+            async with self._uow_factory() as uow:
+                batch = await uow.email_outbox_repository.claim_due(
+                    self._batch_size, self._lease_seconds
+                )
+                await uow.commit()
+            if not batch:
+                return 0
+
+            errors = await self._send(batch)
+
+            async with self._uow_factory() as uow:
+                outbox = uow.email_outbox_repository
+                await outbox.mark_sent(
+                    [email.id for email, error in zip(batch, errors) if error is None]
+                )
+                for email, error in zip(batch, errors):
+                    if error is None:
+                        continue
+                    if email.attempts >= self._max_attempts:
+                        logger.error(
+                            "email_outbox_gave_up id=%s attempts=%s error=%s",
+                            email.id,
+                            email.attempts,
+                            error,
+                        )
+                        await outbox.mark_failed(email.id, error)
+                    else:
+                        await outbox.retry_later(
+                            email.id, self.backoff_seconds(email.attempts), error
+                        )
+                await uow.commit()
+            return len(batch)
+
+    async def drain(self) -> int:
+        """Send batches until no due email is left; return how many were claimed."""
+        total = 0
+        while True:
+            claimed = await self.dispatch_once()
+            total += claimed
+            if claimed < self._batch_size:
+                return total
+
+    def backoff_seconds(self, attempts: int) -> float:
+        """Delay before retrying an email that has failed `attempts` times."""
+        delay = min(self._backoff_max, self._backoff_base * 2 ** (attempts - 1))
+        # Jitter spreads retries of a burst that failed together.
+        return delay * (0.5 + self._rng() / 2)
+
+    async def _send(self, batch: list[OutboxEmail]) -> list[str | None]:
+        """Send the batch in one transport call; return an error per email."""
+        try:
+            results = await asyncio.wait_for(
+                self._transport.send_many([email.message for email in batch]),
+                self._send_timeout,
+            )
+        except Exception as exc:
+            # Nothing is known about individual emails; retry all of them.
+            results = [exc] * len(batch)
+        errors: list[str | None] = []
+        for email, exc in zip(batch, results):
+            if exc is None:
+                errors.append(None)
+                continue
+            logger.warning(
+                "email_outbox_send_failed id=%s attempt=%s",
+                email.id,
+                email.attempts,
+                exc_info=exc,
+            )
+            errors.append(f"{type(exc).__name__}: {exc}"[:_MAX_ERROR_LENGTH])
+        return errors
+
+    async def _run(self) -> None:
+        backoff = self._poll_interval
+        while True:
+            self._wakeup.clear()
+            try:
+                claimed = await self.drain()
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.warning("email_outbox_dispatch_failed", exc_info=True)
+                await asyncio.sleep(backoff)
+                backoff = min(backoff * 2, 30.0)
+                continue
+            backoff = self._poll_interval
+            if claimed:
+                logger.debug("email_outbox_dispatched count=%s", claimed)
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), self._poll_interval)
+            except TimeoutError:
+                pass
@@ -0,0 +1,11 @@
+"""Local similarity search infrastructure (requires NumPy)."""
+
+from backend.src.infrastructure.similarity.index_sync import SimilarTaskIndexSync
+from backend.src.infrastructure.similarity.numpy_similar_task_index import (
+    NumpySimilarTaskIndex,
+)
+
+__all__ = [
+    "NumpySimilarTaskIndex",
+    "SimilarTaskIndexSync",
+]
@@ -0,0 +1,58 @@
+"""Background loop keeping a worker's similar-task index in step with the DB."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+
+from backend.src.application.use_cases.task_management import (
+    IndexCompletedTasksUseCase,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class SimilarTaskIndexSync:
+    """
+    Periodically indexes tasks that other workers completed.
+
+    Each worker holds its own in-process index and only sees the completion
+    events of its own requests; every ``interval_seconds`` this reads the
+    tasks completed since the last pass, so workers drift apart by at most
+    one interval.
+    """
+
+    def __init__(
+        self, indexer: IndexCompletedTasksUseCase, interval_seconds: float = 60.0
+    ) -> None:
+        self._indexer = indexer
+        self._interval = interval_seconds
+        self._task: asyncio.Task[None] | None = None
+
+    async def start(self) -> None:
+        """Start syncing in the background."""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop syncing; the index keeps what it already holds."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self._interval)
+            try:
+                added = await self._indexer.sync()
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.warning("similar_task_index_sync_failed", exc_info=True)
+                continue
+            if added:
+                logger.debug("similar_task_index_synced count=%s", added)
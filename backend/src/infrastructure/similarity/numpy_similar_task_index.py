@@ -0,0 +1,150 @@
+"""Similar-task index over hashed character n-grams in a NumPy matrix."""
+
+from __future__ import annotations
+
+import unicodedata
+import zlib
+from uuid import UUID
+
+import numpy as np
+
+from backend.src.domain.ports.services import SimilarTask
+
+
+class NumpySimilarTaskIndex:
+    """
+    In-process cosine search over completed tasks, with no external service.
+
+    Title and description are case-folded, whitespace-collapsed and cut
+    into character ``ngram``-grams; each is hashed (CRC-32) into one of
+    ``dimensions`` buckets with a sign taken from the hash, and the vector
+    is L2-normalised. Rows live in one float32 matrix, so a query is a
+    single matrix-vector product; rows of other projects are masked out of
+    the scores. The matrix grows by doubling up to ``max_entries`` rows
+    (shared by all projects); once full, the oldest entry is overwritten.
+    """
+
+    def __init__(
+        self, dimensions: int = 4096, ngram: int = 3, max_entries: int = 10000
+    ) -> None:
+        self._dimensions = dimensions
+        self._ngram = ngram
+        self._max_entries = max(1, max_entries)
+        self._matrix = np.zeros((0, dimensions), dtype=np.float32)
+        self._points = np.zeros(0, dtype=np.int32)
+        # Small integer per project, so rows can be masked in one comparison.
+        self._owners = np.zeros(0, dtype=np.int32)
+        self._project_codes: dict[UUID, int] = {}
+        self._task_ids: list[UUID | None] = []
+        self._rows: dict[UUID, int] = {}
+        self._free: list[int] = []
+        self._used = 0  # Rows ever handed out; rows past it are unused.
+        self._oldest = 0  # Row overwritten next once the index is full.
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def add(
+        self,
+        project_id: UUID,
+        task_id: UUID,
+        title: str,
+        description: str,
+        difficulty_points: int,
+    ) -> None:
+        vector = self.vectorize(title, description)
+        if vector is None:
+            return
+        row = self._rows.get(task_id)
+        if row is None:
+            row = self._claim_row()
+            self._rows[task_id] = row
+            self._task_ids[row] = task_id
+        self._matrix[row] = vector
+        self._points[row] = difficulty_points
+        self._owners[row] = self._project_codes.setdefault(
+            project_id, len(self._project_codes) + 1
+        )
+
+    def remove(self, task_id: UUID) -> None:
+        row = self._rows.pop(task_id, None)
+        if row is None:
+            return
+        self._matrix[row] = 0.0
+        self._owners[row] = 0
+        self._task_ids[row] = None
+        self._free.append(row)
+
+    def nearest(
+        self, project_id: UUID, title: str, description: str
+    ) -> SimilarTask | None:
+        code = self._project_codes.get(project_id)
+        if code is None:
+            return None
+        vector = self.vectorize(title, description)
+        if vector is None:
+            return None
+        scores = self._matrix[: self._used] @ vector
+        scores[self._owners[: self._used] != code] = -np.inf
+        row = int(np.argmax(scores))
+        task_id = self._task_ids[row]
+        if task_id is None or scores[row] == -np.inf:
+            return None
+        return SimilarTask(
+            task_id=task_id,
+            difficulty_points=int(self._points[row]),
+            similarity=min(1.0, max(0.0, float(scores[row]))),
+        )
+
+    def vectorize(self, title: str, description: str) -> np.ndarray | None:
+        """Unit vector of the task's text; None if it has no text."""
+        text = " ".join(
+            unicodedata.normalize("NFKC", f"{title} {description}").casefold().split()
+        )
+        if not text:
+            return None
+        padded = f" {text} "
+        hashes = np.fromiter(
+            (
+                zlib.crc32(padded[i : i + self._ngram].encode())
+                for i in range(max(1, len(padded) - self._ngram + 1))
+            ),
+            dtype=np.uint32,
+        )
+        signs = np.where(hashes & 0x80000000, 1.0, -1.0).astype(np.float32)
+        vector = np.zeros(self._dimensions, dtype=np.float32)
+        np.add.at(vector, hashes % self._dimensions, signs)
+        norm = float(np.linalg.norm(vector))
+        if norm == 0.0:
+            return None
+        return vector / norm
+
+    def _claim_row(self) -> int:
+        if self._free:
+            return self._free.pop()
+        if self._used < self._max_entries:
+            row = self._used
+            self._used += 1
+            self._grow(self._used)
+            return row
+        # Full: overwrite the oldest entry.
+        row = self._oldest
+        self._oldest = (self._oldest + 1) % self._max_entries
+        evicted = self._task_ids[row]
+        if evicted is not None:
+            del self._rows[evicted]
+        return row
+
+    def _grow(self, rows: int) -> None:
+        capacity = len(self._task_ids)
+        if rows <= capacity:
+            return
+        capacity = min(self._max_entries, max(rows, capacity * 2, 64))
+        matrix = np.zeros((capacity, self._dimensions), dtype=np.float32)
+        matrix[: len(self._matrix)] = self._matrix
+        points = np.zeros(capacity, dtype=np.int32)
+        points[: len(self._points)] = self._points
+        owners = np.zeros(capacity, dtype=np.int32)
+        owners[: len(self._owners)] = self._owners
+        self._matrix, self._points, self._owners = matrix, points, owners
+        self._task_ids.extend([None] * (capacity - len(self._task_ids)))
@@ -0,0 +1 @@
+"""Scheduled jobs run outside the API process (cron, Kubernetes CronJob)."""
@@ -0,0 +1,52 @@
+"""Manager daily report job (UC-080).
+
+Schedule once a day, e.g. at 08:00:
+
+    python -m backend.src.jobs.daily_reports
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+
+from backend.src.application.use_cases.notifications import (
+    SendDailyReportsInput,
+    SendDailyReportsOutput,
+    SendDailyReportsUseCase,
+)
+from backend.src.config.settings import AppSettings, get_settings
+from backend.src.infrastructure.db.unit_of_work import SqlAlchemyUnitOfWork
+from backend.src.jobs.runtime import job_runtime
+
+logger = logging.getLogger(__name__)
+
+
+async def run_daily_reports(settings: AppSettings) -> SendDailyReportsOutput:
+    """Send today's reports for every project on a working day."""
+    async with job_runtime(settings) as runtime:
+        async with runtime.session_factory() as session:
+            use_case = SendDailyReportsUseCase(
+                uow=SqlAlchemyUnitOfWork(session),
+                notification_service=runtime.notification_service,
+                page_size=settings.daily_report_page_size,
+                concurrency=settings.daily_report_concurrency,
+            )
+            output = await use_case.execute(SendDailyReportsInput())
+    logger.info(
+        "daily_reports_done sent=%s skipped=%s failed=%s",
+        output.sent,
+        output.skipped,
+        output.failed,
+    )
+    return output
+
+
+def main() -> None:
+    output = asyncio.run(run_daily_reports(get_settings()))
+    if output.failed:
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
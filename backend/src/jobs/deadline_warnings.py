@@ -0,0 +1,54 @@
+"""Deadline warning job (UC-084).
+
+Schedule every few minutes, e.g. every 15:
+
+    python -m backend.src.jobs.deadline_warnings
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from datetime import timedelta
+
+from backend.src.application.use_cases.notifications import (
+    SendDeadlineWarningsInput,
+    SendDeadlineWarningsOutput,
+    SendDeadlineWarningsUseCase,
+)
+from backend.src.config.settings import AppSettings, get_settings
+from backend.src.infrastructure.db.unit_of_work import SqlAlchemyUnitOfWork
+from backend.src.jobs.runtime import job_runtime
+
+logger = logging.getLogger(__name__)
+
+
+async def run_deadline_warnings(settings: AppSettings) -> SendDeadlineWarningsOutput:
+    """Schedule newly seen deadlines and send the warnings now due."""
+    async with job_runtime(settings) as runtime:
+        async with runtime.session_factory() as session:
+            use_case = SendDeadlineWarningsUseCase(
+                uow=SqlAlchemyUnitOfWork(session),
+                notification_service=runtime.notification_service,
+                lookahead=timedelta(days=settings.deadline_warning_lookahead_days),
+                page_size=settings.deadline_warning_page_size,
+                concurrency=settings.deadline_warning_concurrency,
+            )
+            output = await use_case.execute(SendDeadlineWarningsInput())
+    logger.info(
+        "deadline_warnings_done scanned=%s sent=%s failed=%s",
+        output.scanned,
+        output.sent,
+        output.failed,
+    )
+    return output
+
+
+def main() -> None:
+    output = asyncio.run(run_deadline_warnings(get_settings()))
+    if output.failed:
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+"""Shared setup for scheduled jobs."""
+
+from __future__ import annotations
+
+from collections.abc import AsyncIterator, Callable
+from contextlib import AbstractAsyncContextManager, asynccontextmanager
+from dataclasses import dataclass
+from functools import partial
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from backend.src.adapters.services import (
+    EmailNotificationService,
+    MockNotificationService,
+    OutboxEmailService,
+)
+from backend.src.config.settings import AppSettings
+from backend.src.domain.ports import NotificationService, UnitOfWork
+from backend.src.infrastructure.db.session import (
+    dispose_db,
+    get_session_factory,
+    init_db,
+)
+from backend.src.infrastructure.db.unit_of_work import open_unit_of_work
+from backend.src.observability.logging_config import configure_logging
+
+
+@dataclass(frozen=True)
+class JobRuntime:
+    """Dependencies available to a job run."""
+
+    session_factory: async_sessionmaker[AsyncSession]
+    uow_factory: Callable[[], AbstractAsyncContextManager[UnitOfWork]]
+    notification_service: NotificationService
+
+
+@asynccontextmanager
+async def job_runtime(settings: AppSettings) -> AsyncIterator[JobRuntime]:
+    """
+    Open the database and notification wiring for one job run.
+
+    Emails are only queued in the outbox; the API workers' dispatcher
+    delivers them, so jobs never talk to SMTP.
+    """
+    if not settings.database_url:
+        raise RuntimeError("DATABASE_URL is required")
+    configure_logging(settings.log_level)
+    init_db(settings)
+    try:
+        session_factory = get_session_factory()
+        uow_factory = partial(open_unit_of_work, session_factory)
+        if settings.notification_provider == "mock":
+            notification_service: NotificationService = MockNotificationService()
+        else:
+            notification_service = EmailNotificationService(
+                OutboxEmailService(uow_factory)
+            )
+        yield JobRuntime(
+            session_factory=session_factory,
+            uow_factory=uow_factory,
+            notification_service=notification_service,
+        )
+    finally:
+        await dispose_db()
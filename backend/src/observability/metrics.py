@@ -0,0 +1,66 @@
+"""Prometheus text exposition of in-process health metrics."""
+
+from __future__ import annotations
+
+from collections.abc import Mapping
+
+from backend.src.adapters.services import (
+    CircuitBreakerSnapshot,
+    CircuitState,
+    LLMCacheStats,
+)
+
+
+def _label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def render_circuit_breakers(breakers: Mapping[str, CircuitBreakerSnapshot]) -> str:
+    """Render LLM provider breakers in the Prometheus text format."""
+    lines = [
+        "# HELP llm_circuit_breaker_state 1 for the breaker's current state.",
+        "# TYPE llm_circuit_breaker_state gauge",
+    ]
+    for name, snapshot in breakers.items():
+        for state in CircuitState:
+            value = int(snapshot.state == state)
+            lines.append(
+                f'llm_circuit_breaker_state{{provider="{_label(name)}",'
+                f'state="{state.value}"}} {value}'
+            )
+    lines += [
+        "# HELP llm_circuit_breaker_failures Consecutive failures recorded.",
+        "# TYPE llm_circuit_breaker_failures gauge",
+    ]
+    for name, snapshot in breakers.items():
+        lines.append(
+            f'llm_circuit_breaker_failures{{provider="{_label(name)}"}} '
+            f"{snapshot.consecutive_failures}"
+        )
+    lines += [
+        "# HELP llm_circuit_breaker_opened_total Times the breaker opened.",
+        "# TYPE llm_circuit_breaker_opened_total counter",
+    ]
+    for name, snapshot in breakers.items():
+        lines.append(
+            f'llm_circuit_breaker_opened_total{{provider="{_label(name)}"}} '
+            f"{snapshot.opened_total}"
+        )
+    return "\n".join(lines) + "\n"
+
+
+def render_llm_cache(stats: LLMCacheStats | None) -> str:
+    """Render LLM result cache hits and misses in the Prometheus text format."""
+    if stats is None:
+        return ""
+    lines = [
+        "# HELP llm_cache_hits_total Estimations served without the provider.",
+        "# TYPE llm_cache_hits_total counter",
+        f'llm_cache_hits_total{{tier="local"}} {stats.local_hits}',
+        f'llm_cache_hits_total{{tier="shared"}} {stats.shared_hits}',
+        f'llm_cache_hits_total{{tier="coalesced"}} {stats.coalesced}',
+        "# HELP llm_cache_misses_total Estimations sent to the provider.",
+        "# TYPE llm_cache_misses_total counter",
+        f"llm_cache_misses_total {stats.misses}",
+    ]
+    return "\n".join(lines) + "\n"
@@ -0,0 +1,140 @@
+"""Per-request latency breakdown reported through the Server-Timing header."""
+
+from __future__ import annotations
+
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from time import perf_counter
+from typing import Any, Literal
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+Phase = Literal["auth", "serialize"]
+
+_QUERY_START_KEY = "server_timing_query_start"
+
+
+@dataclass
+class RequestTiming:
+    """
+    Time spent per phase of one request, in seconds.
+
+    ``domain`` is the endpoint body minus the DB queries and serialization
+    it performed; ``serialize`` covers explicit rendering plus the time
+    between the endpoint returning and the response starting.
+    """
+
+    started_at: float = field(default_factory=perf_counter)
+    auth: float = 0.0
+    db: float = 0.0
+    db_queries: int = 0
+    domain: float = 0.0
+    serialize: float = 0.0
+    endpoint_returned_at: float | None = None
+
+    def header_value(self, now: float | None = None) -> str:
+        """Render the timings as a Server-Timing header value."""
+        now = perf_counter() if now is None else now
+        serialize = self.serialize
+        if self.endpoint_returned_at is not None:
+            serialize += now - self.endpoint_returned_at
+        return ", ".join(
+            [
+                f"auth;dur={self.auth * 1000:.2f}",
+                f'db;dur={self.db * 1000:.2f};desc="{self.db_queries} queries"',
+                f"domain;dur={self.domain * 1000:.2f}",
+                f"serialize;dur={serialize * 1000:.2f}",
+                f"total;dur={(now - self.started_at) * 1000:.2f}",
+            ]
+        )
+
+
+_request_timing: ContextVar[RequestTiming | None] = ContextVar(
+    "request_timing", default=None
+)
+
+
+def start_request_timing() -> tuple[RequestTiming, object]:
+    """Start timing a request and return the timing with its reset token."""
+    timing = RequestTiming()
+    return timing, _request_timing.set(timing)
+
+
+def reset_request_timing(token: object) -> None:
+    """Reset request timing context using token."""
+    _request_timing.reset(token)
+
+
+def get_request_timing() -> RequestTiming | None:
+    """Get the timing of the current request, if one is being timed."""
+    return _request_timing.get()
+
+
+@contextmanager
+def measure(phase: Phase) -> Iterator[None]:
+    """Add the time spent in the block to a phase of the current request."""
+    timing = _request_timing.get()
+    if timing is None:
+        yield
+        return
+    started = perf_counter()
+    try:
+        yield
+    finally:
+        setattr(timing, phase, getattr(timing, phase) + perf_counter() - started)
+
+
+@contextmanager
+def measure_endpoint() -> Iterator[None]:
+    """
+    Attribute the time spent in an endpoint body to the domain phase.
+
+    DB, auth and serialization time recorded while the block runs is
+    subtracted so that each millisecond is reported once.
+    """
+    timing = _request_timing.get()
+    if timing is None:
+        yield
+        return
+    started = perf_counter()
+    accounted = timing.auth + timing.db + timing.serialize
+    try:
+        yield
+    finally:
+        ended = perf_counter()
+        nested = timing.auth + timing.db + timing.serialize - accounted
+        timing.domain += ended - started - nested
+        timing.endpoint_returned_at = ended
+
+
+def _before_cursor_execute(conn: Any, *args: Any) -> None:
+    if _request_timing.get() is not None:
+        conn.info.setdefault(_QUERY_START_KEY, []).append(perf_counter())
+
+
+def _after_cursor_execute(conn: Any, *args: Any) -> None:
+    timing = _request_timing.get()
+    starts = conn.info.get(_QUERY_START_KEY)
+    if timing is None or not starts:
+        return
+    timing.db += perf_counter() - starts.pop()
+    timing.db_queries += 1
+
+
+def _handle_error(context: Any) -> None:
+    starts = context.connection.info.get(_QUERY_START_KEY) if context.connection else None
+    if starts:
+        starts.pop()
+
+
+def instrument_engine(engine: AsyncEngine) -> None:
+    """Record query count and duration on the timing of the current request."""
+    sync_engine = engine.sync_engine
+    if event.contains(sync_engine, "before_cursor_execute", _before_cursor_execute):
+        return
+    event.listen(sync_engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(sync_engine, "after_cursor_execute", _after_cursor_execute)
+    event.listen(sync_engine, "handle_error", _handle_error)
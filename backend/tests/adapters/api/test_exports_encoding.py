@@ -0,0 +1,124 @@
+"""Tests for the streaming export encoders."""
+
+import csv
+import gzip
+import io
+import json
+from collections.abc import AsyncIterator, Iterable
+from datetime import UTC, datetime
+from uuid import uuid4
+
+import pytest
+
+from backend.src.adapters.api.routers.exports import (
+    CHUNK_SIZE,
+    coalesce,
+    encode_csv,
+    encode_ndjson,
+    gzip_stream,
+)
+
+
+async def _aiter(items: Iterable) -> AsyncIterator:
+    for item in items:
+        yield item
+
+
+async def _collect(stream: AsyncIterator) -> list:
+    return [item async for item in stream]
+
+
+def _rows() -> list[dict]:
+    return [
+        {
+            "id": uuid4(),
+            "title": 'Say "hi", then leave',
+            "description": "line one\nline two",
+            "difficulty_points": 3,
+            "assignee_id": None,
+            "created_at": datetime(2026, 1, 5, 9, 30, tzinfo=UTC),
+        },
+        {
+            "id": uuid4(),
+            "title": "Café ☕",
+            "description": "",
+            "difficulty_points": None,
+            "assignee_id": uuid4(),
+            "created_at": datetime(2026, 1, 6, tzinfo=UTC),
+        },
+    ]
+
+
+@pytest.mark.asyncio
+async def test_csv_writes_a_header_and_quotes_values():
+    rows = _rows()
+
+    text = "".join(await _collect(encode_csv(_aiter(rows))))
+
+    header, *records = list(csv.reader(io.StringIO(text)))
+    assert header == list(rows[0])
+    assert records[0] == [
+        str(rows[0]["id"]),
+        'Say "hi", then leave',
+        "line one\nline two",
+        "3",
+        "",
+        "2026-01-05T09:30:00+00:00",
+    ]
+    assert records[1][1] == "Café ☕"
+    assert '"Say ""hi"", then leave"' in text
+
+
+@pytest.mark.asyncio
+async def test_csv_of_no_rows_is_empty():
+    assert await _collect(encode_csv(_aiter([]))) == []
+
+
+@pytest.mark.asyncio
+async def test_ndjson_lines_round_trip_through_json():
+    rows = _rows()
+
+    lines = await _collect(encode_ndjson(_aiter(rows)))
+
+    assert all(line.endswith("\n") and line.count("\n") == 1 for line in lines)
+    decoded = [json.loads(line) for line in lines]
+    assert decoded[0] == {
+        "id": str(rows[0]["id"]),
+        "title": 'Say "hi", then leave',
+        "description": "line one\nline two",
+        "difficulty_points": 3,
+        "assignee_id": None,
+        "created_at": "2026-01-05T09:30:00+00:00",
+    }
+    assert decoded[1]["title"] == "Café ☕"
+
+
+@pytest.mark.asyncio
+async def test_coalesce_joins_pieces_into_chunks_of_chunk_size():
+    piece = "x" * 1000
+    count = 3 * CHUNK_SIZE // len(piece)
+
+    chunks = await _collect(coalesce(_aiter([piece] * count)))
+
+    assert b"".join(chunks) == piece.encode() * count
+    # Each chunk is flushed by the first piece that reaches CHUNK_SIZE.
+    full = -(-CHUNK_SIZE // len(piece)) * len(piece)
+    rest = len(piece) * count - 2 * full
+    assert [len(chunk) for chunk in chunks] == [full, full, rest]
+
+
+@pytest.mark.asyncio
+async def test_coalesce_measures_chunks_in_encoded_bytes():
+    chunks = await _collect(coalesce(_aiter(["é"] * 4), chunk_size=4))
+
+    assert chunks == ["éé".encode(), "éé".encode()]
+
+
+@pytest.mark.asyncio
+async def test_gzip_stream_decompresses_to_the_input():
+    chunks = [bytes(range(256)) * 100, b"", b"tail\n" * 5000]
+
+    compressed = b"".join(await _collect(gzip_stream(_aiter(chunks))))
+
+    assert gzip.decompress(compressed) == b"".join(chunks)
+    assert len(compressed) < len(b"".join(chunks))
@@ -0,0 +1,123 @@
+"""Tests for the pure ASGI request-ID and Server-Timing middleware."""
+
+import re
+import time
+
+import pytest
+import pytest_asyncio
+from fastapi import APIRouter, Depends, FastAPI
+from fastapi.responses import StreamingResponse
+from httpx import ASGITransport, AsyncClient
+from pydantic import BaseModel
+
+from backend.src.adapters.api.middleware.request_id import RequestIdMiddleware
+from backend.src.adapters.api.middleware.server_timing import (
+    ServerTimingMiddleware,
+    TimedRoute,
+)
+from backend.src.adapters.api.responses import ORJSONResponse
+from backend.src.observability.logging_context import get_request_id
+from backend.src.observability.server_timing import get_request_timing, measure
+
+
+class Echo(BaseModel):
+    request_id: str | None
+
+
+async def authenticate() -> str:
+    with measure("auth"):
+        time.sleep(0.01)
+    return "user"
+
+
+def build_app() -> FastAPI:
+    router = APIRouter(route_class=TimedRoute)
+
+    @router.get("/echo", response_model=Echo)
+    async def echo(user: str = Depends(authenticate)) -> Echo:
+        time.sleep(0.02)
+        return Echo(request_id=get_request_id())
+
+    @router.get("/rows")
+    async def rows() -> ORJSONResponse:
+        timing = get_request_timing()
+        timing.db += 0.005
+        timing.db_queries += 2
+        return ORJSONResponse([{"n": n} for n in range(1000)])
+
+    @router.get("/stream")
+    async def stream() -> StreamingResponse:
+        async def chunks():
+            for n in range(3):
+                yield f"{n}\n".encode()
+
+        return StreamingResponse(chunks(), media_type="text/plain")
+
+    app = FastAPI()
+    app.add_middleware(ServerTimingMiddleware)
+    app.add_middleware(RequestIdMiddleware)
+    app.include_router(router)
+    return app
+
+
+def durations(header: str) -> dict[str, float]:
+    return {
+        name: float(dur)
+        for name, dur in re.findall(r"(\w+);dur=([0-9.]+)", header)
+    }
+
+
+@pytest_asyncio.fixture
+async def client():
+    transport = ASGITransport(app=build_app())
+    async with AsyncClient(transport=transport, base_url="http://test") as client:
+        yield client
+
+
+@pytest.mark.asyncio
+async def test_request_id_is_propagated_and_echoed(client):
+    response = await client.get("/echo", headers={"X-Request-Id": "req-1"})
+
+    assert response.headers["X-Request-Id"] == "req-1"
+    assert response.json() == {"request_id": "req-1"}
+
+
+@pytest.mark.asyncio
+async def test_request_id_is_generated_when_missing(client):
+    response = await client.get("/echo")
+
+    assert response.headers["X-Request-Id"]
+    assert response.json()["request_id"] == response.headers["X-Request-Id"]
+
+
+@pytest.mark.asyncio
+async def test_server_timing_separates_auth_from_domain(client):
+    response = await client.get("/echo")
+
+    phases = durations(response.headers["Server-Timing"])
+    assert set(phases) == {"auth", "db", "domain", "serialize", "total"}
+    assert phases["auth"] >= 10
+    assert phases["domain"] >= 20
+    assert phases["domain"] < 20 + phases["auth"]
+    assert phases["total"] >= phases["auth"] + phases["domain"]
+
+
+@pytest.mark.asyncio
+async def test_server_timing_reports_db_and_excludes_it_from_domain(client):
+    response = await client.get("/rows")
+
+    header = response.headers["Server-Timing"]
+    assert 'desc="2 queries"' in header
+    phases = durations(header)
+    assert phases["db"] == pytest.approx(5, abs=0.01)
+    assert phases["serialize"] > 0
+    assert len(response.json()) == 1000
+
+
+@pytest.mark.asyncio
+async def test_streaming_response_passes_through(client):
+    response = await client.get("/stream", headers={"X-Request-Id": "req-2"})
+
+    assert response.text == "0\n1\n2\n"
+    assert response.headers["X-Request-Id"] == "req-2"
+    assert "Server-Timing" in response.headers
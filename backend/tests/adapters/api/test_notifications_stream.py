@@ -0,0 +1,37 @@
+"""Tests for the toast SSE stream."""
+
+import json
+from uuid import uuid4
+
+import pytest
+
+from backend.src.adapters.api.routers.notifications import toast_events
+from backend.src.adapters.services import InMemoryToastHub
+from backend.src.domain.ports.services import NewTaskToastData
+
+
+@pytest.mark.asyncio
+async def test_stream_sends_heartbeats_then_toasts_and_unsubscribes():
+    hub = InMemoryToastHub()
+    user_id = uuid4()
+    events = toast_events(hub, user_id, heartbeat_seconds=0.01)
+
+    assert await anext(events) == "retry: 5000\n\n"
+    assert await anext(events) == ": keep-alive\n\n"
+    await hub.publish(
+        [user_id],
+        NewTaskToastData(
+            project_id=uuid4(),
+            project_name="Project",
+            task_id=uuid4(),
+            task_title="Task",
+            required_role=None,
+        ),
+    )
+    frame = await anext(events)
+    await events.aclose()
+
+    event_line, data_line, _, _ = frame.split("\n")
+    assert event_line == "event: new_task"
+    assert json.loads(data_line.removeprefix("data: "))["task_title"] == "Task"
+    assert hub.connection_count == 0
@@ -0,0 +1,193 @@
+"""Tests for the streamed progress estimate SSE frames."""
+
+import json
+from types import SimpleNamespace
+from uuid import UUID, uuid4
+
+import pytest
+import pytest_asyncio
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse
+from httpx import ASGITransport, AsyncClient
+
+from backend.src.adapters.api.errors import error_detail, http_status_for
+from backend.src.adapters.api.routers.common import get_container, get_current_user_id
+from backend.src.adapters.api.routers.tasks import progress_estimate_events, router
+from backend.src.application.use_cases.task_management import (
+    EstimateTaskProgressOutput,
+)
+from backend.src.domain.entities import Task
+from backend.src.domain.errors import (
+    DomainError,
+    InvalidStatusTransitionError,
+    LLMNotConfiguredError,
+    LLMProviderError,
+    TaskNotOwnedError,
+)
+from backend.src.domain.ports.services import ProgressEstimation
+
+
+def _frame(frame: str) -> tuple[str, dict]:
+    event_line, data_line, _, _ = frame.split("\n")
+    return event_line.removeprefix("event: "), json.loads(
+        data_line.removeprefix("data: ")
+    )
+
+
+@pytest.mark.asyncio
+async def test_frames_reasoning_then_the_result():
+    task = Task(project_id=uuid4(), title="Build API")
+    output = EstimateTaskProgressOutput(
+        task=task,
+        estimation=ProgressEstimation(
+            percentage=60, confidence=0.7, reasoning="Half\ndone"
+        ),
+        reports_sent=2,
+    )
+
+    async def rest():
+        yield "\ndone"
+        yield output
+
+    frames = [frame async for frame in progress_estimate_events("Half", rest())]
+
+    assert [_frame(frame) for frame in frames[:2]] == [
+        ("reasoning", {"text": "Half"}),
+        ("reasoning", {"text": "\ndone"}),
+    ]
+    event, data = _frame(frames[2])
+    assert event == "result"
+    assert data["progress_percent"] == 60
+    assert data["reports_sent"] == 2
+
+
+@pytest.mark.asyncio
+async def test_error_after_the_start_is_sent_as_an_event():
+    closed = []
+
+    async def rest():
+        try:
+            raise LLMProviderError("openai", "stalled")
+            yield
+        finally:
+            closed.append(True)
+
+    frames = [frame async for frame in progress_estimate_events("Half", rest())]
+
+    event, data = _frame(frames[-1])
+    assert event == "error"
+    assert data["status"] == 502
+    assert closed == [True]
+
+
+def _output(percentage: int = 60) -> EstimateTaskProgressOutput:
+    return EstimateTaskProgressOutput(
+        task=Task(project_id=uuid4(), title="Build API"),
+        estimation=ProgressEstimation(
+            percentage=percentage, confidence=0.7, reasoning="Half done"
+        ),
+        reports_sent=1,
+    )
+
+
+class StubEstimateUseCase:
+    """Streams ``items``; an exception among them is raised in its place."""
+
+    def __init__(self, *items) -> None:
+        self.items = items
+        self.inputs: list = []
+
+    async def stream(self, input):
+        self.inputs.append(input)
+        for item in self.items:
+            if isinstance(item, Exception):
+                raise item
+            yield item
+
+
+@pytest_asyncio.fixture
+async def stream_client():
+    app = FastAPI()
+    app.include_router(router)
+
+    @app.exception_handler(DomainError)
+    async def handle_domain_error(request: Request, exc: DomainError) -> JSONResponse:
+        return JSONResponse(
+            status_code=http_status_for(exc), content={"detail": error_detail(exc)}
+        )
+
+    user_id = uuid4()
+    app.dependency_overrides[get_current_user_id] = lambda: user_id
+
+    def serve(use_case: StubEstimateUseCase) -> None:
+        container = SimpleNamespace(estimate_task_progress_use_case=lambda: use_case)
+        app.dependency_overrides[get_container] = lambda: container
+
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as client:
+        yield client, serve, user_id
+
+
+def _url(task_id: UUID | None = None) -> str:
+    return f"/projects/{uuid4()}/tasks/{task_id or uuid4()}/progress/estimate/stream"
+
+
+@pytest.mark.asyncio
+async def test_route_streams_server_sent_events(stream_client):
+    client, serve, user_id = stream_client
+    use_case = StubEstimateUseCase("Half", " done", _output())
+    serve(use_case)
+    task_id = uuid4()
+
+    response = await client.post(_url(task_id))
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/event-stream")
+    assert response.headers["cache-control"] == "no-cache"
+    assert response.headers["x-accel-buffering"] == "no"
+    frames = response.text.split("\n\n")[:-1]
+    assert [_frame(frame + "\n\n")[0] for frame in frames] == [
+        "reasoning",
+        "reasoning",
+        "result",
+    ]
+    (input,) = use_case.inputs
+    assert (input.task_id, input.user_id) == (task_id, user_id)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("error", "status"),
+    [
+        (TaskNotOwnedError("task", "user"), 403),
+        (InvalidStatusTransitionError("todo", "doing"), 400),
+        (LLMNotConfiguredError("project"), 400),
+        (LLMProviderError("openai", "down"), 502),
+    ],
+)
+async def test_route_returns_errors_before_the_first_item(
+    stream_client, error, status
+):
+    client, serve, _ = stream_client
+    serve(StubEstimateUseCase(error))
+
+    response = await client.post(_url())
+
+    assert response.status_code == status
+    assert response.headers["content-type"] == "application/json"
+    assert response.json() == {"detail": error_detail(error)}
+
+
+@pytest.mark.asyncio
+async def test_route_sends_later_errors_as_an_event(stream_client):
+    client, serve, _ = stream_client
+    serve(StubEstimateUseCase("Half", LLMProviderError("openai", "stalled")))
+
+    response = await client.post(_url())
+
+    assert response.status_code == 200
+    frames = response.text.split("\n\n")[:-1]
+    assert [_frame(frame + "\n\n")[0] for frame in frames] == [
+        "reasoning",
+        "error",
+    ]
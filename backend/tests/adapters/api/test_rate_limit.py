@@ -0,0 +1,82 @@
+"""Tests for the rate_limit router dependency."""
+
+from uuid import UUID, uuid4
+
+import pytest
+import pytest_asyncio
+from fastapi import Depends, FastAPI
+from httpx import ASGITransport, AsyncClient
+
+from backend.src.adapters.api import deps
+from backend.src.adapters.api.routers.common import RateLimitScope, rate_limit
+from backend.src.adapters.services import InMemoryRateLimiter
+
+
+class HeaderUserIdProvider(deps.CurrentUserIdProvider):
+    async def get_user_id(self, auth) -> UUID:
+        return UUID(auth.credentials)
+
+
+@pytest_asyncio.fixture
+async def client(monkeypatch):
+    monkeypatch.setattr(deps, "_current_user_id_provider", HeaderUserIdProvider())
+    monkeypatch.setattr(deps, "_rate_limiter", InMemoryRateLimiter())
+
+    app = FastAPI()
+    limits = [
+        Depends(rate_limit("t", per=RateLimitScope.USER, limit=3, window_seconds=60)),
+        Depends(rate_limit("t", per=RateLimitScope.PROJECT, limit=4, window_seconds=60)),
+    ]
+
+    @app.get("/projects/{project_id}/things", dependencies=limits)
+    async def things(project_id: UUID) -> dict:
+        return {}
+
+    @app.get("/things", dependencies=limits)
+    async def all_things() -> dict:
+        return {}
+
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as client:
+        yield client
+
+
+def auth(user_id: UUID) -> dict[str, str]:
+    return {"Authorization": f"Bearer {user_id}"}
+
+
+@pytest.mark.asyncio
+async def test_user_bucket_returns_429_with_retry_after(client):
+    user = uuid4()
+
+    statuses = [
+        (await client.get("/things", headers=auth(user))).status_code for _ in range(3)
+    ]
+    rejected = await client.get("/things", headers=auth(user))
+
+    assert statuses == [200, 200, 200]
+    assert rejected.status_code == 429
+    assert int(rejected.headers["Retry-After"]) >= 1
+    assert (await client.get("/things", headers=auth(uuid4()))).status_code == 200
+
+
+@pytest.mark.asyncio
+async def test_project_bucket_is_shared_by_members(client):
+    project = uuid4()
+    users = [uuid4(), uuid4()]
+
+    statuses = [
+        (await client.get(f"/projects/{project}/things", headers=auth(u))).status_code
+        for u in users * 3
+    ]
+
+    assert statuses == [200, 200, 200, 200, 429, 429]
+    other = await client.get(f"/projects/{uuid4()}/things", headers=auth(uuid4()))
+    assert other.status_code == 200
+
+
+@pytest.mark.asyncio
+async def test_unauthenticated_requests_are_not_counted(client):
+    response = await client.get("/things")
+
+    assert response.status_code in {401, 403}
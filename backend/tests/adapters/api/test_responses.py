@@ -0,0 +1,38 @@
+"""Tests for the orjson-backed list response path."""
+
+import json
+from datetime import datetime, timezone
+from uuid import uuid4
+
+from backend.src.adapters.api.responses import ORJSONResponse, paginated
+from backend.src.adapters.api.routers.tasks import (
+    PaginatedTasksResponse,
+    TaskResponse,
+)
+from backend.src.domain.entities import Task
+
+
+def test_row_page_matches_pydantic_serialization():
+    project_id = uuid4()
+    tasks = [
+        Task(project_id=project_id, title="A", difficulty_points=3),
+        Task(
+            project_id=project_id,
+            title="B",
+            assignee_id=uuid4(),
+            expected_end_date=datetime(2026, 3, 1, 12, 30, 15, 1234, tzinfo=timezone.utc),
+        ),
+    ]
+
+    validated = PaginatedTasksResponse(
+        items=[TaskResponse.from_entity(t) for t in tasks],
+        total=2,
+        limit=20,
+        offset=0,
+    )
+    fast = ORJSONResponse(
+        paginated([TaskResponse.row(t) for t in tasks], total=2, limit=20, offset=0)
+    )
+
+    assert fast.body == validated.model_dump_json().encode()
+    assert json.loads(fast.body)["items"][1]["expected_end_date"].endswith("Z")
@@ -0,0 +1,97 @@
+"""Tests for BoundedTTLStore."""
+
+from backend.src.adapters.services import BoundedTTLStore
+
+
+class Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_entry_expires_after_ttl():
+    clock = Clock()
+    store: BoundedTTLStore[str, int] = BoundedTTLStore(clock=clock)
+    store.set("a", 1, ttl_seconds=10)
+
+    clock.now = 9.9
+    assert store.get("a") == 1
+    clock.now = 10
+    assert store.get("a") is None
+    assert "a" not in store
+
+
+def test_least_recently_used_entry_is_evicted_past_max_entries():
+    store: BoundedTTLStore[str, int] = BoundedTTLStore(max_entries=2, clock=Clock())
+    store.set("a", 1, 60)
+    store.set("b", 2, 60)
+    store.get("a")
+
+    store.set("c", 3, 60)
+
+    assert len(store) == 2
+    assert store.get("b") is None
+    assert store.get("a") == 1
+    assert store.get("c") == 3
+
+
+def test_writes_reclaim_expired_keys_that_are_never_read():
+    clock = Clock()
+    store: BoundedTTLStore[int, int] = BoundedTTLStore(clock=clock)
+    for key in range(1000):
+        store.set(key, key, ttl_seconds=1)
+
+    clock.now = 2
+    for key in range(1000, 1200):
+        store.set(key, key, ttl_seconds=1)
+
+    assert len(store) == 200
+
+
+def test_overwrite_extends_ttl_and_sweep_keeps_it():
+    clock = Clock()
+    store: BoundedTTLStore[str, int] = BoundedTTLStore(clock=clock)
+    store.set("a", 1, ttl_seconds=1)
+    store.set("a", 2, ttl_seconds=10)
+    store.set("b", 3, ttl_seconds=1)
+
+    clock.now = 5
+    assert store.sweep() == 1
+    assert store.get("a") == 2
+    assert len(store) == 1
+
+
+def test_pop_returns_live_value_only():
+    clock = Clock()
+    store: BoundedTTLStore[str, int] = BoundedTTLStore(clock=clock)
+    store.set("a", 1, ttl_seconds=1)
+    store.set("b", 2, ttl_seconds=1)
+
+    assert store.pop("a") == 1
+    clock.now = 1
+    assert store.pop("b") is None
+    assert len(store) == 0
+
+
+def test_sweeping_resumes_after_long_idle_gap():
+    clock = Clock()
+    store: BoundedTTLStore[int, int] = BoundedTTLStore(clock=clock)
+    for key in range(100):
+        store.set(key, key, ttl_seconds=1)
+
+    clock.now = 1_000_000
+    for key in range(100, 120):
+        store.set(key, key, ttl_seconds=1)
+
+    assert len(store) == 20
+
+
+def test_uncapped_store_keeps_live_entries():
+    store: BoundedTTLStore[int, int] = BoundedTTLStore(max_entries=None, clock=Clock())
+    for key in range(500):
+        store.set(key, key, ttl_seconds=60)
+
+    assert len(store) == 500
+    assert store.get(0) == 0
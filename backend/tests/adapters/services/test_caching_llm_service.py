@@ -0,0 +1,166 @@
+"""Tests for CachingLLMService."""
+
+import asyncio
+
+import pytest
+
+from backend.src.adapters.services import CachingLLMService, MockLLMService
+from backend.src.domain.ports.services import DifficultyEstimationRequest
+from backend.src.observability.metrics import render_llm_cache
+
+
+class CountingLLMService(MockLLMService):
+    """MockLLMService that counts calls and can be slowed down or fail."""
+
+    def __init__(self, delay: float = 0.0, failures: int = 0) -> None:
+        self.calls = 0
+        self.delay = delay
+        self.failures = failures
+
+    async def estimate_difficulty(
+        self, task_title, task_description, project_context=None
+    ):
+        self.calls += 1
+        await asyncio.sleep(self.delay)
+        if self.failures:
+            self.failures -= 1
+            raise RuntimeError("provider down")
+        return await super().estimate_difficulty(
+            task_title, task_description, project_context
+        )
+
+    async def estimate_progress(
+        self, task_title, task_description, reports, previous=None
+    ):
+        self.calls += 1
+        return await super().estimate_progress(
+            task_title, task_description, reports, previous
+        )
+
+class FakeSharedCache:
+    def __init__(self) -> None:
+        self.entries: dict[str, str] = {}
+
+    async def get(self, key: str) -> str | None:
+        return self.entries.get(key)
+
+    async def set(self, key: str, value: str, ttl_seconds: int) -> None:
+        self.entries[key] = value
+
+
+@pytest.mark.asyncio
+async def test_equivalent_inputs_are_served_from_the_local_cache():
+    inner = CountingLLMService()
+    service = CachingLLMService(inner, namespace="mock:default")
+
+    first = await service.estimate_difficulty("Build API", "Add  the\nendpoints ")
+    second = await service.estimate_difficulty(" Build API", "Add the endpoints")
+    await service.estimate_progress("Build API", "Add", ["half done"])
+    await service.estimate_progress("Build API", "Add", ["half   done"])
+
+    assert first == second
+    assert inner.calls == 2
+    assert (service.stats.local_hits, service.stats.misses) == (2, 2)
+    assert service.stats.hit_ratio == 0.5
+    text = render_llm_cache(service.stats)
+    assert 'llm_cache_hits_total{tier="local"} 2' in text
+    assert "llm_cache_misses_total 2" in text
+
+
+@pytest.mark.asyncio
+async def test_different_models_do_not_share_entries():
+    shared = FakeSharedCache()
+    inner = CountingLLMService()
+    small = CachingLLMService(inner, namespace="openai:small", shared_cache=shared)
+    large = CachingLLMService(inner, namespace="openai:large", shared_cache=shared)
+
+    await small.estimate_difficulty("Task", "Description")
+    await large.estimate_difficulty("Task", "Description")
+
+    assert inner.calls == 2
+    assert len(shared.entries) == 2
+
+
+@pytest.mark.asyncio
+async def test_shared_cache_serves_other_workers():
+    shared = FakeSharedCache()
+    inner = CountingLLMService()
+    worker_a = CachingLLMService(inner, namespace="mock:default", shared_cache=shared)
+    worker_b = CachingLLMService(inner, namespace="mock:default", shared_cache=shared)
+
+    expected = await worker_a.estimate_difficulty("Task", "Description", "Context")
+    result = await worker_b.estimate_difficulty("Task", "Description", "Context")
+
+    assert result == expected
+    assert inner.calls == 1
+    assert worker_b.stats.shared_hits == 1
+
+
+@pytest.mark.asyncio
+async def test_concurrent_identical_requests_share_one_call():
+    inner = CountingLLMService(delay=0.01)
+    service = CachingLLMService(inner, namespace="mock:default")
+
+    results = await asyncio.gather(
+        *(service.estimate_difficulty("Task", "Description") for _ in range(5))
+    )
+
+    assert inner.calls == 1
+    assert len(set(results)) == 1
+    assert (service.stats.misses, service.stats.coalesced) == (1, 4)
+
+
+@pytest.mark.asyncio
+async def test_provider_errors_are_not_cached():
+    inner = CountingLLMService(failures=1)
+    service = CachingLLMService(inner, namespace="mock:default")
+
+    with pytest.raises(RuntimeError):
+        await service.estimate_difficulty("Task", "Description")
+    await service.estimate_difficulty("Task", "Description")
+
+    assert inner.calls == 2
+
+
+@pytest.mark.asyncio
+async def test_batch_sends_only_distinct_misses_upstream():
+    inner = CountingLLMService()
+    service = CachingLLMService(inner, namespace="mock:default")
+    cached = await service.estimate_difficulty("Build API", "Add endpoints")
+
+    results = await service.estimate_difficulty_batch(
+        [
+            DifficultyEstimationRequest("Build API", "Add endpoints"),
+            DifficultyEstimationRequest("Write docs", "Describe the API"),
+            DifficultyEstimationRequest("Write  docs", "Describe the API "),
+        ]
+    )
+
+    assert results[0] == cached
+    assert results[1] == results[2]
+    assert inner.calls == 2
+    assert (service.stats.local_hits, service.stats.coalesced) == (1, 1)
+    assert await service.estimate_difficulty("Write docs", "Describe the API") == (
+        results[1]
+    )
+    assert inner.calls == 2
+
+
+@pytest.mark.asyncio
+async def test_streamed_estimate_is_cached_and_replayed():
+    inner = CountingLLMService()
+    service = CachingLLMService(inner, namespace="mock:default")
+
+    streamed = [
+        item
+        async for item in service.estimate_progress_stream("API", "", ["half done"])
+    ]
+    replayed = [
+        item
+        async for item in service.estimate_progress_stream("API", "", ["half done"])
+    ]
+    result = await service.estimate_progress("API", "", ["half done"])
+
+    assert inner.calls == 1
+    assert replayed == [streamed[-1].reasoning, streamed[-1]]
+    assert result == streamed[-1]
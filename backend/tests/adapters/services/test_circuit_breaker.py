@@ -0,0 +1,74 @@
+"""Tests for CircuitBreaker and CircuitBreakerRegistry."""
+
+from backend.src.adapters.services import (
+    CircuitBreaker,
+    CircuitBreakerRegistry,
+    CircuitState,
+)
+from backend.src.observability.metrics import render_circuit_breakers
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_opens_after_consecutive_failures_and_probes_once():
+    clock = FakeClock()
+    breaker = CircuitBreaker(failure_threshold=2, reset_timeout_seconds=10, clock=clock)
+
+    breaker.record_failure()
+    breaker.record_success()
+    breaker.record_failure()
+    assert breaker.allow()
+    breaker.record_failure()
+    assert breaker.state == CircuitState.OPEN
+    assert not breaker.allow()
+
+    clock.now = 10
+    assert breaker.allow()
+    assert breaker.state == CircuitState.HALF_OPEN
+    assert not breaker.allow()  # one probe at a time
+    breaker.record_failure()
+    assert breaker.state == CircuitState.OPEN
+
+    clock.now = 20
+    assert breaker.allow()
+    breaker.record_success()
+    assert breaker.state == CircuitState.CLOSED
+    assert breaker.snapshot().opened_total == 2
+
+
+def test_lost_probe_is_replaced_after_reset_timeout():
+    clock = FakeClock()
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout_seconds=5, clock=clock)
+    breaker.record_failure()
+
+    clock.now = 5
+    assert breaker.allow()
+    clock.now = 9
+    assert not breaker.allow()
+    clock.now = 10
+    assert breaker.allow()
+
+
+def test_registry_shares_breakers_by_name_and_renders_metrics():
+    registry = CircuitBreakerRegistry(failure_threshold=1, max_breakers=2)
+    registry.get("house:openai").record_failure()
+    assert registry.get("house:openai").state == CircuitState.OPEN
+    registry.get("openai:ab12cd34")
+    registry.get("openai:ef56ab78")
+
+    assert list(registry.snapshot()) == ["openai:ab12cd34", "openai:ef56ab78"]
+
+    registry.get("house:openai").record_failure()
+    text = render_circuit_breakers(registry.snapshot())
+    assert 'llm_circuit_breaker_state{provider="house:openai",state="open"} 1' in text
+    assert (
+        'llm_circuit_breaker_state{provider="openai:ef56ab78",state="closed"} 1'
+        in text
+    )
+    assert 'llm_circuit_breaker_opened_total{provider="house:openai"} 1' in text
@@ -6,7 +6,11 @@ from uuid import uuid4
 import pytest
 
 from backend.src.adapters.services.email_notification_service import EmailNotificationService
-from backend.src.domain.ports.services import DailyReportData, WorkloadAlertData
+from backend.src.domain.ports.services import (
+    DailyReportData,
+    NewTaskToastData,
+    WorkloadAlertData,
+)
 
 
 @pytest.fixture
@@ -49,3 +53,22 @@ async def test_send_workload_alert(email_service):
     await service.send_workload_alert("manager@example.com", alert)
 
     email_service.send_email.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_send_new_task_toast_goes_to_toast_publisher(email_service):
+    publisher = AsyncMock()
+    service = EmailNotificationService(email_service, toast_publisher=publisher)
+    toast = NewTaskToastData(
+        project_id=uuid4(),
+        project_name="Project",
+        task_id=uuid4(),
+        task_title="Task",
+        required_role="Dev",
+    )
+    user_ids = [uuid4()]
+
+    await service.send_new_task_toast(user_ids, toast)
+
+    publisher.publish.assert_awaited_once_with(user_ids, toast)
+    email_service.send_email.assert_not_awaited()
@@ -0,0 +1,49 @@
+"""Tests for InProcessEventBus."""
+
+from uuid import uuid4
+
+import pytest
+
+from backend.src.adapters.services import InProcessEventBus
+from backend.src.domain.events import TaskCompleted, TaskSelected, TaskWorkloadEvent
+
+
+def _event(event_type):
+    return event_type(task_id=uuid4(), project_id=uuid4(), member_id=uuid4())
+
+
+@pytest.mark.asyncio
+async def test_handler_gets_matching_events_in_one_call():
+    bus = InProcessEventBus()
+    calls = []
+
+    async def on_selected(events):
+        calls.append(list(events))
+
+    bus.subscribe(TaskSelected, on_selected)
+    selected = [_event(TaskSelected), _event(TaskSelected)]
+
+    await bus.publish([selected[0], _event(TaskCompleted), selected[1]])
+    await bus.publish([_event(TaskCompleted)])
+
+    assert calls == [selected]
+
+
+@pytest.mark.asyncio
+async def test_failing_handler_does_not_stop_the_others():
+    bus = InProcessEventBus()
+    received = []
+
+    async def broken(events):
+        raise RuntimeError("boom")
+
+    async def working(events):
+        received.extend(events)
+
+    bus.subscribe(TaskWorkloadEvent, broken)
+    bus.subscribe((TaskSelected, TaskCompleted), working)
+    event = _event(TaskCompleted)
+
+    await bus.publish([event])
+
+    assert received == [event]
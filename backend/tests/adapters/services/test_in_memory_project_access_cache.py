@@ -0,0 +1,44 @@
+"""Tests for InMemoryProjectAccessCache."""
+
+from uuid import uuid4
+
+import pytest
+
+from backend.src.adapters.services import InMemoryProjectAccessCache
+from backend.src.domain.entities import ProjectAccess
+
+
+class Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.mark.asyncio
+async def test_entries_expire_after_ttl():
+    clock = Clock()
+    cache = InMemoryProjectAccessCache(ttl_seconds=30, clock=clock)
+    access = ProjectAccess(project_id=uuid4(), user_id=uuid4(), is_manager=True)
+
+    await cache.set(access)
+    assert await cache.get(access.project_id, access.user_id) == access
+
+    clock.now = 30
+    assert await cache.get(access.project_id, access.user_id) is None
+
+
+@pytest.mark.asyncio
+async def test_invalidate_drops_only_that_user():
+    cache = InMemoryProjectAccessCache()
+    project_id = uuid4()
+    kept = ProjectAccess(project_id=project_id, user_id=uuid4(), is_manager=True)
+    dropped = ProjectAccess(project_id=project_id, user_id=uuid4(), is_manager=False)
+    await cache.set(kept)
+    await cache.set(dropped)
+
+    await cache.invalidate(project_id, dropped.user_id)
+
+    assert await cache.get(project_id, dropped.user_id) is None
+    assert await cache.get(project_id, kept.user_id) == kept
@@ -0,0 +1,71 @@
+"""Tests for InMemoryRateLimiter."""
+
+import pytest
+
+from backend.src.adapters.services import InMemoryRateLimiter
+from backend.src.domain.ports.services import RateLimitAlgorithm
+
+
+class Clock:
+    def __init__(self, now: float = 1000.0) -> None:
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.mark.asyncio
+async def test_sliding_window_rejects_over_limit_with_retry_after():
+    clock = Clock()
+    limiter = InMemoryRateLimiter(clock=clock)
+
+    results = [await limiter.hit("k", limit=3, window_seconds=10) for _ in range(4)]
+
+    assert [r.allowed for r in results] == [True, True, True, False]
+    assert [r.remaining for r in results[:3]] == [2, 1, 0]
+    assert results[3].retry_after_seconds == 10
+
+
+@pytest.mark.asyncio
+async def test_sliding_window_weights_previous_window():
+    clock = Clock(1000.0)
+    limiter = InMemoryRateLimiter(clock=clock)
+    for _ in range(4):
+        await limiter.hit("k", limit=4, window_seconds=10)
+
+    # A quarter into the next window, 3 of the previous 4 hits still count.
+    clock.now = 1012.5
+    assert (await limiter.hit("k", limit=4, window_seconds=10)).allowed
+    denied = await limiter.hit("k", limit=4, window_seconds=10)
+
+    assert not denied.allowed
+    assert denied.retry_after_seconds == 3
+
+    clock.now = 1015.0
+    assert (await limiter.hit("k", limit=4, window_seconds=10)).allowed
+
+
+@pytest.mark.asyncio
+async def test_token_bucket_allows_burst_then_refills():
+    clock = Clock()
+    limiter = InMemoryRateLimiter(clock=clock)
+    hit = lambda: limiter.hit(  # noqa: E731
+        "k", limit=5, window_seconds=10, algorithm=RateLimitAlgorithm.TOKEN_BUCKET
+    )
+
+    burst = [await hit() for _ in range(6)]
+    assert [r.allowed for r in burst] == [True] * 5 + [False]
+    assert burst[5].retry_after_seconds == 2
+
+    clock.now += 2
+    assert (await hit()).allowed
+    assert not (await hit()).allowed
+
+
+@pytest.mark.asyncio
+async def test_keys_are_independent():
+    limiter = InMemoryRateLimiter(clock=Clock())
+
+    assert (await limiter.hit("a", limit=1, window_seconds=10)).allowed
+    assert (await limiter.hit("b", limit=1, window_seconds=10)).allowed
+    assert not (await limiter.hit("a", limit=1, window_seconds=10)).allowed
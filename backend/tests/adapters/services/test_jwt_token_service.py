@@ -55,3 +55,28 @@ async def test_revoke_invalidates_token(settings):
     payload = await service.verify_token(pair.access_token)
 
     assert payload is None
+
+
+@pytest.mark.asyncio
+async def test_verified_token_is_served_from_cache(settings):
+    service = JWTTokenService(settings, revoked_token_store=InMemoryRevokedTokenStore())
+    pair = await service.generate_tokens(uuid4())
+    await service.verify_token(pair.access_token)
+
+    # A cache hit must not need the signature check again.
+    service._secret = "rotated"
+    payload = await service.verify_token(pair.access_token)
+
+    assert payload is not None
+    assert payload["type"] == "access"
+
+
+@pytest.mark.asyncio
+async def test_revocation_applies_to_cached_token(settings):
+    service = JWTTokenService(settings, revoked_token_store=InMemoryRevokedTokenStore())
+    pair = await service.generate_tokens(uuid4())
+    assert await service.verify_token(pair.access_token) is not None
+
+    await service.revoke_token(pair.access_token)
+
+    assert await service.verify_token(pair.access_token) is None
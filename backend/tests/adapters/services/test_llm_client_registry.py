@@ -0,0 +1,144 @@
+"""Tests for LLMClientRegistry."""
+
+from uuid import uuid4
+
+import pytest
+
+from backend.src.adapters.services import (
+    LLMClientRegistry,
+    MockLLMService,
+    SimpleEncryptionService,
+)
+from backend.src.domain.entities import Project
+from backend.src.domain.errors import LLMAPIKeyDecryptionError
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class CountingEncryptionService(SimpleEncryptionService):
+    def __init__(self) -> None:
+        super().__init__()
+        self.decrypts = 0
+
+    async def decrypt(self, ciphertext: str) -> str:
+        self.decrypts += 1
+        return await super().decrypt(ciphertext)
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def encryption():
+    return CountingEncryptionService()
+
+
+@pytest.fixture
+def built():
+    return []
+
+
+@pytest.fixture
+def fallback():
+    return MockLLMService()
+
+
+@pytest.fixture
+def registry(encryption, built, clock, fallback):
+    def build(key, api_key):
+        service = MockLLMService()
+        built.append((key, api_key, service))
+        return service
+
+    return LLMClientRegistry(
+        encryption,
+        client_factory=build,
+        fallback=fallback,
+        max_clients=2,
+        secret_ttl_seconds=60,
+        clock=clock,
+    )
+
+
+async def byok_project(encryption, api_key: str, provider: str = "openai"):
+    project = Project(name="Project", manager_id=uuid4())
+    project.configure_llm(provider, await encryption.encrypt(api_key))
+    return project
+
+
+@pytest.mark.asyncio
+async def test_reuses_client_without_decrypting_again(registry, encryption, built):
+    project = await byok_project(encryption, "sk-one")
+    other = await byok_project(encryption, "sk-one")
+
+    first = await registry.for_project(project)
+    again = await registry.for_project(project)
+    shared = await registry.for_project(other)
+
+    assert first is again is shared
+    assert [(key.provider, api_key) for key, api_key, _ in built] == [
+        ("openai", "sk-one")
+    ]
+    assert "sk-one" not in built[0][0].key_fingerprint
+    assert encryption.decrypts == 2
+
+
+@pytest.mark.asyncio
+async def test_projects_without_supported_byok_use_the_fallback(
+    registry, encryption, fallback
+):
+    plain = Project(name="Project", manager_id=uuid4())
+    other_provider = await byok_project(encryption, "sk-x", provider="anthropic")
+
+    assert await registry.for_project(plain) is fallback
+    assert await registry.for_project(other_provider) is fallback
+    assert encryption.decrypts == 0
+
+
+@pytest.mark.asyncio
+async def test_secret_ttl_and_lru_bound_clients(registry, encryption, built, clock):
+    projects = [await byok_project(encryption, f"sk-{i}") for i in range(3)]
+    for project in projects:
+        await registry.for_project(project)
+    assert len(registry) == 2
+
+    await registry.for_project(projects[0])  # evicted as least recently used
+    assert len(built) == 4
+
+    clock.now += 61
+    await registry.for_project(projects[0])
+    assert len(built) == 5
+
+
+@pytest.mark.asyncio
+async def test_key_change_and_invalidation_build_a_new_client(
+    registry, encryption, built
+):
+    project = await byok_project(encryption, "sk-old")
+    old = await registry.for_project(project)
+
+    project.configure_llm("openai", await encryption.encrypt("sk-new"))
+    new = await registry.for_project(project)
+    assert new is not old
+    assert built[-1][1] == "sk-new"
+
+    registry.invalidate(project.id)
+    assert await registry.for_project(project) is not new
+    assert len(built) == 3
+
+
+@pytest.mark.asyncio
+async def test_undecryptable_key_raises(registry):
+    project = Project(name="Project", manager_id=uuid4())
+    project.configure_llm("openai", "not-encrypted")
+
+    with pytest.raises(LLMAPIKeyDecryptionError):
+        await registry.for_project(project)
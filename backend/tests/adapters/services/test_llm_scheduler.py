@@ -0,0 +1,519 @@
+"""Tests for the fair LLM scheduler and per-project token budgets."""
+
+import asyncio
+from contextlib import asynccontextmanager
+from datetime import date
+from types import SimpleNamespace
+from uuid import uuid4
+
+import pytest
+
+from backend.src.adapters.services import (
+    CircuitBreaker,
+    FairLLMScheduler,
+    LLMTokenBudget,
+    MockLLMService,
+    ProjectScopedLLMResolver,
+    ResilientLLMService,
+    ScheduledLLMService,
+    WeightedFairQueue,
+)
+from backend.src.adapters.services.llm_usage import llm_request
+from backend.src.domain.entities import Project
+from backend.src.domain.errors import (
+    LLMBudgetExceededError,
+    LLMProviderError,
+    LLMRateLimitError,
+)
+from backend.src.domain.ports.services import DifficultyEstimationRequest
+
+
+class InMemoryUsageRepository:
+    def __init__(self) -> None:
+        self.tokens: dict[tuple, int] = {}
+        self.reads = 0
+
+    async def get_tokens(self, project_id, day) -> int:
+        self.reads += 1
+        return self.tokens.get((project_id, day), 0)
+
+    async def add(self, project_id, day, tokens) -> int:
+        key = (project_id, day)
+        self.tokens[key] = self.tokens.get(key, 0) + tokens
+        return self.tokens[key]
+
+
+class FakeUnitOfWork:
+    def __init__(self, usage: InMemoryUsageRepository) -> None:
+        self.llm_usage_repository = usage
+        self.commits = 0
+
+    async def commit(self) -> None:
+        self.commits += 1
+
+
+@pytest.fixture
+def usage():
+    return InMemoryUsageRepository()
+
+
+@pytest.fixture
+def uow_factory(usage):
+    @asynccontextmanager
+    async def factory():
+        yield FakeUnitOfWork(usage)
+
+    return factory
+
+
+class CountingLLMService(MockLLMService):
+    def __init__(self) -> None:
+        self.batches: list[int] = []
+        self.running = 0
+        self.peak = 0
+
+    async def estimate_difficulty(
+        self, task_title, task_description, project_context=None
+    ):
+        self.running += 1
+        self.peak = max(self.peak, self.running)
+        try:
+            await asyncio.sleep(0)
+            return await super().estimate_difficulty(
+                task_title, task_description, project_context
+            )
+        finally:
+            self.running -= 1
+
+    async def estimate_difficulty_batch(self, items, project_context=None):
+        self.batches.append(len(items))
+        return await super().estimate_difficulty_batch(items, project_context)
+
+
+class MeteredLLMService(MockLLMService):
+    """Mock provider reporting 10 tokens per request; the first can hang."""
+
+    def __init__(self, hang_first: bool = False) -> None:
+        self.hang_first = hang_first
+        self.requests = 0
+
+    async def estimate_difficulty(
+        self, task_title, task_description, project_context=None
+    ):
+        request = llm_request()
+        self.requests += 1
+        if self.hang_first and self.requests == 1:
+            await asyncio.Event().wait()
+        request.report(SimpleNamespace(prompt_tokens=7, completion_tokens=3))
+        return await super().estimate_difficulty(
+            task_title, task_description, project_context
+        )
+
+
+class FailingLLMService(MockLLMService):
+    """Mock provider whose requests are sent and then fail with ``error``."""
+
+    def __init__(self, error: Exception) -> None:
+        self.error = error
+
+    async def estimate_difficulty(
+        self, task_title, task_description, project_context=None
+    ):
+        request = llm_request()
+        if isinstance(self.error, LLMRateLimitError):
+            request.refuse()
+        raise self.error
+
+
+class RecordingBudget(LLMTokenBudget):
+    def __init__(self, uow_factory) -> None:
+        super().__init__(uow_factory)
+        self.reserved: list[int] = []
+
+    async def reserve(self, project_id, tokens) -> None:
+        self.reserved.append(tokens)
+        await super().reserve(project_id, tokens)
+
+
+class StaticResolver:
+    def __init__(self, service) -> None:
+        self.service = service
+        self.invalidated: list = []
+
+    async def for_project(self, project):
+        return self.service
+
+    def invalidate(self, project_id) -> None:
+        self.invalidated.append(project_id)
+
+
+class TestWeightedFairQueue:
+    @pytest.mark.asyncio
+    async def test_light_key_is_served_before_a_heavy_backlog(self):
+        queue = WeightedFairQueue(max_concurrency=1)
+        heavy, light = uuid4(), uuid4()
+        order: list[str] = []
+        gate = asyncio.Event()
+
+        async def call(key, name):
+            async with queue.slot(key, 100):
+                order.append(name)
+                await gate.wait()
+
+        first = asyncio.create_task(call(heavy, "heavy-0"))
+        await asyncio.sleep(0)
+        waiting = [asyncio.create_task(call(heavy, f"heavy-{i}")) for i in (1, 2)]
+        await asyncio.sleep(0)
+        waiting.append(asyncio.create_task(call(light, "light")))
+        await asyncio.sleep(0)
+        gate.set()
+        await asyncio.gather(first, *waiting)
+
+        assert order.index("light") < order.index("heavy-2")
+        assert queue.active == 0
+
+    @pytest.mark.asyncio
+    async def test_weight_raises_a_keys_share(self):
+        queue = WeightedFairQueue(max_concurrency=1)
+        a, b = uuid4(), uuid4()
+        order: list[str] = []
+        gate = asyncio.Event()
+
+        async def call(key, name, weight):
+            async with queue.slot(key, 100, weight):
+                order.append(name)
+                await gate.wait()
+
+        blocker = asyncio.create_task(call(uuid4(), "blocker", 1.0))
+        await asyncio.sleep(0)
+        calls = [
+            asyncio.create_task(call(key, f"{name}-{i}", weight))
+            for i in range(2)
+            for key, name, weight in ((a, "a", 1.0), (b, "b", 4.0))
+        ]
+        await asyncio.sleep(0)
+        gate.set()
+        await asyncio.gather(blocker, *calls)
+
+        assert order[1:3] == ["b-0", "b-1"]
+
+    @pytest.mark.asyncio
+    async def test_refuses_a_key_with_a_full_queue(self):
+        queue = WeightedFairQueue(max_concurrency=1, max_queued=1)
+        key = uuid4()
+        gate = asyncio.Event()
+
+        async def call():
+            async with queue.slot(key, 1):
+                await gate.wait()
+
+        running = [asyncio.create_task(call()), asyncio.create_task(call())]
+        await asyncio.sleep(0)
+
+        with pytest.raises(LLMRateLimitError):
+            async with queue.slot(key, 1):
+                pass
+        async with asyncio.timeout(1):
+            gate.set()
+            await asyncio.gather(*running)
+
+    @pytest.mark.asyncio
+    async def test_cancelled_waiter_does_not_leak_a_slot(self):
+        queue = WeightedFairQueue(max_concurrency=1)
+        gate = asyncio.Event()
+
+        async def call():
+            async with queue.slot(uuid4(), 1):
+                await gate.wait()
+
+        running = asyncio.create_task(call())
+        await asyncio.sleep(0)
+        waiter = asyncio.create_task(call())
+        await asyncio.sleep(0)
+        waiter.cancel()
+        gate.set()
+        await running
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+
+        assert queue.active == 0
+
+
+class TestLLMTokenBudget:
+    @pytest.mark.asyncio
+    async def test_refuses_at_once_past_the_daily_budget(self, uow_factory, usage):
+        project_id = uuid4()
+        day = date(2026, 1, 5)
+        usage.tokens[(project_id, day)] = 900
+        budget = LLMTokenBudget(uow_factory, daily_tokens=1000, today=lambda: day)
+
+        await budget.reserve(project_id, 100)
+        with pytest.raises(LLMBudgetExceededError) as excinfo:
+            await budget.reserve(project_id, 1)
+
+        assert excinfo.value.status == 429
+
+    @pytest.mark.asyncio
+    async def test_unspent_reservation_is_released(self, uow_factory, usage):
+        project_id = uuid4()
+        day = date(2026, 1, 5)
+        budget = LLMTokenBudget(uow_factory, daily_tokens=100, today=lambda: day)
+
+        await budget.reserve(project_id, 100)
+        await budget.settle(project_id, 100, spent=0)
+        await budget.reserve(project_id, 100)
+
+        assert usage.tokens == {}
+
+    @pytest.mark.asyncio
+    async def test_spent_tokens_are_persisted_per_day(self, uow_factory, usage):
+        project_id = uuid4()
+        days = iter([date(2026, 1, 5)] * 3 + [date(2026, 1, 6)] * 2)
+        budget = LLMTokenBudget(uow_factory, daily_tokens=100, today=lambda: next(days))
+
+        await budget.reserve(project_id, 80)
+        await budget.settle(project_id, 80, spent=80)
+        with pytest.raises(LLMBudgetExceededError):
+            await budget.reserve(project_id, 80)
+        # A new day starts with a fresh budget.
+        await budget.reserve(project_id, 80)
+
+        assert usage.tokens == {(project_id, date(2026, 1, 5)): 80}
+        assert usage.reads == 2
+
+    @pytest.mark.asyncio
+    async def test_records_usage_without_a_budget(self, uow_factory, usage):
+        project_id = uuid4()
+        day = date(2026, 1, 5)
+        budget = LLMTokenBudget(uow_factory, today=lambda: day)
+
+        await budget.reserve(project_id, 10**9)
+        await budget.settle(project_id, 10**9, spent=10**9)
+
+        assert usage.tokens == {(project_id, day): 10**9}
+        assert usage.reads == 0
+
+
+class TestScheduledLLMService:
+    @pytest.mark.asyncio
+    async def test_caps_concurrent_provider_calls(self, uow_factory):
+        inner = CountingLLMService()
+        scheduler = FairLLMScheduler(
+            WeightedFairQueue(max_concurrency=2), LLMTokenBudget(uow_factory)
+        )
+        service = ScheduledLLMService(inner, scheduler)
+
+        await asyncio.gather(
+            *(service.estimate_difficulty(f"Task {i}", "") for i in range(6))
+        )
+
+        assert inner.peak == 2
+
+    @pytest.mark.asyncio
+    async def test_charges_calls_to_the_resolved_project(self, uow_factory, usage):
+        scheduler = FairLLMScheduler(
+            WeightedFairQueue(max_concurrency=2), LLMTokenBudget(uow_factory)
+        )
+        service = ScheduledLLMService(MockLLMService(), scheduler)
+        resolver = ProjectScopedLLMResolver(StaticResolver(service))
+        project = Project(name="Project", manager_id=uuid4())
+
+        await (await resolver.for_project(project)).estimate_difficulty("Task", "")
+        await service.estimate_difficulty("Unattributed", "")
+
+        ((project_id, _),) = usage.tokens
+        assert project_id == project.id
+
+    @pytest.mark.asyncio
+    async def test_charges_the_usage_the_provider_reported(self, uow_factory, usage):
+        budget = RecordingBudget(uow_factory)
+        scheduler = FairLLMScheduler(WeightedFairQueue(max_concurrency=1), budget)
+        resolver = ProjectScopedLLMResolver(
+            StaticResolver(ScheduledLLMService(MeteredLLMService(), scheduler))
+        )
+        project = Project(name="Project", manager_id=uuid4())
+
+        await (await resolver.for_project(project)).estimate_difficulty("Task", "")
+
+        (reserved,) = budget.reserved
+        assert reserved > 10
+        assert list(usage.tokens.values()) == [10]
+
+    @pytest.mark.asyncio
+    async def test_charges_a_sent_call_that_failed(self, uow_factory, usage):
+        budget = RecordingBudget(uow_factory)
+        scheduler = FairLLMScheduler(WeightedFairQueue(max_concurrency=1), budget)
+        resolver = ProjectScopedLLMResolver(
+            StaticResolver(
+                ScheduledLLMService(FailingLLMService(TimeoutError()), scheduler)
+            )
+        )
+        service = await resolver.for_project(Project(name="P", manager_id=uuid4()))
+
+        with pytest.raises(TimeoutError):
+            await service.estimate_difficulty("Task", "")
+
+        (reserved,) = budget.reserved
+        assert list(usage.tokens.values()) == [reserved]
+
+    @pytest.mark.asyncio
+    async def test_refused_call_is_not_charged(self, uow_factory, usage):
+        scheduler = FairLLMScheduler(
+            WeightedFairQueue(max_concurrency=1), LLMTokenBudget(uow_factory)
+        )
+        resolver = ProjectScopedLLMResolver(
+            StaticResolver(
+                ScheduledLLMService(
+                    FailingLLMService(LLMRateLimitError("house")), scheduler
+                )
+            )
+        )
+        service = await resolver.for_project(Project(name="P", manager_id=uuid4()))
+
+        with pytest.raises(LLMRateLimitError):
+            await service.estimate_difficulty("Task", "")
+
+        assert usage.tokens == {}
+
+    @pytest.mark.asyncio
+    async def test_hedges_share_the_slot_and_are_charged(self, uow_factory, usage):
+        queue = WeightedFairQueue(max_concurrency=1)
+        budget = RecordingBudget(uow_factory)
+        inner = MeteredLLMService(hang_first=True)
+        service = ScheduledLLMService(
+            ResilientLLMService(
+                inner,
+                name="house",
+                breaker=CircuitBreaker(failure_threshold=2),
+                hedge_after_seconds=0.01,
+            ),
+            FairLLMScheduler(queue, budget),
+        )
+        resolver = ProjectScopedLLMResolver(StaticResolver(service))
+        project = Project(name="Project", manager_id=uuid4())
+
+        await (await resolver.for_project(project)).estimate_difficulty("Task", "")
+
+        assert inner.requests == 2
+        assert queue.active == 0
+        # The cancelled first attempt reported nothing: charged at the estimate.
+        (reserved,) = budget.reserved
+        assert list(usage.tokens.values()) == [10 + reserved]
+
+    @pytest.mark.asyncio
+    async def test_splits_batches_into_chunks(self, uow_factory):
+        inner = CountingLLMService()
+        scheduler = FairLLMScheduler(
+            WeightedFairQueue(max_concurrency=2), LLMTokenBudget(uow_factory)
+        )
+        service = ScheduledLLMService(inner, scheduler, batch_size=2)
+        items = [
+            DifficultyEstimationRequest(task_title=f"Task {i}", task_description="")
+            for i in range(5)
+        ]
+
+        results = await service.estimate_difficulty_batch(items)
+
+        assert sorted(inner.batches) == [1, 2, 2]
+        assert len(results) == 5
+
+    @pytest.mark.asyncio
+    async def test_failed_chunk_keeps_the_other_estimates(self, uow_factory):
+        class FlakyBatchService(CountingLLMService):
+            async def estimate_difficulty_batch(self, items, project_context=None):
+                if items[0].task_title == "Task 2":
+                    raise LLMProviderError("house", "500")
+                return await super().estimate_difficulty_batch(items, project_context)
+
+        scheduler = FairLLMScheduler(
+            WeightedFairQueue(max_concurrency=2), LLMTokenBudget(uow_factory)
+        )
+        service = ScheduledLLMService(FlakyBatchService(), scheduler, batch_size=2)
+        items = [
+            DifficultyEstimationRequest(task_title=f"Task {i}", task_description="")
+            for i in range(6)
+        ]
+
+        results = await service.estimate_difficulty_batch(items)
+
+        assert [result is None for result in results] == [
+            False,
+            False,
+            True,
+            True,
+            False,
+            False,
+        ]
+
+    @pytest.mark.asyncio
+    async def test_batch_fails_when_every_chunk_fails(self, uow_factory):
+        class BrokenBatchService(MockLLMService):
+            async def estimate_difficulty_batch(self, items, project_context=None):
+                raise LLMProviderError("house", "500")
+
+        scheduler = FairLLMScheduler(
+            WeightedFairQueue(max_concurrency=2), LLMTokenBudget(uow_factory)
+        )
+        service = ScheduledLLMService(BrokenBatchService(), scheduler, batch_size=2)
+        items = [
+            DifficultyEstimationRequest(task_title=f"Task {i}", task_description="")
+            for i in range(4)
+        ]
+
+        with pytest.raises(LLMProviderError):
+            await service.estimate_difficulty_batch(items)
+
+    @pytest.mark.asyncio
+    async def test_refuses_a_batch_over_budget_before_calling(self, uow_factory):
+        inner = CountingLLMService()
+        scheduler = FairLLMScheduler(
+            WeightedFairQueue(max_concurrency=2),
+            LLMTokenBudget(uow_factory, daily_tokens=500),
+        )
+        resolver = ProjectScopedLLMResolver(
+            StaticResolver(ScheduledLLMService(inner, scheduler, batch_size=2))
+        )
+        service = await resolver.for_project(Project(name="P", manager_id=uuid4()))
+        items = [
+            DifficultyEstimationRequest(task_title=f"Task {i}", task_description="")
+            for i in range(5)
+        ]
+
+        with pytest.raises(LLMBudgetExceededError):
+            await service.estimate_difficulty_batch(items)
+
+        assert inner.batches == []
+
+    @pytest.mark.asyncio
+    async def test_stream_holds_a_slot_and_is_charged_to_the_project(
+        self, uow_factory, usage
+    ):
+        queue = WeightedFairQueue(max_concurrency=1)
+        scheduler = FairLLMScheduler(queue, LLMTokenBudget(uow_factory))
+        resolver = ProjectScopedLLMResolver(
+            StaticResolver(ScheduledLLMService(MockLLMService(), scheduler))
+        )
+        project = Project(name="Project", manager_id=uuid4())
+        service = await resolver.for_project(project)
+
+        stream = service.estimate_progress_stream("Task", "", ["half done"])
+        first = await anext(stream)
+        active = queue.active
+        rest = [item async for item in stream]
+
+        assert first == "Mock"
+        assert active == 1
+        assert queue.active == 0
+        assert rest[-1].percentage == 2
+        ((project_id, _),) = usage.tokens
+        assert project_id == project.id
+
+
+@pytest.mark.asyncio
+async def test_scoped_resolver_passes_invalidation_on():
+    inner = StaticResolver(MockLLMService())
+    project_id = uuid4()
+
+    ProjectScopedLLMResolver(inner).invalidate(project_id)
+
+    assert inner.invalidated == [project_id]
@@ -1,11 +1,23 @@
 """Tests for OpenAILLMService."""
 
+import asyncio
+import json
+import socket
 from types import SimpleNamespace
 
+import httpx
 import pytest
+import uvicorn
+from fastapi import FastAPI, HTTPException, Request
 
+from backend.src.adapters.services.llm_usage import LLMUsage
 from backend.src.adapters.services.openai_llm_service import OpenAILLMService
 from backend.src.config.settings import AppSettings
+from backend.src.domain.errors import LLMInvalidResponseError, LLMProviderError
+from backend.src.domain.ports.services import (
+    DifficultyEstimationRequest,
+    ProgressEstimation,
+)
 
 
 @pytest.fixture
@@ -41,6 +53,35 @@ async def test_estimate_difficulty_parses_json(monkeypatch, settings):
     assert result.confidence == 0.9
 
 
+@pytest.mark.asyncio
+async def test_reports_token_usage_of_each_request(monkeypatch, settings):
+    service = OpenAILLMService(settings)
+    fake_response = SimpleNamespace(
+        choices=[
+            SimpleNamespace(
+                message=SimpleNamespace(
+                    content='{"points":3,"confidence":0.9,"reasoning":"ok"}'
+                )
+            )
+        ],
+        usage=SimpleNamespace(prompt_tokens=80, completion_tokens=20),
+    )
+
+    async def fake_create(**kwargs):
+        return fake_response
+
+    fake_client = SimpleNamespace(
+        chat=SimpleNamespace(completions=SimpleNamespace(create=fake_create))
+    )
+    monkeypatch.setattr(service, "_client", lambda: fake_client)
+
+    with LLMUsage().metering() as usage:
+        await service.estimate_difficulty("title", "desc")
+        await service.estimate_difficulty("title", "desc")
+
+    assert (usage.requests, usage.reported, usage.tokens) == (2, 2, 200)
+
+
 @pytest.mark.asyncio
 async def test_estimate_progress_parses_json(monkeypatch, settings):
     service = OpenAILLMService(settings)
@@ -67,3 +108,302 @@ async def test_estimate_progress_parses_json(monkeypatch, settings):
 
     assert result.percentage == 55
     assert result.confidence == 0.7
+
+
+@pytest.mark.asyncio
+async def test_estimate_progress_sends_previous_summary_and_new_reports(
+    monkeypatch, settings
+):
+    service = OpenAILLMService(settings)
+    requests = []
+
+    async def fake_create(**kwargs):
+        requests.append(json.loads(kwargs["messages"][-1]["content"]))
+        return SimpleNamespace(
+            choices=[
+                SimpleNamespace(
+                    message=SimpleNamespace(
+                        content='{"percentage":70,"confidence":0.8,'
+                        '"reasoning":"ok","summary":"API and tests done"}'
+                    )
+                )
+            ]
+        )
+
+    fake_client = SimpleNamespace(
+        chat=SimpleNamespace(completions=SimpleNamespace(create=fake_create))
+    )
+    monkeypatch.setattr(service, "_client", lambda: fake_client)
+    previous = ProgressEstimation(
+        percentage=40, confidence=0.6, reasoning="ok", summary="API done"
+    )
+
+    result = await service.estimate_progress("title", "desc", ["tests"], previous)
+
+    assert requests[0]["previous"] == {"percentage": 40, "summary": "API done"}
+    assert requests[0]["new_reports"] == ["tests"]
+    assert result.percentage == 70
+    assert result.summary == "API and tests done"
+
+
+class FakeOpenAIServer:
+    """OpenAI-compatible chat completions endpoint served on a local port."""
+
+    def __init__(
+        self,
+        malformed_titles: set[str] = frozenset(),
+        failing_titles: set[str] = frozenset(),
+    ):
+        self.malformed_titles = malformed_titles
+        self.failing_titles = failing_titles
+        self.prompts: list[dict] = []
+        self.api_keys: list[str] = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.app = FastAPI()
+        self.app.post("/v1/chat/completions")(self._complete)
+
+    def _estimate(self, title: str) -> dict:
+        confidence = 2.0 if title in self.malformed_titles else 0.8
+        return {"points": len(title), "confidence": confidence, "reasoning": title}
+
+    async def _complete(self, request: Request) -> dict:
+        body = await request.json()
+        self.api_keys.append(request.headers["authorization"].removeprefix("Bearer "))
+        prompt = json.loads(body["messages"][-1]["content"])
+        self.prompts.append(prompt)
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(0.02)
+        finally:
+            self.in_flight -= 1
+
+        titles = [task["task_title"] for task in prompt.get("tasks", [prompt])]
+        if self.failing_titles.intersection(titles):
+            raise HTTPException(status_code=500, detail="boom")
+        if "tasks" in prompt:
+            content = {
+                "estimates": [
+                    {"id": task["id"], **self._estimate(task["task_title"])}
+                    for task in prompt["tasks"]
+                ]
+            }
+        else:
+            title = prompt["task_title"]
+            # Answer single retries correctly so the fallback can succeed.
+            content = self._estimate("" if title in self.malformed_titles else title)
+            if title == "unanswerable":
+                content = {"points": "many"}
+        return {
+            "id": "chatcmpl-test",
+            "object": "chat.completion",
+            "created": 0,
+            "model": body["model"],
+            "choices": [
+                {
+                    "index": 0,
+                    "finish_reason": "stop",
+                    "message": {"role": "assistant", "content": json.dumps(content)},
+                }
+            ],
+        }
+
+
+@pytest.fixture
+async def fake_openai():
+    running: list[tuple[uvicorn.Server, asyncio.Task]] = []
+
+    async def start(**kwargs) -> tuple[FakeOpenAIServer, str]:
+        fake = FakeOpenAIServer(**kwargs)
+        sock = socket.socket()
+        sock.bind(("127.0.0.1", 0))
+        server = uvicorn.Server(uvicorn.Config(fake.app, log_level="warning"))
+        task = asyncio.create_task(server.serve(sockets=[sock]))
+        while not server.started:
+            await asyncio.sleep(0.01)
+        running.append((server, task))
+        return fake, f"http://127.0.0.1:{sock.getsockname()[1]}/v1"
+
+    yield start
+
+    for server, task in running:
+        server.should_exit = True
+        await task
+
+
+async def test_estimate_difficulty_batch_packs_tasks_per_prompt(fake_openai):
+    fake, base_url = await fake_openai()
+    service = OpenAILLMService(
+        AppSettings(
+            global_llm_api_key="key",
+            global_llm_base_url=base_url,
+            llm_batch_size=3,
+            llm_batch_concurrency=2,
+        )
+    )
+    items = [
+        DifficultyEstimationRequest(task_title=f"task-{i}", task_description="d")
+        for i in range(7)
+    ]
+
+    results = await service.estimate_difficulty_batch(items, project_context="ctx")
+
+    assert [result.reasoning for result in results] == [f"task-{i}" for i in range(7)]
+    assert [len(prompt["tasks"]) for prompt in fake.prompts if "tasks" in prompt] == [
+        3,
+        3,
+    ]
+    # The last chunk has a single task and goes out as a plain estimation.
+    assert sum("tasks" not in prompt for prompt in fake.prompts) == 1
+    assert all(prompt["project_context"] == "ctx" for prompt in fake.prompts)
+    assert fake.max_in_flight == 2
+
+
+async def test_estimate_difficulty_batch_retries_malformed_items_alone(fake_openai):
+    fake, base_url = await fake_openai(malformed_titles={"bad", "unanswerable"})
+    service = OpenAILLMService(
+        AppSettings(global_llm_api_key="key", global_llm_base_url=base_url)
+    )
+    items = [
+        DifficultyEstimationRequest(task_title=title, task_description="d")
+        for title in ("first", "bad", "unanswerable", "last")
+    ]
+
+    results = await service.estimate_difficulty_batch(items)
+
+    assert results[0].points == len("first")
+    assert results[1] is not None and results[1].confidence == 0.8
+    assert results[2] is None
+    assert results[3].points == len("last")
+    retried = [prompt["task_title"] for prompt in fake.prompts if "tasks" not in prompt]
+    assert retried == ["bad", "unanswerable"]
+
+
+async def test_estimate_difficulty_batch_leaves_failed_chunks_unestimated(
+    fake_openai,
+):
+    fake, base_url = await fake_openai(failing_titles={"task-3"})
+    service = OpenAILLMService(
+        AppSettings(
+            global_llm_api_key="key", global_llm_base_url=base_url, llm_batch_size=3
+        )
+    )
+    items = [
+        DifficultyEstimationRequest(task_title=f"task-{i}", task_description="d")
+        for i in range(9)
+    ]
+
+    results = await service.estimate_difficulty_batch(items)
+
+    failed = [index for index, result in enumerate(results) if result is None]
+    assert failed == [3, 4, 5]
+    # The failed chunk is not retried task by task.
+    assert all("tasks" in prompt for prompt in fake.prompts)
+
+
+async def test_estimate_difficulty_batch_fails_when_no_item_succeeds(fake_openai):
+    fake, base_url = await fake_openai(failing_titles={"first", "second"})
+    service = OpenAILLMService(
+        AppSettings(
+            global_llm_api_key="key", global_llm_base_url=base_url, llm_batch_size=1
+        )
+    )
+    items = [
+        DifficultyEstimationRequest(task_title=title, task_description="d")
+        for title in ("first", "second")
+    ]
+
+    with pytest.raises(LLMProviderError):
+        await service.estimate_difficulty_batch(items)
+
+
+async def test_project_keys_share_one_connection_pool(fake_openai):
+    fake, base_url = await fake_openai()
+    settings = AppSettings(global_llm_api_key=None)
+    async with httpx.AsyncClient() as http_client:
+        services = [
+            OpenAILLMService(
+                settings, api_key=key, base_url=base_url, http_client=http_client
+            )
+            for key in ("sk-project-a", "sk-project-b")
+        ]
+        for service in services:
+            await service.estimate_difficulty("title", "desc")
+        assert not http_client.is_closed
+
+    assert fake.api_keys == ["sk-project-a", "sk-project-b"]
+
+
+def _streaming_client(pieces, requests=None, usage=None):
+    async def chunks():
+        for piece in pieces:
+            yield SimpleNamespace(
+                choices=[SimpleNamespace(delta=SimpleNamespace(content=piece))]
+            )
+        if usage is not None:
+            yield SimpleNamespace(choices=[], usage=usage)
+
+    async def fake_create(**kwargs):
+        if requests is not None:
+            requests.append(kwargs)
+        return chunks()
+
+    return SimpleNamespace(
+        chat=SimpleNamespace(completions=SimpleNamespace(create=fake_create))
+    )
+
+
+@pytest.mark.asyncio
+async def test_estimate_progress_stream_yields_reasoning_as_it_arrives(
+    monkeypatch, settings
+):
+    service = OpenAILLMService(settings)
+    reply = json.dumps(
+        {
+            "reasoning": 'Tests "pass"\nAPI done',
+            "percentage": 70,
+            "confidence": 0.8,
+            "summary": "reasoning: none",
+        }
+    )
+    requests = []
+    pieces = [reply[i : i + 7] for i in range(0, len(reply), 7)]
+    reported = SimpleNamespace(prompt_tokens=120, completion_tokens=45)
+    monkeypatch.setattr(
+        service, "_client", lambda: _streaming_client(pieces, requests, reported)
+    )
+
+    with LLMUsage().metering() as usage:
+        items = [
+            item
+            async for item in service.estimate_progress_stream("t", "d", ["r1"])
+        ]
+
+    assert requests[0]["stream"] is True
+    assert requests[0]["stream_options"] == {"include_usage": True}
+    assert (usage.requests, usage.tokens) == (1, 165)
+    assert len(items) > 2
+    assert "".join(items[:-1]) == 'Tests "pass"\nAPI done'
+    assert items[-1] == ProgressEstimation(
+        percentage=70,
+        confidence=0.8,
+        reasoning='Tests "pass"\nAPI done',
+        summary="reasoning: none",
+    )
+
+
+@pytest.mark.asyncio
+async def test_estimate_progress_stream_validates_the_complete_reply(
+    monkeypatch, settings
+):
+    service = OpenAILLMService(settings)
+    monkeypatch.setattr(
+        service, "_client", lambda: _streaming_client(['{"reasoning": "ok"', "}"])
+    )
+
+    items = []
+    with pytest.raises(LLMInvalidResponseError):
+        async for item in service.estimate_progress_stream("t", "d", ["r1"]):
+            items.append(item)
+    assert items == ["ok"]
@@ -0,0 +1,27 @@
+"""Tests for OutboxEmailService."""
+
+from contextlib import asynccontextmanager
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from backend.src.adapters.services import OutboxEmailService
+from backend.src.domain.ports import EmailMessage
+
+
+@pytest.mark.asyncio
+async def test_send_email_queues_message_and_wakes_dispatcher():
+    uow = AsyncMock()
+    uow.email_outbox_repository = AsyncMock()
+    on_enqueued = MagicMock()
+
+    @asynccontextmanager
+    async def uow_factory():
+        yield uow
+
+    message = EmailMessage(recipients=["a@example.com"], subject="S", body_text="B")
+    await OutboxEmailService(uow_factory, on_enqueued=on_enqueued).send_email(message)
+
+    uow.email_outbox_repository.add.assert_awaited_once_with(message)
+    uow.commit.assert_awaited_once()
+    on_enqueued.assert_called_once()
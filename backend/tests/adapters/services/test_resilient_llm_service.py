@@ -0,0 +1,225 @@
+"""Tests for ResilientLLMService."""
+
+import asyncio
+
+import pytest
+
+from backend.src.adapters.services import (
+    CircuitBreaker,
+    CircuitState,
+    MockLLMService,
+    ResilientLLMService,
+)
+from backend.src.domain.errors import (
+    LLMInvalidResponseError,
+    LLMProviderError,
+    LLMRateLimitError,
+)
+from backend.src.domain.ports.services import DifficultyEstimationRequest
+
+
+class ScriptedLLMService(MockLLMService):
+    """Mock LLM that raises or stalls according to a script, then answers."""
+
+    def __init__(self, script=(), delay: float = 0.0) -> None:
+        self.script = list(script)
+        self.delay = delay
+        self.calls = 0
+
+    async def _next(self) -> None:
+        self.calls += 1
+        step = self.script.pop(0) if self.script else None
+        if isinstance(step, Exception):
+            raise step
+        await asyncio.sleep(step if isinstance(step, float) else self.delay)
+
+    async def estimate_difficulty(
+        self, task_title, task_description, project_context=None
+    ):
+        await self._next()
+        return await super().estimate_difficulty(
+            task_title, task_description, project_context
+        )
+
+    async def estimate_difficulty_batch(self, items, project_context=None):
+        await self._next()
+        return [None for _ in items]
+
+    async def estimate_progress_stream(
+        self, task_title, task_description, reports, previous=None
+    ):
+        await self._next()
+        async for item in super().estimate_progress_stream(
+            task_title, task_description, reports, previous
+        ):
+            yield item
+
+
+class RecordingSleep:
+    def __init__(self) -> None:
+        self.delays: list[float] = []
+
+    async def __call__(self, delay: float) -> None:
+        self.delays.append(delay)
+
+
+def resilient(inner, breaker=None, **kwargs):
+    return ResilientLLMService(
+        inner,
+        name="house:openai",
+        breaker=breaker or CircuitBreaker(failure_threshold=2),
+        **kwargs,
+    )
+
+
+@pytest.mark.asyncio
+async def test_rate_limits_are_retried_with_jittered_backoff():
+    inner = ScriptedLLMService(
+        [LLMRateLimitError("openai"), LLMRateLimitError("openai", retry_after=3)]
+    )
+    sleep = RecordingSleep()
+    service = resilient(
+        inner, sleep=sleep, jitter=lambda: 0.5, retry_base_delay_seconds=1.0
+    )
+
+    result = await service.estimate_difficulty("Build API", "CRUD")
+
+    assert result.points > 0
+    assert inner.calls == 3
+    assert sleep.delays == [0.5, 3.0]
+
+
+@pytest.mark.asyncio
+async def test_exhausted_retries_raise_and_count_against_the_breaker():
+    breaker = CircuitBreaker(failure_threshold=1)
+    inner = ScriptedLLMService([LLMRateLimitError("openai")] * 3)
+    service = resilient(inner, breaker, max_retries=1, sleep=RecordingSleep())
+
+    with pytest.raises(LLMRateLimitError):
+        await service.estimate_difficulty("Build API", "CRUD")
+
+    assert inner.calls == 2
+    assert breaker.state == CircuitState.OPEN
+
+
+@pytest.mark.asyncio
+async def test_deadline_bounds_a_slow_provider():
+    inner = ScriptedLLMService(delay=5.0)
+    service = resilient(inner, timeout_seconds=0.05)
+
+    with pytest.raises(LLMProviderError, match="no response within"):
+        await service.estimate_difficulty("Build API", "CRUD")
+
+
+@pytest.mark.asyncio
+async def test_unhealthy_provider_falls_back_and_is_skipped_once_open():
+    breaker = CircuitBreaker(failure_threshold=2)
+    inner = ScriptedLLMService([LLMProviderError("openai", "500")] * 2)
+    fallback = ScriptedLLMService()
+    service = resilient(inner, breaker, fallback=fallback)
+
+    for _ in range(3):
+        result = await service.estimate_difficulty("Build API", "CRUD")
+        assert result.points > 0
+
+    assert breaker.state == CircuitState.OPEN
+    assert (inner.calls, fallback.calls) == (2, 3)
+
+    batch = await service.estimate_difficulty_batch(
+        [DifficultyEstimationRequest("Build API", "CRUD")]
+    )
+    assert batch == [None]
+    assert (inner.calls, fallback.calls) == (2, 4)
+
+
+@pytest.mark.asyncio
+async def test_open_breaker_without_fallback_fails_fast():
+    breaker = CircuitBreaker(failure_threshold=1)
+    breaker.record_failure()
+    inner = ScriptedLLMService()
+
+    with pytest.raises(LLMProviderError, match="circuit open"):
+        await resilient(inner, breaker).estimate_difficulty("Build API", "CRUD")
+    assert inner.calls == 0
+
+
+@pytest.mark.asyncio
+async def test_invalid_responses_do_not_trip_the_breaker():
+    breaker = CircuitBreaker(failure_threshold=1)
+    inner = ScriptedLLMService([LLMInvalidResponseError("json")])
+    fallback = ScriptedLLMService()
+
+    with pytest.raises(LLMInvalidResponseError):
+        await resilient(inner, breaker, fallback=fallback).estimate_difficulty(
+            "Build API", "CRUD"
+        )
+    assert breaker.state == CircuitState.CLOSED
+    assert fallback.calls == 0
+
+
+@pytest.mark.asyncio
+async def test_slow_call_is_hedged_and_first_answer_wins():
+    inner = ScriptedLLMService([1.0, 0.0])
+    service = resilient(inner, hedge_after_seconds=0.02, timeout_seconds=0.5)
+
+    result = await service.estimate_difficulty("Build API", "CRUD")
+
+    assert result.points > 0
+    assert inner.calls == 2
+
+
+async def _collect(stream):
+    return [item async for item in stream]
+
+
+@pytest.mark.asyncio
+async def test_stream_retries_a_rate_limit_before_the_first_item():
+    inner = ScriptedLLMService([LLMRateLimitError("openai")])
+    sleep = RecordingSleep()
+    service = resilient(inner, sleep=sleep, jitter=lambda: 0.5)
+
+    items = await _collect(service.estimate_progress_stream("API", "", ["done"]))
+
+    assert inner.calls == 2
+    assert len(sleep.delays) == 1
+    assert "".join(items[:-1]) == items[-1].reasoning
+
+
+@pytest.mark.asyncio
+async def test_stream_falls_back_when_the_provider_fails_to_start():
+    breaker = CircuitBreaker(failure_threshold=1)
+    inner = ScriptedLLMService([LLMProviderError("openai", "down")])
+    fallback = ScriptedLLMService()
+    service = resilient(inner, breaker, fallback=fallback)
+
+    items = await _collect(service.estimate_progress_stream("API", "", ["done"]))
+
+    assert fallback.calls == 1
+    assert items[-1].percentage == 1
+    assert breaker.state == CircuitState.OPEN
+
+
+@pytest.mark.asyncio
+async def test_stalled_stream_is_a_provider_error_once_started():
+    class StallingLLMService(MockLLMService):
+        async def estimate_progress_stream(
+            self, task_title, task_description, reports, previous=None
+        ):
+            yield "Half"
+            await asyncio.sleep(1)
+            yield "never"
+
+    breaker = CircuitBreaker(failure_threshold=1)
+    fallback = ScriptedLLMService()
+    service = resilient(
+        StallingLLMService(), breaker, fallback=fallback, timeout_seconds=0.02
+    )
+    received = []
+
+    with pytest.raises(LLMProviderError, match="stalled"):
+        async for item in service.estimate_progress_stream("API", "", ["done"]):
+            received.append(item)
+
+    assert received == ["Half"]
+    assert fallback.calls == 0
+    assert breaker.state == CircuitState.OPEN
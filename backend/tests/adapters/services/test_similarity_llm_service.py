@@ -0,0 +1,149 @@
+"""Tests for SimilarityLLMService."""
+
+from uuid import uuid4
+
+import pytest
+
+from backend.src.adapters.services import (
+    MockLLMService,
+    ProjectScopedLLMResolver,
+    SimilarityLLMService,
+)
+from backend.src.domain.entities import Project
+from backend.src.domain.ports.services import DifficultyEstimationRequest, SimilarTask
+
+
+class StaticIndex:
+    """Index answering by exact title, for one project."""
+
+    def __init__(self, matches: dict[str, SimilarTask]) -> None:
+        self.matches = matches
+        self.project = Project(name="Project", manager_id=uuid4())
+
+    def add(self, project_id, task_id, title, description, difficulty_points) -> None:
+        raise AssertionError("not used")
+
+    def remove(self, task_id) -> None:
+        raise AssertionError("not used")
+
+    def nearest(self, project_id, title, description):
+        if project_id != self.project.id:
+            return None
+        return self.matches.get(title)
+
+
+class StaticResolver:
+    def __init__(self, service) -> None:
+        self.service = service
+
+    async def for_project(self, project):
+        return self.service
+
+    def invalidate(self, project_id) -> None:
+        pass
+
+
+async def _for_project(service, project):
+    """The service as use cases get it: scoped to the project."""
+    return await ProjectScopedLLMResolver(StaticResolver(service)).for_project(project)
+
+
+class CountingLLMService(MockLLMService):
+    def __init__(self) -> None:
+        self.single: list[str] = []
+        self.batches: list[list[str]] = []
+
+    async def estimate_difficulty(
+        self, task_title, task_description, project_context=None
+    ):
+        self.single.append(task_title)
+        return await super().estimate_difficulty(
+            task_title, task_description, project_context
+        )
+
+    async def estimate_difficulty_batch(self, items, project_context=None):
+        self.batches.append([item.task_title for item in items])
+        return await super().estimate_difficulty_batch(items, project_context)
+
+
+@pytest.fixture
+def index():
+    return StaticIndex(
+        {
+            "Export CSV": SimilarTask(uuid4(), difficulty_points=2, similarity=0.95),
+            "Export PDF": SimilarTask(uuid4(), difficulty_points=5, similarity=0.7),
+        }
+    )
+
+
+@pytest.mark.asyncio
+async def test_close_match_is_answered_without_the_provider(index):
+    inner = CountingLLMService()
+    service = await _for_project(
+        SimilarityLLMService(inner, index, threshold=0.9), index.project
+    )
+
+    result = await service.estimate_difficulty("Export CSV", "")
+
+    assert result.points == 2
+    assert result.confidence == 0.95
+    assert inner.single == []
+
+
+@pytest.mark.asyncio
+async def test_match_below_threshold_goes_to_the_provider(index):
+    inner = CountingLLMService()
+    service = await _for_project(
+        SimilarityLLMService(inner, index, threshold=0.9), index.project
+    )
+
+    await service.estimate_difficulty("Export PDF", "")
+    await service.estimate_difficulty("Unrelated", "")
+
+    assert inner.single == ["Export PDF", "Unrelated"]
+
+
+@pytest.mark.asyncio
+async def test_batch_sends_only_unmatched_tasks_in_order(index):
+    inner = CountingLLMService()
+    service = await _for_project(
+        SimilarityLLMService(inner, index, threshold=0.9), index.project
+    )
+    items = [
+        DifficultyEstimationRequest("Export PDF", "Layout"),
+        DifficultyEstimationRequest("Export CSV", ""),
+        DifficultyEstimationRequest("Unrelated", "Some work"),
+    ]
+
+    results = await service.estimate_difficulty_batch(items)
+
+    assert inner.batches == [["Export PDF", "Unrelated"]]
+    assert results[1].points == 2
+    assert all(result is not None for result in results)
+
+
+@pytest.mark.asyncio
+async def test_batch_of_matches_skips_the_provider(index):
+    inner = CountingLLMService()
+    service = await _for_project(
+        SimilarityLLMService(inner, index, threshold=0.9), index.project
+    )
+
+    results = await service.estimate_difficulty_batch(
+        [DifficultyEstimationRequest("Export CSV", "")]
+    )
+
+    assert [result.points for result in results] == [2]
+    assert inner.batches == []
+
+
+@pytest.mark.asyncio
+async def test_other_projects_and_unscoped_calls_go_to_the_provider(index):
+    inner = CountingLLMService()
+    service = SimilarityLLMService(inner, index, threshold=0.9)
+    other = await _for_project(service, Project(name="Other", manager_id=uuid4()))
+
+    await other.estimate_difficulty("Export CSV", "")
+    await service.estimate_difficulty("Export CSV", "")
+
+    assert inner.single == ["Export CSV", "Export CSV"]
@@ -10,6 +10,49 @@ from backend.src.domain.ports.services import EmailMessage
 aiosmtplib = pytest.importorskip("aiosmtplib")
 
 
+class FakeSMTP:
+    """Stand-in for aiosmtplib.SMTP that records connections and sends."""
+
+    instances: list["FakeSMTP"] = []
+    refused: set[str] = set()
+
+    def __init__(self, **kwargs):
+        self.kwargs = kwargs
+        self.sent = []
+        self.is_connected = False
+        self.fail_next_send = None
+        self.noops = 0
+        FakeSMTP.instances.append(self)
+
+    async def connect(self):
+        self.is_connected = True
+
+    async def send_message(self, message, recipients=None):
+        if self.fail_next_send is not None:
+            error, self.fail_next_send = self.fail_next_send, None
+            raise error
+        if recipients[0] in self.refused:
+            raise aiosmtplib.SMTPRecipientsRefused([])
+        self.sent.append((message, recipients))
+
+    async def noop(self):
+        self.noops += 1
+
+    async def quit(self):
+        self.is_connected = False
+
+    def close(self):
+        self.is_connected = False
+
+
+class Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
 @pytest.fixture
 def settings():
     return AppSettings(
@@ -19,29 +62,119 @@ def settings():
         smtp_password="pass",
         smtp_from_email="noreply@example.com",
         smtp_use_tls=True,
+        smtp_pool_size=2,
+        smtp_pool_idle_seconds=30,
+    )
+
+
+@pytest.fixture(autouse=True)
+def fake_smtp(monkeypatch):
+    FakeSMTP.instances = []
+    FakeSMTP.refused = set()
+    monkeypatch.setattr(aiosmtplib, "SMTP", FakeSMTP)
+    return FakeSMTP
+
+
+def _message(recipient="to@example.com"):
+    return EmailMessage(
+        recipients=[recipient],
+        subject="Hello",
+        body_text="Text body",
+        body_html="<p>HTML</p>",
+        bcc=["audit@example.com"],
     )
 
 
 @pytest.mark.asyncio
-async def test_send_email_calls_aiosmtplib(monkeypatch, settings):
+async def test_send_email_authenticates_and_sends(settings):
     service = SMTPEmailService(settings)
-    called = {}
 
-    async def fake_send(message, **kwargs):
-        called["message"] = message
-        called["kwargs"] = kwargs
+    await service.send_email(_message())
 
-    monkeypatch.setattr(aiosmtplib, "send", fake_send)
+    [smtp] = FakeSMTP.instances
+    assert smtp.kwargs["hostname"] == "smtp.example.com"
+    assert smtp.kwargs["username"] == "user"
+    mime, recipients = smtp.sent[0]
+    assert mime["Subject"] == "Hello"
+    assert recipients == ["to@example.com", "audit@example.com"]
 
-    await service.send_email(
-        EmailMessage(
-            recipients=["to@example.com"],
-            subject="Hello",
-            body_text="Text body",
-            body_html="<p>HTML</p>",
-        )
-    )
 
-    assert called["kwargs"]["hostname"] == "smtp.example.com"
-    assert called["kwargs"]["username"] == "user"
-    assert "to@example.com" in called["kwargs"]["recipients"]
+@pytest.mark.asyncio
+async def test_consecutive_sends_reuse_one_connection(settings):
+    clock = Clock()
+    service = SMTPEmailService(settings, clock=clock)
+
+    await service.send_email(_message())
+    clock.now = 10.0
+    await service.send_email(_message())
+
+    [smtp] = FakeSMTP.instances
+    assert len(smtp.sent) == 2
+    # Idle past the health-check threshold, so it was probed first.
+    assert smtp.noops == 1
+
+
+@pytest.mark.asyncio
+async def test_idle_connections_are_closed_after_timeout(settings):
+    clock = Clock()
+    service = SMTPEmailService(settings, clock=clock)
+
+    await service.send_email(_message())
+    clock.now = 31.0
+    await service.send_email(_message())
+
+    first, second = FakeSMTP.instances
+    assert not first.is_connected
+    assert len(second.sent) == 1
+
+
+@pytest.mark.asyncio
+async def test_dropped_pooled_connection_is_replaced_and_retried(settings):
+    service = SMTPEmailService(settings)
+    await service.send_email(_message())
+    FakeSMTP.instances[0].fail_next_send = aiosmtplib.SMTPServerDisconnected("bye")
+
+    await service.send_email(_message())
+
+    first, second = FakeSMTP.instances
+    assert not first.is_connected
+    assert len(second.sent) == 1
+
+
+@pytest.mark.asyncio
+async def test_refused_message_is_not_retried_and_keeps_connection(settings):
+    service = SMTPEmailService(settings)
+    await service.send_email(_message())
+    FakeSMTP.instances[0].fail_next_send = aiosmtplib.SMTPRecipientsRefused([])
+
+    with pytest.raises(aiosmtplib.SMTPRecipientsRefused):
+        await service.send_email(_message())
+    await service.send_email(_message())
+
+    [smtp] = FakeSMTP.instances
+    assert len(smtp.sent) == 2
+
+
+@pytest.mark.asyncio
+async def test_send_many_spreads_over_the_pool_and_reports_failures(settings):
+    service = SMTPEmailService(settings)
+    messages = [_message(f"user{n}@example.com") for n in range(5)]
+    FakeSMTP.refused = {"user1@example.com"}
+
+    results = await service.send_many(messages)
+
+    assert results[0] is None
+    assert isinstance(results[1], aiosmtplib.SMTPRecipientsRefused)
+    sent = sorted(r[0] for smtp in FakeSMTP.instances for _, r in smtp.sent)
+    assert sent == [f"user{n}@example.com" for n in (0, 2, 3, 4)]
+    assert len(FakeSMTP.instances) <= settings.smtp_pool_size
+
+
+@pytest.mark.asyncio
+async def test_aclose_quits_idle_connections(settings):
+    service = SMTPEmailService(settings)
+    await service.send_email(_message())
+
+    await service.aclose()
+
+    assert not FakeSMTP.instances[0].is_connected
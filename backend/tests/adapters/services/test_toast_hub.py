@@ -0,0 +1,79 @@
+"""Tests for InMemoryToastHub."""
+
+import asyncio
+import json
+from uuid import uuid4
+
+import pytest
+
+from backend.src.adapters.services import InMemoryToastHub
+from backend.src.domain.ports.services import NewTaskToastData
+
+
+def _toast(title: str = "Task") -> NewTaskToastData:
+    return NewTaskToastData(
+        project_id=uuid4(),
+        project_name="Project",
+        task_id=uuid4(),
+        task_title=title,
+        required_role="Dev",
+    )
+
+
+@pytest.mark.asyncio
+async def test_publish_reaches_every_stream_of_the_recipients_only():
+    hub = InMemoryToastHub()
+    alice, bob = uuid4(), uuid4()
+    toast = _toast()
+
+    with (
+        hub.subscribe(alice) as tab1,
+        hub.subscribe(alice) as tab2,
+        hub.subscribe(bob) as other,
+    ):
+        await hub.publish([alice], toast)
+
+        first = json.loads(await tab1.get())
+        assert first["task_id"] == str(toast.task_id)
+        assert first["required_role"] == "Dev"
+        assert json.loads(await tab2.get()) == first
+        with pytest.raises(TimeoutError):
+            async with asyncio.timeout(0.01):
+                await other.get()
+
+
+@pytest.mark.asyncio
+async def test_waiting_reader_is_woken_by_publish():
+    hub = InMemoryToastHub()
+    user_id = uuid4()
+
+    with hub.subscribe(user_id) as subscription:
+        reader = asyncio.create_task(subscription.get())
+        await asyncio.sleep(0)
+        await hub.publish([user_id], _toast("Wake up"))
+
+        assert json.loads(await reader)["task_title"] == "Wake up"
+
+
+@pytest.mark.asyncio
+async def test_slow_stream_keeps_only_the_newest_toasts():
+    hub = InMemoryToastHub(max_pending=2)
+    user_id = uuid4()
+
+    with hub.subscribe(user_id) as subscription:
+        for n in range(3):
+            await hub.publish([user_id], _toast(f"T{n}"))
+
+        titles = [json.loads(await subscription.get())["task_title"] for _ in range(2)]
+    assert titles == ["T1", "T2"]
+
+
+def test_closing_a_stream_unsubscribes_it():
+    hub = InMemoryToastHub()
+    user_id = uuid4()
+
+    with hub.subscribe(user_id):
+        assert hub.connection_count == 1
+
+    assert hub.connection_count == 0
+    assert hub.deliver([user_id], "{}") == 0
@@ -0,0 +1,41 @@
+"""Tests for VerifiedTokenCache."""
+
+from backend.src.adapters.services.verified_token_cache import VerifiedTokenCache
+
+
+def test_entry_expires_at_exp_claim():
+    cache = VerifiedTokenCache()
+    cache.put("token", {"user_id": "u", "exp": 100})
+
+    assert cache.get("token", now=99.5) == {"user_id": "u", "exp": 100}
+    assert cache.get("token", now=100) is None
+    assert len(cache) == 0
+
+
+def test_least_recently_used_entry_is_evicted():
+    cache = VerifiedTokenCache(max_entries=2)
+    cache.put("a", {"exp": 100})
+    cache.put("b", {"exp": 100})
+    cache.get("a", now=0)
+
+    cache.put("c", {"exp": 100})
+
+    assert cache.get("a", now=0) is not None
+    assert cache.get("b", now=0) is None
+    assert cache.get("c", now=0) is not None
+
+
+def test_payload_without_exp_is_not_cached():
+    cache = VerifiedTokenCache()
+    cache.put("token", {"user_id": "u"})
+
+    assert cache.get("token", now=0) is None
+
+
+def test_returned_payload_is_a_copy():
+    cache = VerifiedTokenCache()
+    cache.put("token", {"exp": 100})
+
+    cache.get("token", now=0)["exp"] = 0
+
+    assert cache.get("token", now=0) == {"exp": 100}
@@ -0,0 +1,72 @@
+"""Tests for RequestMagicLinkUseCase."""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from backend.src.application.use_cases.auth.request_magic_link import (
+    RequestMagicLinkInput,
+    RequestMagicLinkUseCase,
+)
+from backend.src.domain.entities import User
+
+
+@pytest.fixture
+def uow():
+    mock = AsyncMock()
+    mock.user_repository = AsyncMock()
+    mock.email_outbox_repository = AsyncMock()
+    mock.__aenter__ = AsyncMock(return_value=mock)
+    mock.__aexit__ = AsyncMock(return_value=False)
+    return mock
+
+
+@pytest.fixture
+def email_service():
+    return AsyncMock()
+
+
+@pytest.mark.asyncio
+async def test_magic_link_is_queued_in_the_same_transaction(uow, email_service):
+    uow.user_repository.find_by_email.return_value = None
+    calls = MagicMock()
+    uow.user_repository.save.side_effect = lambda user: calls.save(user)
+    uow.email_outbox_repository.add.side_effect = lambda message: calls.add(message)
+    uow.commit.side_effect = lambda: calls.commit()
+
+    await RequestMagicLinkUseCase(email_service=email_service, uow=uow).execute(
+        RequestMagicLinkInput(email=" New@Example.com ")
+    )
+
+    assert [c[0] for c in calls.mock_calls] == ["save", "add", "commit"]
+    message = uow.email_outbox_repository.add.await_args.args[0]
+    assert message.recipients == ["new@example.com"]
+    email_service.send_email.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_nothing_is_queued_when_the_transaction_fails(uow, email_service):
+    uow.user_repository.find_by_email.return_value = User(
+        email="user@example.com", name="User"
+    )
+    uow.user_repository.save.side_effect = RuntimeError("db down")
+
+    with pytest.raises(RuntimeError):
+        await RequestMagicLinkUseCase(email_service=email_service, uow=uow).execute(
+            RequestMagicLinkInput(email="user@example.com")
+        )
+
+    uow.email_outbox_repository.add.assert_not_awaited()
+    uow.commit.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_without_uow_email_is_sent_directly(email_service):
+    user_repository = AsyncMock()
+    user_repository.find_by_email.return_value = None
+
+    await RequestMagicLinkUseCase(
+        email_service=email_service, user_repository=user_repository
+    ).execute(RequestMagicLinkInput(email="user@example.com"))
+
+    email_service.send_email.assert_awaited_once()
@@ -24,6 +24,7 @@ from backend.src.domain.errors import (
     UserAlreadyMemberError,
     UserNotFoundError,
 )
+from backend.src.domain.services.project_access_resolver import ProjectAccessResolver
 
 
 @pytest.fixture
@@ -363,3 +364,27 @@ class TestAcceptInviteUseCase:
             await use_case.execute(input_data)
 
         uow.commit.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_invalidates_cached_access_after_commit(
+        self,
+        uow,
+        valid_invite,
+        existing_user,
+        user_id,
+    ):
+        """A cached "not a member" answer must not outlive the join."""
+        cache = AsyncMock()
+        cache.invalidate.side_effect = lambda *_: uow.commit.assert_awaited_once()
+        use_case = AcceptInviteUseCase(
+            uow=uow, access_resolver=ProjectAccessResolver(cache)
+        )
+        uow.project_invite_repository.find_by_token.return_value = valid_invite
+        uow.user_repository.find_by_id.return_value = existing_user
+        uow.project_member_repository.find_by_project_and_user.return_value = None
+
+        await use_case.execute(
+            AcceptInviteInput(token=valid_invite.token, user_id=user_id)
+        )
+
+        cache.invalidate.assert_awaited_once_with(valid_invite.project_id, user_id)
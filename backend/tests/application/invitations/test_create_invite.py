@@ -9,7 +9,7 @@ from backend.src.application.use_cases.invitations import (
     CreateInviteInput,
     CreateInviteUseCase,
 )
-from backend.src.domain.entities import Project, ProjectInvite, Role
+from backend.src.domain.entities import Project, ProjectAccess, ProjectInvite, Role
 from backend.src.domain.errors import ManagerRequiredError, ProjectNotFoundError
 
 
@@ -68,7 +68,9 @@ class TestCreateInviteUseCase:
         manager_id,
     ):
         """BR-INV-001: Only Managers can generate invite links."""
-        project_repository.find_by_id.return_value = existing_project
+        project_repository.find_access.return_value = ProjectAccess.of(
+            existing_project, manager_id
+        )
         role_repository.find_by_id.return_value = existing_role
         project_invite_repository.save.return_value = None
 
@@ -99,7 +101,9 @@ class TestCreateInviteUseCase:
         manager_id,
     ):
         """BR-INV-002: An invite link is tied to a specific Project and Role."""
-        project_repository.find_by_id.return_value = existing_project
+        project_repository.find_access.return_value = ProjectAccess.of(
+            existing_project, manager_id
+        )
         role_repository.find_by_id.return_value = existing_role
         project_invite_repository.save.return_value = None
 
@@ -126,7 +130,9 @@ class TestCreateInviteUseCase:
         manager_id,
     ):
         """BR-INV-003: Invite links are public tokens."""
-        project_repository.find_by_id.return_value = existing_project
+        project_repository.find_access.return_value = ProjectAccess.of(
+            existing_project, manager_id
+        )
         role_repository.find_by_id.return_value = existing_role
         project_invite_repository.save.return_value = None
 
@@ -153,7 +159,7 @@ class TestCreateInviteUseCase:
         project_invite_repository,
     ):
         """Should raise ProjectNotFoundError when project doesn't exist."""
-        project_repository.find_by_id.return_value = None
+        project_repository.find_access.return_value = None
 
         input_data = CreateInviteInput(
             project_id=uuid4(),
@@ -176,7 +182,9 @@ class TestCreateInviteUseCase:
         existing_project,
     ):
         """BR-INV-001: Only Managers can generate invite links."""
-        project_repository.find_by_id.return_value = existing_project
+        project_repository.find_access.return_value = ProjectAccess.of(
+            existing_project, uuid4()
+        )
         non_manager_id = uuid4()
 
         input_data = CreateInviteInput(
@@ -201,7 +209,9 @@ class TestCreateInviteUseCase:
         manager_id,
     ):
         """Should raise ValueError when role doesn't exist."""
-        project_repository.find_by_id.return_value = existing_project
+        project_repository.find_access.return_value = ProjectAccess.of(
+            existing_project, manager_id
+        )
         role_repository.find_by_id.return_value = None
 
         input_data = CreateInviteInput(
@@ -225,7 +235,9 @@ class TestCreateInviteUseCase:
     ):
         """Should raise ValueError when role belongs to different project."""
         different_project_role = Role(project_id=uuid4(), name="Other Role")
-        project_repository.find_by_id.return_value = existing_project
+        project_repository.find_access.return_value = ProjectAccess.of(
+            existing_project, manager_id
+        )
         role_repository.find_by_id.return_value = different_project_role
 
         input_data = CreateInviteInput(
@@ -249,7 +261,9 @@ class TestCreateInviteUseCase:
         manager_id,
     ):
         """Should save the invite using the repository."""
-        project_repository.find_by_id.return_value = existing_project
+        project_repository.find_access.return_value = ProjectAccess.of(
+            existing_project, manager_id
+        )
         role_repository.find_by_id.return_value = existing_role
         project_invite_repository.save.return_value = None
 
@@ -0,0 +1,115 @@
+"""Tests for CheckWorkloadAlertsUseCase."""
+
+from contextlib import asynccontextmanager
+from unittest.mock import AsyncMock
+from uuid import uuid4
+
+import pytest
+
+from backend.src.application.use_cases.notifications import (
+    CheckWorkloadAlertsInput,
+    CheckWorkloadAlertsUseCase,
+)
+from backend.src.domain.entities import SeniorityLevel
+from backend.src.domain.events import TaskCompleted, TaskSelected
+from backend.src.domain.ports.repositories import MemberWorkloadState
+
+
+def _state(member_id, doing_points: int) -> MemberWorkloadState:
+    # A MID member has a capacity of 10 points: more than 15 is Impossible.
+    return MemberWorkloadState(
+        project_id=uuid4(),
+        project_name="Alpha",
+        manager_email="manager@example.com",
+        member_id=member_id,
+        user_id=uuid4(),
+        member_name="Ana",
+        member_email="ana@example.com",
+        seniority_level=SeniorityLevel.MID,
+        doing_points=doing_points,
+    )
+
+
+@pytest.fixture
+def uow():
+    mock = AsyncMock()
+    mock.workload_alert_repository = AsyncMock()
+    mock.workload_alert_repository.raise_alert.return_value = True
+    mock.workload_alert_repository.clear_alert.return_value = True
+    return mock
+
+
+@pytest.fixture
+def notification_service():
+    return AsyncMock()
+
+
+@pytest.fixture
+def use_case(uow, notification_service):
+    @asynccontextmanager
+    async def uow_factory():
+        yield uow
+
+    return CheckWorkloadAlertsUseCase(uow_factory, notification_service)
+
+
+@pytest.mark.asyncio
+async def test_alerts_manager_when_member_becomes_impossible(
+    use_case, uow, notification_service
+):
+    member_id = uuid4()
+    uow.workload_alert_repository.get_member_workload.return_value = _state(member_id, 16)
+
+    output = await use_case.execute(CheckWorkloadAlertsInput(member_ids=[member_id]))
+
+    assert output.alerted == 1
+    uow.workload_alert_repository.raise_alert.assert_awaited_once_with(member_id)
+    manager_email, alert = notification_service.send_workload_alert.call_args.args
+    assert manager_email == "manager@example.com"
+    assert alert.employee_name == "Ana"
+    assert alert.current_workload_ratio == pytest.approx(1.6)
+    uow.commit.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_raised_alert_is_not_repeated(use_case, uow, notification_service):
+    member_id = uuid4()
+    uow.workload_alert_repository.get_member_workload.return_value = _state(member_id, 20)
+    uow.workload_alert_repository.raise_alert.return_value = False
+
+    output = await use_case.execute(CheckWorkloadAlertsInput(member_ids=[member_id]))
+
+    assert output.alerted == 0
+    notification_service.send_workload_alert.assert_not_called()
+    uow.commit.assert_not_called()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(("points", "rearmed"), [(15, False), (13, False), (12, True)])
+async def test_alert_rearms_only_below_tight(use_case, uow, points, rearmed):
+    member_id = uuid4()
+    uow.workload_alert_repository.get_member_workload.return_value = _state(
+        member_id, points
+    )
+
+    output = await use_case.execute(CheckWorkloadAlertsInput(member_ids=[member_id]))
+
+    assert output.rearmed == int(rearmed)
+    uow.workload_alert_repository.raise_alert.assert_not_called()
+    assert uow.workload_alert_repository.clear_alert.called is rearmed
+
+
+@pytest.mark.asyncio
+async def test_handle_events_checks_each_member_once(use_case, uow):
+    member_id = uuid4()
+    uow.workload_alert_repository.get_member_workload.return_value = _state(member_id, 5)
+    events = [
+        TaskSelected(uuid4(), uuid4(), member_id),
+        TaskCompleted(uuid4(), uuid4(), member_id),
+    ]
+
+    await use_case.handle_events(events)
+
+    uow.workload_alert_repository.get_member_workload.assert_awaited_once_with(
+        member_id
+    )
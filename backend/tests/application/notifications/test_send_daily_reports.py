@@ -0,0 +1,118 @@
+"""Tests for SendDailyReportsUseCase."""
+
+from datetime import date, datetime, timezone
+from unittest.mock import AsyncMock
+from uuid import uuid4
+
+import pytest
+
+from backend.src.application.use_cases.notifications import (
+    SendDailyReportsInput,
+    SendDailyReportsUseCase,
+)
+from backend.src.domain.entities import SeniorityLevel, WorkingCalendar
+from backend.src.domain.ports.repositories import (
+    MemberWorkloadPoints,
+    ProjectTaskCounts,
+    ReportProject,
+)
+
+# A Wednesday.
+NOW = datetime(2026, 3, 4, 8, 0, tzinfo=timezone.utc)
+
+
+def _project(name: str, calendar: WorkingCalendar | None = None) -> ReportProject:
+    return ReportProject(
+        project_id=uuid4(),
+        project_name=name,
+        manager_email=f"{name.lower()}@example.com",
+        calendar=calendar or WorkingCalendar.default(),
+    )
+
+
+@pytest.fixture
+def uow():
+    mock = AsyncMock()
+    mock.report_repository = AsyncMock()
+    mock.report_repository.count_tasks_by_project.return_value = {}
+    mock.report_repository.list_member_workloads.return_value = []
+    mock.__aenter__ = AsyncMock(return_value=mock)
+    mock.__aexit__ = AsyncMock(return_value=False)
+    return mock
+
+
+@pytest.fixture
+def notification_service():
+    return AsyncMock()
+
+
+@pytest.mark.asyncio
+async def test_sends_report_with_counts_and_workload(uow, notification_service):
+    project = _project("Alpha")
+    uow.report_repository.list_projects.side_effect = [[project]]
+    uow.report_repository.count_tasks_by_project.return_value = {
+        project.project_id: ProjectTaskCounts(
+            total_tasks=10, completed_today=2, blocked_tasks=1, delayed_tasks=3
+        )
+    }
+    uow.report_repository.list_member_workloads.return_value = [
+        MemberWorkloadPoints(project.project_id, "Ana", SeniorityLevel.MID, 10),
+        MemberWorkloadPoints(project.project_id, "Bo", SeniorityLevel.MID, 0),
+    ]
+
+    output = await SendDailyReportsUseCase(uow, notification_service).execute(
+        SendDailyReportsInput(now=NOW)
+    )
+
+    assert output.sent == 1
+    manager_email, report = notification_service.send_daily_report.await_args.args
+    assert manager_email == "alpha@example.com"
+    assert (report.total_tasks, report.completed_today) == (10, 2)
+    assert (report.blocked_tasks, report.delayed_tasks) == (1, 3)
+    assert report.team_workload_summary == {"Ana": "Healthy", "Bo": "Idle"}
+
+
+@pytest.mark.asyncio
+async def test_skips_projects_on_non_working_days(uow, notification_service):
+    working = _project("Alpha")
+    holiday = _project(
+        "Beta", WorkingCalendar(exclusion_dates=frozenset({date(2026, 3, 4)}))
+    )
+    uow.report_repository.list_projects.side_effect = [[working, holiday]]
+
+    output = await SendDailyReportsUseCase(uow, notification_service).execute(
+        SendDailyReportsInput(now=NOW)
+    )
+
+    assert (output.sent, output.skipped) == (1, 1)
+    uow.report_repository.count_tasks_by_project.assert_awaited_once_with(
+        [working.project_id], NOW
+    )
+
+
+@pytest.mark.asyncio
+async def test_reads_projects_in_pages(uow, notification_service):
+    first = [_project(f"P{n}") for n in range(2)]
+    second = [_project("P2")]
+    uow.report_repository.list_projects.side_effect = [first, second]
+
+    output = await SendDailyReportsUseCase(
+        uow, notification_service, page_size=2
+    ).execute(SendDailyReportsInput(now=NOW))
+
+    assert output.sent == 3
+    calls = uow.report_repository.list_projects.await_args_list
+    assert [c.kwargs["after"] for c in calls] == [None, first[-1].project_id]
+    assert uow.report_repository.count_tasks_by_project.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_failed_send_does_not_stop_the_run(uow, notification_service):
+    uow.report_repository.list_projects.side_effect = [[_project("A"), _project("B")]]
+    notification_service.send_daily_report.side_effect = [RuntimeError("down"), None]
+
+    output = await SendDailyReportsUseCase(
+        uow, notification_service, concurrency=1
+    ).execute(SendDailyReportsInput(now=NOW))
+
+    assert (output.sent, output.failed) == (1, 1)
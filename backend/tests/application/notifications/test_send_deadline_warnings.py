@@ -0,0 +1,150 @@
+"""Tests for SendDeadlineWarningsUseCase."""
+
+from datetime import datetime, timedelta, timezone
+from unittest.mock import AsyncMock
+from uuid import uuid4
+
+import pytest
+
+from backend.src.application.use_cases.notifications import (
+    SendDeadlineWarningsInput,
+    SendDeadlineWarningsUseCase,
+)
+from backend.src.application.use_cases.notifications.send_deadline_warnings import (
+    CHANGES_WATERMARK,
+    DEADLINES_WATERMARK,
+)
+from backend.src.domain.entities import WorkingCalendar
+from backend.src.domain.ports.repositories import (
+    DeadlineCandidate,
+    DueDeadlineWarning,
+    ScheduledDeadlineWarning,
+)
+
+# A Friday.
+NOW = datetime(2026, 3, 6, 9, 0, tzinfo=timezone.utc)
+
+
+@pytest.fixture
+def repo():
+    mock = AsyncMock()
+    mock.get_watermark.return_value = None
+    mock.find_by_deadline.return_value = []
+    mock.find_changed.return_value = []
+    mock.list_due.return_value = []
+    return mock
+
+
+@pytest.fixture
+def uow(repo):
+    mock = AsyncMock()
+    mock.deadline_warning_repository = repo
+    mock.__aenter__ = AsyncMock(return_value=mock)
+    mock.__aexit__ = AsyncMock(return_value=False)
+    return mock
+
+
+@pytest.fixture
+def notification_service():
+    return AsyncMock()
+
+
+def _use_case(uow, notification_service, **kwargs):
+    return SendDeadlineWarningsUseCase(
+        uow, notification_service, lookahead=timedelta(days=14), **kwargs
+    )
+
+
+@pytest.mark.asyncio
+async def test_first_run_schedules_the_lookahead_window(uow, repo, notification_service):
+    task_id = uuid4()
+    monday = datetime(2026, 3, 9, 17, 0, tzinfo=timezone.utc)
+    repo.find_by_deadline.return_value = [
+        DeadlineCandidate(task_id, monday, WorkingCalendar.default(), monday)
+    ]
+
+    output = await _use_case(uow, notification_service).execute(
+        SendDeadlineWarningsInput(now=NOW)
+    )
+
+    assert output.scanned == 1
+    repo.find_by_deadline.assert_awaited_once_with(
+        NOW, NOW + timedelta(days=14), after=None, limit=1000
+    )
+    repo.find_changed.assert_not_awaited()
+    # Monday's deadline is warned from the start of Friday (BR-NOTIF-004).
+    repo.schedule.assert_any_await(
+        [
+            ScheduledDeadlineWarning(
+                task_id, monday, datetime(2026, 3, 6, tzinfo=timezone.utc)
+            )
+        ]
+    )
+    repo.set_watermark.assert_any_await(DEADLINES_WATERMARK, NOW + timedelta(days=14))
+    repo.set_watermark.assert_any_await(CHANGES_WATERMARK, NOW)
+
+
+@pytest.mark.asyncio
+async def test_later_runs_only_scan_the_new_window_and_recent_edits(
+    uow, repo, notification_service
+):
+    scanned_until = NOW + timedelta(days=14) - timedelta(minutes=15)
+    last_run = NOW - timedelta(minutes=15)
+    repo.get_watermark.side_effect = lambda name: {
+        DEADLINES_WATERMARK: scanned_until,
+        CHANGES_WATERMARK: last_run,
+    }[name]
+
+    await _use_case(uow, notification_service).execute(
+        SendDeadlineWarningsInput(now=NOW)
+    )
+
+    repo.find_by_deadline.assert_awaited_once_with(
+        scanned_until, NOW + timedelta(days=14), after=None, limit=1000
+    )
+    repo.find_changed.assert_awaited_once_with(
+        last_run - timedelta(minutes=5), NOW, scanned_until, after=None, limit=1000
+    )
+
+
+@pytest.mark.asyncio
+async def test_scan_pages_by_cursor(uow, repo, notification_service):
+    deadline = NOW + timedelta(days=3)
+    first = [
+        DeadlineCandidate(uuid4(), deadline, WorkingCalendar.default(), deadline)
+        for _ in range(2)
+    ]
+    repo.find_by_deadline.side_effect = [first, []]
+
+    output = await _use_case(uow, notification_service, page_size=2).execute(
+        SendDeadlineWarningsInput(now=NOW)
+    )
+
+    assert output.scanned == 2
+    second_call = repo.find_by_deadline.await_args_list[1]
+    assert second_call.kwargs["after"] == (deadline, first[-1].task_id)
+
+
+@pytest.mark.asyncio
+async def test_sends_due_warnings_and_marks_only_successes(
+    uow, repo, notification_service
+):
+    deadline = NOW + timedelta(hours=30)
+    ok = DueDeadlineWarning(uuid4(), deadline, "Ship it", "ana@example.com")
+    bad = DueDeadlineWarning(uuid4(), deadline, "Test it", "bo@example.com")
+    repo.list_due.return_value = [ok, bad]
+    notification_service.send_deadline_warning.side_effect = [
+        None,
+        RuntimeError("down"),
+    ]
+
+    output = await _use_case(uow, notification_service, concurrency=1).execute(
+        SendDeadlineWarningsInput(now=NOW)
+    )
+
+    assert (output.sent, output.failed) == (1, 1)
+    notification_service.send_deadline_warning.assert_any_await(
+        "ana@example.com", ok.task_id, "Ship it", 30
+    )
+    repo.mark_sent.assert_awaited_once_with([ok], NOW)
+    repo.prune.assert_awaited_once_with(NOW)
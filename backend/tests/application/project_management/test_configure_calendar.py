@@ -10,7 +10,7 @@ from backend.src.application.use_cases.project_management.configure_calendar imp
     ConfigureCalendarInput,
     ConfigureCalendarUseCase,
 )
-from backend.src.domain.entities import Calendar, Project
+from backend.src.domain.entities import Calendar, Project, ProjectAccess
 from backend.src.domain.errors import ManagerRequiredError, ProjectNotFoundError
 
 
@@ -46,7 +46,7 @@ async def test_updates_existing_calendar(use_case, project_repository, calendar_
     project = Project(name="P", manager_id=manager_id)
     calendar = Calendar(project_id=project.id)
 
-    project_repository.find_by_id.return_value = project
+    project_repository.find_access.return_value = ProjectAccess.of(project, manager_id)
     calendar_repository.get_by_project_id.return_value = calendar
     calendar_repository.save.return_value = calendar
 
@@ -70,7 +70,7 @@ async def test_creates_calendar_if_missing(use_case, project_repository, calenda
     manager_id = uuid4()
     project = Project(name="P", manager_id=manager_id)
 
-    project_repository.find_by_id.return_value = project
+    project_repository.find_access.return_value = ProjectAccess.of(project, manager_id)
     calendar_repository.get_by_project_id.return_value = None
     calendar_repository.save.side_effect = lambda c: c
 
@@ -84,7 +84,7 @@ async def test_creates_calendar_if_missing(use_case, project_repository, calenda
 
 @pytest.mark.asyncio
 async def test_raises_for_missing_project_or_permissions(use_case, project_repository):
-    project_repository.find_by_id.return_value = None
+    project_repository.find_access.return_value = None
     with pytest.raises(ProjectNotFoundError):
         await use_case.execute(
             ConfigureCalendarInput(project_id=uuid4(), requester_id=uuid4())
@@ -92,8 +92,9 @@ async def test_raises_for_missing_project_or_permissions(use_case, project_repos
 
     manager_id = uuid4()
     project = Project(name="P", manager_id=manager_id)
-    project_repository.find_by_id.return_value = project
+    outsider_id = uuid4()
+    project_repository.find_access.return_value = ProjectAccess.of(project, outsider_id)
     with pytest.raises(ManagerRequiredError):
         await use_case.execute(
-            ConfigureCalendarInput(project_id=project.id, requester_id=uuid4())
+            ConfigureCalendarInput(project_id=project.id, requester_id=outsider_id)
         )
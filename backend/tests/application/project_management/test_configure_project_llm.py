@@ -1,6 +1,6 @@
 """Tests for ConfigureProjectLLMUseCase."""
 
-from unittest.mock import AsyncMock
+from unittest.mock import AsyncMock, MagicMock
 from uuid import uuid4
 
 import pytest
@@ -9,13 +9,20 @@ from backend.src.application.use_cases.project_management import (
     ConfigureProjectLLMInput,
     ConfigureProjectLLMUseCase,
 )
-from backend.src.domain.entities import Project
+from backend.src.domain.entities import Project, ProjectAccess
 from backend.src.domain.errors import ManagerRequiredError, ProjectNotFoundError
 
 
 @pytest.fixture
 def project_repository():
-    return AsyncMock()
+    repository = AsyncMock()
+
+    async def find_access(project_id, user_id):
+        project = repository.find_by_id.return_value
+        return None if project is None else ProjectAccess.of(project, user_id)
+
+    repository.find_access.side_effect = find_access
+    return repository
 
 
 @pytest.fixture
@@ -194,3 +201,28 @@ class TestConfigureProjectLLMUseCase:
         saved_project = project_repository.save.call_args[0][0]
         assert saved_project.llm_provider == "openai"
         assert saved_project.llm_api_key_encrypted == "encrypted_key"
+
+    @pytest.mark.asyncio
+    async def test_invalidates_cached_client_for_the_old_key(
+        self, project_repository, encryption_service, existing_project, manager_id
+    ):
+        """The client built from the previous key must not be reused."""
+        project_repository.find_by_id.return_value = existing_project
+        encryption_service.encrypt.return_value = "encrypted_key"
+        llm_resolver = MagicMock()
+        use_case = ConfigureProjectLLMUseCase(
+            project_repository=project_repository,
+            encryption_service=encryption_service,
+            llm_resolver=llm_resolver,
+        )
+
+        await use_case.execute(
+            ConfigureProjectLLMInput(
+                project_id=existing_project.id,
+                requester_id=manager_id,
+                provider="openai",
+                api_key="sk-new-key",
+            )
+        )
+
+        llm_resolver.invalidate.assert_called_once_with(existing_project.id)
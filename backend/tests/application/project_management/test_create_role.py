@@ -9,7 +9,7 @@ from backend.src.application.use_cases.project_management import (
     CreateRoleInput,
     CreateRoleUseCase,
 )
-from backend.src.domain.entities import Project, Role
+from backend.src.domain.entities import Project, ProjectAccess, Role
 from backend.src.domain.errors import ManagerRequiredError, ProjectNotFoundError
 
 
@@ -54,7 +54,9 @@ class TestCreateRoleUseCase:
         manager_id,
     ):
         """BR-ROLE-001: Roles are created by the Manager."""
-        project_repository.find_by_id.return_value = existing_project
+        project_repository.find_access.return_value = ProjectAccess.of(
+            existing_project, manager_id
+        )
         role_repository.save.return_value = None
 
         input_data = CreateRoleInput(
@@ -74,7 +76,7 @@ class TestCreateRoleUseCase:
         self, use_case, project_repository, role_repository
     ):
         """Should raise ProjectNotFoundError when project doesn't exist."""
-        project_repository.find_by_id.return_value = None
+        project_repository.find_access.return_value = None
         project_id = uuid4()
         requester_id = uuid4()
 
@@ -94,7 +96,9 @@ class TestCreateRoleUseCase:
         self, use_case, project_repository, role_repository, existing_project
     ):
         """BR-PROJ-004: Only the Manager can edit Project settings."""
-        project_repository.find_by_id.return_value = existing_project
+        project_repository.find_access.return_value = ProjectAccess.of(
+            existing_project, uuid4()
+        )
         non_manager_id = uuid4()
 
         input_data = CreateRoleInput(
@@ -118,7 +122,9 @@ class TestCreateRoleUseCase:
         manager_id,
     ):
         """Should save the role using the repository."""
-        project_repository.find_by_id.return_value = existing_project
+        project_repository.find_access.return_value = ProjectAccess.of(
+            existing_project, manager_id
+        )
         role_repository.save.return_value = None
 
         input_data = CreateRoleInput(
@@ -0,0 +1,142 @@
+"""Tests for ExportProjectDataUseCase."""
+
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import pytest
+
+from backend.src.application.use_cases.project_management import (
+    ExportProjectDataInput,
+    ExportProjectDataUseCase,
+    ExportResource,
+)
+from backend.src.domain.entities import (
+    Project,
+    ProjectAccess,
+    ProjectMember,
+    SeniorityLevel,
+    Task,
+    TaskDependency,
+)
+from backend.src.domain.errors import ProjectAccessDeniedError, ProjectNotFoundError
+
+
+async def _aiter(items):
+    for item in items:
+        yield item
+
+
+@pytest.fixture
+def uow():
+    mock = AsyncMock()
+    mock.project_repository = AsyncMock()
+    mock.project_member_repository = AsyncMock()
+    mock.task_repository = MagicMock()
+    mock.task_dependency_repository = MagicMock()
+    mock.task_log_repository = MagicMock()
+    mock.__aenter__ = AsyncMock(return_value=mock)
+    mock.__aexit__ = AsyncMock(return_value=False)
+    return mock
+
+
+@pytest.fixture
+def use_case(uow):
+    return ExportProjectDataUseCase(uow=uow)
+
+
+@pytest.fixture
+def manager_id():
+    return uuid4()
+
+
+@pytest.fixture
+def project(manager_id):
+    return Project(name="Test Project", manager_id=manager_id)
+
+
+class TestExportProjectDataUseCase:
+    """Tests for ExportProjectDataUseCase.execute()."""
+
+    @pytest.mark.asyncio
+    async def test_streams_tasks_for_manager(self, use_case, uow, project, manager_id):
+        tasks = [Task(project_id=project.id, title=f"T{i}") for i in range(3)]
+        uow.project_repository.find_access.return_value = ProjectAccess.of(
+            project, manager_id
+        )
+        uow.task_repository.stream_by_project.return_value = _aiter(tasks)
+
+        records = [
+            record
+            async for record in use_case.execute(
+                ExportProjectDataInput(
+                    project_id=project.id,
+                    requester_id=manager_id,
+                    resource=ExportResource.TASKS,
+                )
+            )
+        ]
+
+        assert records == tasks
+        uow.task_repository.stream_by_project.assert_called_once_with(project.id)
+        uow.project_repository.find_access.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_streams_dependencies_for_member(self, use_case, uow, project):
+        member = ProjectMember(
+            project_id=project.id,
+            user_id=uuid4(),
+            role_id=uuid4(),
+            seniority_level=SeniorityLevel.MID,
+        )
+        dependency = TaskDependency(blocking_task_id=uuid4(), blocked_task_id=uuid4())
+        uow.project_repository.find_access.return_value = ProjectAccess.of(
+            project, member.user_id, member
+        )
+        uow.task_dependency_repository.stream_by_project.return_value = _aiter([dependency])
+
+        records = [
+            record
+            async for record in use_case.execute(
+                ExportProjectDataInput(
+                    project_id=project.id,
+                    requester_id=member.user_id,
+                    resource=ExportResource.DEPENDENCIES,
+                )
+            )
+        ]
+
+        assert records == [dependency]
+        uow.task_repository.stream_by_project.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_raises_before_streaming_for_non_member(self, use_case, uow, project):
+        uow.project_repository.find_access.return_value = ProjectAccess.of(
+            project, uuid4()
+        )
+
+        records = use_case.execute(
+            ExportProjectDataInput(
+                project_id=project.id,
+                requester_id=uuid4(),
+                resource=ExportResource.LOGS,
+            )
+        )
+
+        with pytest.raises(ProjectAccessDeniedError):
+            await anext(records)
+        uow.task_log_repository.stream_by_project.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_raises_if_project_missing(self, use_case, uow):
+        uow.project_repository.find_access.return_value = None
+
+        records = use_case.execute(
+            ExportProjectDataInput(
+                project_id=uuid4(),
+                requester_id=uuid4(),
+                resource=ExportResource.TASKS,
+            )
+        )
+
+        with pytest.raises(ProjectNotFoundError):
+            await anext(records)
@@ -12,12 +12,14 @@ from backend.src.application.use_cases.project_management import (
 )
 from backend.src.domain.entities import (
     Project,
+    ProjectAccess,
     ProjectMember,
     SeniorityLevel,
     Task,
     TaskStatus,
 )
 from backend.src.domain.errors import ManagerRequiredError, ProjectNotFoundError
+from backend.src.domain.services.project_access_resolver import ProjectAccessResolver
 
 
 @pytest.fixture
@@ -103,7 +105,9 @@ class TestFireEmployeeUseCase:
         employee_user_id,
     ):
         """Manager can fire an employee from the project."""
-        uow.project_repository.find_by_id.return_value = project
+        uow.project_repository.find_access.return_value = ProjectAccess.of(
+            project, manager_user_id
+        )
         uow.project_member_repository.find_by_project_and_user.return_value = (
             employee_member
         )
@@ -134,7 +138,9 @@ class TestFireEmployeeUseCase:
         employee_user_id,
     ):
         """Firing an employee unassigns all their Doing tasks."""
-        uow.project_repository.find_by_id.return_value = project
+        uow.project_repository.find_access.return_value = ProjectAccess.of(
+            project, manager_user_id
+        )
         uow.project_member_repository.find_by_project_and_user.return_value = (
             employee_member
         )
@@ -168,7 +174,9 @@ class TestFireEmployeeUseCase:
         employee_user_id,
     ):
         """Firing an employee does not affect Todo tasks."""
-        uow.project_repository.find_by_id.return_value = project
+        uow.project_repository.find_access.return_value = ProjectAccess.of(
+            project, manager_user_id
+        )
         uow.project_member_repository.find_by_project_and_user.return_value = (
             employee_member
         )
@@ -202,7 +210,9 @@ class TestFireEmployeeUseCase:
         task2 = Task(project_id=project.id, title="Task 2", difficulty_points=5)
         task2.select(employee_member.id)
 
-        uow.project_repository.find_by_id.return_value = project
+        uow.project_repository.find_access.return_value = ProjectAccess.of(
+            project, manager_user_id
+        )
         uow.project_member_repository.find_by_project_and_user.return_value = (
             employee_member
         )
@@ -231,7 +241,7 @@ class TestFireEmployeeUseCase:
         employee_user_id,
     ):
         """Should raise ProjectNotFoundError when project doesn't exist."""
-        uow.project_repository.find_by_id.return_value = None
+        uow.project_repository.find_access.return_value = None
 
         input_data = FireEmployeeInput(
             project_id=uuid4(),
@@ -251,7 +261,9 @@ class TestFireEmployeeUseCase:
         employee_user_id,
     ):
         """Should raise ManagerRequiredError when user is not the manager."""
-        uow.project_repository.find_by_id.return_value = project
+        uow.project_repository.find_access.return_value = ProjectAccess.of(
+            project, uuid4()
+        )
         non_manager_id = uuid4()
 
         input_data = FireEmployeeInput(
@@ -272,7 +284,9 @@ class TestFireEmployeeUseCase:
         manager_user_id,
     ):
         """Should raise MemberNotFoundError when employee is not a member."""
-        uow.project_repository.find_by_id.return_value = project
+        uow.project_repository.find_access.return_value = ProjectAccess.of(
+            project, manager_user_id
+        )
         uow.project_member_repository.find_by_project_and_user.return_value = None
         non_member_user_id = uuid4()
 
@@ -301,7 +315,9 @@ class TestFireEmployeeUseCase:
             role_id=role_id,
             seniority_level=SeniorityLevel.LEAD,
         )
-        uow.project_repository.find_by_id.return_value = project
+        uow.project_repository.find_access.return_value = ProjectAccess.of(
+            project, manager_user_id
+        )
         uow.project_member_repository.find_by_project_and_user.return_value = (
             manager_member
         )
@@ -338,7 +354,9 @@ class TestFireEmployeeUseCase:
         )
         other_task.select(other_member.id)
 
-        uow.project_repository.find_by_id.return_value = project
+        uow.project_repository.find_access.return_value = ProjectAccess.of(
+            project, manager_user_id
+        )
         uow.project_member_repository.find_by_project_and_user.return_value = (
             employee_member
         )
@@ -369,7 +387,9 @@ class TestFireEmployeeUseCase:
         employee_user_id,
     ):
         """UoW should not commit if member deletion fails."""
-        uow.project_repository.find_by_id.return_value = project
+        uow.project_repository.find_access.return_value = ProjectAccess.of(
+            project, manager_user_id
+        )
         uow.project_member_repository.find_by_project_and_user.return_value = (
             employee_member
         )
@@ -400,7 +420,9 @@ class TestFireEmployeeUseCase:
         employee_user_id,
     ):
         """UoW should not commit if task save fails."""
-        uow.project_repository.find_by_id.return_value = project
+        uow.project_repository.find_access.return_value = ProjectAccess.of(
+            project, manager_user_id
+        )
         uow.project_member_repository.find_by_project_and_user.return_value = (
             employee_member
         )
@@ -418,3 +440,37 @@ class TestFireEmployeeUseCase:
 
         uow.commit.assert_not_called()
         uow.project_member_repository.delete.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_invalidates_cached_access_after_commit(
+        self,
+        uow,
+        project,
+        employee_member,
+        manager_user_id,
+        employee_user_id,
+    ):
+        """The fired employee loses access on every worker at once."""
+        cache = AsyncMock()
+        cache.get.return_value = None
+        cache.invalidate.side_effect = lambda *_: uow.commit.assert_awaited_once()
+        use_case = FireEmployeeUseCase(
+            uow=uow, access_resolver=ProjectAccessResolver(cache)
+        )
+        uow.project_repository.find_access.return_value = ProjectAccess.of(
+            project, manager_user_id
+        )
+        uow.project_member_repository.find_by_project_and_user.return_value = (
+            employee_member
+        )
+        uow.task_repository.find_by_project.return_value = []
+
+        await use_case.execute(
+            FireEmployeeInput(
+                project_id=project.id,
+                employee_user_id=employee_user_id,
+                manager_user_id=manager_user_id,
+            )
+        )
+
+        cache.invalidate.assert_awaited_once_with(project.id, employee_user_id)
@@ -9,18 +9,34 @@ from backend.src.application.use_cases.project_management import (
     GetProjectDetailsInput,
     GetProjectDetailsUseCase,
 )
-from backend.src.domain.entities import Project, ProjectMember, SeniorityLevel
+from backend.src.domain.entities import (
+    Project,
+    ProjectAccess,
+    ProjectMember,
+    SeniorityLevel,
+)
 from backend.src.domain.errors import ProjectAccessDeniedError, ProjectNotFoundError
 
 
 @pytest.fixture
-def project_repository():
+def project_member_repository():
     return AsyncMock()
 
 
 @pytest.fixture
-def project_member_repository():
-    return AsyncMock()
+def project_repository(project_member_repository):
+    repository = AsyncMock()
+
+    async def find_access(project_id, user_id):
+        # Mirrors the single project + membership query of the real repository.
+        project = repository.find_by_id.return_value
+        if project is None:
+            return None
+        member = project_member_repository.find_by_project_and_user.return_value
+        return ProjectAccess.of(project, user_id, member)
+
+    repository.find_access.side_effect = find_access
+    return repository
 
 
 @pytest.fixture
@@ -131,7 +147,7 @@ class TestGetProjectDetailsUseCase:
     async def test_checks_membership_with_correct_parameters(
         self, use_case, project_repository, project_member_repository, existing_project
     ):
-        """Should query membership with correct project and user IDs."""
+        """Should query access with correct project and user IDs."""
         member_id = uuid4()
         role_id = uuid4()
         project_member = ProjectMember(
@@ -150,6 +166,6 @@ class TestGetProjectDetailsUseCase:
 
         await use_case.execute(input_data)
 
-        project_member_repository.find_by_project_and_user.assert_called_once_with(
+        project_repository.find_access.assert_called_once_with(
             existing_project.id, member_id
         )
@@ -0,0 +1,132 @@
+"""Tests for GetProjectSnapshotUseCase."""
+
+from unittest.mock import AsyncMock
+from uuid import uuid4
+
+import pytest
+
+from backend.src.application.use_cases.project_management import (
+    GetProjectSnapshotInput,
+    GetProjectSnapshotUseCase,
+    SnapshotSection,
+)
+from backend.src.domain.entities import (
+    Project,
+    ProjectMember,
+    Role,
+    SeniorityLevel,
+    Task,
+    TaskDependency,
+    User,
+)
+from backend.src.domain.errors import ProjectAccessDeniedError, ProjectNotFoundError
+from backend.src.domain.services.schedule_calculator import ScheduleCalculator
+
+
+@pytest.fixture
+def uow():
+    mock = AsyncMock()
+    mock.project_repository = AsyncMock()
+    mock.project_member_repository = AsyncMock()
+    mock.user_repository = AsyncMock()
+    mock.role_repository = AsyncMock()
+    mock.task_repository = AsyncMock()
+    mock.task_dependency_repository = AsyncMock()
+    mock.project_member_repository.find_by_project.return_value = []
+    mock.task_repository.find_by_project.return_value = []
+    mock.task_dependency_repository.find_by_project.return_value = []
+    mock.__aenter__ = AsyncMock(return_value=mock)
+    mock.__aexit__ = AsyncMock(return_value=False)
+    return mock
+
+
+@pytest.fixture
+def use_case(uow):
+    return GetProjectSnapshotUseCase(uow=uow, schedule_calculator=ScheduleCalculator())
+
+
+@pytest.fixture
+def manager_id():
+    return uuid4()
+
+
+@pytest.fixture
+def project(manager_id):
+    return Project(name="P", manager_id=manager_id)
+
+
+@pytest.mark.asyncio
+async def test_full_snapshot_uses_batched_lookups(use_case, uow, project):
+    user = User(email="dev@example.com", name="Dev")
+    role = Role(project_id=project.id, name="Developer")
+    member = ProjectMember(
+        project_id=project.id,
+        user_id=user.id,
+        role_id=role.id,
+        seniority_level=SeniorityLevel.SENIOR,
+    )
+    a = Task(project_id=project.id, title="A", difficulty_points=3)
+    b = Task(project_id=project.id, title="B", difficulty_points=5)
+    c = Task(project_id=project.id, title="C", difficulty_points=1)
+    uow.project_repository.find_by_id.return_value = project
+    uow.project_member_repository.find_by_project.return_value = [member]
+    uow.user_repository.find_by_ids.return_value = [user]
+    uow.role_repository.find_by_ids.return_value = [role]
+    uow.task_repository.find_by_project.return_value = [a, b, c]
+    uow.task_dependency_repository.find_by_project.return_value = [
+        TaskDependency(blocking_task_id=a.id, blocked_task_id=b.id)
+    ]
+
+    result = await use_case.execute(
+        GetProjectSnapshotInput(project_id=project.id, requester_id=user.id)
+    )
+
+    assert result.is_manager is False
+    assert [(m.user_name, m.role_name) for m in result.members] == [("Dev", "Developer")]
+    assert len(result.tasks) == 3
+    assert len(result.dependencies) == 1
+    assert result.critical_path[:2] == [a.id, b.id]
+    assert result.project_end_date is not None
+    uow.user_repository.find_by_id.assert_not_called()
+    uow.role_repository.find_by_id.assert_not_called()
+    uow.project_member_repository.find_by_project_and_user.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_whitelist_skips_unneeded_queries(use_case, uow, project, manager_id):
+    uow.project_repository.find_by_id.return_value = project
+
+    result = await use_case.execute(
+        GetProjectSnapshotInput(
+            project_id=project.id,
+            requester_id=manager_id,
+            sections=frozenset({SnapshotSection.TASKS}),
+        )
+    )
+
+    assert result.is_manager is True
+    assert result.members == []
+    uow.task_repository.find_by_project.assert_awaited_once()
+    uow.task_dependency_repository.find_by_project.assert_not_called()
+    uow.user_repository.find_by_ids.assert_not_called()
+    uow.role_repository.find_by_ids.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_rejects_non_member(use_case, uow, project):
+    uow.project_repository.find_by_id.return_value = project
+
+    with pytest.raises(ProjectAccessDeniedError):
+        await use_case.execute(
+            GetProjectSnapshotInput(project_id=project.id, requester_id=uuid4())
+        )
+
+
+@pytest.mark.asyncio
+async def test_missing_project(use_case, uow):
+    uow.project_repository.find_by_id.return_value = None
+
+    with pytest.raises(ProjectNotFoundError):
+        await use_case.execute(
+            GetProjectSnapshotInput(project_id=uuid4(), requester_id=uuid4())
+        )
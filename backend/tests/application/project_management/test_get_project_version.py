@@ -0,0 +1,46 @@
+"""Tests for GetProjectVersionUseCase."""
+
+from unittest.mock import AsyncMock
+from uuid import uuid4
+
+import pytest
+
+from backend.src.application.use_cases.project_management import (
+    GetProjectVersionInput,
+    GetProjectVersionUseCase,
+)
+
+
+@pytest.fixture
+def uow():
+    mock = AsyncMock()
+    mock.project_repository = AsyncMock()
+    mock.__aenter__ = AsyncMock(return_value=mock)
+    mock.__aexit__ = AsyncMock(return_value=False)
+    return mock
+
+
+@pytest.mark.asyncio
+async def test_returns_version_and_ends_read_transaction(uow):
+    uow.project_repository.find_version.return_value = 7
+    project_id, user_id = uuid4(), uuid4()
+
+    version = await GetProjectVersionUseCase(uow=uow).execute(
+        GetProjectVersionInput(project_id=project_id, requester_id=user_id)
+    )
+
+    assert version == 7
+    uow.project_repository.find_version.assert_awaited_once_with(project_id, user_id)
+    uow.rollback.assert_awaited_once()
+    uow.commit.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_returns_none_without_access(uow):
+    uow.project_repository.find_version.return_value = None
+
+    version = await GetProjectVersionUseCase(uow=uow).execute(
+        GetProjectVersionInput(project_id=uuid4(), requester_id=uuid4())
+    )
+
+    assert version is None
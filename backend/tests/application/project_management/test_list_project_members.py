@@ -9,7 +9,14 @@ from backend.src.application.use_cases.project_management import (
     ListProjectMembersInput,
     ListProjectMembersUseCase,
 )
-from backend.src.domain.entities import Project, ProjectMember, Role, SeniorityLevel, User
+from backend.src.domain.entities import (
+    Project,
+    ProjectAccess,
+    ProjectMember,
+    Role,
+    SeniorityLevel,
+    User,
+)
 from backend.src.domain.errors import ProjectAccessDeniedError, ProjectNotFoundError
 
 
@@ -57,7 +64,9 @@ class TestListProjectMembersUseCase:
             seniority_level=SeniorityLevel.MID,
         )
 
-        uow.project_repository.find_by_id.return_value = project
+        uow.project_repository.find_access.return_value = ProjectAccess.of(
+            project, manager_id
+        )
         uow.project_member_repository.list_by_project.return_value = [member]
         uow.project_member_repository.count_by_project.return_value = 1
         uow.user_repository.find_by_id.return_value = user
@@ -100,8 +109,9 @@ class TestListProjectMembersUseCase:
             seniority_level=SeniorityLevel.MID,
         )
 
-        uow.project_repository.find_by_id.return_value = project
-        uow.project_member_repository.find_by_project_and_user.return_value = requester_member
+        uow.project_repository.find_access.return_value = ProjectAccess.of(
+            project, member_user_id, requester_member
+        )
         uow.project_member_repository.list_by_project.return_value = [member]
         uow.project_member_repository.count_by_project.return_value = 1
         uow.user_repository.find_by_id.return_value = user
@@ -122,7 +132,7 @@ class TestListProjectMembersUseCase:
     @pytest.mark.asyncio
     async def test_raises_project_not_found(self, use_case, uow):
         """Should raise ProjectNotFoundError when project doesn't exist."""
-        uow.project_repository.find_by_id.return_value = None
+        uow.project_repository.find_access.return_value = None
 
         with pytest.raises(ProjectNotFoundError):
             await use_case.execute(
@@ -140,8 +150,9 @@ class TestListProjectMembersUseCase:
     ):
         """Should raise ProjectAccessDeniedError for non-member."""
         non_member_id = uuid4()
-        uow.project_repository.find_by_id.return_value = project
-        uow.project_member_repository.find_by_project_and_user.return_value = None
+        uow.project_repository.find_access.return_value = ProjectAccess.of(
+            project, non_member_id
+        )
 
         with pytest.raises(ProjectAccessDeniedError):
             await use_case.execute(
@@ -158,7 +169,9 @@ class TestListProjectMembersUseCase:
         self, use_case, uow, project, manager_id
     ):
         """Pagination: passes limit/offset to repo correctly."""
-        uow.project_repository.find_by_id.return_value = project
+        uow.project_repository.find_access.return_value = ProjectAccess.of(
+            project, manager_id
+        )
         uow.project_member_repository.list_by_project.return_value = []
         uow.project_member_repository.count_by_project.return_value = 0
 
@@ -21,6 +21,7 @@ from backend.src.domain.entities import (
     TaskStatus,
 )
 from backend.src.domain.errors import ProjectNotFoundError
+from backend.src.domain.services.project_access_resolver import ProjectAccessResolver
 
 
 @pytest.fixture
@@ -386,3 +387,29 @@ class TestResignFromProjectUseCase:
             await use_case.execute(input_data)
 
         uow.commit.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_invalidates_cached_access_after_commit(
+        self,
+        uow,
+        project,
+        employee_member,
+        employee_user_id,
+    ):
+        """A resigned employee loses access on every worker at once."""
+        cache = AsyncMock()
+        cache.invalidate.side_effect = lambda *_: uow.commit.assert_awaited_once()
+        use_case = ResignFromProjectUseCase(
+            uow=uow, access_resolver=ProjectAccessResolver(cache)
+        )
+        uow.project_repository.find_by_id.return_value = project
+        uow.project_member_repository.find_by_project_and_user.return_value = (
+            employee_member
+        )
+        uow.task_repository.find_by_project.return_value = []
+
+        await use_case.execute(
+            ResignFromProjectInput(project_id=project.id, user_id=employee_user_id)
+        )
+
+        cache.invalidate.assert_awaited_once_with(project.id, employee_user_id)
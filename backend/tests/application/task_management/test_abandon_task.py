@@ -10,6 +10,7 @@ from backend.src.application.use_cases.task_management import (
     AbandonTaskUseCase,
 )
 from backend.src.domain.entities import (
+    ProjectAccess,
     ProjectMember,
     SeniorityLevel,
     Task,
@@ -23,7 +24,7 @@ from backend.src.domain.errors import TaskNotFoundError, TaskNotOwnedError
 @pytest.fixture
 def uow():
     mock = AsyncMock()
-    mock.project_member_repository = AsyncMock()
+    mock.project_repository = AsyncMock()
     mock.task_repository = AsyncMock()
     mock.task_log_repository = AsyncMock()
     mock.__aenter__ = AsyncMock(return_value=mock)
@@ -86,7 +87,7 @@ class TestAbandonTaskUseCase:
     ):
         """Owner can abandon their task with a reason."""
         uow.task_repository.find_by_id.return_value = doing_task
-        uow.project_member_repository.find_by_project_and_user.return_value = (
+        uow.project_repository.find_access.return_value = ProjectAccess.of_member(
             project_member
         )
         uow.task_repository.save.return_value = None
@@ -116,7 +117,7 @@ class TestAbandonTaskUseCase:
     ):
         """BR-ABANDON-002: Creates audit log with abandonment reason."""
         uow.task_repository.find_by_id.return_value = doing_task
-        uow.project_member_repository.find_by_project_and_user.return_value = (
+        uow.project_repository.find_access.return_value = ProjectAccess.of_member(
             project_member
         )
         uow.task_repository.save.return_value = None
@@ -227,7 +228,7 @@ class TestAbandonTaskUseCase:
             seniority_level=SeniorityLevel.MID,
         )
         uow.task_repository.find_by_id.return_value = doing_task
-        uow.project_member_repository.find_by_project_and_user.return_value = (
+        uow.project_repository.find_access.return_value = ProjectAccess.of_member(
             different_member
         )
 
@@ -259,7 +260,7 @@ class TestAbandonTaskUseCase:
         todo_task.assignee_id = project_member.id
 
         uow.task_repository.find_by_id.return_value = todo_task
-        uow.project_member_repository.find_by_project_and_user.return_value = (
+        uow.project_repository.find_access.return_value = ProjectAccess.of_member(
             project_member
         )
 
@@ -285,7 +286,7 @@ class TestAbandonTaskUseCase:
     ):
         """Abandoned task should be selectable again."""
         uow.task_repository.find_by_id.return_value = doing_task
-        uow.project_member_repository.find_by_project_and_user.return_value = (
+        uow.project_repository.find_access.return_value = ProjectAccess.of_member(
             project_member
         )
         uow.task_repository.save.return_value = None
@@ -9,7 +9,13 @@ from backend.src.application.use_cases.task_management.add_dependency import (
     AddDependencyInput,
     AddDependencyUseCase,
 )
-from backend.src.domain.entities import Project, Task, TaskDependency, TaskStatus
+from backend.src.domain.entities import (
+    Project,
+    ProjectAccess,
+    Task,
+    TaskDependency,
+    TaskStatus,
+)
 from backend.src.domain.errors import CircularDependencyError, ManagerRequiredError
 
 
@@ -43,7 +49,9 @@ async def test_adds_dependency_and_blocks_child(use_case, uow, recalc_use_case):
     blocking = Task(project_id=project.id, title="A", difficulty_points=1)
     blocked = Task(project_id=project.id, title="B", difficulty_points=1)
 
-    uow.project_repository.find_by_id.return_value = project
+    uow.project_repository.find_access.return_value = ProjectAccess.of(
+        project, manager_id
+    )
     uow.task_repository.find_by_id.side_effect = [blocking, blocked]
     uow.task_dependency_repository.find_by_project.return_value = []
     uow.task_dependency_repository.find_by_tasks.return_value = None
@@ -71,7 +79,9 @@ async def test_raises_for_cycle(use_case, uow):
     a = Task(project_id=project.id, title="A", difficulty_points=1)
     b = Task(project_id=project.id, title="B", difficulty_points=1)
 
-    uow.project_repository.find_by_id.return_value = project
+    uow.project_repository.find_access.return_value = ProjectAccess.of(
+        project, manager_id
+    )
     uow.task_repository.find_by_id.side_effect = [a, b]
     uow.task_dependency_repository.find_by_project.return_value = [
         TaskDependency(blocking_task_id=b.id, blocked_task_id=a.id)
@@ -95,7 +105,7 @@ async def test_raises_if_not_manager(use_case, uow):
     a = Task(project_id=project.id, title="A", difficulty_points=1)
     b = Task(project_id=project.id, title="B", difficulty_points=1)
 
-    uow.project_repository.find_by_id.return_value = project
+    uow.project_repository.find_access.return_value = ProjectAccess.of(project, uuid4())
     uow.task_repository.find_by_id.side_effect = [a, b]
 
     with pytest.raises(ManagerRequiredError):
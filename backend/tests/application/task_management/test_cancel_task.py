@@ -9,7 +9,7 @@ from backend.src.application.use_cases.task_management.cancel_task import (
     CancelTaskInput,
     CancelTaskUseCase,
 )
-from backend.src.domain.entities import Project, Task, TaskStatus
+from backend.src.domain.entities import Project, ProjectAccess, Task, TaskStatus
 from backend.src.domain.errors import ManagerRequiredError, ProjectNotFoundError, TaskNotFoundError
 
 
@@ -46,7 +46,9 @@ async def test_cancels_task_and_recalculates(
     project = Project(name="P", manager_id=manager_id)
     task = Task(project_id=project.id, title="T", difficulty_points=1)
 
-    uow.project_repository.find_by_id.return_value = project
+    uow.project_repository.find_access.return_value = ProjectAccess.of(
+        project, manager_id
+    )
     uow.task_repository.find_by_id.return_value = task
 
     result = await use_case.execute(
@@ -67,7 +69,7 @@ async def test_cancels_task_and_recalculates(
 async def test_raises_if_not_manager(use_case, uow):
     manager_id = uuid4()
     project = Project(name="P", manager_id=manager_id)
-    uow.project_repository.find_by_id.return_value = project
+    uow.project_repository.find_access.return_value = ProjectAccess.of(project, uuid4())
 
     with pytest.raises(ManagerRequiredError):
         await use_case.execute(
@@ -81,7 +83,7 @@ async def test_raises_if_not_manager(use_case, uow):
 
 @pytest.mark.asyncio
 async def test_raises_if_project_or_task_missing(use_case, uow):
-    uow.project_repository.find_by_id.return_value = None
+    uow.project_repository.find_access.return_value = None
     with pytest.raises(ProjectNotFoundError):
         await use_case.execute(
             CancelTaskInput(project_id=uuid4(), task_id=uuid4(), manager_user_id=uuid4())
@@ -89,7 +91,9 @@ async def test_raises_if_project_or_task_missing(use_case, uow):
 
     manager_id = uuid4()
     project = Project(name="P", manager_id=manager_id)
-    uow.project_repository.find_by_id.return_value = project
+    uow.project_repository.find_access.return_value = ProjectAccess.of(
+        project, manager_id
+    )
     uow.task_repository.find_by_id.return_value = None
     with pytest.raises(TaskNotFoundError):
         await use_case.execute(
@@ -10,6 +10,7 @@ from backend.src.application.use_cases.task_management import (
     CompleteTaskUseCase,
 )
 from backend.src.domain.entities import (
+    ProjectAccess,
     ProjectMember,
     SeniorityLevel,
     Task,
@@ -23,7 +24,7 @@ from backend.src.domain.errors import TaskNotFoundError, TaskNotOwnedError
 @pytest.fixture
 def uow():
     mock = AsyncMock()
-    mock.project_member_repository = AsyncMock()
+    mock.project_repository = AsyncMock()
     mock.task_repository = AsyncMock()
     mock.task_log_repository = AsyncMock()
     mock.__aenter__ = AsyncMock(return_value=mock)
@@ -86,7 +87,7 @@ class TestCompleteTaskUseCase:
     ):
         """Owner can complete their task."""
         uow.task_repository.find_by_id.return_value = doing_task
-        uow.project_member_repository.find_by_project_and_user.return_value = (
+        uow.project_repository.find_access.return_value = ProjectAccess.of_member(
             project_member
         )
         uow.task_repository.save.return_value = None
@@ -116,7 +117,7 @@ class TestCompleteTaskUseCase:
     ):
         """BR-ASSIGN-005: All status changes are logged in history."""
         uow.task_repository.find_by_id.return_value = doing_task
-        uow.project_member_repository.find_by_project_and_user.return_value = (
+        uow.project_repository.find_access.return_value = ProjectAccess.of_member(
             project_member
         )
         uow.task_repository.save.return_value = None
@@ -190,7 +191,7 @@ class TestCompleteTaskUseCase:
             seniority_level=SeniorityLevel.MID,
         )
         uow.task_repository.find_by_id.return_value = doing_task
-        uow.project_member_repository.find_by_project_and_user.return_value = (
+        uow.project_repository.find_access.return_value = ProjectAccess.of_member(
             different_member
         )
 
@@ -221,7 +222,7 @@ class TestCompleteTaskUseCase:
         todo_task.assignee_id = project_member.id
 
         uow.task_repository.find_by_id.return_value = todo_task
-        uow.project_member_repository.find_by_project_and_user.return_value = (
+        uow.project_repository.find_access.return_value = ProjectAccess.of_member(
             project_member
         )
 
@@ -246,7 +247,7 @@ class TestCompleteTaskUseCase:
     ):
         """Should save the task after completion."""
         uow.task_repository.find_by_id.return_value = doing_task
-        uow.project_member_repository.find_by_project_and_user.return_value = (
+        uow.project_repository.find_access.return_value = ProjectAccess.of_member(
             project_member
         )
         uow.task_repository.save.return_value = None
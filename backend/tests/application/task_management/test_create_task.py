@@ -9,7 +9,7 @@ from backend.src.application.use_cases.task_management import (
     CreateTaskInput,
     CreateTaskUseCase,
 )
-from backend.src.domain.entities import Project, Task
+from backend.src.domain.entities import Project, ProjectAccess, Role, Task
 from backend.src.domain.errors import ManagerRequiredError, ProjectNotFoundError
 
 
@@ -54,7 +54,9 @@ class TestCreateTaskUseCase:
         manager_id,
     ):
         """BR-TASK-001: Only the Manager can create Tasks."""
-        project_repository.find_by_id.return_value = existing_project
+        project_repository.find_access.return_value = ProjectAccess.of(
+            existing_project, manager_id
+        )
         task_repository.save.return_value = None
 
         input_data = CreateTaskInput(
@@ -83,7 +85,9 @@ class TestCreateTaskUseCase:
         manager_id,
     ):
         """Task can be created without difficulty points."""
-        project_repository.find_by_id.return_value = existing_project
+        project_repository.find_access.return_value = ProjectAccess.of(
+            existing_project, manager_id
+        )
         task_repository.save.return_value = None
 
         input_data = CreateTaskInput(
@@ -107,7 +111,9 @@ class TestCreateTaskUseCase:
         manager_id,
     ):
         """Task can be created with a required role."""
-        project_repository.find_by_id.return_value = existing_project
+        project_repository.find_access.return_value = ProjectAccess.of(
+            existing_project, manager_id
+        )
         task_repository.save.return_value = None
         role_id = uuid4()
 
@@ -127,7 +133,7 @@ class TestCreateTaskUseCase:
         self, use_case, project_repository, task_repository
     ):
         """Should raise ProjectNotFoundError when project doesn't exist."""
-        project_repository.find_by_id.return_value = None
+        project_repository.find_access.return_value = None
 
         input_data = CreateTaskInput(
             project_id=uuid4(),
@@ -145,7 +151,9 @@ class TestCreateTaskUseCase:
         self, use_case, project_repository, task_repository, existing_project
     ):
         """BR-TASK-001: Only the Manager can create Tasks."""
-        project_repository.find_by_id.return_value = existing_project
+        project_repository.find_access.return_value = ProjectAccess.of(
+            existing_project, uuid4()
+        )
         non_manager_id = uuid4()
 
         input_data = CreateTaskInput(
@@ -169,7 +177,9 @@ class TestCreateTaskUseCase:
         manager_id,
     ):
         """Should save the task using the repository."""
-        project_repository.find_by_id.return_value = existing_project
+        project_repository.find_access.return_value = ProjectAccess.of(
+            existing_project, manager_id
+        )
         task_repository.save.return_value = None
 
         input_data = CreateTaskInput(
@@ -184,3 +194,88 @@ class TestCreateTaskUseCase:
         saved_task = task_repository.save.call_args[0][0]
         assert isinstance(saved_task, Task)
         assert saved_task.title == "Test task"
+
+
+class TestNewTaskToasts:
+    """BR-NOTIF-003: Toasts go to Employees whose Role matches the task."""
+
+    @pytest.fixture
+    def uow(self, existing_project, manager_id):
+        mock = AsyncMock()
+        mock.__aenter__ = AsyncMock(return_value=mock)
+        mock.__aexit__ = AsyncMock(return_value=False)
+        mock.project_repository.find_access.return_value = ProjectAccess.of(
+            existing_project, manager_id
+        )
+        mock.project_repository.find_by_id.return_value = existing_project
+        return mock
+
+    @pytest.mark.asyncio
+    async def test_toasts_members_with_the_required_role_after_commit(
+        self, uow, existing_project, manager_id
+    ):
+        role = Role(project_id=existing_project.id, name="Backend")
+        member_user_ids = [uuid4(), uuid4()]
+        uow.project_member_repository.find_user_ids_by_role.return_value = (
+            member_user_ids
+        )
+        uow.role_repository.find_by_id.return_value = role
+        notification_service = AsyncMock()
+        use_case = CreateTaskUseCase(uow=uow, notification_service=notification_service)
+
+        task = await use_case.execute(
+            CreateTaskInput(
+                project_id=existing_project.id,
+                requester_id=manager_id,
+                title="Backend task",
+                required_role_id=role.id,
+            )
+        )
+
+        uow.project_member_repository.find_user_ids_by_role.assert_awaited_once_with(
+            existing_project.id, role.id
+        )
+        user_ids, toast = notification_service.send_new_task_toast.await_args.args
+        assert user_ids == member_user_ids
+        assert toast.task_id == task.id
+        assert toast.project_name == "Test Project"
+        assert toast.required_role == "Backend"
+        uow.commit.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_failed_toast_does_not_fail_task_creation(
+        self, uow, existing_project, manager_id
+    ):
+        uow.project_member_repository.find_user_ids_by_role.return_value = [uuid4()]
+        notification_service = AsyncMock()
+        notification_service.send_new_task_toast.side_effect = RuntimeError("down")
+        use_case = CreateTaskUseCase(uow=uow, notification_service=notification_service)
+
+        task = await use_case.execute(
+            CreateTaskInput(
+                project_id=existing_project.id,
+                requester_id=manager_id,
+                title="Any role",
+            )
+        )
+
+        assert task.title == "Any role"
+        uow.commit.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_no_toast_without_matching_members(
+        self, uow, existing_project, manager_id
+    ):
+        uow.project_member_repository.find_user_ids_by_role.return_value = []
+        notification_service = AsyncMock()
+        use_case = CreateTaskUseCase(uow=uow, notification_service=notification_service)
+
+        await use_case.execute(
+            CreateTaskInput(
+                project_id=existing_project.id,
+                requester_id=manager_id,
+                title="Lonely task",
+            )
+        )
+
+        notification_service.send_new_task_toast.assert_not_awaited()
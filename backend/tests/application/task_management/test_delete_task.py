@@ -9,7 +9,7 @@ from backend.src.application.use_cases.task_management.delete_task import (
     DeleteTaskInput,
     DeleteTaskUseCase,
 )
-from backend.src.domain.entities import Project, Task
+from backend.src.domain.entities import Project, ProjectAccess, Task
 from backend.src.domain.errors import ManagerRequiredError, ProjectNotFoundError, TaskNotFoundError
 
 
@@ -42,7 +42,9 @@ async def test_deletes_task_and_dependencies(use_case, uow, recalc_use_case):
     project = Project(name="P", manager_id=manager_id)
     task = Task(project_id=project.id, title="T", difficulty_points=1)
 
-    uow.project_repository.find_by_id.return_value = project
+    uow.project_repository.find_access.return_value = ProjectAccess.of(
+        project, manager_id
+    )
     uow.task_repository.find_by_id.return_value = task
 
     await use_case.execute(
@@ -61,7 +63,7 @@ async def test_deletes_task_and_dependencies(use_case, uow, recalc_use_case):
 
 @pytest.mark.asyncio
 async def test_raises_on_missing_project_or_task(use_case, uow):
-    uow.project_repository.find_by_id.return_value = None
+    uow.project_repository.find_access.return_value = None
     with pytest.raises(ProjectNotFoundError):
         await use_case.execute(
             DeleteTaskInput(project_id=uuid4(), task_id=uuid4(), manager_user_id=uuid4())
@@ -69,7 +71,9 @@ async def test_raises_on_missing_project_or_task(use_case, uow):
 
     manager_id = uuid4()
     project = Project(name="P", manager_id=manager_id)
-    uow.project_repository.find_by_id.return_value = project
+    uow.project_repository.find_access.return_value = ProjectAccess.of(
+        project, manager_id
+    )
     uow.task_repository.find_by_id.return_value = None
     with pytest.raises(TaskNotFoundError):
         await use_case.execute(
@@ -83,7 +87,7 @@ async def test_raises_if_not_manager(use_case, uow):
     project = Project(name="P", manager_id=manager_id)
     task = Task(project_id=project.id, title="T", difficulty_points=1)
 
-    uow.project_repository.find_by_id.return_value = project
+    uow.project_repository.find_access.return_value = ProjectAccess.of(project, uuid4())
     uow.task_repository.find_by_id.return_value = task
 
     with pytest.raises(ManagerRequiredError):
@@ -0,0 +1,213 @@
+"""Tests for EstimateTaskDifficultiesUseCase."""
+
+from unittest.mock import AsyncMock
+from uuid import uuid4
+
+import pytest
+
+from backend.src.adapters.services import MockLLMService
+from backend.src.application.use_cases.task_management import (
+    EstimateTaskDifficultiesInput,
+    EstimateTaskDifficultiesUseCase,
+)
+from backend.src.domain.entities import Project, ProjectAccess, Task, TaskStatus
+from backend.src.domain.errors import (
+    LLMNotConfiguredError,
+    ManagerRequiredError,
+    ProjectNotFoundError,
+)
+from backend.src.domain.events import TaskDifficultyChanged
+
+
+class PartialLLMService(MockLLMService):
+    """Mock LLM that cannot estimate titles containing 'vague'."""
+
+    def __init__(self) -> None:
+        self.batches: list[list[str]] = []
+
+    async def estimate_difficulty_batch(self, items, project_context=None):
+        self.batches.append([item.task_title for item in items])
+        results = await super().estimate_difficulty_batch(items, project_context)
+        return [
+            None if "vague" in item.task_title else result
+            for item, result in zip(items, results)
+        ]
+
+
+@pytest.fixture
+def uow():
+    mock = AsyncMock()
+    mock.project_repository = AsyncMock()
+    mock.task_repository = AsyncMock()
+    mock.__aenter__ = AsyncMock(return_value=mock)
+    mock.__aexit__ = AsyncMock(return_value=False)
+
+    async def find_access(project_id, user_id):
+        project = mock.project_repository.find_by_id.return_value
+        return None if project is None else ProjectAccess.of(project, user_id)
+
+    mock.project_repository.find_access.side_effect = find_access
+    return mock
+
+
+@pytest.fixture
+def llm_service():
+    return PartialLLMService()
+
+
+@pytest.fixture
+def manager_id():
+    return uuid4()
+
+
+@pytest.fixture
+def project(manager_id):
+    project = Project(name="Project", manager_id=manager_id, description="An API")
+    project.configure_llm("openai", "encrypted-key")
+    return project
+
+
+@pytest.fixture
+def use_case(uow, llm_service):
+    return EstimateTaskDifficultiesUseCase(uow=uow, llm_service=llm_service)
+
+
+class TestEstimateTaskDifficultiesUseCase:
+    """Tests for EstimateTaskDifficultiesUseCase.execute()."""
+
+    @pytest.mark.asyncio
+    async def test_estimates_open_unestimated_tasks_in_one_batch(
+        self, use_case, uow, llm_service, project, manager_id
+    ):
+        todo = Task(project_id=project.id, title="Build API", description="CRUD")
+        vague = Task(project_id=project.id, title="vague idea")
+        estimated = Task(project_id=project.id, title="Done", difficulty_points=3)
+        cancelled = Task(project_id=project.id, title="Dropped")
+        cancelled.cancel()
+        tasks = [todo, vague, estimated, cancelled]
+        uow.project_repository.find_by_id.return_value = project
+        uow.task_repository.find_by_project.return_value = tasks
+
+        result = await use_case.execute(
+            EstimateTaskDifficultiesInput(
+                project_id=project.id, requester_id=manager_id
+            )
+        )
+
+        assert llm_service.batches == [["Build API", "vague idea"]]
+        assert result.estimated == [todo]
+        assert todo.difficulty_points is not None
+        assert result.failed_task_ids == [vague.id]
+        assert vague.difficulty_points is None
+        uow.task_repository.save_many.assert_called_once_with([todo])
+        uow.commit.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_skips_tasks_estimated_while_the_llm_was_working(
+        self, use_case, uow, project, manager_id
+    ):
+        task = Task(project_id=project.id, title="Build API")
+        concurrent = Task(id=task.id, project_id=project.id, title="Build API")
+        concurrent.set_difficulty(8)
+        uow.project_repository.find_by_id.return_value = project
+        uow.task_repository.find_by_project.side_effect = [[task], [concurrent]]
+
+        result = await use_case.execute(
+            EstimateTaskDifficultiesInput(
+                project_id=project.id, requester_id=manager_id
+            )
+        )
+
+        assert result.estimated == []
+        assert concurrent.difficulty_points == 8
+        uow.task_repository.save_many.assert_not_called()
+        uow.commit.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_publishes_difficulty_events_for_doing_tasks(
+        self, uow, llm_service, project, manager_id
+    ):
+        member_id = uuid4()
+        doing = Task(project_id=project.id, title="Build API", difficulty_points=1)
+        doing.select(member_id)
+        doing.difficulty_points = None
+        doing.pull_events()
+        publisher = AsyncMock()
+        uow.project_repository.find_by_id.return_value = project
+        uow.task_repository.find_by_project.return_value = [doing]
+        use_case = EstimateTaskDifficultiesUseCase(
+            uow=uow, llm_service=llm_service, event_publisher=publisher
+        )
+
+        await use_case.execute(
+            EstimateTaskDifficultiesInput(
+                project_id=project.id, requester_id=manager_id
+            )
+        )
+
+        (events,), _ = publisher.publish.call_args
+        assert [type(event) for event in events] == [TaskDifficultyChanged]
+        assert events[0].member_id == member_id
+        assert doing.status == TaskStatus.DOING
+
+    @pytest.mark.asyncio
+    async def test_uses_the_service_resolved_for_the_project(
+        self, uow, project, manager_id
+    ):
+        """ADR 009: projects with their own key use their own provider."""
+        global_service = PartialLLMService()
+        project_service = PartialLLMService()
+        resolver = AsyncMock()
+        resolver.for_project.return_value = project_service
+        uow.project_repository.find_by_id.return_value = project
+        uow.task_repository.find_by_project.return_value = [
+            Task(project_id=project.id, title="Build API")
+        ]
+        use_case = EstimateTaskDifficultiesUseCase(
+            uow=uow, llm_service=global_service, llm_resolver=resolver
+        )
+
+        await use_case.execute(
+            EstimateTaskDifficultiesInput(
+                project_id=project.id, requester_id=manager_id
+            )
+        )
+
+        resolver.for_project.assert_awaited_once_with(project)
+        assert project_service.batches == [["Build API"]]
+        assert global_service.batches == []
+
+    @pytest.mark.asyncio
+    async def test_raises_when_llm_not_enabled(
+        self, use_case, uow, llm_service, project, manager_id
+    ):
+        project.disable_llm()
+        uow.project_repository.find_by_id.return_value = project
+
+        with pytest.raises(LLMNotConfiguredError):
+            await use_case.execute(
+                EstimateTaskDifficultiesInput(
+                    project_id=project.id, requester_id=manager_id
+                )
+            )
+        assert llm_service.batches == []
+
+    @pytest.mark.asyncio
+    async def test_raises_when_requester_is_not_manager(self, use_case, uow, project):
+        uow.project_repository.find_by_id.return_value = project
+
+        with pytest.raises(ManagerRequiredError):
+            await use_case.execute(
+                EstimateTaskDifficultiesInput(
+                    project_id=project.id, requester_id=uuid4()
+                )
+            )
+
+    @pytest.mark.asyncio
+    async def test_raises_when_project_not_found(self, use_case, uow):
+        uow.project_repository.find_by_id.return_value = None
+
+        with pytest.raises(ProjectNotFoundError):
+            await use_case.execute(
+                EstimateTaskDifficultiesInput(project_id=uuid4(), requester_id=uuid4())
+            )
@@ -0,0 +1,302 @@
+"""Tests for EstimateTaskProgressUseCase."""
+
+from datetime import timedelta
+from unittest.mock import AsyncMock
+from uuid import uuid4
+
+import pytest
+
+from backend.src.adapters.services import MockLLMService
+from backend.src.application.use_cases.task_management import (
+    EstimateTaskProgressInput,
+    EstimateTaskProgressUseCase,
+)
+from backend.src.domain.entities import (
+    Project,
+    ProjectAccess,
+    Task,
+    TaskLog,
+    TaskLogType,
+)
+from backend.src.domain.errors import LLMNotConfiguredError, TaskNotOwnedError
+from backend.src.domain.ports.repositories import TaskProgressState
+from backend.src.domain.time import utcnow
+
+
+class RecordingLLMService(MockLLMService):
+    """Mock LLM that records what each progress estimate was sent."""
+
+    def __init__(self) -> None:
+        self.calls: list[tuple[list[str], object]] = []
+
+    async def estimate_progress(
+        self, task_title, task_description, reports, previous=None
+    ):
+        self.calls.append((list(reports), previous))
+        return await super().estimate_progress(
+            task_title, task_description, reports, previous
+        )
+
+
+@pytest.fixture
+def uow():
+    mock = AsyncMock()
+    mock.project_repository = AsyncMock()
+    mock.task_repository = AsyncMock()
+    mock.task_log_repository = AsyncMock()
+    mock.task_progress_repository = AsyncMock()
+    mock.__aenter__ = AsyncMock(return_value=mock)
+    mock.__aexit__ = AsyncMock(return_value=False)
+    return mock
+
+
+@pytest.fixture
+def llm_service():
+    return RecordingLLMService()
+
+
+@pytest.fixture
+def member_id():
+    return uuid4()
+
+
+@pytest.fixture
+def user_id():
+    return uuid4()
+
+
+@pytest.fixture
+def project():
+    project = Project(name="Project", manager_id=uuid4())
+    project.configure_llm("openai", "encrypted-key")
+    return project
+
+
+@pytest.fixture
+def task(uow, project, member_id, user_id):
+    task = Task(project_id=project.id, title="Build API", difficulty_points=3)
+    task.select(member_id)
+    uow.task_repository.find_by_id.return_value = task
+    uow.project_repository.find_by_id.return_value = project
+    uow.project_repository.find_access.return_value = ProjectAccess(
+        project_id=project.id, user_id=user_id, is_manager=False, member_id=member_id
+    )
+    return task
+
+
+def _reports(task, member_id, *texts):
+    start = utcnow()
+    return [
+        TaskLog(
+            task_id=task.id,
+            author_id=member_id,
+            log_type=TaskLogType.REPORT,
+            content=text,
+            created_at=start + timedelta(minutes=i),
+        )
+        for i, text in enumerate(texts)
+    ]
+
+
+def _state(task, summary="API designed", percentage=30):
+    return TaskProgressState(
+        task_id=task.id,
+        percentage=percentage,
+        confidence=0.5,
+        reasoning="ok",
+        summary=summary,
+        last_report_at=utcnow() - timedelta(days=1),
+        last_report_id=uuid4(),
+    )
+
+
+class TestEstimateTaskProgressUseCase:
+    """Tests for EstimateTaskProgressUseCase.execute()."""
+
+    @pytest.mark.asyncio
+    async def test_sends_summary_and_only_reports_after_the_watermark(
+        self, uow, llm_service, task, member_id, user_id
+    ):
+        state = _state(task)
+        reports = _reports(task, member_id, "endpoints done", "tests written")
+        uow.task_progress_repository.get.return_value = state
+        uow.task_log_repository.find_reports_after.return_value = reports
+        uow.task_progress_repository.save.return_value = True
+        use_case = EstimateTaskProgressUseCase(uow=uow, llm_service=llm_service)
+
+        result = await use_case.execute(
+            EstimateTaskProgressInput(task_id=task.id, user_id=user_id)
+        )
+
+        uow.task_log_repository.find_reports_after.assert_awaited_once_with(
+            task.id, (state.last_report_at, state.last_report_id)
+        )
+        ((sent, previous),) = llm_service.calls
+        assert sent == ["endpoints done", "tests written"]
+        assert previous.summary == "API designed"
+        assert previous.percentage == 30
+        assert result.reports_sent == 2
+        assert task.progress_percent == result.estimation.percentage
+        (saved,), _ = uow.task_progress_repository.save.call_args
+        assert saved.last_report_id == reports[-1].id
+        assert saved.last_report_at == reports[-1].created_at
+        assert "tests written" in saved.summary
+        uow.commit.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_reuses_the_stored_estimate_without_new_reports(
+        self, uow, llm_service, task, user_id
+    ):
+        uow.task_progress_repository.get.return_value = _state(task, percentage=45)
+        uow.task_log_repository.find_reports_after.return_value = []
+        use_case = EstimateTaskProgressUseCase(uow=uow, llm_service=llm_service)
+
+        result = await use_case.execute(
+            EstimateTaskProgressInput(task_id=task.id, user_id=user_id)
+        )
+
+        assert result.reused
+        assert result.estimation.percentage == 45
+        assert llm_service.calls == []
+        uow.task_progress_repository.save.assert_not_called()
+        uow.commit.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_keeps_the_prompt_within_the_token_budget(
+        self, uow, llm_service, task, member_id, user_id
+    ):
+        # 25 tokens: 100 characters for the summary and the reports.
+        uow.task_progress_repository.get.return_value = _state(task, summary="s" * 80)
+        reports = _reports(task, member_id, "a" * 30, "b" * 30, "c" * 30)
+        uow.task_log_repository.find_reports_after.return_value = reports
+        uow.task_progress_repository.save.return_value = True
+        use_case = EstimateTaskProgressUseCase(
+            uow=uow, llm_service=llm_service, token_budget=25
+        )
+
+        result = await use_case.execute(
+            EstimateTaskProgressInput(task_id=task.id, user_id=user_id)
+        )
+
+        ((sent, previous),) = llm_service.calls
+        assert previous.summary == "s" * 50
+        assert sent == ["a" * 30]
+        assert (result.reports_sent, result.reports_pending) == (1, 2)
+        # Only the report sent is covered; the next estimate sends the rest.
+        (saved,), _ = uow.task_progress_repository.save.call_args
+        assert saved.last_report_id == reports[0].id
+        assert saved.last_report_at == reports[0].created_at
+
+    @pytest.mark.asyncio
+    async def test_truncates_a_single_report_larger_than_the_budget(
+        self, uow, llm_service, task, member_id, user_id
+    ):
+        uow.task_progress_repository.get.return_value = None
+        uow.task_log_repository.find_reports_after.return_value = _reports(
+            task, member_id, "x" * 500
+        )
+        uow.task_progress_repository.save.return_value = True
+        use_case = EstimateTaskProgressUseCase(
+            uow=uow, llm_service=llm_service, token_budget=25
+        )
+
+        await use_case.execute(
+            EstimateTaskProgressInput(task_id=task.id, user_id=user_id)
+        )
+
+        ((sent, previous),) = llm_service.calls
+        assert previous is None
+        assert sent == ["x" * 100]
+        uow.task_log_repository.find_reports_after.assert_awaited_once_with(
+            task.id, None
+        )
+
+    @pytest.mark.asyncio
+    async def test_leaves_progress_alone_when_a_later_estimate_is_stored(
+        self, uow, llm_service, task, member_id, user_id
+    ):
+        uow.task_progress_repository.get.return_value = None
+        uow.task_log_repository.find_reports_after.return_value = _reports(
+            task, member_id, "done"
+        )
+        uow.task_progress_repository.save.return_value = False
+        use_case = EstimateTaskProgressUseCase(uow=uow, llm_service=llm_service)
+
+        await use_case.execute(
+            EstimateTaskProgressInput(task_id=task.id, user_id=user_id)
+        )
+
+        assert task.progress_percent == 0
+        uow.task_repository.save.assert_not_called()
+        uow.commit.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_stream_yields_reasoning_then_stores_the_estimate(
+        self, uow, llm_service, task, member_id, user_id
+    ):
+        uow.task_progress_repository.get.return_value = None
+        uow.task_log_repository.find_reports_after.return_value = _reports(
+            task, member_id, "endpoints done"
+        )
+        uow.task_progress_repository.save.return_value = True
+        use_case = EstimateTaskProgressUseCase(uow=uow, llm_service=llm_service)
+
+        items = [
+            item
+            async for item in use_case.stream(
+                EstimateTaskProgressInput(task_id=task.id, user_id=user_id)
+            )
+        ]
+
+        *reasoning, result = items
+        assert "".join(reasoning) == result.estimation.reasoning
+        assert result.reports_sent == 1
+        assert task.progress_percent == result.estimation.percentage
+        uow.commit.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_stream_yields_the_stored_estimate_without_new_reports(
+        self, uow, llm_service, task, user_id
+    ):
+        uow.task_progress_repository.get.return_value = _state(task, percentage=45)
+        uow.task_log_repository.find_reports_after.return_value = []
+        use_case = EstimateTaskProgressUseCase(uow=uow, llm_service=llm_service)
+
+        items = [
+            item
+            async for item in use_case.stream(
+                EstimateTaskProgressInput(task_id=task.id, user_id=user_id)
+            )
+        ]
+
+        (result,) = items
+        assert result.reused
+        assert result.estimation.percentage == 45
+        assert llm_service.calls == []
+
+    @pytest.mark.asyncio
+    async def test_raises_when_user_is_not_assignee_or_manager(
+        self, uow, llm_service, task, project
+    ):
+        uow.project_repository.find_access.return_value = ProjectAccess(
+            project_id=project.id, user_id=uuid4(), is_manager=False, member_id=uuid4()
+        )
+        use_case = EstimateTaskProgressUseCase(uow=uow, llm_service=llm_service)
+
+        with pytest.raises(TaskNotOwnedError):
+            await use_case.execute(
+                EstimateTaskProgressInput(task_id=task.id, user_id=uuid4())
+            )
+
+    @pytest.mark.asyncio
+    async def test_raises_when_llm_not_enabled(
+        self, uow, llm_service, task, project, user_id
+    ):
+        project.disable_llm()
+        use_case = EstimateTaskProgressUseCase(uow=uow, llm_service=llm_service)
+
+        with pytest.raises(LLMNotConfiguredError):
+            await use_case.execute(
+                EstimateTaskProgressInput(task_id=task.id, user_id=user_id)
+            )
+        assert llm_service.calls == []
@@ -0,0 +1,183 @@
+"""Tests for ImportTasksUseCase."""
+
+from unittest.mock import AsyncMock
+from uuid import uuid4
+
+import pytest
+
+from backend.src.application.use_cases.task_management import (
+    ImportDependencyItem,
+    ImportTaskItem,
+    ImportTasksInput,
+    ImportTasksUseCase,
+)
+from backend.src.domain.entities import Project, Task, TaskDependency, TaskStatus
+from backend.src.domain.errors import (
+    CircularDependencyError,
+    ManagerRequiredError,
+    TaskNotFoundError,
+)
+
+
+@pytest.fixture
+def uow():
+    mock = AsyncMock()
+    mock.project_repository = AsyncMock()
+    mock.task_repository = AsyncMock()
+    mock.task_dependency_repository = AsyncMock()
+    mock.task_repository.find_by_project.return_value = []
+    mock.task_dependency_repository.find_by_project.return_value = []
+    mock.__aenter__ = AsyncMock(return_value=mock)
+    mock.__aexit__ = AsyncMock(return_value=False)
+    return mock
+
+
+@pytest.fixture
+def recalc_use_case():
+    mock = AsyncMock()
+    mock.recalculate_in_transaction = AsyncMock()
+    return mock
+
+
+@pytest.fixture
+def use_case(uow, recalc_use_case):
+    return ImportTasksUseCase(uow=uow, recalculate_schedule_use_case=recalc_use_case)
+
+
+@pytest.fixture
+def manager_id():
+    return uuid4()
+
+
+@pytest.fixture
+def project(manager_id):
+    return Project(name="P", manager_id=manager_id)
+
+
+@pytest.mark.asyncio
+async def test_imports_tasks_and_edges_with_single_recalculation(
+    use_case, uow, recalc_use_case, project, manager_id
+):
+    uow.project_repository.find_by_id.return_value = project
+
+    result = await use_case.execute(
+        ImportTasksInput(
+            project_id=project.id,
+            requester_id=manager_id,
+            tasks=[
+                ImportTaskItem(ref="a", title="A", difficulty_points=3),
+                ImportTaskItem(ref="b", title="B"),
+                ImportTaskItem(ref="c", title="C"),
+            ],
+            dependencies=[
+                ImportDependencyItem(blocking="a", blocked="b"),
+                ImportDependencyItem(blocking="b", blocked="c"),
+            ],
+        )
+    )
+
+    assert set(result.task_ids) == {"a", "b", "c"}
+    tasks = {t.title: t for t in result.tasks}
+    assert tasks["A"].status == TaskStatus.TODO
+    assert tasks["B"].status == TaskStatus.BLOCKED
+    assert tasks["C"].status == TaskStatus.BLOCKED
+    uow.task_repository.insert_many.assert_awaited_once()
+    uow.task_dependency_repository.insert_many.assert_awaited_once_with(result.dependencies)
+    recalc_use_case.recalculate_in_transaction.assert_awaited_once()
+    uow.commit.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_edges_can_reference_existing_tasks(use_case, uow, project, manager_id):
+    existing = Task(project_id=project.id, title="Existing", difficulty_points=1)
+    uow.project_repository.find_by_id.return_value = project
+    uow.task_repository.find_by_project.return_value = [existing]
+
+    result = await use_case.execute(
+        ImportTasksInput(
+            project_id=project.id,
+            requester_id=manager_id,
+            tasks=[ImportTaskItem(ref="new", title="New")],
+            dependencies=[ImportDependencyItem(blocking="new", blocked=str(existing.id))],
+        )
+    )
+
+    assert result.dependencies[0].blocked_task_id == existing.id
+    assert existing.status == TaskStatus.BLOCKED
+    uow.task_repository.save_many.assert_awaited_once_with([existing])
+
+
+@pytest.mark.asyncio
+async def test_rejects_cycle_through_existing_dependencies(
+    use_case, uow, recalc_use_case, project, manager_id
+):
+    existing = Task(project_id=project.id, title="Existing")
+    uow.project_repository.find_by_id.return_value = project
+    uow.task_repository.find_by_project.return_value = [existing]
+
+    new_task = ImportTaskItem(ref="n", title="N")
+    with pytest.raises(CircularDependencyError):
+        await use_case.execute(
+            ImportTasksInput(
+                project_id=project.id,
+                requester_id=manager_id,
+                tasks=[new_task],
+                dependencies=[
+                    ImportDependencyItem(blocking="n", blocked=str(existing.id)),
+                    ImportDependencyItem(blocking=str(existing.id), blocked="n"),
+                ],
+            )
+        )
+
+    uow.task_repository.insert_many.assert_not_awaited()
+    recalc_use_case.recalculate_in_transaction.assert_not_awaited()
+    uow.commit.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_rejects_unknown_reference(use_case, uow, project, manager_id):
+    uow.project_repository.find_by_id.return_value = project
+
+    with pytest.raises(TaskNotFoundError):
+        await use_case.execute(
+            ImportTasksInput(
+                project_id=project.id,
+                requester_id=manager_id,
+                tasks=[ImportTaskItem(ref="a", title="A")],
+                dependencies=[ImportDependencyItem(blocking="missing", blocked="a")],
+            )
+        )
+
+
+@pytest.mark.asyncio
+async def test_rejects_duplicate_of_existing_dependency(use_case, uow, project, manager_id):
+    a = Task(project_id=project.id, title="A")
+    b = Task(project_id=project.id, title="B")
+    uow.project_repository.find_by_id.return_value = project
+    uow.task_repository.find_by_project.return_value = [a, b]
+    uow.task_dependency_repository.find_by_project.return_value = [
+        TaskDependency(blocking_task_id=a.id, blocked_task_id=b.id)
+    ]
+
+    with pytest.raises(ValueError):
+        await use_case.execute(
+            ImportTasksInput(
+                project_id=project.id,
+                requester_id=manager_id,
+                dependencies=[ImportDependencyItem(blocking=str(a.id), blocked=str(b.id))],
+            )
+        )
+
+
+@pytest.mark.asyncio
+async def test_requires_manager(use_case, uow, project):
+    uow.project_repository.find_by_id.return_value = project
+
+    with pytest.raises(ManagerRequiredError):
+        await use_case.execute(
+            ImportTasksInput(
+                project_id=project.id,
+                requester_id=uuid4(),
+                tasks=[ImportTaskItem(ref="a", title="A")],
+            )
+        )
@@ -0,0 +1,112 @@
+"""Tests for IndexCompletedTasksUseCase."""
+
+from contextlib import asynccontextmanager
+from unittest.mock import AsyncMock
+from uuid import uuid4
+
+import pytest
+
+from backend.src.application.use_cases.task_management import (
+    IndexCompletedTasksUseCase,
+)
+from backend.src.domain.entities import Task
+from backend.src.domain.events import TaskCompleted, TaskSelected
+
+
+class RecordingIndex:
+    def __init__(self) -> None:
+        self.added: list[tuple[str, int]] = []
+
+    def add(self, project_id, task_id, title, description, difficulty_points) -> None:
+        self.added.append((title, difficulty_points))
+
+    def remove(self, task_id) -> None:
+        pass
+
+    def nearest(self, project_id, title, description):
+        return None
+
+
+def _done(title: str, points: int) -> Task:
+    task = Task(project_id=uuid4(), title=title, difficulty_points=points)
+    task.select(uuid4())
+    task.complete()
+    return task
+
+
+@pytest.fixture
+def uow():
+    mock = AsyncMock()
+    mock.task_repository = AsyncMock()
+    return mock
+
+
+@pytest.fixture
+def index():
+    return RecordingIndex()
+
+
+@pytest.fixture
+def use_case(uow, index):
+    @asynccontextmanager
+    async def uow_factory():
+        yield uow
+
+    return IndexCompletedTasksUseCase(uow_factory, index, limit=50)
+
+
+@pytest.mark.asyncio
+async def test_indexes_tasks_as_they_are_completed(use_case, uow, index):
+    task = _done("Export CSV", 3)
+    uow.task_repository.find_by_id.return_value = task
+
+    await use_case.handle_events(
+        [
+            TaskCompleted(task.id, task.project_id, uuid4()),
+            TaskSelected(uuid4(), task.project_id, uuid4()),
+        ]
+    )
+
+    uow.task_repository.find_by_id.assert_awaited_once_with(task.id)
+    assert index.added == [("Export CSV", 3)]
+
+
+@pytest.mark.asyncio
+async def test_skips_tasks_no_longer_done(use_case, uow, index):
+    task = Task(project_id=uuid4(), title="Reopened", difficulty_points=3)
+    uow.task_repository.find_by_id.return_value = task
+
+    await use_case.handle_events([TaskCompleted(task.id, task.project_id, uuid4())])
+
+    assert index.added == []
+
+
+@pytest.mark.asyncio
+async def test_warm_up_adds_recent_tasks_oldest_first(use_case, uow, index):
+    uow.task_repository.find_recently_completed.return_value = [
+        _done("Newest", 5),
+        _done("Oldest", 1),
+    ]
+
+    added = await use_case.warm_up()
+
+    uow.task_repository.find_recently_completed.assert_awaited_once_with(50)
+    assert added == 2
+    assert index.added == [("Oldest", 1), ("Newest", 5)]
+
+
+@pytest.mark.asyncio
+async def test_sync_adds_tasks_completed_since_the_last_look(use_case, uow, index):
+    uow.task_repository.find_recently_completed.return_value = []
+    await use_case.warm_up()
+    uow.task_repository.find_recently_completed.return_value = [
+        _done("Done elsewhere", 2)
+    ]
+
+    added = await use_case.sync()
+
+    (limit,), kwargs = uow.task_repository.find_recently_completed.call_args
+    assert limit == 50
+    assert kwargs["completed_after"] is not None
+    assert added == 1
+    assert index.added == [("Done elsewhere", 2)]
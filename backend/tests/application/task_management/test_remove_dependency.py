@@ -9,7 +9,13 @@ from backend.src.application.use_cases.task_management.remove_dependency import
     RemoveDependencyInput,
     RemoveDependencyUseCase,
 )
-from backend.src.domain.entities import Project, Task, TaskDependency, TaskStatus
+from backend.src.domain.entities import (
+    Project,
+    ProjectAccess,
+    Task,
+    TaskDependency,
+    TaskStatus,
+)
 from backend.src.domain.errors import ManagerRequiredError
 
 
@@ -49,7 +55,9 @@ async def test_removes_dependency_and_unblocks_task(use_case, uow, recalc_use_ca
 
     dep = TaskDependency(blocking_task_id=blocking.id, blocked_task_id=blocked.id)
 
-    uow.project_repository.find_by_id.return_value = project
+    uow.project_repository.find_access.return_value = ProjectAccess.of(
+        project, manager_id
+    )
     uow.task_repository.find_by_id.return_value = blocked
     uow.task_dependency_repository.find_by_tasks.return_value = dep
     uow.task_dependency_repository.find_by_project.return_value = []
@@ -84,7 +92,9 @@ async def test_keeps_blocked_if_other_open_blockers(use_case, uow):
     dep = TaskDependency(blocking_task_id=b1.id, blocked_task_id=blocked.id)
     remaining = TaskDependency(blocking_task_id=b2.id, blocked_task_id=blocked.id)
 
-    uow.project_repository.find_by_id.return_value = project
+    uow.project_repository.find_access.return_value = ProjectAccess.of(
+        project, manager_id
+    )
     uow.task_repository.find_by_id.return_value = blocked
     uow.task_dependency_repository.find_by_tasks.return_value = dep
     uow.task_dependency_repository.find_by_project.return_value = [remaining]
@@ -109,7 +119,7 @@ async def test_raises_if_not_manager(use_case, uow):
     project = Project(name="P", manager_id=manager_id)
     blocked = Task(project_id=project.id, title="B", difficulty_points=1)
 
-    uow.project_repository.find_by_id.return_value = project
+    uow.project_repository.find_access.return_value = ProjectAccess.of(project, uuid4())
     uow.task_repository.find_by_id.return_value = blocked
 
     with pytest.raises(ManagerRequiredError):
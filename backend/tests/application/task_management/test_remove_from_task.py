@@ -11,6 +11,7 @@ from backend.src.application.use_cases.task_management import (
 )
 from backend.src.domain.entities import (
     Project,
+    ProjectAccess,
     ProjectMember,
     SeniorityLevel,
     Task,
@@ -123,7 +124,9 @@ class TestRemoveFromTaskUseCase:
     ):
         """Manager can forcibly remove an employee from a task."""
         uow.task_repository.find_by_id.return_value = doing_task
-        uow.project_repository.find_by_id.return_value = project
+        uow.project_repository.find_access.return_value = ProjectAccess.of(
+            project, manager_user_id
+        )
         uow.task_repository.save.return_value = None
         uow.task_log_repository.save.return_value = None
 
@@ -158,9 +161,8 @@ class TestRemoveFromTaskUseCase:
             seniority_level=SeniorityLevel.LEAD,
         )
         uow.task_repository.find_by_id.return_value = doing_task
-        uow.project_repository.find_by_id.return_value = project
-        uow.project_member_repository.find_by_project_and_user.return_value = (
-            manager_member
+        uow.project_repository.find_access.return_value = ProjectAccess.of(
+            project, manager_user_id, manager_member
         )
         uow.task_repository.save.return_value = None
         uow.task_log_repository.save.return_value = None
@@ -208,7 +210,7 @@ class TestRemoveFromTaskUseCase:
     ):
         """Should raise ProjectNotFoundError when project doesn't exist."""
         uow.task_repository.find_by_id.return_value = doing_task
-        uow.project_repository.find_by_id.return_value = None
+        uow.project_repository.find_access.return_value = None
 
         input_data = RemoveFromTaskInput(
             task_id=doing_task.id,
@@ -228,7 +230,9 @@ class TestRemoveFromTaskUseCase:
     ):
         """Should raise ManagerRequiredError when user is not the manager."""
         uow.task_repository.find_by_id.return_value = doing_task
-        uow.project_repository.find_by_id.return_value = project
+        uow.project_repository.find_access.return_value = ProjectAccess.of(
+            project, uuid4()
+        )
         non_manager_id = uuid4()
 
         input_data = RemoveFromTaskInput(
@@ -250,7 +254,9 @@ class TestRemoveFromTaskUseCase:
     ):
         """Should raise TaskNotAssignedError when task has no assignee."""
         uow.task_repository.find_by_id.return_value = todo_task
-        uow.project_repository.find_by_id.return_value = project
+        uow.project_repository.find_access.return_value = ProjectAccess.of(
+            project, manager_user_id
+        )
 
         input_data = RemoveFromTaskInput(
             task_id=todo_task.id,
@@ -280,7 +286,9 @@ class TestRemoveFromTaskUseCase:
         blocked_task.block()
 
         uow.task_repository.find_by_id.return_value = blocked_task
-        uow.project_repository.find_by_id.return_value = project
+        uow.project_repository.find_access.return_value = ProjectAccess.of(
+            project, manager_user_id
+        )
 
         input_data = RemoveFromTaskInput(
             task_id=blocked_task.id,
@@ -301,7 +309,9 @@ class TestRemoveFromTaskUseCase:
     ):
         """Removed task should be selectable again."""
         uow.task_repository.find_by_id.return_value = doing_task
-        uow.project_repository.find_by_id.return_value = project
+        uow.project_repository.find_access.return_value = ProjectAccess.of(
+            project, manager_user_id
+        )
         uow.task_repository.save.return_value = None
         uow.task_log_repository.save.return_value = None
 
@@ -326,7 +336,9 @@ class TestRemoveFromTaskUseCase:
     ):
         """After removal, any employee (including the same one) can select the task."""
         uow.task_repository.find_by_id.return_value = doing_task
-        uow.project_repository.find_by_id.return_value = project
+        uow.project_repository.find_access.return_value = ProjectAccess.of(
+            project, manager_user_id
+        )
         uow.task_repository.save.return_value = None
         uow.task_log_repository.save.return_value = None
 
@@ -0,0 +1,241 @@
+"""Tests for RunTaskBatchUseCase."""
+
+from unittest.mock import AsyncMock
+from uuid import uuid4
+
+import pytest
+
+from backend.src.application.use_cases.task_management import (
+    BatchCommand,
+    BatchCommandError,
+    BatchMode,
+    BatchOperation,
+    RunTaskBatchInput,
+    RunTaskBatchUseCase,
+)
+from backend.src.domain.entities import (
+    Project,
+    ProjectAccess,
+    ProjectMember,
+    SeniorityLevel,
+    Task,
+    TaskDependency,
+    TaskStatus,
+)
+from backend.src.domain.errors import (
+    ManagerRequiredError,
+    ProjectAccessDeniedError,
+    TaskNotFoundError,
+)
+
+
+@pytest.fixture
+def uow():
+    mock = AsyncMock()
+    mock.project_repository = AsyncMock()
+    mock.project_member_repository = AsyncMock()
+    mock.task_repository = AsyncMock()
+    mock.task_dependency_repository = AsyncMock()
+    mock.task_log_repository = AsyncMock()
+    mock.task_dependency_repository.find_by_project.return_value = []
+    mock.__aenter__ = AsyncMock(return_value=mock)
+    mock.__aexit__ = AsyncMock(return_value=False)
+
+    async def find_access(project_id, user_id):
+        project = mock.project_repository.find_by_id.return_value
+        if project is None:
+            return None
+        member = mock.project_member_repository.find_by_project_and_user.return_value
+        return ProjectAccess.of(project, user_id, member)
+
+    mock.project_repository.find_access.side_effect = find_access
+    return mock
+
+
+@pytest.fixture
+def recalc_use_case():
+    mock = AsyncMock()
+    mock.recalculate_in_transaction = AsyncMock()
+    return mock
+
+
+@pytest.fixture
+def use_case(uow, recalc_use_case):
+    return RunTaskBatchUseCase(uow=uow, recalculate_schedule_use_case=recalc_use_case)
+
+
+@pytest.fixture
+def manager_id():
+    return uuid4()
+
+
+@pytest.fixture
+def project(manager_id):
+    return Project(name="P", manager_id=manager_id)
+
+
+@pytest.mark.asyncio
+async def test_manager_cancels_and_removes_dependency_with_one_recalculation(
+    use_case, uow, recalc_use_case, project, manager_id
+):
+    a = Task(project_id=project.id, title="A", difficulty_points=1)
+    b = Task(project_id=project.id, title="B", difficulty_points=1, status=TaskStatus.BLOCKED)
+    c = Task(project_id=project.id, title="C", difficulty_points=1)
+    uow.project_repository.find_by_id.return_value = project
+    uow.project_member_repository.find_by_project_and_user.return_value = None
+    uow.task_repository.find_by_project.return_value = [a, b, c]
+    uow.task_dependency_repository.find_by_project.return_value = [
+        TaskDependency(blocking_task_id=a.id, blocked_task_id=b.id)
+    ]
+
+    output = await use_case.execute(
+        RunTaskBatchInput(
+            project_id=project.id,
+            user_id=manager_id,
+            commands=[
+                BatchCommand(operation=BatchOperation.CANCEL, task_id=c.id),
+                BatchCommand(
+                    operation=BatchOperation.REMOVE_DEPENDENCY,
+                    task_id=b.id,
+                    blocking_task_id=a.id,
+                ),
+            ],
+        )
+    )
+
+    assert [r.ok for r in output.results] == [True, True]
+    assert c.status == TaskStatus.CANCELLED
+    assert b.status == TaskStatus.TODO
+    uow.project_repository.find_access.assert_awaited_once()
+    uow.project_repository.find_by_id.assert_not_awaited()
+    recalc_use_case.recalculate_in_transaction.assert_awaited_once()
+    uow.commit.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_member_selects_then_completes_without_recalculation(
+    use_case, uow, recalc_use_case, project
+):
+    member = ProjectMember(
+        project_id=project.id,
+        user_id=uuid4(),
+        role_id=uuid4(),
+        seniority_level=SeniorityLevel.MID,
+    )
+    task = Task(project_id=project.id, title="A", difficulty_points=1)
+    uow.project_repository.find_by_id.return_value = project
+    uow.project_member_repository.find_by_project_and_user.return_value = member
+    uow.task_repository.find_by_project.return_value = [task]
+
+    output = await use_case.execute(
+        RunTaskBatchInput(
+            project_id=project.id,
+            user_id=member.user_id,
+            commands=[
+                BatchCommand(operation=BatchOperation.SELECT, task_id=task.id),
+                BatchCommand(operation=BatchOperation.COMPLETE, task_id=task.id),
+            ],
+        )
+    )
+
+    assert all(r.ok for r in output.results)
+    assert task.status == TaskStatus.DONE
+    assert uow.task_log_repository.save.await_count == 2
+    recalc_use_case.recalculate_in_transaction.assert_not_awaited()
+    uow.commit.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_atomic_mode_aborts_on_first_failure(
+    use_case, uow, recalc_use_case, project, manager_id
+):
+    task = Task(project_id=project.id, title="A", difficulty_points=1)
+    uow.project_repository.find_by_id.return_value = project
+    uow.project_member_repository.find_by_project_and_user.return_value = None
+    uow.task_repository.find_by_project.return_value = [task]
+
+    with pytest.raises(BatchCommandError) as exc_info:
+        await use_case.execute(
+            RunTaskBatchInput(
+                project_id=project.id,
+                user_id=manager_id,
+                commands=[
+                    BatchCommand(operation=BatchOperation.CANCEL, task_id=task.id),
+                    BatchCommand(operation=BatchOperation.DELETE, task_id=uuid4()),
+                ],
+            )
+        )
+
+    assert exc_info.value.index == 1
+    assert isinstance(exc_info.value.cause, TaskNotFoundError)
+    recalc_use_case.recalculate_in_transaction.assert_not_awaited()
+    uow.commit.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_partial_mode_reports_failures_and_commits_successes(
+    use_case, uow, project, manager_id
+):
+    task = Task(project_id=project.id, title="A", difficulty_points=1)
+    uow.project_repository.find_by_id.return_value = project
+    uow.project_member_repository.find_by_project_and_user.return_value = None
+    uow.task_repository.find_by_project.return_value = [task]
+
+    output = await use_case.execute(
+        RunTaskBatchInput(
+            project_id=project.id,
+            user_id=manager_id,
+            mode=BatchMode.PARTIAL,
+            commands=[
+                BatchCommand(operation=BatchOperation.SELECT, task_id=task.id),
+                BatchCommand(operation=BatchOperation.CANCEL, task_id=task.id),
+            ],
+        )
+    )
+
+    assert isinstance(output.results[0].error, ProjectAccessDeniedError)
+    assert output.results[1].ok
+    assert task.status == TaskStatus.CANCELLED
+    uow.commit.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_partial_mode_with_only_failures_does_not_commit(use_case, uow, project):
+    member = ProjectMember(
+        project_id=project.id,
+        user_id=uuid4(),
+        role_id=uuid4(),
+        seniority_level=SeniorityLevel.MID,
+    )
+    task = Task(project_id=project.id, title="A", difficulty_points=1)
+    uow.project_repository.find_by_id.return_value = project
+    uow.project_member_repository.find_by_project_and_user.return_value = member
+    uow.task_repository.find_by_project.return_value = [task]
+
+    output = await use_case.execute(
+        RunTaskBatchInput(
+            project_id=project.id,
+            user_id=member.user_id,
+            mode=BatchMode.PARTIAL,
+            commands=[BatchCommand(operation=BatchOperation.CANCEL, task_id=task.id)],
+        )
+    )
+
+    assert isinstance(output.results[0].error, ManagerRequiredError)
+    assert task.status == TaskStatus.TODO
+    uow.commit.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_rejects_non_member(use_case, uow, project):
+    uow.project_repository.find_by_id.return_value = project
+    uow.project_member_repository.find_by_project_and_user.return_value = None
+
+    with pytest.raises(ProjectAccessDeniedError):
+        await use_case.execute(
+            RunTaskBatchInput(
+                project_id=project.id,
+                user_id=uuid4(),
+                commands=[BatchCommand(operation=BatchOperation.CANCEL, task_id=uuid4())],
+            )
+        )
@@ -28,6 +28,7 @@ from backend.src.domain.errors import (
     TaskNotSelectableError,
     WorkloadExceededError,
 )
+from backend.src.domain.events import TaskSelected
 
 
 @pytest.fixture
@@ -651,3 +652,40 @@ class TestSelectTaskUseCaseSingleTaskFocus:
         result = await use_case_with_multitasking.execute(input_data)
 
         assert result.status == TaskStatus.DOING
+
+
+class TestSelectTaskUseCaseEvents:
+    """Workload events are published once the selection has committed."""
+
+    @pytest.mark.asyncio
+    async def test_publishes_task_selected_after_commit(
+        self,
+        uow,
+        existing_project,
+        project_member,
+        todo_task,
+        member_user_id,
+    ):
+        publisher = AsyncMock()
+        publisher.publish.side_effect = lambda events: uow.commit.assert_awaited_once()
+        use_case = SelectTaskUseCase(uow=uow, event_publisher=publisher)
+        uow.project_repository.find_by_id.return_value = existing_project
+        uow.project_member_repository.find_by_project_and_user.return_value = (
+            project_member
+        )
+        uow.task_repository.find_by_id.return_value = todo_task
+        uow.task_repository.find_by_assignee.return_value = []
+        uow.task_repository.find_by_project.return_value = [todo_task]
+        uow.task_dependency_repository.find_by_project.return_value = []
+
+        await use_case.execute(
+            SelectTaskInput(
+                project_id=existing_project.id,
+                task_id=todo_task.id,
+                user_id=member_user_id,
+            )
+        )
+
+        publisher.publish.assert_awaited_once_with(
+            [TaskSelected(todo_task.id, existing_project.id, project_member.id)]
+        )
@@ -0,0 +1,48 @@
+"""Tests for TaskDependency cycle detection."""
+
+from uuid import uuid4
+
+from backend.src.domain.entities import (
+    TaskDependency,
+    detect_circular_dependency,
+    find_circular_dependency,
+)
+
+
+def _chain(length: int) -> tuple[list, list[TaskDependency]]:
+    ids = [uuid4() for _ in range(length)]
+    deps = [TaskDependency(blocking_task_id=a, blocked_task_id=b) for a, b in zip(ids, ids[1:])]
+    return ids, deps
+
+
+def test_find_circular_dependency_returns_none_for_dag():
+    a, b, c, d = (uuid4() for _ in range(4))
+    deps = [
+        TaskDependency(blocking_task_id=a, blocked_task_id=b),
+        TaskDependency(blocking_task_id=a, blocked_task_id=c),
+        TaskDependency(blocking_task_id=b, blocked_task_id=d),
+        TaskDependency(blocking_task_id=c, blocked_task_id=d),
+    ]
+
+    assert find_circular_dependency(deps) is None
+
+
+def test_find_circular_dependency_returns_edge_on_cycle():
+    a, b, c, downstream = (uuid4() for _ in range(4))
+    cycle = [
+        TaskDependency(blocking_task_id=a, blocked_task_id=b),
+        TaskDependency(blocking_task_id=b, blocked_task_id=c),
+        TaskDependency(blocking_task_id=c, blocked_task_id=a),
+    ]
+    deps = [*cycle, TaskDependency(blocking_task_id=c, blocked_task_id=downstream)]
+
+    assert find_circular_dependency(deps) in cycle
+
+
+def test_find_circular_dependency_handles_deep_chains_without_recursion():
+    ids, deps = _chain(20_000)
+
+    assert find_circular_dependency(deps) is None
+
+    closing = TaskDependency(blocking_task_id=ids[-1], blocked_task_id=ids[0])
+    assert detect_circular_dependency(closing, deps) is True
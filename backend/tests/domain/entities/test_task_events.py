@@ -0,0 +1,50 @@
+"""Tests for the domain events recorded by Task."""
+
+from uuid import uuid4
+
+from backend.src.domain.entities import Task
+from backend.src.domain.events import (
+    TaskAbandoned,
+    TaskCompleted,
+    TaskDifficultyChanged,
+    TaskSelected,
+)
+
+
+def _task(points: int = 3) -> Task:
+    return Task(project_id=uuid4(), title="Task", difficulty_points=points)
+
+
+def test_workload_transitions_record_events_for_the_assignee():
+    member_id = uuid4()
+    first, second = _task(), _task()
+
+    first.select(member_id)
+    first.complete()
+    second.select(member_id)
+    second.abandon()
+
+    assert first.pull_events() == [
+        TaskSelected(first.id, first.project_id, member_id),
+        TaskCompleted(first.id, first.project_id, member_id),
+    ]
+    assert second.pull_events()[-1] == TaskAbandoned(
+        second.id, second.project_id, member_id
+    )
+    assert first.pull_events() == []
+
+
+def test_difficulty_change_is_recorded_only_for_doing_tasks():
+    member_id = uuid4()
+    task = _task(points=3)
+    task.set_difficulty(5)
+    assert task.pull_events() == []
+
+    task.select(member_id)
+    task.pull_events()
+    task.set_difficulty(5)
+    task.set_difficulty(8)
+
+    assert task.pull_events() == [
+        TaskDifficultyChanged(task.id, task.project_id, member_id, 5, 8)
+    ]
@@ -18,3 +18,23 @@ def test_is_working_day_respects_timezone_and_exclusions():
     # 2024-01-02 01:00 UTC is 22:00 on 2024-01-01 in Sao Paulo (not excluded)
     prior_local_dt = datetime(2024, 1, 2, 1, 0, 0, tzinfo=timezone.utc)
     assert calendar.is_working_day(prior_local_dt) is True
+
+
+def test_deadline_warning_is_due_the_working_day_before():
+    calendar = WorkingCalendar(timezone="America/Sao_Paulo")
+
+    # Thursday 2024-01-04 18:00 local -> warned from Wednesday 00:00 local
+    deadline = datetime(2024, 1, 4, 21, 0, 0, tzinfo=timezone.utc)
+    assert calendar.deadline_warning_at(deadline) == datetime(
+        2024, 1, 3, 3, 0, 0, tzinfo=timezone.utc
+    )
+
+
+def test_deadline_warning_shifts_back_over_non_working_days():
+    # Monday deadline after a Friday holiday -> warned on Thursday (BR-NOTIF-004)
+    calendar = WorkingCalendar(exclusion_dates=frozenset({date(2024, 1, 5)}))
+
+    deadline = datetime(2024, 1, 8, 12, 0, 0, tzinfo=timezone.utc)
+    assert calendar.deadline_warning_at(deadline) == datetime(
+        2024, 1, 4, tzinfo=timezone.utc
+    )
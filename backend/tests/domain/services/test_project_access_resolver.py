@@ -0,0 +1,139 @@
+"""Tests for ProjectAccessResolver."""
+
+from unittest.mock import AsyncMock
+from uuid import uuid4
+
+import pytest
+
+from backend.src.domain.entities import (
+    Project,
+    ProjectAccess,
+    ProjectMember,
+    SeniorityLevel,
+)
+from backend.src.domain.errors import (
+    ManagerRequiredError,
+    ProjectAccessDeniedError,
+    ProjectNotFoundError,
+)
+from backend.src.domain.services.project_access_resolver import ProjectAccessResolver
+
+
+@pytest.fixture
+def manager_id():
+    return uuid4()
+
+
+@pytest.fixture
+def project(manager_id):
+    return Project(name="P", manager_id=manager_id)
+
+
+@pytest.fixture
+def member(project):
+    return ProjectMember(
+        project_id=project.id,
+        user_id=uuid4(),
+        role_id=uuid4(),
+        seniority_level=SeniorityLevel.SENIOR,
+    )
+
+
+@pytest.fixture
+def projects():
+    return AsyncMock()
+
+
+@pytest.fixture
+def cache():
+    mock = AsyncMock()
+    mock.get.return_value = None
+    return mock
+
+
+@pytest.fixture
+def resolver(cache):
+    return ProjectAccessResolver(cache)
+
+
+@pytest.mark.asyncio
+async def test_cache_hit_skips_repository(resolver, projects, cache, project, member):
+    cached = ProjectAccess.of(project, member.user_id, member)
+    cache.get.return_value = cached
+
+    access = await resolver.resolve(projects, project.id, member.user_id)
+
+    assert access == cached
+    projects.find_access.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_miss_reads_repository_once_and_caches(
+    resolver, projects, cache, project, member
+):
+    loaded = ProjectAccess.of(project, member.user_id, member)
+    projects.find_access.return_value = loaded
+
+    access = await resolver.resolve(projects, project.id, member.user_id)
+
+    assert access.member_id == member.id
+    assert access.role_id == member.role_id
+    assert access.seniority_level is SeniorityLevel.SENIOR
+    projects.find_access.assert_awaited_once_with(project.id, member.user_id)
+    cache.set.assert_awaited_once_with(loaded)
+
+
+@pytest.mark.asyncio
+async def test_missing_project_raises_and_is_not_cached(resolver, projects, cache):
+    projects.find_access.return_value = None
+
+    with pytest.raises(ProjectNotFoundError):
+        await resolver.resolve(projects, uuid4(), uuid4())
+
+    cache.set.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_require_access_admits_manager_and_member(
+    resolver, projects, project, member, manager_id
+):
+    projects.find_access.return_value = ProjectAccess.of(project, manager_id)
+    assert (await resolver.require_access(projects, project.id, manager_id)).is_manager
+
+    projects.find_access.return_value = ProjectAccess.of(
+        project, member.user_id, member
+    )
+    access = await resolver.require_access(projects, project.id, member.user_id)
+    assert access.is_member and not access.is_manager
+
+
+@pytest.mark.asyncio
+async def test_require_access_denies_outsider(resolver, projects, project):
+    outsider = uuid4()
+    projects.find_access.return_value = ProjectAccess.of(project, outsider)
+
+    with pytest.raises(ProjectAccessDeniedError):
+        await resolver.require_access(projects, project.id, outsider)
+
+
+@pytest.mark.asyncio
+async def test_require_manager_rejects_member(resolver, projects, project, member):
+    projects.find_access.return_value = ProjectAccess.of(
+        project, member.user_id, member
+    )
+
+    with pytest.raises(ManagerRequiredError):
+        await resolver.require_manager(
+            projects, project.id, member.user_id, "create task"
+        )
+
+
+@pytest.mark.asyncio
+async def test_works_without_cache(projects, project, manager_id):
+    projects.find_access.return_value = ProjectAccess.of(project, manager_id)
+    resolver = ProjectAccessResolver()
+
+    await resolver.require_manager(projects, project.id, manager_id, "create task")
+    await resolver.invalidate(project.id, manager_id)
+
+    projects.find_access.assert_awaited_once()
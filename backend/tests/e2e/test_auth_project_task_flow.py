@@ -170,3 +170,39 @@ async def test_e2e_manager_employee_project_task_flow(e2e_client):
         headers=_bearer(manager_tokens["access_token"]),
     )
     assert delete_task.status_code == 204
+
+
+@pytest.mark.asyncio
+async def test_e2e_project_reads_support_conditional_get(e2e_client):
+    tokens = await _login_with_magic_link(e2e_client, "etag@example.com")
+    headers = _bearer(tokens["access_token"])
+
+    create_project = await e2e_client.post(
+        "/projects", json={"name": "ETag Project", "description": ""}, headers=headers
+    )
+    assert create_project.status_code == 201
+    project_id = create_project.json()["id"]
+
+    first = await e2e_client.get(f"/projects/{project_id}/tasks", headers=headers)
+    assert first.status_code == 200
+    etag = first.headers["etag"]
+
+    unchanged = await e2e_client.get(
+        f"/projects/{project_id}/tasks", headers={**headers, "If-None-Match": etag}
+    )
+    assert unchanged.status_code == 304
+    assert unchanged.content == b""
+
+    create_task = await e2e_client.post(
+        f"/projects/{project_id}/tasks",
+        json={"title": "Task", "description": "", "difficulty_points": 1},
+        headers=headers,
+    )
+    assert create_task.status_code == 201
+
+    changed = await e2e_client.get(
+        f"/projects/{project_id}/tasks", headers={**headers, "If-None-Match": etag}
+    )
+    assert changed.status_code == 200
+    assert changed.headers["etag"] != etag
+    assert changed.json()["total"] == 1
@@ -0,0 +1,278 @@
+"""Tests for EmailOutboxDispatcher."""
+
+import asyncio
+import socket
+from contextlib import asynccontextmanager
+from uuid import UUID, uuid4
+
+import pytest
+
+from backend.src.adapters.services import MockEmailService
+from backend.src.domain.ports import EmailMessage, OutboxEmail
+from backend.src.infrastructure.outbox import EmailOutboxDispatcher
+
+
+class FakeOutbox:
+    """In-memory outbox honouring leases the way the Postgres one does."""
+
+    def __init__(self) -> None:
+        self.pending: dict[UUID, OutboxEmail] = {}
+        self.leased: set[UUID] = set()
+        self.retries: dict[UUID, tuple[float, str]] = {}
+        self.failed: dict[UUID, str] = {}
+
+    async def add(self, message: EmailMessage) -> UUID:
+        email_id = uuid4()
+        self.pending[email_id] = OutboxEmail(id=email_id, message=message, attempts=0)
+        return email_id
+
+    async def claim_due(self, limit: int, lease_seconds: float) -> list[OutboxEmail]:
+        due = [e for e in self.pending.values() if e.id not in self.leased][:limit]
+        claimed = []
+        for email in due:
+            email = OutboxEmail(email.id, email.message, email.attempts + 1)
+            self.pending[email.id] = email
+            self.leased.add(email.id)
+            claimed.append(email)
+        return claimed
+
+    async def mark_sent(self, email_ids) -> None:
+        for email_id in email_ids:
+            del self.pending[email_id]
+            self.leased.discard(email_id)
+
+    async def retry_later(self, email_id, delay_seconds, error) -> None:
+        self.retries[email_id] = (delay_seconds, error)
+
+    async def mark_failed(self, email_id, error) -> None:
+        self.failed[email_id] = error
+
+
+class FakeUnitOfWork:
+    def __init__(self, outbox: FakeOutbox) -> None:
+        self.email_outbox_repository = outbox
+        self.commits = 0
+
+    async def commit(self) -> None:
+        self.commits += 1
+
+
+@pytest.fixture
+def outbox():
+    return FakeOutbox()
+
+
+@pytest.fixture
+def uow(outbox):
+    return FakeUnitOfWork(outbox)
+
+
+@pytest.fixture
+def uow_factory(uow):
+    @asynccontextmanager
+    async def factory():
+        yield uow
+
+    return factory
+
+
+def _message(n: int = 0) -> EmailMessage:
+    return EmailMessage(recipients=[f"user{n}@example.com"], subject="Hi", body_text="Body")
+
+
+class FlakyEmailService:
+    def __init__(self, failures: int) -> None:
+        self.failures = failures
+        self.sent: list[EmailMessage] = []
+
+    async def send_email(self, message: EmailMessage) -> None:
+        if self.failures:
+            self.failures -= 1
+            raise ConnectionError("smtp down")
+        self.sent.append(message)
+
+    async def send_many(self, messages):
+        results = []
+        for message in messages:
+            try:
+                await self.send_email(message)
+            except ConnectionError as exc:
+                results.append(exc)
+            else:
+                results.append(None)
+        return results
+
+
+@pytest.mark.asyncio
+async def test_dispatch_sends_batch_and_removes_it(outbox, uow, uow_factory):
+    transport = MockEmailService()
+    for n in range(3):
+        await outbox.add(_message(n))
+    dispatcher = EmailOutboxDispatcher(uow_factory, transport, batch_size=2)
+
+    assert await dispatcher.drain() == 3
+
+    assert [m.recipients[0] for m in transport.sent_messages] == [
+        "user0@example.com",
+        "user1@example.com",
+        "user2@example.com",
+    ]
+    assert outbox.pending == {}
+    # Claim and outcome commit once each per batch; the short batch ends the drain.
+    assert uow.commits == 4
+
+
+@pytest.mark.asyncio
+async def test_failed_send_is_rescheduled_with_jittered_backoff(outbox, uow_factory):
+    email_id = await outbox.add(_message())
+    dispatcher = EmailOutboxDispatcher(
+        uow_factory,
+        FlakyEmailService(failures=1),
+        backoff_base_seconds=2.0,
+        rng=lambda: 1.0,
+    )
+
+    await dispatcher.dispatch_once()
+
+    delay, error = outbox.retries[email_id]
+    assert delay == 2.0
+    assert error == "ConnectionError: smtp down"
+    assert email_id in outbox.pending
+
+
+def test_backoff_grows_exponentially_up_to_the_cap(uow_factory):
+    dispatcher = EmailOutboxDispatcher(
+        uow_factory,
+        MockEmailService(),
+        backoff_base_seconds=2.0,
+        backoff_max_seconds=30.0,
+        rng=lambda: 0.0,
+    )
+
+    assert [dispatcher.backoff_seconds(n) for n in (1, 2, 3, 4, 5, 6)] == [
+        1.0,
+        2.0,
+        4.0,
+        8.0,
+        15.0,
+        15.0,
+    ]
+
+
+@pytest.mark.asyncio
+async def test_gives_up_after_max_attempts(outbox, uow_factory):
+    email_id = await outbox.add(_message())
+    outbox.pending[email_id] = OutboxEmail(email_id, _message(), attempts=2)
+    dispatcher = EmailOutboxDispatcher(
+        uow_factory, FlakyEmailService(failures=1), max_attempts=3
+    )
+
+    await dispatcher.dispatch_once()
+
+    assert outbox.failed[email_id] == "ConnectionError: smtp down"
+    assert email_id not in outbox.retries
+
+
+@pytest.mark.asyncio
+async def test_sends_each_claimed_batch_in_one_transport_call(outbox, uow_factory):
+    batches: list[int] = []
+
+    class BatchingEmailService(MockEmailService):
+        async def send_many(self, messages):
+            batches.append(len(messages))
+            return await super().send_many(messages)
+
+    for n in range(10):
+        await outbox.add(_message(n))
+    dispatcher = EmailOutboxDispatcher(
+        uow_factory, BatchingEmailService(), batch_size=4
+    )
+
+    assert await dispatcher.drain() == 10
+    assert batches == [4, 4, 2]
+
+
+@pytest.mark.asyncio
+async def test_failed_batch_call_retries_every_email(outbox, uow_factory):
+    class BrokenEmailService(MockEmailService):
+        async def send_many(self, messages):
+            raise ConnectionError("smtp down")
+
+    ids = [await outbox.add(_message(n)) for n in range(2)]
+    dispatcher = EmailOutboxDispatcher(uow_factory, BrokenEmailService())
+
+    await dispatcher.dispatch_once()
+
+    assert sorted(outbox.retries) == sorted(ids)
+
+
+@pytest.mark.asyncio
+async def test_background_loop_sends_when_woken(outbox, uow_factory):
+    transport = MockEmailService()
+    dispatcher = EmailOutboxDispatcher(uow_factory, transport, poll_interval_seconds=60)
+    await dispatcher.start()
+    try:
+        await asyncio.sleep(0)
+        await outbox.add(_message())
+        dispatcher.wake()
+        for _ in range(50):
+            if transport.sent_messages:
+                break
+            await asyncio.sleep(0.01)
+    finally:
+        await dispatcher.stop()
+
+    assert len(transport.sent_messages) == 1
+
+
+@pytest.mark.asyncio
+async def test_delivers_through_local_smtp_server(outbox, uow_factory):
+    aiosmtpd_controller = pytest.importorskip("aiosmtpd.controller")
+    aiosmtpd_smtp = pytest.importorskip("aiosmtpd.smtp")
+    pytest.importorskip("aiosmtplib")
+    from backend.src.adapters.services import SMTPEmailService
+    from backend.src.config.settings import AppSettings
+
+    received = []
+
+    class Handler:
+        async def handle_DATA(self, server, session, envelope):
+            received.append(envelope)
+            return "250 OK"
+
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+    controller = aiosmtpd_controller.Controller(
+        Handler(),
+        hostname="127.0.0.1",
+        port=port,
+        authenticator=lambda *args: aiosmtpd_smtp.AuthResult(success=True),
+        auth_require_tls=False,
+    )
+    controller.start()
+    try:
+        transport = SMTPEmailService(
+            AppSettings(
+                smtp_host="127.0.0.1",
+                smtp_port=port,
+                smtp_user="user",
+                smtp_password="pass",
+                smtp_from_email="noreply@example.com",
+                smtp_use_tls=False,
+            )
+        )
+        for n in range(3):
+            await outbox.add(_message(n))
+        dispatcher = EmailOutboxDispatcher(uow_factory, transport)
+
+        assert await dispatcher.drain() == 3
+    finally:
+        controller.stop()
+
+    assert outbox.retries == {}
+    assert sorted(e.rcpt_tos[0] for e in received) == [
+        "user0@example.com",
+        "user1@example.com",
+        "user2@example.com",
+    ]
@@ -0,0 +1,91 @@
+"""Tests for NumpySimilarTaskIndex."""
+
+from uuid import uuid4
+
+import pytest
+
+pytest.importorskip("numpy")
+
+from backend.src.infrastructure.similarity import NumpySimilarTaskIndex  # noqa: E402
+
+PROJECT = uuid4()
+
+
+def test_near_duplicates_score_high_and_unrelated_tasks_low():
+    index = NumpySimilarTaskIndex()
+    login, ci = uuid4(), uuid4()
+    index.add(PROJECT, login, "Build login page", "Form with email and password", 5)
+    index.add(PROJECT, ci, "Set up CI pipeline", "Run tests on every push", 3)
+
+    close = index.nearest(PROJECT, "Build the login page", "form with email + password")
+    far = index.nearest(PROJECT, "Translate onboarding emails", "Spanish and French")
+
+    assert close.task_id == login
+    assert close.difficulty_points == 5
+    assert close.similarity > 0.8
+    assert far.similarity < 0.5
+
+
+def test_identical_text_ignores_case_and_spacing():
+    index = NumpySimilarTaskIndex()
+    task_id = uuid4()
+    index.add(PROJECT, task_id, "Export  CSV", "All tasks", 2)
+
+    match = index.nearest(PROJECT, "export csv", "all   TASKS")
+
+    assert match.task_id == task_id
+    assert match.similarity == pytest.approx(1.0, abs=1e-5)
+
+
+def test_adding_a_task_again_replaces_its_entry():
+    index = NumpySimilarTaskIndex()
+    task_id = uuid4()
+    index.add(PROJECT, task_id, "Export CSV", "", 2)
+    index.add(PROJECT, task_id, "Export CSV", "", 8)
+
+    assert len(index) == 1
+    assert index.nearest(PROJECT, "Export CSV", "").difficulty_points == 8
+
+
+def test_removed_tasks_are_not_returned():
+    index = NumpySimilarTaskIndex()
+    kept, removed = uuid4(), uuid4()
+    index.add(PROJECT, kept, "Write API docs", "", 3)
+    index.add(PROJECT, removed, "Export CSV", "", 2)
+
+    index.remove(removed)
+
+    assert len(index) == 1
+    assert index.nearest(PROJECT, "Export CSV", "").task_id == kept
+
+
+def test_full_index_overwrites_the_oldest_entry():
+    index = NumpySimilarTaskIndex(max_entries=2)
+    oldest, middle, newest = uuid4(), uuid4(), uuid4()
+    index.add(PROJECT, oldest, "Export CSV", "", 2)
+    index.add(PROJECT, middle, "Write API docs", "", 3)
+    index.add(PROJECT, newest, "Migrate database", "", 8)
+
+    assert len(index) == 2
+    assert index.nearest(PROJECT, "Export CSV", "").task_id != oldest
+    assert index.nearest(PROJECT, "Migrate database", "").task_id == newest
+
+
+def test_empty_index_or_text_has_no_match():
+    index = NumpySimilarTaskIndex()
+    assert index.nearest(PROJECT, "Export CSV", "") is None
+
+    index.add(PROJECT, uuid4(), "Export CSV", "", 2)
+    assert index.nearest(PROJECT, "", "  ") is None
+
+
+def test_lookups_only_see_their_own_projects_tasks():
+    index = NumpySimilarTaskIndex()
+    other = uuid4()
+    ours, theirs = uuid4(), uuid4()
+    index.add(other, theirs, "Export CSV", "All tasks", 8)
+    index.add(PROJECT, ours, "Write API docs", "", 3)
+
+    assert index.nearest(other, "Export CSV", "All tasks").task_id == theirs
+    assert index.nearest(PROJECT, "Export CSV", "All tasks").task_id == ours
+    assert index.nearest(uuid4(), "Export CSV", "All tasks") is None
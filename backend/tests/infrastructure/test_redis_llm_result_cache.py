@@ -0,0 +1,34 @@
+"""Tests for RedisLLMResultCache."""
+
+from unittest.mock import AsyncMock
+
+import pytest
+from redis.exceptions import ConnectionError as RedisConnectionError
+
+from backend.src.infrastructure.cache import RedisLLMResultCache
+
+
+@pytest.mark.asyncio
+async def test_values_are_stored_under_the_prefix_with_ttl():
+    redis = AsyncMock()
+    redis.get.return_value = '{"points": 3}'
+    cache = RedisLLMResultCache(redis)
+
+    await cache.set("v1:mock:difficulty:abc", '{"points": 3}', ttl_seconds=60)
+    value = await cache.get("v1:mock:difficulty:abc")
+
+    redis.set.assert_awaited_once_with(
+        "llm:estimates:v1:mock:difficulty:abc", '{"points": 3}', ex=60
+    )
+    assert value == '{"points": 3}'
+
+
+@pytest.mark.asyncio
+async def test_redis_errors_behave_as_misses():
+    redis = AsyncMock()
+    redis.get.side_effect = RedisConnectionError("down")
+    redis.set.side_effect = RedisConnectionError("down")
+    cache = RedisLLMResultCache(redis)
+
+    assert await cache.get("key") is None
+    await cache.set("key", "value", ttl_seconds=60)
@@ -0,0 +1,63 @@
+"""Tests for RedisProjectAccessCache."""
+
+import json
+from unittest.mock import AsyncMock
+from uuid import uuid4
+
+import pytest
+from redis.exceptions import ConnectionError as RedisConnectionError
+
+from backend.src.domain.entities import ProjectAccess, SeniorityLevel
+from backend.src.infrastructure.cache import RedisProjectAccessCache
+
+
+@pytest.fixture
+def redis():
+    return AsyncMock()
+
+
+@pytest.fixture
+def cache(redis):
+    return RedisProjectAccessCache(redis, ttl_seconds=30)
+
+
+@pytest.mark.asyncio
+async def test_round_trips_membership_with_ttl(cache, redis):
+    access = ProjectAccess(
+        project_id=uuid4(),
+        user_id=uuid4(),
+        is_manager=False,
+        member_id=uuid4(),
+        role_id=uuid4(),
+        seniority_level=SeniorityLevel.LEAD,
+    )
+
+    await cache.set(access)
+    key, payload = redis.set.await_args.args
+    assert key == f"authz:project_access:{access.project_id}:{access.user_id}"
+    assert redis.set.await_args.kwargs == {"ex": 30}
+    assert json.loads(payload)["seniority_level"] == "Lead"
+
+    redis.get.return_value = payload
+    assert await cache.get(access.project_id, access.user_id) == access
+
+
+@pytest.mark.asyncio
+async def test_invalidate_deletes_key(cache, redis):
+    project_id, user_id = uuid4(), uuid4()
+
+    await cache.invalidate(project_id, user_id)
+
+    redis.delete.assert_awaited_once_with(
+        f"authz:project_access:{project_id}:{user_id}"
+    )
+
+
+@pytest.mark.asyncio
+async def test_redis_errors_count_as_misses(cache, redis):
+    redis.get.side_effect = RedisConnectionError("down")
+    redis.set.side_effect = RedisConnectionError("down")
+    access = ProjectAccess(project_id=uuid4(), user_id=uuid4(), is_manager=True)
+
+    assert await cache.get(access.project_id, access.user_id) is None
+    await cache.set(access)
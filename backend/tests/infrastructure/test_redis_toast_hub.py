@@ -0,0 +1,62 @@
+"""Tests for RedisToastHub."""
+
+import json
+from unittest.mock import AsyncMock
+from uuid import uuid4
+
+import pytest
+
+from backend.src.domain.ports.services import NewTaskToastData
+from backend.src.infrastructure.cache import RedisToastHub
+
+
+def _toast() -> NewTaskToastData:
+    return NewTaskToastData(
+        project_id=uuid4(),
+        project_name="Project",
+        task_id=uuid4(),
+        task_title="Task",
+        required_role=None,
+    )
+
+
+@pytest.mark.asyncio
+async def test_publish_sends_one_message_for_all_recipients():
+    redis = AsyncMock()
+    hub = RedisToastHub(redis)
+    user_ids = [uuid4(), uuid4()]
+
+    await hub.publish(user_ids, _toast())
+
+    channel, data = redis.publish.await_args.args
+    assert channel == "toasts:events"
+    assert json.loads(data)["user_ids"] == [str(u) for u in user_ids]
+
+
+@pytest.mark.asyncio
+async def test_messages_from_any_worker_reach_local_streams():
+    redis = AsyncMock()
+    publisher, receiver = RedisToastHub(redis), RedisToastHub(AsyncMock())
+    user_id = uuid4()
+    toast = _toast()
+    await publisher.publish([user_id], toast)
+
+    with receiver.subscribe(user_id) as subscription:
+        receiver._apply(redis.publish.await_args.args[1])
+        event = json.loads(await subscription.get())
+
+    assert event["task_id"] == str(toast.task_id)
+
+
+@pytest.mark.asyncio
+async def test_delivers_locally_when_redis_is_down():
+    redis = AsyncMock()
+    redis.publish.side_effect = ConnectionError("down")
+    hub = RedisToastHub(redis)
+    user_id = uuid4()
+
+    with hub.subscribe(user_id) as subscription:
+        await hub.publish([user_id], _toast())
+        event = json.loads(await subscription.get())
+
+    assert event["type"] == "new_task"
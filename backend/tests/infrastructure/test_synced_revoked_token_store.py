@@ -0,0 +1,82 @@
+"""Tests for SyncedRedisRevokedTokenStore."""
+
+import time
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from backend.src.infrastructure.cache import SyncedRedisRevokedTokenStore
+
+
+@pytest.fixture
+def redis():
+    mock = AsyncMock()
+    pipe = MagicMock()
+    pipe.execute = AsyncMock(return_value=[True, 1, 0, 7])
+    pipe.__aenter__ = AsyncMock(return_value=pipe)
+    pipe.__aexit__ = AsyncMock(return_value=False)
+    mock.pipeline = MagicMock(return_value=pipe)
+    mock.get.return_value = None
+    mock.zrangebyscore.return_value = []
+    return mock
+
+
+@pytest.fixture
+async def store(redis):
+    store = SyncedRedisRevokedTokenStore(redis, sync_interval_seconds=60)
+    await store._reload()
+    store._ready = True
+    return store
+
+
+@pytest.mark.asyncio
+async def test_unknown_jti_is_answered_locally_when_in_sync(store, redis):
+    redis.get.reset_mock()
+
+    assert await store.is_revoked("jti-1") is False
+    redis.get.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_falls_back_to_redis_when_subscription_is_down(store, redis):
+    store._ready = False
+    redis.get.return_value = "1"
+
+    assert await store.is_revoked("jti-1") is True
+    redis.get.assert_awaited_with("auth:revoked_jti:jti-1")
+
+
+@pytest.mark.asyncio
+async def test_revoke_is_local_immediately_and_published(store, redis):
+    await store.revoke("jti-1", 60)
+
+    assert await store.is_revoked("jti-1") is True
+    channel, message = redis.publish.await_args.args
+    assert channel == "auth:revoked_jti:events"
+    assert message.startswith("7:") and message.endswith(":jti-1")
+
+
+@pytest.mark.asyncio
+async def test_published_revocation_is_applied(store):
+    await store._apply(f"1:{time.time() + 60}:jti-1")
+
+    assert await store.is_revoked("jti-1") is True
+
+
+@pytest.mark.asyncio
+async def test_version_gap_reloads_live_set(store, redis):
+    redis.get.return_value = "5"
+    redis.zrangebyscore.return_value = [("missed", time.time() + 60)]
+
+    await store._apply(f"5:{time.time() + 60}:jti-5")
+
+    assert await store.is_revoked("missed") is True
+    assert await store.is_revoked("jti-5") is True
+    assert store._version == 5
+
+
+@pytest.mark.asyncio
+async def test_expired_revocation_is_forgotten(store):
+    await store._apply(f"1:{time.time() - 1}:jti-1")
+
+    assert await store.is_revoked("jti-1") is False
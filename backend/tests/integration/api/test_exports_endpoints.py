@@ -0,0 +1,11 @@
+"""Integration tests for exports router auth requirements."""
+
+import pytest
+
+
+@pytest.mark.asyncio
+async def test_exports_requires_bearer(api_client):
+    res = await api_client.get(
+        "/projects/00000000-0000-0000-0000-000000000001/export/tasks",
+    )
+    assert res.status_code in {401, 403}
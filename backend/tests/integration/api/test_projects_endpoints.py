@@ -13,3 +13,11 @@ async def test_projects_requires_bearer(api_client):
 async def test_projects_list_requires_bearer(api_client):
     res = await api_client.get("/projects?limit=20&offset=0")
     assert res.status_code in {401, 403}
+
+
+@pytest.mark.asyncio
+async def test_project_snapshot_requires_bearer(api_client):
+    res = await api_client.get(
+        "/projects/00000000-0000-0000-0000-000000000000/snapshot?fields=tasks"
+    )
+    assert res.status_code in {401, 403}
@@ -10,3 +10,34 @@ async def test_tasks_requires_bearer(api_client):
         json={"title": "Task", "description": "", "difficulty_points": 1},
     )
     assert res.status_code in {401, 403}
+
+
+@pytest.mark.asyncio
+async def test_task_import_requires_bearer(api_client):
+    res = await api_client.post(
+        "/projects/00000000-0000-0000-0000-000000000001/tasks/import",
+        json={"tasks": [{"ref": "a", "title": "Task"}], "dependencies": []},
+    )
+    assert res.status_code in {401, 403}
+
+
+@pytest.mark.asyncio
+async def test_task_batch_requires_bearer(api_client):
+    res = await api_client.post(
+        "/projects/00000000-0000-0000-0000-000000000001/batch",
+        json={
+            "commands": [
+                {"op": "cancel", "task_id": "00000000-0000-0000-0000-000000000002"}
+            ]
+        },
+    )
+    assert res.status_code in {401, 403}
+
+
+@pytest.mark.asyncio
+async def test_task_logs_requires_bearer(api_client):
+    res = await api_client.get(
+        "/projects/00000000-0000-0000-0000-000000000001/tasks/"
+        "00000000-0000-0000-0000-000000000002/logs?limit=50&offset=0"
+    )
+    assert res.status_code in {401, 403}
@@ -0,0 +1,80 @@
+"""Integration tests for PostgresDeadlineWarningRepository."""
+
+from datetime import timedelta
+
+from backend.src.adapters.db import (
+    PostgresDeadlineWarningRepository,
+    PostgresProjectMemberRepository,
+    PostgresProjectRepository,
+    PostgresRoleRepository,
+    PostgresTaskRepository,
+    PostgresUserRepository,
+)
+from backend.src.domain.entities import (
+    Project,
+    ProjectMember,
+    Role,
+    SeniorityLevel,
+    Task,
+    TaskStatus,
+    User,
+)
+from backend.src.domain.ports.repositories import ScheduledDeadlineWarning
+from backend.src.domain.time import utcnow
+
+import pytest
+
+
+@pytest.mark.asyncio
+async def test_deadline_warnings_are_scheduled_once_and_sent_once(db_session):
+    now = utcnow()
+    manager = User(email="manager@example.com", name="Manager")
+    employee = User(email="employee@example.com", name="Emp")
+    await PostgresUserRepository(db_session).save(manager)
+    await PostgresUserRepository(db_session).save(employee)
+    project = Project(name="Proj", manager_id=manager.id)
+    await PostgresProjectRepository(db_session).save(project)
+    role = Role(project_id=project.id, name="Dev")
+    await PostgresRoleRepository(db_session).save(role)
+    member = ProjectMember(
+        project_id=project.id,
+        user_id=employee.id,
+        role_id=role.id,
+        seniority_level=SeniorityLevel.MID,
+    )
+    await PostgresProjectMemberRepository(db_session).save(member)
+    deadline = now + timedelta(hours=20)
+    open_task = Task(
+        project_id=project.id,
+        title="Open",
+        assignee_id=member.id,
+        expected_end_date=deadline,
+    )
+    done_task = Task(
+        project_id=project.id,
+        title="Done",
+        status=TaskStatus.DONE,
+        assignee_id=member.id,
+        expected_end_date=deadline,
+    )
+    await PostgresTaskRepository(db_session).save(open_task)
+    await PostgresTaskRepository(db_session).save(done_task)
+
+    repo = PostgresDeadlineWarningRepository(db_session)
+    candidates = await repo.find_by_deadline(
+        now, now + timedelta(days=1), after=None, limit=100
+    )
+    assert [c.task_id for c in candidates] == [open_task.id]
+
+    warning = ScheduledDeadlineWarning(open_task.id, deadline, now - timedelta(hours=1))
+    await repo.schedule([warning])
+    await repo.schedule([warning])
+
+    [due] = await repo.list_due(now, after=None, limit=100)
+    assert (due.task_title, due.assignee_email) == ("Open", "employee@example.com")
+
+    await repo.mark_sent([due], now)
+    assert await repo.list_due(now, after=None, limit=100) == []
+
+    await repo.set_watermark("test", now)
+    assert await repo.get_watermark("test") == now
@@ -0,0 +1,45 @@
+"""Integration tests for PostgresEmailOutboxRepository."""
+
+import pytest
+
+from backend.src.adapters.db import PostgresEmailOutboxRepository
+from backend.src.domain.ports import EmailMessage
+
+
+@pytest.mark.asyncio
+async def test_claim_leases_due_emails_and_counts_attempts(db_session):
+    repo = PostgresEmailOutboxRepository(db_session)
+    message = EmailMessage(
+        recipients=["user@example.com"],
+        subject="Subject",
+        body_text="Text",
+        body_html="<p>Html</p>",
+        bcc=["audit@example.com"],
+    )
+    email_id = await repo.add(message)
+
+    claimed = await repo.claim_due(limit=10, lease_seconds=60)
+
+    assert [e.id for e in claimed] == [email_id]
+    assert claimed[0].attempts == 1
+    assert claimed[0].message == message
+    # Leased emails are not handed out again until the lease expires.
+    assert await repo.claim_due(limit=10, lease_seconds=60) == []
+
+
+@pytest.mark.asyncio
+async def test_retry_failed_and_sent_emails(db_session):
+    repo = PostgresEmailOutboxRepository(db_session)
+    message = EmailMessage(recipients=["user@example.com"], subject="S", body_text="B")
+    retried = await repo.add(message)
+    failed = await repo.add(message)
+    sent = await repo.add(message)
+    await repo.claim_due(limit=10, lease_seconds=60)
+
+    await repo.retry_later(retried, delay_seconds=0, error="timeout")
+    await repo.mark_failed(failed, error="rejected")
+    await repo.mark_sent([sent])
+
+    claimed = await repo.claim_due(limit=10, lease_seconds=60)
+    assert [e.id for e in claimed] == [retried]
+    assert claimed[0].attempts == 2
@@ -0,0 +1,30 @@
+"""Integration tests for per-project daily LLM usage."""
+
+from datetime import date
+
+from backend.src.adapters.db import (
+    PostgresLLMUsageRepository,
+    PostgresProjectRepository,
+    PostgresUserRepository,
+)
+from backend.src.domain.entities import Project, User
+
+import pytest
+
+
+@pytest.mark.asyncio
+async def test_add_accumulates_tokens_per_project_and_day(db_session):
+    manager = User(email="llm-usage-manager@example.com", name="Manager")
+    await PostgresUserRepository(db_session).save(manager)
+    project = Project(name="Proj", manager_id=manager.id)
+    await PostgresProjectRepository(db_session).save(project)
+    repo = PostgresLLMUsageRepository(db_session)
+    today, tomorrow = date(2026, 1, 5), date(2026, 1, 6)
+
+    assert await repo.get_tokens(project.id, today) == 0
+    assert await repo.add(project.id, today, 120) == 120
+    assert await repo.add(project.id, today, 30) == 150
+    assert await repo.add(project.id, tomorrow, 10) == 10
+
+    assert await repo.get_tokens(project.id, today) == 150
+    assert await repo.get_tokens(project.id, tomorrow) == 10
@@ -1,12 +1,24 @@
 """Integration tests for PostgresProjectRepository."""
 
+from uuid import uuid4
+
 from backend.src.adapters.db import (
     PostgresProjectMemberRepository,
     PostgresProjectRepository,
     PostgresRoleRepository,
+    PostgresTaskRepository,
     PostgresUserRepository,
 )
-from backend.src.domain.entities import Project, ProjectMember, Role, SeniorityLevel, User
+from backend.src.domain.entities import (
+    Project,
+    ProjectAccess,
+    ProjectMember,
+    Role,
+    SeniorityLevel,
+    Task,
+    User,
+)
+from backend.src.infrastructure.db.versioning import bump_project_versions, reset_changes
 
 import pytest
 
@@ -80,3 +92,66 @@ async def test_project_repository_list_by_user_pagination(db_session):
 
     page = await project_repo.list_by_user(manager.id, limit=2, offset=1)
     assert len(page) == 2
+
+
+@pytest.mark.asyncio
+async def test_find_access_reports_manager_member_and_outsider(db_session):
+    user_repo = PostgresUserRepository(db_session)
+    project_repo = PostgresProjectRepository(db_session)
+    role_repo = PostgresRoleRepository(db_session)
+    member_repo = PostgresProjectMemberRepository(db_session)
+
+    manager = User(email="manager-access@example.com", name="Manager")
+    employee = User(email="employee-access@example.com", name="Emp")
+    outsider = User(email="outsider-access@example.com", name="Outsider")
+    for user in (manager, employee, outsider):
+        await user_repo.save(user)
+    project = Project(name="Access", manager_id=manager.id)
+    await project_repo.save(project)
+    role = Role(project_id=project.id, name="Dev")
+    await role_repo.save(role)
+    member = ProjectMember(
+        project_id=project.id,
+        user_id=employee.id,
+        role_id=role.id,
+        seniority_level=SeniorityLevel.SENIOR,
+    )
+    await member_repo.save(member)
+
+    manager_access = await project_repo.find_access(project.id, manager.id)
+    assert manager_access is not None
+    assert manager_access.is_manager and not manager_access.is_member
+
+    member_access = await project_repo.find_access(project.id, employee.id)
+    assert member_access == ProjectAccess.of(project, employee.id, member)
+
+    outsider_access = await project_repo.find_access(project.id, outsider.id)
+    assert outsider_access is not None and not outsider_access.can_view
+
+    assert await project_repo.find_access(uuid4(), manager.id) is None
+
+
+@pytest.mark.asyncio
+async def test_project_version_bumped_once_per_unit_of_work(db_session):
+    user_repo = PostgresUserRepository(db_session)
+    project_repo = PostgresProjectRepository(db_session)
+    task_repo = PostgresTaskRepository(db_session)
+
+    manager = User(email="manager-version@example.com", name="Manager")
+    outsider = User(email="outsider-version@example.com", name="Outsider")
+    await user_repo.save(manager)
+    await user_repo.save(outsider)
+    project = Project(name="Versioned", manager_id=manager.id)
+    await project_repo.save(project)
+    reset_changes(db_session)
+
+    initial = await project_repo.find_version(project.id, manager.id)
+    assert initial is not None
+    assert await project_repo.find_version(project.id, outsider.id) is None
+
+    task = Task(project_id=project.id, title="T")
+    await task_repo.insert_many([task, Task(project_id=project.id, title="U")])
+    await task_repo.delete(task.id)
+    await bump_project_versions(db_session)
+
+    assert await project_repo.find_version(project.id, manager.id) == initial + 1
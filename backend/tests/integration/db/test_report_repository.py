@@ -0,0 +1,73 @@
+"""Integration tests for PostgresReportRepository."""
+
+from datetime import timedelta
+
+from backend.src.adapters.db import (
+    PostgresProjectMemberRepository,
+    PostgresProjectRepository,
+    PostgresReportRepository,
+    PostgresRoleRepository,
+    PostgresTaskRepository,
+    PostgresUserRepository,
+)
+from backend.src.domain.entities import (
+    Project,
+    ProjectMember,
+    Role,
+    SeniorityLevel,
+    Task,
+    TaskStatus,
+    User,
+)
+from backend.src.domain.time import utcnow
+
+import pytest
+
+
+@pytest.mark.asyncio
+async def test_report_repository_aggregates_per_project(db_session):
+    now = utcnow()
+    manager = User(email="manager@example.com", name="Manager")
+    employee = User(email="employee@example.com", name="Emp")
+    await PostgresUserRepository(db_session).save(manager)
+    await PostgresUserRepository(db_session).save(employee)
+    project = Project(name="Proj", manager_id=manager.id)
+    await PostgresProjectRepository(db_session).save(project)
+    role = Role(project_id=project.id, name="Dev")
+    await PostgresRoleRepository(db_session).save(role)
+    member = ProjectMember(
+        project_id=project.id,
+        user_id=employee.id,
+        role_id=role.id,
+        seniority_level=SeniorityLevel.MID,
+    )
+    await PostgresProjectMemberRepository(db_session).save(member)
+
+    task_repo = PostgresTaskRepository(db_session)
+    for task in (
+        Task(project_id=project.id, title="Done", status=TaskStatus.DONE, actual_end_date=now),
+        Task(project_id=project.id, title="Blocked", status=TaskStatus.BLOCKED),
+        Task(
+            project_id=project.id,
+            title="Late",
+            difficulty_points=5,
+            status=TaskStatus.DOING,
+            assignee_id=member.id,
+            expected_end_date=now - timedelta(days=1),
+        ),
+    ):
+        await task_repo.save(task)
+
+    repo = PostgresReportRepository(db_session)
+    projects = await repo.list_projects(after=None, limit=100)
+    counts = await repo.count_tasks_by_project([project.id], now)
+    workloads = await repo.list_member_workloads([project.id])
+
+    [report_project] = [p for p in projects if p.project_id == project.id]
+    assert report_project.manager_email == "manager@example.com"
+    project_counts = counts[project.id]
+    assert project_counts.total_tasks == 3
+    assert project_counts.completed_today == 1
+    assert project_counts.blocked_tasks == 1
+    assert project_counts.delayed_tasks == 1
+    assert [(w.member_name, w.doing_points) for w in workloads] == [("Emp", 5)]
@@ -23,3 +23,21 @@ async def test_role_repository_roundtrip(db_session):
     found = await repo.find_by_id(role.id)
     assert found is not None
     assert found.name == "Developer"
+
+
+@pytest.mark.asyncio
+async def test_role_repository_find_by_ids(db_session):
+    user_repo = PostgresUserRepository(db_session)
+    project_repo = PostgresProjectRepository(db_session)
+    repo = PostgresRoleRepository(db_session)
+
+    manager = User(email="manager@example.com", name="Manager")
+    await user_repo.save(manager)
+    project = Project(name="Proj", manager_id=manager.id)
+    await project_repo.save(project)
+    dev = await repo.save(Role(project_id=project.id, name="Developer"))
+    qa = await repo.save(Role(project_id=project.id, name="QA"))
+
+    found = await repo.find_by_ids([dev.id, qa.id])
+    assert {r.name for r in found} == {"Developer", "QA"}
+    assert await repo.find_by_ids([]) == []
@@ -99,3 +99,50 @@ async def test_task_log_repository_pagination_and_count(db_session):
     assert await repo.count_by_task(task.id) == 3
     page = await repo.list_by_task(task.id, limit=2, offset=1)
     assert len(page) == 2
+
+
+@pytest.mark.asyncio
+async def test_task_log_repository_streams_project_logs(db_session):
+    user_repo = PostgresUserRepository(db_session)
+    project_repo = PostgresProjectRepository(db_session)
+    role_repo = PostgresRoleRepository(db_session)
+    member_repo = PostgresProjectMemberRepository(db_session)
+    task_repo = PostgresTaskRepository(db_session)
+    repo = PostgresTaskLogRepository(db_session)
+
+    manager = User(email="stream-manager@example.com", name="Manager")
+    employee = User(email="stream-employee@example.com", name="Employee")
+    await user_repo.save(manager)
+    await user_repo.save(employee)
+
+    project = Project(name="Proj", manager_id=manager.id)
+    other_project = Project(name="Other", manager_id=manager.id)
+    await project_repo.save(project)
+    await project_repo.save(other_project)
+
+    role = Role(project_id=project.id, name="Dev")
+    await role_repo.save(role)
+
+    member = ProjectMember(
+        project_id=project.id,
+        user_id=employee.id,
+        role_id=role.id,
+        seniority_level=SeniorityLevel.MID,
+    )
+    await member_repo.save(member)
+
+    task = Task(project_id=project.id, title="Task", difficulty_points=1)
+    other_task = Task(project_id=other_project.id, title="Other", difficulty_points=1)
+    await task_repo.save(task)
+    await task_repo.save(other_task)
+
+    for text in ("first", "second"):
+        await repo.save(
+            TaskLog.create_report_log(task_id=task.id, author_id=member.id, report_text=text)
+        )
+    await repo.save(
+        TaskLog.create_report_log(task_id=other_task.id, author_id=member.id, report_text="x")
+    )
+
+    streamed = [log async for log in repo.stream_by_project(project.id)]
+    assert [log.content for log in streamed] == ["first", "second"]
@@ -0,0 +1,103 @@
+"""Integration tests for incremental progress estimation storage."""
+
+from datetime import timedelta
+
+from backend.src.adapters.db import (
+    PostgresProjectMemberRepository,
+    PostgresProjectRepository,
+    PostgresRoleRepository,
+    PostgresTaskLogRepository,
+    PostgresTaskProgressRepository,
+    PostgresTaskRepository,
+    PostgresUserRepository,
+)
+from backend.src.domain.entities import (
+    Project,
+    ProjectMember,
+    Role,
+    SeniorityLevel,
+    Task,
+    TaskLog,
+    User,
+)
+from backend.src.domain.ports.repositories import TaskProgressState
+
+import pytest
+
+
+async def _task_with_member(db_session, suffix: str) -> tuple[Task, ProjectMember]:
+    manager = User(email=f"progress-manager-{suffix}@example.com", name="Manager")
+    employee = User(email=f"progress-employee-{suffix}@example.com", name="Employee")
+    await PostgresUserRepository(db_session).save(manager)
+    await PostgresUserRepository(db_session).save(employee)
+    project = Project(name="Proj", manager_id=manager.id)
+    await PostgresProjectRepository(db_session).save(project)
+    role = Role(project_id=project.id, name="Dev")
+    await PostgresRoleRepository(db_session).save(role)
+    member = ProjectMember(
+        project_id=project.id,
+        user_id=employee.id,
+        role_id=role.id,
+        seniority_level=SeniorityLevel.MID,
+    )
+    await PostgresProjectMemberRepository(db_session).save(member)
+    task = Task(project_id=project.id, title="Task", difficulty_points=1)
+    await PostgresTaskRepository(db_session).save(task)
+    return task, member
+
+
+@pytest.mark.asyncio
+async def test_find_reports_after_returns_only_later_reports(db_session):
+    task, member = await _task_with_member(db_session, "after")
+    repo = PostgresTaskLogRepository(db_session)
+    reports = [
+        TaskLog.create_report_log(task_id=task.id, author_id=member.id, report_text=t)
+        for t in ("first", "second", "third")
+    ]
+    for i, log in enumerate(reports):
+        log.created_at = log.created_at + timedelta(seconds=i)
+        await repo.save(log)
+    await repo.save(TaskLog.create_assignment_log(task_id=task.id, author_id=member.id))
+
+    everything = await repo.find_reports_after(task.id)
+    later = await repo.find_reports_after(
+        task.id, (reports[0].created_at, reports[0].id)
+    )
+
+    assert [log.content for log in everything] == ["first", "second", "third"]
+    assert [log.content for log in later] == ["second", "third"]
+
+
+@pytest.mark.asyncio
+async def test_progress_save_never_moves_the_watermark_back(db_session):
+    task, member = await _task_with_member(db_session, "save")
+    repo = PostgresTaskProgressRepository(db_session)
+    newer = TaskLog.create_report_log(
+        task_id=task.id, author_id=member.id, report_text="newer"
+    )
+    state = TaskProgressState(
+        task_id=task.id,
+        percentage=60,
+        confidence=0.8,
+        reasoning="ok",
+        summary="most done",
+        last_report_at=newer.created_at,
+        last_report_id=newer.id,
+    )
+
+    assert await repo.get(task.id) is None
+    assert await repo.save(state)
+    stale = TaskProgressState(
+        task_id=task.id,
+        percentage=20,
+        confidence=0.5,
+        reasoning="old",
+        summary="started",
+        last_report_at=newer.created_at - timedelta(hours=1),
+        last_report_id=newer.id,
+    )
+    assert not await repo.save(stale)
+
+    stored = await repo.get(task.id)
+    assert stored.percentage == 60
+    assert stored.summary == "most done"
@@ -1,7 +1,8 @@
 """Integration tests for PostgresTaskRepository."""
 
 from backend.src.adapters.db import PostgresProjectRepository, PostgresTaskRepository, PostgresUserRepository
-from backend.src.domain.entities import Project, Task, User
+from backend.src.domain.entities import Project, Task, TaskStatus, User
+from backend.src.domain.time import utcnow
 
 import pytest
 
@@ -26,3 +27,32 @@ async def test_task_repository_roundtrip(db_session):
     assert found is not None
     assert len(by_project) == 1
     assert by_project[0].id == task.id
+
+
+@pytest.mark.asyncio
+async def test_task_repository_finds_recently_completed(db_session):
+    user_repo = PostgresUserRepository(db_session)
+    project_repo = PostgresProjectRepository(db_session)
+    repo = PostgresTaskRepository(db_session)
+
+    manager = User(email="completed-manager@example.com", name="Manager")
+    await user_repo.save(manager)
+    project = Project(name="Proj", manager_id=manager.id)
+    await project_repo.save(project)
+
+    done = Task(
+        project_id=project.id,
+        title="Done",
+        difficulty_points=3,
+        status=TaskStatus.DONE,
+        actual_end_date=utcnow(),
+    )
+    todo = Task(project_id=project.id, title="Todo", difficulty_points=2)
+    await repo.save(done)
+    await repo.save(todo)
+
+    found = await repo.find_recently_completed(limit=10)
+    assert [task.id for task in found] == [done.id]
+    assert await repo.find_recently_completed(
+        limit=10, completed_after=done.actual_end_date
+    ) == []
@@ -0,0 +1,68 @@
+"""Integration tests for PostgresWorkloadAlertRepository."""
+
+from uuid import uuid4
+
+from backend.src.adapters.db import (
+    PostgresProjectMemberRepository,
+    PostgresProjectRepository,
+    PostgresRoleRepository,
+    PostgresTaskRepository,
+    PostgresUserRepository,
+    PostgresWorkloadAlertRepository,
+)
+from backend.src.domain.entities import (
+    Project,
+    ProjectMember,
+    Role,
+    SeniorityLevel,
+    Task,
+    TaskStatus,
+    User,
+)
+
+import pytest
+
+
+@pytest.mark.asyncio
+async def test_workload_alert_repository_reads_one_member_and_dedupes(db_session):
+    manager = User(email="manager@example.com", name="Manager")
+    employee = User(email="employee@example.com", name="Emp")
+    await PostgresUserRepository(db_session).save(manager)
+    await PostgresUserRepository(db_session).save(employee)
+    project = Project(name="Proj", manager_id=manager.id)
+    await PostgresProjectRepository(db_session).save(project)
+    role = Role(project_id=project.id, name="Dev")
+    await PostgresRoleRepository(db_session).save(role)
+    member = ProjectMember(
+        project_id=project.id,
+        user_id=employee.id,
+        role_id=role.id,
+        seniority_level=SeniorityLevel.MID,
+    )
+    await PostgresProjectMemberRepository(db_session).save(member)
+
+    task_repo = PostgresTaskRepository(db_session)
+    for points, status in ((8, TaskStatus.DOING), (9, TaskStatus.DOING), (5, TaskStatus.DONE)):
+        await task_repo.save(
+            Task(
+                project_id=project.id,
+                title=f"Task {points}",
+                difficulty_points=points,
+                status=status,
+                assignee_id=member.id,
+            )
+        )
+
+    repo = PostgresWorkloadAlertRepository(db_session)
+    state = await repo.get_member_workload(member.id)
+
+    assert state is not None
+    assert state.manager_email == "manager@example.com"
+    assert state.user_id == employee.id
+    assert state.doing_points == 17
+    assert await repo.get_member_workload(uuid4()) is None
+
+    assert await repo.raise_alert(member.id) is True
+    assert await repo.raise_alert(member.id) is False
+    assert await repo.clear_alert(member.id) is True
+    assert await repo.clear_alert(member.id) is False